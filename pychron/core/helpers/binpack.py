@@ -20,6 +20,8 @@
 import base64
 import struct
 
+from numpy import asarray, dtype, empty, frombuffer
+
 
 def format_blob(blob):
     return base64.b64decode(blob)
@@ -75,4 +77,81 @@ def unpack(blob, fmt=">ff", step=8, decode=False):
         return [[] for _ in fmt.count("f")]
 
 
+def make_dtype(fmt):
+    """
+    convert a struct format string e.g. ">ff" into an equivalent numpy structured dtype.
+
+    returns None if ``fmt`` cannot be represented as a packed numpy record, e.g. native alignment
+    padding or a code with a platform dependent size
+    """
+    endianness, codes = "=", fmt
+    if fmt and fmt[0] in "@=<>!":
+        endianness = {"@": "=", "!": ">"}.get(fmt[0], fmt[0])
+        codes = fmt[1:]
+
+    try:
+        dt = dtype([("f{}".format(i), endianness + c) for i, c in enumerate(codes)])
+    except (TypeError, ValueError):
+        return
+
+    if dt.itemsize != struct.calcsize(fmt):
+        return
+    return dt
+
+
+def unpack_array(blob, fmt=">ff", decode=False):
+    """
+    numpy version of ``unpack``. decode ``blob`` without copying into a structured array with
+    one field per code in ``fmt`` (f0, f1, ...).
+
+    a truncated trailing record is ignored
+    """
+    if decode:
+        blob = format_blob(blob)
+
+    dt = make_dtype(fmt)
+    if dt is None:
+        raise ValueError("Unsupported format {}".format(fmt))
+
+    if not blob:
+        return empty(0, dtype=dt)
+
+    n = len(blob) // dt.itemsize
+    return frombuffer(blob, dtype=dt, count=n)
+
+
+def unpack_columns(blob, fmt=">ff", decode=False):
+    """
+    decode ``blob`` into a tuple of float64 arrays, one per code in ``fmt``
+    """
+    a = unpack_array(blob, fmt, decode=decode)
+    return tuple(a[name].astype(float) for name in a.dtype.names)
+
+
+def count_records(blob, fmt=">ff"):
+    """
+    return the number of complete records in ``blob`` without decoding it
+    """
+    if not blob:
+        return 0
+    return len(blob) // struct.calcsize(fmt)
+
+
+def pack_array(fmt, *columns):
+    """
+    numpy version of ``pack``. encode equal length columns in one pass
+
+    pack_array('>ff', xs, ys) == pack('>ff', zip(xs, ys))
+    """
+    dt = make_dtype(fmt)
+    if dt is None:
+        return pack(fmt, zip(*columns))
+
+    n = len(columns[0]) if columns else 0
+    a = empty(n, dtype=dt)
+    for name, c in zip(dt.names, columns):
+        a[name] = asarray(c)
+    return a.tobytes()
+
+
 # ============= EOF =============================================
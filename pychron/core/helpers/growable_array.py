@@ -0,0 +1,116 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+# ============= local library imports  ==========================
+from numpy import asarray, empty, Inf
+
+
+class GrowableArray(object):
+    """
+    1D array with amortized O(1) append.
+
+    values are stored in a preallocated buffer that doubles in size when full. ``view`` is a
+    numpy view of the filled part of the buffer. a new view object is returned after every append
+    so ``view`` can be assigned to attributes that are compared by identity (e.g. isotope xs/ys).
+
+    ``min`` and ``max`` are the running bounds of the values, updated on every append
+    """
+
+    def __init__(self, data=None, capacity=64, dtype=float):
+        self._n = 0
+        self._dtype = dtype
+        self._buffer = empty(capacity, dtype=dtype)
+        self._view = self._buffer[:0]
+        self._min = Inf
+        self._max = -Inf
+        if data is not None:
+            self.extend(data)
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def capacity(self):
+        return self._buffer.shape[0]
+
+    @property
+    def min(self):
+        return self._min
+
+    @property
+    def max(self):
+        return self._max
+
+    @property
+    def view(self):
+        return self._view
+
+    def is_view(self, a):
+        """
+        return True if ``a`` is the current view of this array
+        """
+        return a is self._view
+
+    def append(self, v):
+        n = self._n
+        if n == self._buffer.shape[0]:
+            self._grow(n + 1)
+
+        self._buffer[n] = v
+        self._update_bounds(self._buffer[n], self._buffer[n])
+        self._n = n + 1
+        self._view = self._buffer[: self._n]
+        return self._view
+
+    def extend(self, vs):
+        vs = asarray(vs, dtype=self._dtype).ravel()
+        m = vs.shape[0]
+        n = self._n
+        if n + m > self._buffer.shape[0]:
+            self._grow(n + m)
+
+        self._buffer[n : n + m] = vs
+        if m:
+            self._update_bounds(vs.min(), vs.max())
+        self._n = n + m
+        self._view = self._buffer[: self._n]
+        return self._view
+
+    def clear(self):
+        self._n = 0
+        self._view = self._buffer[:0]
+        self._min = Inf
+        self._max = -Inf
+
+    def _update_bounds(self, mi, ma):
+        if mi < self._min:
+            self._min = mi
+        if ma > self._max:
+            self._max = ma
+
+    def _grow(self, minimum):
+        capacity = max(self._buffer.shape[0], 1)
+        while capacity < minimum:
+            capacity *= 2
+
+        buf = empty(capacity, dtype=self._dtype)
+        buf[: self._n] = self._buffer[: self._n]
+        self._buffer = buf
+
+
+# ============= EOF =============================================
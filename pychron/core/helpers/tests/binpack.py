@@ -0,0 +1,86 @@
+import unittest
+
+from numpy import linspace, random, array_equal, allclose, float32
+
+from pychron.core.helpers.binpack import (
+    unpack,
+    unpack_columns,
+    unpack_array,
+    pack,
+    pack_array,
+    count_records,
+    encode_blob,
+)
+from pychron.processing.isotope import Isotope
+
+
+def make_signal(n=500):
+    xs = linspace(0, 100, n)
+    ys = 1000 - 2 * xs + random.normal(size=n)
+    return xs, ys
+
+
+class BinpackTestCase(unittest.TestCase):
+    def setUp(self):
+        self.xs, self.ys = make_signal()
+
+    def test_pack_array(self):
+        for fmt in (">ff", "<ff"):
+            a = pack(fmt, zip(self.xs, self.ys))
+            b = pack_array(fmt, self.xs, self.ys)
+            self.assertEqual(a, b)
+
+    def test_unpack_columns(self):
+        for fmt in (">ff", "<ff", "ff"):
+            blob = pack(fmt, zip(self.xs, self.ys))
+            ox, oy = unpack(blob, fmt)
+            x, y = unpack_columns(blob, fmt)
+            self.assertTrue(array_equal(ox, x))
+            self.assertTrue(array_equal(oy, y))
+
+    def test_unpack_decode(self):
+        blob = pack(">ff", zip(self.xs, self.ys))
+        x, y = unpack_columns(encode_blob(blob), decode=True)
+        self.assertTrue(allclose(x, self.xs.astype(float32)))
+
+    def test_truncated(self):
+        blob = pack(">ff", zip(self.xs, self.ys))[:-3]
+        x, y = unpack_columns(blob)
+        self.assertEqual(len(x), len(self.xs) - 1)
+        self.assertEqual(count_records(blob), len(self.xs) - 1)
+
+    def test_empty(self):
+        x, y = unpack_columns(b"")
+        self.assertEqual(len(x), 0)
+        self.assertEqual(len(y), 0)
+
+    def test_unpack_array_dtype(self):
+        blob = pack("<HH", ((1, 2), (3, 4)))
+        a = unpack_array(blob, "<HH")
+        self.assertEqual(list(a["f0"]), [1, 3])
+        self.assertEqual(list(a["f1"]), [2, 4])
+
+    def test_isotope_roundtrip(self):
+        iso = Isotope("Ar40", "H1")
+        iso.xs, iso.ys = self.xs, self.ys
+        blob = iso.pack(as_hex=False)
+
+        iso2 = Isotope("Ar40", "H1")
+        iso2.unpack_data(blob)
+        self.assertTrue(allclose(iso2.xs, self.xs, rtol=1e-6))
+        self.assertTrue(allclose(iso2.ys, self.ys, rtol=1e-6))
+
+    def test_isotope_reverse_unpack(self):
+        iso = Isotope("Ar40", "H1")
+        iso.reverse_unpack = True
+        iso.unpack_data(pack(">ff", zip(self.ys, self.xs)))
+        self.assertTrue(allclose(iso.xs, self.xs, rtol=1e-6))
+
+    def test_isotope_n_only(self):
+        iso = Isotope("Ar40", "H1")
+        iso.unpack_data(pack(">ff", zip(self.xs, self.ys)), n_only=True)
+        self.assertEqual(iso.n, len(self.xs))
+
+
+if __name__ == "__main__":
+    unittest.main()
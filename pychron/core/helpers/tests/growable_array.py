@@ -0,0 +1,66 @@
+import unittest
+
+from numpy import arange, array_equal
+
+from pychron.core.helpers.growable_array import GrowableArray
+from pychron.processing.isotope import Isotope
+
+
+class GrowableArrayTestCase(unittest.TestCase):
+    def test_append(self):
+        a = GrowableArray(capacity=2)
+        for i in range(10):
+            a.append(i)
+
+        self.assertEqual(len(a), 10)
+        self.assertGreaterEqual(a.capacity, 10)
+        self.assertTrue(array_equal(a.view, arange(10)))
+
+    def test_extend(self):
+        a = GrowableArray([1, 2, 3])
+        a.extend([4, 5])
+        self.assertTrue(array_equal(a.view, [1, 2, 3, 4, 5]))
+
+    def test_old_view_unchanged(self):
+        a = GrowableArray(capacity=4)
+        v = a.extend([1, 2])
+        a.append(3)
+        a.extend(arange(10))
+        self.assertTrue(array_equal(v, [1, 2]))
+
+    def test_is_view(self):
+        a = GrowableArray()
+        v = a.append(1)
+        self.assertTrue(a.is_view(v))
+        a.append(2)
+        self.assertFalse(a.is_view(v))
+
+    def test_bounds(self):
+        a = GrowableArray([3, 1, 2], capacity=2)
+        self.assertEqual((a.min, a.max), (1, 3))
+        a.append(-1)
+        a.extend([5, 0])
+        self.assertEqual((a.min, a.max), (-1, 5))
+
+        a.clear()
+        a.append(2)
+        self.assertEqual((a.min, a.max), (2, 2))
+
+    def test_isotope_add_datum(self):
+        iso = Isotope("Ar40", "H1")
+        for i in range(100):
+            iso.add_datum(i, 2 * i)
+
+        self.assertEqual(iso.xs.shape[0], 100)
+        self.assertTrue(array_equal(iso.ys, 2 * arange(100)))
+
+    def test_isotope_add_datum_after_reassign(self):
+        iso = Isotope("Ar40", "H1")
+        iso.add_datum(0, 0)
+        iso.xs, iso.ys = arange(5.0), arange(5.0)
+        iso.add_datum(5, 5)
+        self.assertTrue(array_equal(iso.xs, arange(6)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,6 +44,52 @@ from pychron.pychron_constants import PLUSMINUS, format_mswd
 logger = logging.getLogger("BaseRegressor")
 
 
+def truncate_excluded(truncate, xs):
+    """
+    return the indices of ``xs`` excluded by ``truncate`` or None if ``truncate`` is
+    invalid.
+
+    truncate: an expression of x e.g. "x>100" or an int, the last index to keep
+    """
+    m = re.match(r"[A-Za-z]+", truncate)
+    if m:
+        k = m.group(0)
+        exclude = eval(truncate, {k: xs})
+        return list(exclude.nonzero()[0])
+    else:
+        try:
+            trunc = int(truncate)
+            return [i for i, _ in enumerate(xs) if i > trunc]
+        except ValueError:
+            pass
+
+
+def format_percent_error(s, e):
+    try:
+        return "{:0.2}%".format(abs(e / s * 100))
+    except ZeroDivisionError:
+        return "Inf"
+
+
+def format_coefficients(coefficients, coefficient_errors, sig_figs=5):
+    cs = coefficients[::-1]
+    ce = coefficient_errors[::-1]
+
+    coeffs = []
+    for i, (ci, ei) in enumerate(zip(cs, ce)):
+        pp = "({})".format(format_percent_error(ci, ei))
+        fmt = "{{:0.{}e}}" if abs(ci) < math.pow(10, -sig_figs) else "{{:0.{}f}}"
+        ci = fmt.format(sig_figs).format(ci)
+
+        fmt = "{{:0.{}e}}" if abs(ei) < math.pow(10, -sig_figs) else "{{:0.{}f}}"
+        ei = fmt.format(sig_figs).format(ei)
+
+        vfmt = u"{{}}= {{}} {} {{}} {{}}".format(PLUSMINUS)
+        coeffs.append(vfmt.format(alphas(i), ci, ei, pp))
+
+    return u", ".join(coeffs)
+
+
 class BaseRegressor(HasTraits):
     ddof = 1
     xs = Array
@@ -238,31 +284,16 @@ class BaseRegressor(HasTraits):
     def set_truncate(self, trunc):
         self.truncate = trunc or ""
         if self.truncate:
-            m = re.match(r"[A-Za-z]+", self.truncate)
-            if m:
-                k = m.group(0)
-                exclude = eval(self.truncate, {k: self.xs})
-                excludes = list(exclude.nonzero()[0])
+            excludes = truncate_excluded(self.truncate, self.xs)
+            if excludes is not None:
                 self.truncate_excluded = excludes
                 self.dirty = True
-            else:
-                try:
-                    trunc = int(trunc)
-                    excludes = [i for i, _ in enumerate(self.xs) if i > trunc]
-
-                    self.truncate_excluded = excludes
-                    self.dirty = True
-                except ValueError:
-                    pass
 
     def calculate(self, *args, **kw):
         pass
 
     def format_percent_error(self, s, e):
-        try:
-            return "{:0.2}%".format(abs(e / s * 100))
-        except ZeroDivisionError:
-            return "Inf"
+        return format_percent_error(s, e)
 
     def predict(self, x):
         raise NotImplementedError
@@ -396,24 +427,7 @@ class BaseRegressor(HasTraits):
         return ((x - xm) ** 2).sum()
 
     def tostring(self, sig_figs=5):
-
-        cs = self.coefficients[::-1]
-        ce = self.coefficient_errors[::-1]
-
-        coeffs = []
-        for i, (ci, ei) in enumerate(zip(cs, ce)):
-            pp = "({})".format(self.format_percent_error(ci, ei))
-            fmt = "{{:0.{}e}}" if abs(ci) < math.pow(10, -sig_figs) else "{{:0.{}f}}"
-            ci = fmt.format(sig_figs).format(ci)
-
-            fmt = "{{:0.{}e}}" if abs(ei) < math.pow(10, -sig_figs) else "{{:0.{}f}}"
-            ei = fmt.format(sig_figs).format(ei)
-
-            vfmt = u"{{}}= {{}} {} {{}} {{}}".format(PLUSMINUS)
-            coeffs.append(vfmt.format(alphas(i), ci, ei, pp))
-
-        s = u", ".join(coeffs)
-        return s
+        return format_coefficients(self.coefficients, self.coefficient_errors, sig_figs)
 
     def make_equation(self):
         """
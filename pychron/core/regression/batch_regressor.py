@@ -0,0 +1,511 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+Fit many series at once.
+
+``BatchRegressor`` fits the polynomial, average and exponential regressions of many
+series, e.g. the isotope evolutions of a set of analyses, with stacked linear algebra
+instead of one regressor object per series. The results are those of
+``PolynomialRegressor``, ``MeanRegressor`` and ``ExponentialRegressor`` with the same
+outlier filtering.
+
+The series are padded to a common length. A boolean mask marks the points of a series
+that are used by a fit.
+"""
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import (
+    abs as nabs,
+    arange,
+    asarray,
+    einsum,
+    errstate,
+    exp,
+    eye,
+    full,
+    isfinite,
+    linalg,
+    newaxis,
+    ones,
+    sqrt,
+    where,
+    zeros,
+)
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.fits import FITS, fit_to_degree
+from pychron.core.regression.base_regressor import format_coefficients
+from pychron.core.regression.mean_regressor import format_mean
+from pychron.core.regression.tinv import tinv
+from pychron.pychron_constants import AUTO_LINEAR_PARABOLIC, EXPONENTIAL, SEM
+
+AVERAGE = "average"
+
+
+def is_batch_fit(fit, error_calc_type, filter_outliers_dict=None):
+    """
+    return True if BatchRegressor fits ``fit`` with ``error_calc_type`` exactly like the
+    regressor of the fit
+    """
+    if not fit:
+        return False
+
+    fod = filter_outliers_dict or {}
+    if fod.get("filter_outliers") and fod.get("use_iqr_filtering"):
+        return False
+
+    lfit = fit.lower()
+    if lfit in FITS or lfit == AUTO_LINEAR_PARABOLIC.lower():
+        return error_calc_type != "MC" and (error_calc_type or "").lower() != "msem"
+    elif lfit == AVERAGE:
+        return (error_calc_type or "").lower() != "msem"
+    elif lfit == EXPONENTIAL:
+        return True
+
+
+class SeriesFit(object):
+    """
+    the regression of one series
+    """
+
+    def __init__(
+        self,
+        fit,
+        intercept,
+        error,
+        coefficients,
+        coefficient_errors,
+        n,
+        total,
+        outliers,
+        rsquared=0,
+        rsquared_adj=0,
+        mswd=None,
+    ):
+        self.fit = fit
+        self.intercept = intercept
+        self.error = error
+        self.coefficients = coefficients
+        self.coefficient_errors = coefficient_errors
+        # number of points used by the fit and in the series
+        self.n = n
+        self.total = total
+        # indices of the points excluded by the outlier filter
+        self.outliers = outliers
+        self.rsquared = rsquared
+        self.rsquared_adj = rsquared_adj
+        self.mswd = mswd
+
+    @property
+    def noutliers(self):
+        return self.total - self.n
+
+    def tostring(self, sig_figs=5):
+        if self.fit == AVERAGE:
+            std, sem = self.coefficient_errors
+            return format_mean(self.intercept, std, sem, std, self.n, self.total)
+        return format_coefficients(self.coefficients, self.coefficient_errors, sig_figs)
+
+
+class BatchRegressor(object):
+    def __init__(self, fit="linear", error_calc_type="SEM", filter_outliers_dict=None):
+        self.fit = fit
+        self.error_calc_type = error_calc_type
+        self.filter_outliers_dict = filter_outliers_dict or {}
+
+        # exponential
+        self.max_iterations = 200
+        self.tolerance = 1e-10
+
+    def fit_series(self, xs, ys, excluded=None, yserr=None):
+        """
+        xs, ys: lists of 1D arrays. one per series
+        excluded: list of lists of indices excluded from the fit of each series e.g.
+            truncated
+        yserr: list of 1D arrays. only used for the mswd of polynomial fits
+
+        returns a list of SeriesFit. an item is None if the series could not be fit
+        """
+        m = len(xs)
+        if not m:
+            return []
+
+        ns = asarray([len(x) for x in xs])
+        npts = max(ns.max(), 1)
+        X, Y = zeros((m, npts)), zeros((m, npts))
+        E = ones((m, npts))
+        valid = arange(npts)[newaxis, :] < ns[:, newaxis]
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            X[i, : ns[i]] = x
+            Y[i, : ns[i]] = y
+            if yserr is not None and len(yserr[i]):
+                E[i, : ns[i]] = yserr[i]
+
+        mask = valid.copy()
+        if excluded:
+            for i, ex in enumerate(excluded):
+                ex = [e for e in ex if e < ns[i]]
+                if ex:
+                    mask[i, ex] = False
+
+        lfit = self.fit.lower()
+        if lfit == AVERAGE:
+            results = self._fit_average(Y, valid, mask)
+        elif lfit == EXPONENTIAL:
+            results = self._fit_exponential(X, Y, valid, mask, ns)
+        elif lfit == AUTO_LINEAR_PARABOLIC.lower():
+            lr = self._fit_polynomial(X, Y, E, valid, mask, 1, yserr is not None)
+            pr = self._fit_polynomial(X, Y, E, valid, mask, 2, yserr is not None)
+            results = []
+            for li, pi in zip(lr, pr):
+                # the regressor takes the parabolic fit unless the linear fit is better
+                if li is not None and (pi is None or li.rsquared_adj > pi.rsquared_adj):
+                    results.append(li)
+                else:
+                    results.append(pi)
+        else:
+            results = self._fit_polynomial(
+                X, Y, E, valid, mask, fit_to_degree(lfit), yserr is not None
+            )
+
+        return results
+
+    # private
+    def _filter(self, Y, valid, mask, fitfunc, refit=True):
+        """
+        outlier filtering of ``BaseRegressor.calculate_filtered_data``.
+
+        fitfunc(fmask, smask) returns (model of all the points, bound scale) where the
+        fit is made with the points of ``fmask`` and the scale is calculated from the
+        points of ``smask``. ``refit`` is False for regressors that do not exclude the
+        outliers found by earlier iterations from the fit
+
+        returns the mask of the points to fit and the outlier mask
+        """
+        fod = self.filter_outliers_dict
+        outliers = zeros(mask.shape, dtype=bool)
+        if fod.get("filter_outliers", False):
+            nsigma = fod.get("std_devs", 2)
+            for _ in range(fod.get("iterations", 1)):
+                cmask = mask & ~outliers
+                model, s = fitfunc(cmask if refit else mask, cmask)
+                if fod.get("use_standard_deviation_filtering"):
+                    s = _std(Y, cmask)
+
+                residuals = nabs(Y - model)
+                outliers |= valid & (residuals >= (s * nsigma)[:, newaxis])
+
+        return mask & ~outliers, outliers
+
+    def _outlier_indices(self, outliers):
+        return [where(o)[0] for o in outliers]
+
+    def _fit_average(self, Y, valid, mask):
+        def fitfunc(fmask, smask):
+            return _mean(Y, fmask)[:, newaxis], _std(Y, smask)
+
+        cmask, outliers = self._filter(Y, valid, mask, fitfunc)
+        n = cmask.sum(axis=1)
+        means = _mean(Y, cmask)
+        stds = _std(Y, cmask)
+        sems = where(n > 0, stds * sqrt(n.clip(1)) ** -1, 0)
+
+        ec = self.error_calc_type
+        if not ec:
+            ec = "SEM" if "sem" in self.fit.lower() else "SD"
+        errors = sems if ec.lower() == SEM.lower() else stds
+
+        results = []
+        for i, oi in enumerate(self._outlier_indices(outliers)):
+            if n[i]:
+                r = SeriesFit(
+                    AVERAGE,
+                    means[i],
+                    errors[i],
+                    [means[i]],
+                    [stds[i], sems[i]],
+                    int(n[i]),
+                    int(valid[i].sum()),
+                    oi,
+                )
+            else:
+                r = None
+            results.append(r)
+        return results
+
+    def _fit_polynomial(self, X, Y, E, valid, mask, degree, use_mswd=False):
+        q = degree + 1
+        V = X[:, :, newaxis] ** arange(q)
+
+        def solve(fmask):
+            # the pseudo inverse of the masked design matrix, as statsmodels' OLS
+            pinv = linalg.pinv(V * fmask[:, :, newaxis])
+            beta = einsum("mqn,mn->mq", pinv, Y * fmask)
+            return pinv, beta
+
+        def fitfunc(fmask, smask):
+            _, beta = solve(fmask)
+            model = einsum("mnq,mq->mn", V, beta)
+            n = fmask.sum(axis=1)
+            ssr = ((Y - model) ** 2 * fmask).sum(axis=1)
+            return model, _sef(ssr, n, q)
+
+        cmask, outliers = self._filter(Y, valid, mask, fitfunc)
+        pinv, beta = solve(cmask)
+        cov = einsum("mqn,mpn->mqp", pinv, pinv)
+        model = einsum("mnq,mq->mn", V, beta)
+
+        n = cmask.sum(axis=1)
+        ssr = ((Y - model) ** 2 * cmask).sum(axis=1)
+        sef = _sef(ssr, n, q)
+
+        ybar = _mean(Y, cmask)
+        tss = ((Y - ybar[:, newaxis]) ** 2 * cmask).sum(axis=1)
+        with _ignore():
+            rsquared = 1 - ssr / tss
+            rsquared_adj = 1 - (n - 1) / (n - q) * (1 - rsquared)
+
+        cov00 = cov[:, 0, 0]
+        ec = self.error_calc_type
+        if not ec or ec == "CI":
+            errors = self._confidence_interval(X, cmask, n, ssr)
+        elif ec.lower() == SEM.lower():
+            errors = sef * sqrt(cov00)
+        else:
+            errors = sqrt(sef**2 + sef**2 * cov00)
+
+        mswds = None
+        if use_mswd:
+            mswds = _mswd(Y, E, cmask, q)
+
+        with _ignore():
+            bse = sqrt(einsum("mqq->mq", cov) * (sef**2)[:, newaxis])
+
+        fit = FITS[degree - 1]
+        results = []
+        for i, oi in enumerate(self._outlier_indices(outliers)):
+            if n[i] > q and isfinite(beta[i]).all():
+                r = SeriesFit(
+                    fit,
+                    beta[i, 0],
+                    errors[i],
+                    list(beta[i]),
+                    list(bse[i]),
+                    int(n[i]),
+                    int(valid[i].sum()),
+                    oi,
+                    rsquared=rsquared[i],
+                    rsquared_adj=rsquared_adj[i],
+                    mswd=None if mswds is None else mswds[i],
+                )
+            else:
+                r = None
+            results.append(r)
+
+        return results
+
+    def _confidence_interval(self, X, cmask, n, ssr, confidence=95):
+        """
+        ``BaseRegressor._calculate_confidence_interval`` at x=0
+        """
+        alpha = 1.0 - confidence / 100.0
+        ts = {ni: tinv(alpha, ni - 1) for ni in set(n.tolist()) if ni > 2}
+        ti = asarray([ts.get(ni, 0) for ni in n.tolist()])
+
+        xm = _mean(X, cmask)
+        ssx = ((X - xm[:, newaxis]) ** 2 * cmask).sum(axis=1)
+        with _ignore():
+            syx = sqrt(ssr / (n - 2))
+            d = 1 / n + xm**2 / ssx
+            cors = ti * syx * sqrt(d) / 2.0
+
+        return where(n > 2, cors, 0)
+
+    def _fit_exponential(self, X, Y, valid, mask, ns):
+        """
+        y = a*exp(-b*x)+c fit by Levenberg-Marquardt, one damping factor per series
+        """
+        # the initial guesses of ExponentialRegressor
+        m = X.shape[0]
+        idx = arange(m)
+        decay = Y[idx, 0] > Y[idx, (ns - 1).clip(0)]
+        p0 = zeros((m, 3))
+        p0[decay] = 100, 0.1, -100
+        p0[~decay] = -10, 0.1, 10
+
+        state = {}
+
+        def fitfunc(fmask, smask):
+            p, ok = self._levenberg_marquardt(X, Y, fmask, p0)
+            state["ok"] = ok
+            model = _exponential(X, p)
+            n = smask.sum(axis=1)
+            ssr = ((Y - model) ** 2 * smask).sum(axis=1)
+            return model, _sef(ssr, n, 3)
+
+        # ExponentialRegressor fits the data without the outliers of earlier iterations
+        cmask, outliers = self._filter(Y, valid, mask, fitfunc, refit=False)
+        ok = state.get("ok", True)
+
+        p, fok = self._levenberg_marquardt(X, Y, cmask, p0)
+        ok = ok & fok
+        model = _exponential(X, p)
+        n = cmask.sum(axis=1)
+        ssr = ((Y - model) ** 2 * cmask).sum(axis=1)
+
+        J = _exponential_jacobian(X, p) * cmask[:, :, newaxis]
+        with _ignore():
+            JTJ = einsum("mnq,mnp->mqp", J, J)
+            JTJ[~ok] = eye(3)
+            cov = linalg.pinv(JTJ) * (ssr / (n - 3))[:, newaxis, newaxis]
+            perr = sqrt(einsum("mqq->mq", cov))
+
+        results = []
+        for i, oi in enumerate(self._outlier_indices(outliers)):
+            if ok[i] and n[i] > 3:
+                a, b, c = p[i]
+                # ExponentialRegressor.predict_error(0) is 0
+                r = SeriesFit(
+                    EXPONENTIAL,
+                    a + c,
+                    0.0,
+                    list(p[i]),
+                    list(perr[i]),
+                    int(n[i]),
+                    int(valid[i].sum()),
+                    oi,
+                )
+            else:
+                r = None
+            results.append(r)
+        return results
+
+    def _levenberg_marquardt(self, X, Y, fmask, p0):
+        """
+        returns the parameters and a boolean array, True if the fit of a series
+        converged
+        """
+        p = p0.copy()
+        m = p.shape[0]
+        lam = full(m, 1e-3)
+        I = eye(3)
+
+        def cost(pp):
+            with _ignore():
+                r = (Y - _exponential(X, pp)) * fmask
+                c = (r**2).sum(axis=1)
+            return where(isfinite(c), c, float("inf"))
+
+        c = cost(p)
+        converged = zeros(m, dtype=bool)
+        for _ in range(self.max_iterations):
+            active = ~converged
+            if not active.any():
+                break
+
+            with _ignore():
+                r = (Y - _exponential(X, p)) * fmask
+                J = _exponential_jacobian(X, p) * fmask[:, :, newaxis]
+                JTJ = einsum("mnq,mnp->mqp", J, J)
+                g = einsum("mnq,mn->mq", J, r)
+
+                A = JTJ + lam[:, newaxis, newaxis] * JTJ * I
+                A[~active] = I
+                A[~isfinite(A).all(axis=(1, 2))] = I
+                try:
+                    dp = linalg.solve(A, g[:, :, newaxis])[:, :, 0]
+                except linalg.LinAlgError:
+                    dp = zeros(p.shape)
+                    for i in where(active)[0]:
+                        try:
+                            dp[i] = linalg.solve(A[i], g[i])
+                        except linalg.LinAlgError:
+                            pass
+
+            dp[~active] = 0
+            pn = p + dp
+            cn = cost(pn)
+            better = active & (cn < c)
+
+            dc = nabs(c - cn)
+            step = (dp**2).sum(axis=1) ** 0.5
+            pnorm = (p**2).sum(axis=1) ** 0.5
+
+            p[better] = pn[better]
+            lam = where(better, lam / 10, lam * 10)
+
+            done = better & (
+                (dc <= self.tolerance * c) | (step <= self.tolerance * (pnorm + 1e-30))
+            )
+            # a damping factor this large means no step reduces the cost, i.e. at the
+            # minimum
+            stalled = active & ~better & (lam > 1e16)
+            converged |= done | stalled
+            c = where(better, cn, c)
+
+        return p, converged & isfinite(p).all(axis=1)
+
+
+def _exponential(X, p):
+    a, b, c = (p[:, i, newaxis] for i in range(3))
+    return a * exp(-b * X) + c
+
+
+def _exponential_jacobian(X, p):
+    a, b = p[:, 0, newaxis], p[:, 1, newaxis]
+    e = exp(-b * X)
+    return asarray([e, -a * X * e, ones(X.shape)]).transpose(1, 2, 0)
+
+
+def _mean(Y, mask):
+    n = mask.sum(axis=1)
+    return (Y * mask).sum(axis=1) / n.clip(1)
+
+
+def _std(Y, mask, ddof=1):
+    """
+    ``BaseRegressor.std``. 0 if there are not more than ``ddof`` points
+    """
+    n = mask.sum(axis=1)
+    m = _mean(Y, mask)
+    ss = ((Y - m[:, newaxis]) ** 2 * mask).sum(axis=1)
+    return where(n > ddof, sqrt(ss / (n - ddof).clip(1)), 0)
+
+
+def _sef(ssr, n, q):
+    """
+    ``BaseRegressor.calculate_standard_error_fit``
+    """
+    with _ignore():
+        return sqrt(ssr / (n - q))
+
+
+def _mswd(Y, E, mask, k):
+    """
+    ``calculate_mswd`` of the masked values of each series
+    """
+    W = mask / E**2
+    wm = (Y * W).sum(axis=1) / W.sum(axis=1)
+    ssw = ((Y - wm[:, newaxis]) ** 2 * W).sum(axis=1)
+    n = mask.sum(axis=1)
+    return where(n > k, ssw / (n - k).clip(1), 0)
+
+
+def _ignore():
+    return errstate(divide="ignore", invalid="ignore", over="ignore")
+
+
+# ============= EOF =============================================
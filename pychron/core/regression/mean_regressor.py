@@ -17,11 +17,27 @@
 # ============= enthought library imports =======================
 # ============= standard library imports ========================
 
-from numpy import average, where, full
+from numpy import average, where, full, asarray, repeat
 
 from pychron.core.helpers.formatting import floatfmt
 from pychron.pychron_constants import SEM, MSEM
-from .base_regressor import BaseRegressor
+from .base_regressor import BaseRegressor, format_percent_error
+
+
+def format_mean(m, std, sem, se, n, tn):
+    sm = floatfmt(m, n=9)
+    sstd = floatfmt(std, n=9)
+    ssem = floatfmt(sem, n=9)
+    sse = floatfmt(se, n=9)
+
+    pstd = format_percent_error(m, std)
+    psem = format_percent_error(m, sem)
+    pse = format_percent_error(m, se)
+
+    s = "mean={}, n={}({}), std={} ({}), sem={} ({}) se={} ({})".format(
+        sm, n, tn, sstd, pstd, ssem, psem, sse, pse
+    )
+    return s
 
 
 class MeanRegressor(BaseRegressor):
@@ -33,6 +49,14 @@ class MeanRegressor(BaseRegressor):
     def fast_predict2(self, endog, exog):
         return full(exog.shape[0], endog.mean())
 
+    def fast_predict_batch(self, endog, exog):
+        return self._repeat_batch(endog.mean(axis=1), exog)
+
+    def _repeat_batch(self, means, exog):
+        exog = asarray(exog)
+        npts = exog.shape[1] if exog.ndim == 3 else exog.shape[0]
+        return repeat(means[:, None], npts, axis=1)
+
     def calculate(self, filtering=False, **kw):
         # cxs, cys = self.pre_clean_ys, self.pre_clean_ys
         if not filtering:
@@ -94,29 +118,9 @@ sem={}
         return ly, uy
 
     def tostring(self, sig_figs=3):
-
-        m = self.mean
-        std = self.std
-        sem = self.sem
-        se = self.se
-
-        sm = floatfmt(m, n=9)
-        sstd = floatfmt(std, n=9)
-        ssem = floatfmt(sem, n=9)
-        sse = floatfmt(se, n=9)
-
-        pstd = self.format_percent_error(m, std)
-        psem = self.format_percent_error(m, sem)
-        pse = self.format_percent_error(m, se)
-
-        n = self.n
-        tn = self.xs.shape[0]
-        s = "mean={}, n={}({}), std={} ({}), sem={} ({}) se={} ({})".format(
-            sm, n, tn, sstd, pstd, ssem, psem, sse, pse
+        return format_mean(
+            self.mean, self.std, self.sem, self.se, self.n, self.xs.shape[0]
         )
-        # s = fmt.format(m, std, self.percent_error(m, std),
-        #                sem, self.percent_error(m, sem))
-        return s
 
     def make_equation(self):
         return "Mean"
@@ -165,6 +169,10 @@ class WeightedMeanRegressor(MeanRegressor):
         mean = average(endog, weights=ws)
         return full(exog.shape[0], mean)
 
+    def fast_predict_batch(self, endog, exog):
+        ws = self._get_weights()
+        return self._repeat_batch(average(endog, weights=ws, axis=1), exog)
+
     @property
     def se(self):
         """
@@ -26,6 +26,7 @@ from numpy import (
     hstack,
     ones_like,
     array,
+    einsum,
 )
 from statsmodels.api import OLS
 from traits.api import Int, Property
@@ -84,12 +85,33 @@ class OLSRegressor(BaseRegressor):
 
         currently useful for monte_carlo_estimation
         """
+        ols = self._ols
         if not hasattr(self, "pinv_wexog"):
-            self.pinv_wexog = linalg.pinv(self._ols.wexog)
-        beta = dot(self.pinv_wexog, endog)
+            self.pinv_wexog = linalg.pinv(ols.wexog)
+
+        # wexog is whitened so endog must be as well. matters for WLS only
+        beta = dot(self.pinv_wexog, ols.whiten(endog))
 
         return dot(exog, beta)
 
+    def fast_predict_batch(self, endog, exog):
+        """
+        predict values for many sets of endog at once. all the fits are solved with a single
+        lstsq call using the sets as stacked right hand sides.
+
+        used by the monte carlo estimators
+
+        :param endog: (ntrials, n) array
+        :param exog: (npts, k) array, or (ntrials, npts, k) if each trial has its own exog
+        :return: (ntrials, npts) array
+        """
+        ols = self._ols
+        wendog = ols.whiten(asarray(endog).T)
+        beta = linalg.lstsq(ols.wexog, wendog, rcond=None)[0]
+        if exog.ndim == 3:
+            return einsum("tpk,kt->tp", exog, beta)
+        return dot(exog, beta).T
+
     def determine_fit(self):
         if self._fit == AUTO_LINEAR_PARABOLIC:
             self.set_degree("linear", refresh=False)
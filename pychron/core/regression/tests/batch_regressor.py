@@ -0,0 +1,137 @@
+import unittest
+
+from numpy import exp, linspace, random
+
+from pychron.core.regression.batch_regressor import BatchRegressor, is_batch_fit
+from pychron.core.regression.mean_regressor import MeanRegressor
+from pychron.core.regression.ols_regressor import PolynomialRegressor
+from pychron.processing.isotope import Isotope, fit_isotopes
+
+FOD = dict(filter_outliers=True, iterations=2, std_devs=2)
+
+
+def make_series(m, n=60, seed=3, outliers=True, kind="linear"):
+    rnd = random.RandomState(seed)
+    xs, ys = [], []
+    for i in range(m):
+        x = linspace(5, 100, n - i % 7)
+        if kind == "exponential":
+            y = 5 * exp(-0.03 * x) + 2 + rnd.normal(0, 0.01, x.shape)
+        else:
+            y = 10 + rnd.uniform(-0.1, 0.1) * x + 1e-4 * x**2
+            y += rnd.normal(0, 0.2, x.shape)
+
+        if outliers:
+            y[rnd.randint(0, x.shape[0], 2)] += 3
+        xs.append(x)
+        ys.append(y)
+    return xs, ys
+
+
+def make_isotope(x, y, fit, error_type="SEM", fod=None, truncate=None):
+    iso = Isotope("Ar40", "H1")
+    iso.xs, iso.ys = x, y
+    iso.fit = fit
+    iso.error_type = error_type
+    iso.filter_outliers_dict = dict(fod or {})
+    iso.truncate = truncate
+    return iso
+
+
+class BatchRegressorTestCase(unittest.TestCase):
+    def _compare(
+        self, fit, error_type="SEM", fod=None, kind="linear", places=7, outliers=True
+    ):
+        xs, ys = make_series(12, kind=kind, outliers=outliers)
+        bfs = BatchRegressor(fit, error_type, fod).fit_series(xs, ys)
+        for x, y, bf in zip(xs, ys, bfs):
+            iso = make_isotope(x, y, fit, error_type, fod)
+            reg = iso.regressor
+            # the exponential regressor has no fit name
+            self.assertEqual(bf.fit, iso.fit or fit)
+            self.assertAlmostEqual(bf.intercept, reg.predict(0), places=places)
+            self.assertAlmostEqual(bf.error, reg.predict_error(0), places=places)
+            self.assertEqual(list(bf.outliers), sorted(reg.outlier_excluded))
+            if isinstance(reg, PolynomialRegressor):
+                self.assertAlmostEqual(bf.rsquared_adj, reg.rsquared_adj)
+                self.assertEqual(bf.tostring(), reg.tostring())
+            elif isinstance(reg, MeanRegressor):
+                self.assertEqual(bf.tostring(), reg.tostring())
+
+    def test_is_batch_fit(self):
+        self.assertTrue(is_batch_fit("linear", "SEM"))
+        self.assertTrue(is_batch_fit("parabolic", "CI"))
+        self.assertTrue(is_batch_fit("average", "SD"))
+        self.assertTrue(is_batch_fit("exponential", "SEM"))
+        self.assertFalse(is_batch_fit("linear", "MC"))
+        self.assertFalse(is_batch_fit("average", "MSEM"))
+        self.assertFalse(is_batch_fit("custom:a*x", "SEM"))
+        fod = dict(FOD, use_iqr_filtering=True)
+        self.assertFalse(is_batch_fit("linear", "SEM", fod))
+
+    def test_polynomial(self):
+        for fit in ("linear", "parabolic", "cubic"):
+            for error_type in ("SEM", "SD", "CI"):
+                self._compare(fit, error_type)
+
+    def test_polynomial_filtered(self):
+        for fit in ("linear", "parabolic"):
+            self._compare(fit, "SEM", FOD)
+            self._compare(fit, "SEM", dict(FOD, use_standard_deviation_filtering=True))
+
+    def test_auto(self):
+        self._compare("Auto Linear/Parabolic", "SEM")
+        self._compare("Auto Linear/Parabolic", "SEM", FOD)
+
+    def test_average(self):
+        for error_type in ("SEM", "SD"):
+            self._compare("average", error_type)
+            self._compare("average", error_type, FOD)
+
+    def test_exponential(self):
+        # the cost of an exponential fit to data with outliers is too flat to compare the
+        # minima of different solvers
+        self._compare("exponential", kind="exponential", places=6, outliers=False)
+        fod = dict(FOD, iterations=1)
+        self._compare("exponential", "SEM", fod, kind="exponential", places=6)
+
+    def test_truncate(self):
+        xs, ys = make_series(4)
+        isos = [make_isotope(x, y, "linear", truncate="x>80") for x, y in zip(xs, ys)]
+        self.assertEqual(fit_isotopes(isos), 4)
+        for x, y, iso in zip(xs, ys, isos):
+            expected = make_isotope(x, y, "linear", truncate="x>80")
+            self.assertAlmostEqual(iso.value, expected.value)
+            self.assertAlmostEqual(iso.error, expected.error)
+            self.assertEqual(iso.fn, expected.fn)
+
+    def test_fit_isotopes(self):
+        xs, ys = make_series(6)
+        fits = ("linear", "parabolic", "average", "linear", "custom:a*x+b", "linear")
+        isos = [
+            make_isotope(x, y, f, "MC" if i == 5 else "SEM", FOD)
+            for i, (x, y, f) in enumerate(zip(xs, ys, fits))
+        ]
+        # custom fits and MC errors are left to the regressor
+        self.assertEqual(fit_isotopes(isos), 4)
+        self.assertIsNone(isos[4].get_batch_fit())
+        self.assertIsNone(isos[5].get_batch_fit())
+
+        for x, y, f, iso in zip(xs, ys, fits, isos[:4]):
+            expected = make_isotope(x, y, f, "SEM", FOD)
+            self.assertIsNotNone(iso.get_batch_fit())
+            self.assertAlmostEqual(iso.value, expected.value)
+            self.assertAlmostEqual(iso.error, expected.error)
+            self.assertEqual(iso.noutliers(), expected.noutliers())
+            self.assertEqual(iso.regression_string(), expected.regression_string())
+
+        # changing the fit drops the batch fit
+        iso = isos[0]
+        iso.fit = "parabolic"
+        self.assertIsNone(iso.get_batch_fit())
+        expected = make_isotope(xs[0], ys[0], "parabolic", "SEM", FOD)
+        self.assertAlmostEqual(iso.value, expected.value)
+
+
+if __name__ == "__main__":
+    unittest.main()
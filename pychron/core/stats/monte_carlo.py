@@ -17,7 +17,7 @@
 # ============= enthought library imports =======================
 # ============= standard library imports ========================
 
-from numpy import zeros, percentile, array, random, abs as nabs, column_stack
+from numpy import zeros, percentile, random, abs as nabs, column_stack
 from scipy.stats import norm
 
 
@@ -25,31 +25,46 @@ from scipy.stats import norm
 
 
 class MonteCarloEstimator(object):
-    def __init__(self, ntrials, regressor, seed=None):
+    """
+    the trials are run ``chunk_size`` at a time. the perturbed ys (and exogs) are only
+    drawn for the current chunk so that memory for the inputs is bounded by chunk_size.
+    the predictions of all the trials, (ntrials, npts), are kept for the percentiles.
+
+    if the regressor provides ``fast_predict_batch`` the trials of a chunk are solved
+    with matrix operations. otherwise each trial is solved with ``fast_predict2``
+    """
+
+    def __init__(self, ntrials, regressor, seed=None, chunk_size=2000):
         self.regressor = regressor
         self.ntrials = ntrials
         self.seed = seed
+        self.chunk_size = chunk_size
 
     def _calculate(self, nominal_ys, ps):
         res = nominal_ys - ps
         pct = (15.87, 84.13)
 
-        a, b = array([percentile(ri, pct) for ri in res.T]).T
+        a, b = percentile(res, pct, axis=0)
         a, b = nabs(a), nabs(b)
         return (a + b) * 0.5
 
-    def _get_dist(self, n, npts):
+    def _get_dist(self):
         if self.seed:
             random.seed(self.seed)
 
-        ndist = norm()
-        ntrials = self.ntrials
+        return norm()
 
-        ga = ndist.rvs((ntrials, n))
-        ps = zeros((ntrials, npts))
-        return ndist, ga, ps
+    def _chunks(self):
+        ntrials = self.ntrials
+        chunk = max(1, self.chunk_size)
+        for i in range(0, ntrials, chunk):
+            yield slice(i, min(i + chunk, ntrials))
 
     def _estimate(self, pts, pexog, ys=None, yserr=None):
+        """
+        pexog is either an exog array or a callable that takes a slice of trials and returns a
+        (ntrials, npts, k) exog array for those trials
+        """
         reg = self.regressor
         nominal_ys = reg.predict(pts)
 
@@ -60,17 +75,21 @@ class MonteCarloEstimator(object):
 
         n, npts = len(ys), len(pts)
 
-        ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-        pred = reg.fast_predict2
-        yp = ys + yserr * ga
-
-        if hasattr(pexog, "__call__"):
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog(i))
-        else:
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog)
+        ndist = self._get_dist()
+        ps = zeros((self.ntrials, npts))
+
+        is_callable = hasattr(pexog, "__call__")
+        batch = hasattr(reg, "fast_predict_batch")
+        for sl in self._chunks():
+            m = sl.stop - sl.start
+            yp = ys + yserr * ndist.rvs((m, n))
+            exog = pexog(sl) if is_callable else pexog
+            if batch:
+                ps[sl] = reg.fast_predict_batch(yp, exog)
+            else:
+                pred = reg.fast_predict2
+                for j in range(m):
+                    ps[sl.start + j] = pred(yp[j], exog[j] if is_callable else exog)
 
         return nominal_ys, self._calculate(nominal_ys, ps)
 
@@ -88,19 +107,17 @@ class FluxEstimator(MonteCarloEstimator):
         reg = self.regressor
         ox, oy = pts.T
 
-        n, npts = len(reg.ys), len(pts)
-
-        ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-
-        pgax = ndist.rvs((ntrials, npts))
-        pgay = ndist.rvs((ntrials, npts))
-
-        pgax *= error
-        pgay *= error
+        npts = len(pts)
+        ndist = norm()
 
-        def get_pexog(i):
-            return reg.get_exog(column_stack((ox + pgax[i], oy + pgay[i])))
+        def get_pexog(sl):
+            # perturb the positions of the trials in the slice and build their exog with
+            # one get_exog call
+            m = sl.stop - sl.start
+            x = ox + ndist.rvs((m, npts)) * error
+            y = oy + ndist.rvs((m, npts)) * error
+            exog = reg.get_exog(column_stack((x.ravel(), y.ravel())))
+            return exog.reshape(m, npts, -1)
 
         return self._estimate(pts, get_pexog, yserr=0)
 
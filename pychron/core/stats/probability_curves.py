@@ -17,34 +17,181 @@
 # ============= enthought library imports =======================
 
 # ============= standard library imports ========================
-from numpy import linspace, zeros, exp, pi, full
+from collections import OrderedDict
 
+from numpy import (
+    abs as nabs,
+    add,
+    arange,
+    asarray,
+    ceil,
+    exp,
+    floor,
+    linspace,
+    log,
+    pi,
+    sqrt,
+    zeros,
+)
 
 # ============= local library imports  ==========================
 
+# max number of elements of the (ages x bins) array evaluated at once
+CHUNK_SIZE = 2**20
 
-def cumulative_probability(ages, errors, xmi, xma, n=100):
-    x = linspace(xmi, xma, n)
-    probs = zeros(n)
+# number of ages above which the curve is calculated by binned convolution
+BINNED_THRESHOLD = 5000
 
-    for ai, ei in zip(ages, errors):
-        if abs(ai) < 1e-10 or abs(ei) < 1e-10:
-            continue
 
-        # calculate probability curve for ai+/-ei
+def _clean(ages, errors):
+    ages = asarray(ages, dtype=float)
+    errors = asarray(errors, dtype=float)
+    idx = (nabs(ages) >= 1e-10) & (nabs(errors) >= 1e-10)
+    return ages[idx], nabs(errors[idx])
+
+
+def _summed_pdf(x, ages, errors):
+    """
+    sum of the normal pdfs of ``ages`` +/- ``errors`` at ``x``. the pdfs are evaluated
+    in chunks of ages to bound the memory used
+    """
+    probs = zeros(x.shape[0])
+    step = max(1, CHUNK_SIZE // max(1, x.shape[0]))
+    for i in range(0, ages.shape[0], step):
+        a = ages[i : i + step, None]
+        es2 = 2 * errors[i : i + step, None] ** 2
+
         # p=1/(2*pi*sigma2) *exp (-(x-u)**2)/(2*sigma2)
         # see http://en.wikipedia.org/wiki/Normal_distribution
-        ds = (x - full(n, ai)) ** 2
-        es2 = full(n, 2 * ei * ei)
-        gs = (es2 * pi) ** -0.5 * exp(-ds / es2)
+        # in place to avoid temporary (ages x bins) arrays
+        gs = x - a
+        gs *= gs
+        gs /= -es2
+        exp(gs, out=gs)
+        gs *= (es2 * pi) ** -0.5
+        probs += gs.sum(axis=0)
+    return probs
+
+
+def _binned_pdf(x, ages, errors, nsigma=5, sigma_ratio=1.05):
+    """
+    approximate ``_summed_pdf`` on the evenly spaced ``x``.
+
+    the ages are grouped by error into log spaced bins ``sigma_ratio`` wide. the ages of a
+    group are histogrammed onto the grid, extended by ``nsigma`` errors each side, and
+    convolved with the normal kernel of the group. ages too far from the grid and groups
+    with kernels narrower than two bins or much wider than the grid are summed exactly
+    """
+    from scipy.signal import fftconvolve
+
+    n = x.shape[0]
+    dx = x[1] - x[0]
+    probs = zeros(n)
+
+    gidx = floor(log(errors / errors.min()) / log(sigma_ratio)).astype(int)
+    for g in range(gidx.max() + 1):
+        idx = gidx == g
+        if not idx.any():
+            continue
+
+        ga, ge = ages[idx], errors[idx]
+        sigma = errors.min() * sigma_ratio ** (g + 0.5)
+        pad = int(ceil(nsigma * sigma / dx))
+        if sigma < 2 * dx or pad > 4 * n:
+            probs += _summed_pdf(x, ga, ge)
+            continue
+
+        # position of the ages on the extended grid
+        pos = (ga - x[0]) / dx + pad
+        m = n + 2 * pad
+        inside = (pos >= 0) & (pos < m - 1)
+        if not inside.all():
+            probs += _summed_pdf(x, ga[~inside], ge[~inside])
+            pos = pos[inside]
+
+        # linear interpolation of each age onto its two neighboring bins
+        i0 = floor(pos).astype(int)
+        w1 = pos - i0
+        hist = zeros(m)
+        add.at(hist, i0, 1 - w1)
+        add.at(hist, i0 + 1, w1)
+
+        k = arange(-pad, pad + 1) * dx
+        kernel = (2 * pi * sigma**2) ** -0.5 * exp(-(k**2) / (2 * sigma**2))
+        probs += fftconvolve(hist, kernel, mode="same")[pad : pad + n]
+
+    return probs.clip(0)
+
+
+def cumulative_probability(ages, errors, xmi, xma, n=100):
+    """
+    sum of the normal pdfs of ``ages`` +/- ``errors`` at ``n`` points between ``xmi`` and
+    ``xma``. ages or errors of 0 are skipped
+
+    returns x, probs
+    """
+    x = linspace(xmi, xma, n)
+    ages, errors = _clean(ages, errors)
+    if not ages.shape[0]:
+        return x, zeros(n)
 
-        # cumulate probabilities
-        # numpy element_wise addition
-        probs += gs
+    if ages.shape[0] > BINNED_THRESHOLD and n > 1:
+        probs = _binned_pdf(x, ages, errors)
+    else:
+        probs = _summed_pdf(x, ages, errors)
 
     return x, probs
 
 
+def asymptotic_limits(ages, errors, xmi, xma, tol=10, n=100):
+    """
+    return the limits where the cumulative probability curve falls below ``tol`` percent
+    of its maximum.
+
+    ``xmi``, ``xma`` are the nominal limits. the maximum is that of the curve between them.
+    the curve increases monotonically from either side towards the ages, so each limit is
+    bracketed by the nearest age and the point where every pdf is below 1/N of the
+    threshold, i.e. age -/+ k*error, and found by bisection
+    """
+    ages, errors = _clean(ages, errors)
+    if not ages.shape[0]:
+        return xmi, xma
+
+    _, probs = cumulative_probability(ages, errors, xmi, xma, n)
+    t = tol * 0.01 * probs.max()
+    if t <= 0:
+        return xmi, xma
+
+    # distance at which a pdf is below t/N
+    peaks = (2 * pi) ** -0.5 / errors
+    k = sqrt(2 * log((peaks * ages.shape[0] / t).clip(1)))
+    d = errors * k
+
+    def f(xi):
+        return _summed_pdf(asarray([xi]), ages, errors)[0]
+
+    def bisect(inner, outer):
+        for i in range(60):
+            mid = (inner + outer) / 2.0
+            if f(mid) < t:
+                outer = mid
+            else:
+                inner = mid
+            if abs(outer - inner) <= 1e-9 * max(1.0, abs(outer)):
+                break
+        return outer
+
+    x1 = min(xmi, ages.min())
+    if f(x1) >= t:
+        x1 = bisect(x1, (ages - d).min())
+
+    x2 = max(xma, ages.max())
+    if f(x2) >= t:
+        x2 = bisect(x2, (ages + d).max())
+
+    return x1, x2
+
+
 def kernel_density(ages, errors, xmi, xma, n=100):
     from scipy.stats.kde import gaussian_kde
 
@@ -55,4 +202,70 @@ def kernel_density(ages, errors, xmi, xma, n=100):
     return x, y
 
 
+class ProbabilityCurveCache(object):
+    """
+    LRU cache of cumulative probability curves keyed on the ages, errors and limits.
+
+    redrawing an ideogram, e.g. when the selection changes, often recalculates curves of
+    data that has been plotted before
+    """
+
+    def __init__(self, max_size=64):
+        self._cache = OrderedDict()
+        self.max_size = max_size
+
+    def clear(self):
+        self._cache.clear()
+
+    def cumulative_probability(self, ages, errors, xmi, xma, n=100):
+        """
+        cached ``cumulative_probability``
+        """
+        ages, errors = self._asarrays(ages, errors)
+        key = self._make_key("curve", ages, errors, xmi, xma, n)
+
+        def func():
+            return cumulative_probability(ages, errors, xmi, xma, n)
+
+        x, probs = self._get(key, func)
+        return x.copy(), probs.copy()
+
+    def asymptotic_curve(self, ages, errors, xmi, xma, tol=10, n=100):
+        """
+        cumulative probability curve between the asymptotic limits
+
+        returns x, probs, x1, x2
+        """
+        ages, errors = self._asarrays(ages, errors)
+        key = self._make_key("limits", ages, errors, xmi, xma, n, tol)
+
+        x1, x2 = self._get(
+            key, lambda: asymptotic_limits(ages, errors, xmi, xma, tol, n)
+        )
+        x, probs = self.cumulative_probability(ages, errors, x1, x2, n)
+        return x, probs, x1, x2
+
+    def _asarrays(self, ages, errors):
+        return asarray(ages, dtype=float), asarray(errors, dtype=float)
+
+    def _make_key(self, kind, ages, errors, *args):
+        return (kind, ages.tobytes(), errors.tobytes()) + tuple(
+            float(a) for a in args
+        )
+
+    def _get(self, key, func):
+        cache = self._cache
+        try:
+            v = cache[key]
+            cache.move_to_end(key)
+        except KeyError:
+            v = func()
+            cache[key] = v
+            if len(cache) > self.max_size:
+                cache.popitem(last=False)
+        return v
+
+
+probability_curve_cache = ProbabilityCurveCache()
+
 # ============= EOF =============================================
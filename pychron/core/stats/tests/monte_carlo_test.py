@@ -0,0 +1,122 @@
+import unittest
+
+from numpy import (
+    allclose,
+    array,
+    column_stack,
+    dot,
+    einsum,
+    linalg,
+    linspace,
+    meshgrid,
+    random,
+)
+
+from pychron.core.regression.flux_regressor import PlaneFluxRegressor, BowlFluxRegressor
+from pychron.core.regression.mean_regressor import WeightedMeanRegressor
+from pychron.core.regression.ols_regressor import PolynomialRegressor
+from pychron.core.regression.wls_regressor import WeightedPolynomialRegressor
+from pychron.core.stats.monte_carlo import FluxEstimator, RegressionEstimator
+
+
+class LoopRegressor(object):
+    """
+    hide fast_predict_batch so the estimator solves one trial at a time
+    """
+
+    def __init__(self, reg):
+        self._reg = reg
+
+    def __getattr__(self, item):
+        if item == "fast_predict_batch":
+            raise AttributeError(item)
+        return getattr(self._reg, item)
+
+
+def make_flux_regressor(klass=PlaneFluxRegressor, seed=1):
+    rng = random.RandomState(seed)
+    x, y = meshgrid(linspace(-1, 1, 5), linspace(-1, 1, 5))
+    xy = column_stack((x.ravel(), y.ravel()))
+    zs = 0.01 + 0.001 * xy[:, 0] - 0.0005 * xy[:, 1] + rng.normal(0, 1e-5, len(xy))
+    reg = klass(xs=xy, ys=zs, yserr=[1e-5] * len(xy))
+    reg.calculate()
+    return reg, xy
+
+
+class MonteCarloTestCase(unittest.TestCase):
+    def _compare(
+        self, reg, pts, klass=FluxEstimator, position_error=None, chunk_size=64
+    ):
+        results = []
+        for r in (reg, LoopRegressor(reg)):
+            e = klass(200, r, seed=123, chunk_size=chunk_size)
+            if position_error:
+                results.append(e.estimate_position_err(pts, position_error))
+            else:
+                results.append(e.estimate(pts))
+
+        (an, ae), (bn, be) = results
+        self.assertTrue(allclose(an, bn))
+        self.assertTrue(allclose(ae, be, rtol=1e-8))
+        return ae
+
+    def test_plane(self):
+        reg, xy = make_flux_regressor()
+        self._compare(reg, xy)
+
+    def test_bowl(self):
+        reg, xy = make_flux_regressor(BowlFluxRegressor)
+        self._compare(reg, xy)
+
+    def test_position_error(self):
+        reg, xy = make_flux_regressor()
+        self._compare(reg, xy, position_error=0.01)
+
+    def test_polynomial(self):
+        xs = linspace(0, 10, 20)
+        ys = 2 + 3 * xs + random.RandomState(2).normal(0, 0.1, 20)
+        reg = PolynomialRegressor(xs=xs, ys=ys, yserr=[0.1] * 20, fit="linear")
+        reg.calculate()
+        self._compare(reg, array([0, 5.0]), klass=RegressionEstimator)
+
+    def test_weighted_polynomial(self):
+        rng = random.RandomState(3)
+        xs = linspace(0, 10, 20)
+        yserr = linspace(0.05, 1, 20)
+        ys = 2 + 3 * xs + rng.normal(0, yserr)
+        reg = WeightedPolynomialRegressor(xs=xs, ys=ys, yserr=yserr, fit="linear")
+        reg.calculate()
+
+        pts = array([0, 5.0])
+        errs = self._compare(reg, pts, klass=RegressionEstimator)
+        # the endog is whitened like the exog so the errors agree with the errors of
+        # the weighted fit, X (X'WX)^-1 X'
+        X, pX = reg.get_exog(xs), reg.get_exog(pts)
+        cov = linalg.inv(dot(X.T / yserr**2, X))
+        expected = einsum("ij,jk,ik->i", pX, cov, pX) ** 0.5
+        self.assertTrue(allclose(errs, expected, rtol=0.1))
+
+    def test_chunk_size(self):
+        xs = linspace(0, 10, 20)
+        ys = 2 + 3 * xs + random.RandomState(2).normal(0, 0.1, 20)
+        reg = PolynomialRegressor(xs=xs, ys=ys, yserr=[0.1] * 20, fit="linear")
+        reg.calculate()
+
+        pts = array([0, 5.0])
+        errs = [
+            RegressionEstimator(200, reg, seed=123, chunk_size=c).estimate(pts)[1]
+            for c in (1, 7, 64, 1000)
+        ]
+        for e in errs[1:]:
+            self.assertTrue(allclose(e, errs[0], rtol=1e-8))
+
+    def test_weighted_mean(self):
+        reg = WeightedMeanRegressor(
+            xs=[0, 1, 2, 3], ys=[1.0, 1.1, 0.9, 1.05], yserr=[0.1, 0.2, 0.1, 0.3]
+        )
+        reg.calculate()
+        self._compare(reg, array([0, 1.0]), klass=RegressionEstimator)
+
+
+if __name__ == "__main__":
+    unittest.main()
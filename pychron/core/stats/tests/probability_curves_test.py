@@ -0,0 +1,133 @@
+import unittest
+
+from numpy import exp, full, linspace, pi, random, zeros
+
+from pychron.core.stats import probability_curves
+from pychron.core.stats.probability_curves import (
+    ProbabilityCurveCache,
+    _binned_pdf,
+    _summed_pdf,
+    asymptotic_limits,
+    cumulative_probability,
+)
+
+
+def loop_cumulative_probability(ages, errors, xmi, xma, n=100):
+    """
+    the original, one age at a time, calculation
+    """
+    x = linspace(xmi, xma, n)
+    probs = zeros(n)
+    for ai, ei in zip(ages, errors):
+        if abs(ai) < 1e-10 or abs(ei) < 1e-10:
+            continue
+        ds = (x - full(n, ai)) ** 2
+        es2 = full(n, 2 * ei * ei)
+        probs += (es2 * pi) ** -0.5 * exp(-ds / es2)
+    return x, probs
+
+
+def iterative_limits(ages, errors, xmi, xma, tol=10, n=100, max_iter=200):
+    """
+    the original search for the asymptotic limits by growing the limits
+    """
+    tol *= 0.01
+    rx1, rx2 = None, None
+    x1, x2 = xmi, xma
+    step = 0.005 * (xma - xmi)
+    for i in range(max_iter):
+        x1 = x1 - step if rx1 is None else rx1
+        x2 = x2 + step if rx2 is None else rx2
+        step = 0.005 * (x2 - x1)
+
+        xs, ys = loop_cumulative_probability(ages, errors, x1, x2, n)
+        tt = tol * ys.max()
+        if rx1 is None and ys[0] < tt:
+            rx1 = x1
+        if rx2 is None and ys[-1] < tt:
+            rx2 = x2
+        if rx1 is not None and rx2 is not None:
+            break
+
+    return rx1 or x1, rx2 or x2
+
+
+def make_grains(n, seed=5):
+    rnd = random.RandomState(seed)
+    ages = rnd.choice([100, 300, 1000, 1800, 2700], n) + rnd.normal(0, 30, n)
+    errors = abs(ages) * rnd.uniform(0.005, 0.03, n)
+    return ages, errors
+
+
+def nominal_limits(ages, errors):
+    return (ages - 2 * errors).min(), (ages + 2 * errors).max()
+
+
+class ProbabilityCurvesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.ages, self.errors = make_grains(200)
+
+    def test_cumulative_probability(self):
+        ages, errors = list(self.ages), list(self.errors)
+        ages[3], errors[7] = 0, 0
+        x, ys = cumulative_probability(ages, errors, 0, 3000, n=500)
+        ex, eys = loop_cumulative_probability(ages, errors, 0, 3000, n=500)
+        self.assertTrue((x == ex).all())
+        self.assertTrue(abs(ys - eys).max() < 1e-12 * eys.max())
+
+    def test_chunks(self):
+        x = linspace(0, 3000, 500)
+        ys = _summed_pdf(x, self.ages, self.errors)
+        chunk = probability_curves.CHUNK_SIZE
+        try:
+            probability_curves.CHUNK_SIZE = 1000
+            cys = _summed_pdf(x, self.ages, self.errors)
+        finally:
+            probability_curves.CHUNK_SIZE = chunk
+        self.assertTrue(abs(ys - cys).max() < 1e-12 * ys.max())
+
+    def test_binned(self):
+        ages, errors = make_grains(5000)
+        x = linspace(0, 3000, 500)
+        ys = _summed_pdf(x, ages, errors)
+        bys = _binned_pdf(x, ages, errors)
+        self.assertLess(abs(ys - bys).max(), 0.02 * ys.max())
+
+    def test_asymptotic_limits(self):
+        ages, errors = self.ages, self.errors
+        xmi, xma = nominal_limits(ages, errors)
+        x1, x2 = asymptotic_limits(ages, errors, xmi, xma, tol=10, n=500)
+        e1, e2 = iterative_limits(ages, errors, xmi, xma, tol=10, n=500)
+
+        # the iterative search overshoots by up to one step
+        step = 0.005 * (e2 - e1)
+        self.assertTrue(e1 - step <= x1 <= e1 + step)
+        self.assertTrue(e2 - step <= x2 <= e2 + step)
+
+        _, ys = cumulative_probability(ages, errors, xmi, xma, n=500)
+        x, cys = cumulative_probability(ages, errors, x1, x2, n=500)
+        self.assertLess(cys[0], 0.1 * ys.max())
+        self.assertLess(cys[-1], 0.1 * ys.max())
+
+    def test_asymptotic_limits_single(self):
+        # 501 points so that the peak at 10 is on the grid
+        x1, x2 = asymptotic_limits([10], [1], 8, 12, tol=10, n=501)
+        # exp(-d**2/2)=0.1
+        d = (2 * 2.302585092994046) ** 0.5
+        self.assertAlmostEqual(x1, 10 - d, places=6)
+        self.assertAlmostEqual(x2, 10 + d, places=6)
+
+    def test_cache(self):
+        cache = ProbabilityCurveCache(max_size=2)
+        x, ys = cache.cumulative_probability(self.ages, self.errors, 0, 3000, 500)
+        ys[:] = 0
+        x, ys2 = cache.cumulative_probability(self.ages, self.errors, 0, 3000, 500)
+        self.assertGreater(ys2.max(), 0)
+
+        xs, ys, x1, x2 = cache.asymptotic_curve(list(self.ages), self.errors, 0, 3000)
+        self.assertEqual((xs[0], xs[-1]), (x1, x2))
+        self.assertEqual(len(cache._cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
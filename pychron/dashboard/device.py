@@ -25,7 +25,7 @@ import struct
 import time
 
 import yaml
-from traits.api import Str, Bool, List, Instance, Event
+from traits.api import Str, Bool, List, Instance, Event, Any
 from traitsui.api import View, ListEditor, InstanceEditor, UItem, VGroup, HGroup, VSplit
 
 # ============= local library imports  ==========================
@@ -50,6 +50,8 @@ class DashboardDevice(Loggable):
     conditional_event = Event
 
     graph = Instance(StreamStackedGraph)
+    # ProcessValueRecorder. values are written to a csv file per process value if None
+    recorder = Any
 
     @property
     def value_keys(self):
@@ -200,6 +202,10 @@ class DashboardDevice(Loggable):
             self._check_conditional(pv, new)
 
     def _record(self, pv, v):
+        if self.recorder:
+            self.recorder.add(self.name, pv.name, pv.units, v, pv.last_time)
+            return
+
         path = pv.path
         if not path:
             path, _ = unique_path2(paths.device_scan_dir, pv.name)
@@ -0,0 +1,234 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from traits.api import Any, Float, Int, Str
+
+# ============= standard library imports ========================
+import sqlite3
+import time
+from threading import Event, Lock, Thread
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS process_value ("
+    "id INTEGER PRIMARY KEY, device TEXT, name TEXT, units TEXT, UNIQUE(device, name))",
+    "CREATE TABLE IF NOT EXISTS measurement ("
+    "process_value_id INTEGER, timestamp REAL, value REAL)",
+    "CREATE INDEX IF NOT EXISTS measurement_idx ON measurement (process_value_id, timestamp)",
+)
+
+
+class ProcessValueRecorder(Loggable):
+    """
+    buffer the process values of the dashboard devices and write them in batches.
+
+    recorded values are appended to an sqlite database in WAL mode. published values are
+    bulk inserted into labspy. both are flushed every ``flush_period`` seconds by a
+    background thread or when ``max_buffer`` values are waiting
+    """
+
+    path = Str
+    labspy_client = Any
+
+    flush_period = Float(5)
+    max_buffer = Int(10000)
+
+    _buffer = None
+    _publish_buffer = None
+    _lock = None
+    _db_lock = None
+    _flush_evt = None
+    _stop_evt = None
+    _thread = None
+    _conn = None
+    _pv_ids = None
+
+    def __init__(self, *args, **kw):
+        super(ProcessValueRecorder, self).__init__(*args, **kw)
+        self._buffer = []
+        self._publish_buffer = []
+        self._lock = Lock()
+        self._db_lock = Lock()
+        self._flush_evt = Event()
+        self._pv_ids = {}
+
+    def start(self):
+        if self._thread is None:
+            self._stop_evt = Event()
+            self._thread = Thread(target=self._run, name="ProcessValueRecorder")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """
+        stop the flush thread and write the remaining values
+        """
+        if self._thread is not None:
+            self._stop_evt.set()
+            self._flush_evt.set()
+            self._thread.join(max(1, self.flush_period * 2))
+            self._thread = None
+
+        self.flush()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def add(self, device, name, units, value, timestamp=None):
+        """
+        buffer a value to record
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        with self._lock:
+            self._buffer.append((device, name, units, timestamp, value))
+            n = len(self._buffer)
+
+        if n >= self.max_buffer:
+            self._flush_evt.set()
+
+    def publish(self, device, name, value, units, timestamp=None):
+        """
+        buffer a value to send to labspy
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        with self._lock:
+            self._publish_buffer.append((device, name, value, units, timestamp))
+
+    def flush(self):
+        with self._lock:
+            buf, self._buffer = self._buffer, []
+            pbuf, self._publish_buffer = self._publish_buffer, []
+
+        if buf:
+            try:
+                self._write(buf)
+            except sqlite3.Error as e:
+                self.warning("failed writing {} values. error={}".format(len(buf), e))
+
+        if pbuf and self.labspy_client:
+            self.labspy_client.add_measurements(pbuf)
+
+    def get_history(self, device, name, start=None, end=None, window=None):
+        """
+        return the recorded values of a process value.
+
+        start, end: timestamps (seconds) to bound the query
+        window: seconds. downsample to one row per window
+
+        returns a list of (timestamp, value) or if ``window`` a list of
+        (window start, min, mean, max, n)
+        """
+        self.flush()
+
+        with self._db_lock:
+            conn = self._get_connection()
+            pid = self._get_pv_id(conn, device, name)
+            if pid is None:
+                return []
+
+            where = "WHERE process_value_id=?"
+            args = [pid]
+            if start is not None:
+                where = "{} AND timestamp>=?".format(where)
+                args.append(start)
+            if end is not None:
+                where = "{} AND timestamp<?".format(where)
+                args.append(end)
+
+            if window:
+                sql = (
+                    "SELECT CAST(timestamp/? AS INTEGER)*? AS w, MIN(value), AVG(value), "
+                    "MAX(value), COUNT(*) FROM measurement {} GROUP BY w ORDER BY w"
+                ).format(where)
+                args = [window, window] + args
+            else:
+                sql = "SELECT timestamp, value FROM measurement {} ORDER BY timestamp".format(
+                    where
+                )
+            return conn.execute(sql, args).fetchall()
+
+    # private
+    def _run(self):
+        while not self._stop_evt.is_set():
+            self._flush_evt.wait(self.flush_period)
+            self._flush_evt.clear()
+            if self._stop_evt.is_set():
+                break
+
+            try:
+                self.flush()
+            except Exception as e:
+                self.warning("flush failed. error={}".format(e))
+                self.debug_exception()
+
+    def _write(self, buf):
+        with self._db_lock:
+            conn = self._get_connection()
+            rows = []
+            for device, name, units, ts, v in buf:
+                pid = self._get_pv_id(conn, device, name, units)
+                rows.append((pid, ts, v))
+
+            with conn:
+                conn.executemany(
+                    "INSERT INTO measurement (process_value_id, timestamp, value) "
+                    "VALUES (?,?,?)",
+                    rows,
+                )
+
+    def _get_connection(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for sql in SCHEMA:
+                conn.execute(sql)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get_pv_id(self, conn, device, name, units=None):
+        key = device, name
+        pid = self._pv_ids.get(key)
+        if pid is None:
+            row = conn.execute(
+                "SELECT id FROM process_value WHERE device=? AND name=?", key
+            ).fetchone()
+            if row:
+                pid = row[0]
+            elif units is not None:
+                with conn:
+                    cur = conn.execute(
+                        "INSERT INTO process_value (device, name, units) VALUES (?,?,?)",
+                        (device, name, units),
+                    )
+                pid = cur.lastrowid
+            else:
+                return
+
+            self._pv_ids[key] = pid
+        return pid
+
+
+# ============= EOF =============================================
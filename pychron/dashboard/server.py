@@ -27,6 +27,7 @@ import time
 # ============= local library imports  ==========================
 from pychron.dashboard.constants import CRITICAL, NOERROR, WARNING
 from pychron.dashboard.device import DashboardDevice
+from pychron.dashboard.recorder import ProcessValueRecorder
 from pychron.globals import globalv
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.core.helpers.filetools import add_extension
@@ -76,6 +77,8 @@ class DashboardServer(Loggable):
     notifier = Instance(Notifier, ())
     emailer = Instance("pychron.social.emailer.Emailer")
     labspy_client = Instance("pychron.labspy.client.LabspyClient")
+    recorder = Instance(ProcessValueRecorder, ())
+    use_recorder = Bool(True)
 
     use_db = False
     _alive = False
@@ -84,6 +87,10 @@ class DashboardServer(Loggable):
         bind_preference(
             self.notifier, "enabled", "pychron.dashboard.server.notifier_enabled"
         )
+        bind_preference(self, "use_recorder", "pychron.dashboard.server.use_recorder")
+        bind_preference(
+            self.recorder, "flush_period", "pychron.dashboard.server.flush_period"
+        )
 
     def activate(self):
         emailer = self.application.get_service("pychron.social.emailer.Emailer")
@@ -94,6 +101,7 @@ class DashboardServer(Loggable):
                 "Extraction Line Plugin not initialized. Will not be able to take valve actions"
             )
         self.setup_notifier()
+        self.setup_recorder()
 
         self.load_devices()
         if self.devices:
@@ -103,7 +111,8 @@ class DashboardServer(Loggable):
             self.labspy_client.start()
 
     def deactivate(self):
-        pass
+        if self.recorder:
+            self.recorder.stop()
 
     # def deactivate(self):
     # if self.use_db:
@@ -113,6 +122,14 @@ class DashboardServer(Loggable):
     # if self.use_db:
     # self.db_manager.start()
 
+    def setup_recorder(self):
+        if self.use_recorder:
+            r = self.recorder
+            r.path = os.path.join(paths.device_scan_dir, "dashboard.sqlite")
+            r.labspy_client = self.labspy_client
+            r.start()
+            self.info("recording to {}. flush period={}s".format(r.path, r.flush_period))
+
     def setup_notifier(self):
         if self.notifier.enabled:
             parser = get_parser()
@@ -241,6 +258,8 @@ class DashboardServer(Loggable):
                     continue
 
             d = DashboardDevice(name=name, use=dd["enabled"], hardware_device=device)
+            if self.use_recorder:
+                d.recorder = self.recorder
             for args, cs in dd["values"]:
                 pv = d.add_value(**args)
                 self.values.append(pv)
@@ -336,7 +355,10 @@ class DashboardServer(Loggable):
 
     def _update_labspy_device(self, dev, tag, val, units):
         if self.labspy_client:
-            self.labspy_client.add_measurement(dev, tag, val, units)
+            if self.use_recorder:
+                self.recorder.publish(dev, tag, val, units)
+            else:
+                self.labspy_client.add_measurement(dev, tag, val, units)
 
     def _update_labspy_error(self, error):
         if self.labspy_client:
@@ -14,7 +14,7 @@
 # limitations under the License.
 # ===============================================================================
 
-from traits.api import Bool
+from traits.api import Bool, Float
 from traitsui.api import View, Item
 from apptools.preferences.preferences_helper import PreferencesHelper
 from envisage.ui.tasks.preferences_pane import PreferencesPane
@@ -25,6 +25,8 @@ class DashboardServerPreferences(PreferencesHelper):
     preferences_path = "pychron.dashboard.server"
 
     notifier_enabled = Bool
+    use_recorder = Bool(True)
+    flush_period = Float(5)
 
 
 class DashboardServerPreferencesPane(PreferencesPane):
@@ -32,7 +34,20 @@ class DashboardServerPreferencesPane(PreferencesPane):
     model_factory = DashboardServerPreferences
 
     def traits_view(self):
-        v = View(Item("notifier_enabled"))
+        v = View(
+            Item("notifier_enabled"),
+            Item(
+                "use_recorder",
+                label="Batch Recording",
+                tooltip="Buffer the recorded values and write them to the dashboard database "
+                "and labspy in batches",
+            ),
+            Item(
+                "flush_period",
+                label="Flush Period (s)",
+                enabled_when="use_recorder",
+            ),
+        )
 
         return v
 
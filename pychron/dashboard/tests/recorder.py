@@ -0,0 +1,96 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.dashboard.recorder import ProcessValueRecorder
+
+
+class FakeLabspyClient(object):
+    def __init__(self):
+        self.batches = []
+
+    def add_measurements(self, ms):
+        self.batches.append(ms)
+
+
+class ProcessValueRecorderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "dashboard.sqlite")
+        self.labspy = FakeLabspyClient()
+        self.recorder = ProcessValueRecorder(
+            path=self.path, labspy_client=self.labspy, flush_period=60
+        )
+
+    def tearDown(self):
+        self.recorder.stop()
+        shutil.rmtree(self.root)
+
+    def test_buffered(self):
+        self.recorder.add("Gauge", "pressure", "torr", 1.0)
+        # nothing is written until the buffer is flushed
+        self.assertFalse(os.path.isfile(self.path))
+
+        self.recorder.flush()
+        conn = sqlite3.connect(self.path)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM measurement").fetchone(), (1,))
+        self.assertEqual(
+            conn.execute("PRAGMA journal_mode").fetchone()[0].lower(), "wal"
+        )
+        conn.close()
+
+    def test_history(self):
+        for i in range(100):
+            self.recorder.add("Gauge", "pressure", "torr", i, timestamp=1000 + i)
+            self.recorder.add("Gauge", "temperature", "C", -i, timestamp=1000 + i)
+
+        rows = self.recorder.get_history("Gauge", "pressure")
+        self.assertEqual(len(rows), 100)
+        self.assertEqual(rows[0], (1000, 0))
+
+        rows = self.recorder.get_history("Gauge", "pressure", start=1010, end=1020)
+        self.assertEqual([r[1] for r in rows], list(range(10, 20)))
+
+        self.assertEqual(self.recorder.get_history("Gauge", "missing"), [])
+
+    def test_downsample(self):
+        for i in range(100):
+            self.recorder.add("Gauge", "pressure", "torr", i, timestamp=1000 + i)
+
+        rows = self.recorder.get_history("Gauge", "pressure", window=10)
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[0], (1000, 0, 4.5, 9, 10))
+        self.assertEqual(rows[-1], (1090, 90, 94.5, 99, 10))
+
+    def test_publish(self):
+        for i in range(5):
+            self.recorder.publish("Gauge", "pressure", i, "torr")
+        self.recorder.flush()
+        self.recorder.flush()
+
+        self.assertEqual(len(self.labspy.batches), 1)
+        self.assertEqual([m[2] for m in self.labspy.batches[0]], list(range(5)))
+
+    def test_background_flush(self):
+        self.recorder.flush_period = 0.05
+        self.recorder.start()
+        self.recorder.add("Gauge", "pressure", "torr", 1.0)
+
+        st = time.time()
+        while not os.path.isfile(self.path) and time.time() - st < 2:
+            time.sleep(0.01)
+
+        self.recorder.stop()
+        self.assertEqual(len(self.recorder.get_history("Gauge", "pressure")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
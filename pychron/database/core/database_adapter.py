@@ -16,8 +16,9 @@
 
 # =============enthought library imports=======================
 import os
+import time
 from datetime import datetime, timedelta
-from threading import Lock
+from threading import Lock, local
 
 import six
 from sqlalchemy import create_engine, distinct, MetaData
@@ -39,6 +40,7 @@ from traits.api import (
     Property,
     cached_property,
     Int,
+    Float,
 )
 
 from pychron.database.core.base_orm import AlembicVersionTable
@@ -78,6 +80,7 @@ class SessionCTX(object):
         self._psession = None
 
     def __enter__(self):
+        self._parent.enter_session_ctx()
         if self._use_parent_session:
             self._parent.create_session()
             return self._parent.session
@@ -96,6 +99,7 @@ class SessionCTX(object):
         if self._psession:
             self._parent.session = self._psession
         self._psession = None
+        self._parent.exit_session_ctx()
 
 
 class MockQuery:
@@ -121,6 +125,61 @@ class MockSession:
     #     return
 
 
+class SessionPoolStatistics(object):
+    """
+    checkout latency and queue depth of the sessions of a pooled ``DatabaseAdapter``
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.ncheckouts = 0
+            self.nfailed = 0
+            self.waiting = 0
+            self.max_waiting = 0
+            self.total_latency = 0
+            self.max_latency = 0
+
+    def checkout(self, sess):
+        """
+        check out the connection of ``sess`` from the pool
+        """
+        with self._lock:
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+
+        st = time.perf_counter()
+        ok = False
+        try:
+            sess.connection()
+            ok = True
+        finally:
+            dt = time.perf_counter() - st
+            with self._lock:
+                self.waiting -= 1
+                if ok:
+                    self.ncheckouts += 1
+                    self.total_latency += dt
+                    self.max_latency = max(self.max_latency, dt)
+                else:
+                    self.nfailed += 1
+
+    def report(self):
+        with self._lock:
+            n = self.ncheckouts
+            return {
+                "checkouts": n,
+                "failed": self.nfailed,
+                "waiting": self.waiting,
+                "max_waiting": self.max_waiting,
+                "mean_latency": self.total_latency / n if n else 0,
+                "max_latency": self.max_latency,
+            }
+
+
 class DatabaseAdapter(Loggable):
     """
     The DatabaseAdapter is a base class for interacting with a SQLAlchemy database.
@@ -132,9 +191,13 @@ class DatabaseAdapter(Loggable):
     It also provides some helper functions used extensively by the subclasses, e.g. ``_add_item``,
     ``_retrieve_items``
 
+    With ``use_session_pool`` each thread gets its own session on a pooled connection so that
+    background work can query concurrently. ``session`` and ``session_ctx`` work the same in both
+    modes. Toggling ``use_session_pool`` while a session context is open is deferred until the
+    last context closes.
     """
 
-    session = None
+    _session = None
 
     sess_stack = 0
     reraise = False
@@ -172,13 +235,64 @@ class DatabaseAdapter(Loggable):
     connection_error = Str
     _session_lock = None
 
+    use_session_pool = Bool(False)
+    pool_size = Int(5)
+    pool_max_overflow = Int(10)
+    pool_timeout = Float(30)
+    pool_pre_ping = Bool(True)
+    pool_statistics = None
+    _engine = None
+    _local = None
+    # the session mode in effect. follows use_session_pool once no session context is open
+    _session_pool_enabled = Bool(False)
+    _nsession_ctx = 0
+
     modified = False
     _trying_to_add = False
     _test_connection_enabled = True
 
     def __init__(self, *args, **kw):
-        super(DatabaseAdapter, self).__init__(*args, **kw)
         self._session_lock = Lock()
+        super(DatabaseAdapter, self).__init__(*args, **kw)
+        self._local = local()
+        self.pool_statistics = SessionPoolStatistics()
+
+    @property
+    def session(self):
+        if self._session_pool_enabled:
+            return getattr(self._local, "session", None)
+        return self._session
+
+    @session.setter
+    def session(self, v):
+        if self._session_pool_enabled:
+            self._local.session = v
+        else:
+            self._session = v
+
+    @property
+    def _session_cnt(self):
+        if self._session_pool_enabled:
+            return getattr(self._local, "cnt", 0)
+        return self._shared_session_cnt
+
+    @_session_cnt.setter
+    def _session_cnt(self, v):
+        if self._session_pool_enabled:
+            self._local.cnt = v
+        else:
+            self._shared_session_cnt = v
+
+    def get_pool_statistics(self):
+        """
+        return a dict of the connection pool status and the session checkout statistics
+        """
+        ret = self.pool_statistics.report()
+        pool = self._engine.pool if self._engine is not None else None
+        for attr in ("size", "checkedout", "overflow"):
+            func = getattr(pool, attr, None)
+            ret[attr] = func() if func else 0
+        return ret
 
     def create_all(self, metadata):
         """
@@ -200,12 +314,22 @@ class DatabaseAdapter(Loggable):
     #             sess = self.sess
     #         return SessionCTX(sess, parent=self, commit=commit, rollback=rollback)
 
-    _session_cnt = 0
+    _shared_session_cnt = 0
 
     def session_ctx(self, use_parent_session=True):
         with self._session_lock:
             return SessionCTX(self, use_parent_session)
 
+    def enter_session_ctx(self):
+        with self._session_lock:
+            self._nsession_ctx += 1
+
+    def exit_session_ctx(self):
+        with self._session_lock:
+            self._nsession_ctx -= 1
+            if not self._nsession_ctx:
+                self._set_session_pool_enabled()
+
     def create_session(self, force=False):
         if self.connect(test=False):
             if self.session_factory:
@@ -214,12 +338,12 @@ class DatabaseAdapter(Loggable):
                     if self.session:
                         self.session.close()
 
-                    self.session = self.session_factory()
+                    self.session = self._new_session()
                     self._session_cnt = 1
                 else:
                     if not self.session:
                         # self.debug('create new session {}'.format(id(self)))
-                        self.session = self.session_factory()
+                        self.session = self._new_session()
                     self._session_cnt += 1
             else:
                 self.warning("no session factory")
@@ -236,6 +360,16 @@ class DatabaseAdapter(Loggable):
                 self.session.close()
                 self.session = None
 
+    def _new_session(self):
+        sess = self.session_factory()
+        if self._session_pool_enabled:
+            # check out the connection now so that the time spent waiting on the pool is measured
+            try:
+                self.pool_statistics.checkout(sess)
+            except SQLAlchemyError as e:
+                self.debug("session checkout failed. {}".format(e))
+        return sess
+
     @property
     def enabled(self):
         return self.kind in ["mysql", "sqlite", "postgresql", "mssql"]
@@ -246,14 +380,20 @@ class DatabaseAdapter(Loggable):
 
         return globalv.username
 
-    @on_trait_change("username,host,password,name,kind,path")
+    @on_trait_change(
+        "username,host,password,name,kind,path,"
+        "_session_pool_enabled,pool_size,pool_max_overflow,pool_timeout,pool_pre_ping"
+    )
     def reset_connection(self):
         """
         Trip the ``connection_parameters_changed`` flag. Next ``connect`` call with use the new values
         """
         self.connection_parameters_changed = True
         self.session_factory = None
-        self.session = None
+        self._session = None
+        self._shared_session_cnt = 0
+        # drop the sessions of all threads
+        self._local = local()
 
     # @caller
     def connect(
@@ -302,8 +442,14 @@ class DatabaseAdapter(Loggable):
                         "{} connecting to database {}".format(id(self), self.public_url)
                     )
                     engine = create_engine(
-                        url, echo=self.echo, pool_recycle=pool_recycle
+                        url,
+                        echo=self.echo,
+                        pool_recycle=pool_recycle,
+                        **self._get_pool_kw(),
                     )
+                    if self._engine is not None:
+                        self._engine.dispose()
+                    self._engine = engine
 
                     self.session_factory = sessionmaker(
                         bind=engine,
@@ -340,6 +486,34 @@ host= {}\nurl= {}'.format(
         self.connection_parameters_changed = False
         return self.connected
 
+    def _use_session_pool_changed(self, new):
+        with self._session_lock:
+            if self._nsession_ctx:
+                self.warning(
+                    "{} session contexts open. use_session_pool={} deferred until they "
+                    "close".format(self._nsession_ctx, new)
+                )
+            else:
+                self._set_session_pool_enabled()
+
+    def _set_session_pool_enabled(self):
+        """
+        switch the session mode. the caller holds ``_session_lock``
+        """
+        if self._session_pool_enabled != self.use_session_pool:
+            self.debug("use_session_pool={}".format(self.use_session_pool))
+            self._session_pool_enabled = self.use_session_pool
+
+    def _get_pool_kw(self):
+        kw = {}
+        if self._session_pool_enabled:
+            kw["pool_pre_ping"] = self.pool_pre_ping
+            if self.kind != "sqlite":
+                kw["pool_size"] = self.pool_size
+                kw["max_overflow"] = self.pool_max_overflow
+                kw["pool_timeout"] = self.pool_timeout
+        return kw
+
     # def initialize_database(self):
     # pass
 
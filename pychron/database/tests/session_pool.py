@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.dvc.dvc_database import DVCDatabase
+from pychron.dvc.dvc_orm import Base
+
+
+class SessionPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.db = db = DVCDatabase()
+        db.trait_set(kind="sqlite", path=os.path.join(self.root, "pool.sqlite"))
+        db.connect()
+        with db.session_ctx() as sess:
+            Base.metadata.create_all(sess.bind)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _thread_sessions(self, n=4, query=True):
+        sessions = []
+        barrier = threading.Barrier(n)
+
+        def func():
+            with self.db.session_ctx() as sess:
+                # hold the session until every thread has one
+                barrier.wait(1)
+                if query:
+                    self.db.get_mass_spectrometers()
+                sessions.append(sess)
+
+        ts = [threading.Thread(target=func) for i in range(n)]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join(2)
+        return sessions
+
+    def test_shared_session(self):
+        # the shared session is not thread safe so do not query with it
+        sessions = self._thread_sessions(query=False)
+        self.assertEqual(len({id(s) for s in sessions}), 1)
+
+    def test_session_per_thread(self):
+        self.db.use_session_pool = True
+        self.assertEqual(len({id(s) for s in self._thread_sessions()}), 4)
+
+        stats = self.db.get_pool_statistics()
+        self.assertEqual(stats["checkouts"], 4)
+        self.assertEqual(stats["waiting"], 0)
+        self.assertGreater(stats["max_latency"], 0)
+        self.assertEqual(stats["checkedout"], 0)
+
+    def test_nested_ctx(self):
+        db = self.db
+        db.use_session_pool = True
+        with db.session_ctx() as a:
+            with db.session_ctx() as b:
+                self.assertIs(a, b)
+            self.assertIs(db.session, a)
+        self.assertIsNone(db.session)
+
+    def test_reset_connection(self):
+        db = self.db
+        db.use_session_pool = True
+        db.create_session()
+        self.assertIsNotNone(db.session)
+
+        db.pool_size = 2
+        self.assertIsNone(db.session)
+        with db.session_ctx():
+            db.get_mass_spectrometers()
+
+    def test_toggle_deferred(self):
+        db = self.db
+        with db.session_ctx() as sess:
+            db.use_session_pool = True
+            # the open context keeps the shared session
+            self.assertIs(db.session, sess)
+            with db.session_ctx() as b:
+                self.assertIs(b, sess)
+
+        # applied once the last context closed
+        self.assertEqual(len({id(s) for s in self._thread_sessions()}), 4)
+
+    def test_init_pooled(self):
+        db = DVCDatabase(use_session_pool=True)
+        db.trait_set(kind="sqlite", path=os.path.join(self.root, "pool.sqlite"))
+        with db.session_ctx():
+            db.get_mass_spectrometers()
+        self.assertEqual(db.get_pool_statistics()["checkouts"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
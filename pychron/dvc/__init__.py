@@ -108,6 +108,15 @@ def dvc_load(path):
     return ret
 
 
+def dvc_load_many(paths):
+    """
+    load a list of json files. returns a dict of path: json.
+
+    this is a module level function so that it can be used with a process pool
+    """
+    return {p: dvc_load(p) for p in paths}
+
+
 MASSES = None
 
 
@@ -0,0 +1,361 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+Binary sidecar bundles for DVC analyses.
+
+A bundle is a single file that holds all of the json files of an analysis. The json is stored
+compact in one index and the measured signal blobs of the ``.data`` file are stored as raw float32
+bytes after the index instead of base64 text, so an analysis is read with one open and one parse.
+
+    header  struct ``>4sII``: magic, version, index size
+    index   compact json {"stats": {member: [size, mtime_ns]}, "members": {member: json}}
+    blobs   raw bytes. the index references them as {"offset": int, "size": int}
+
+The json files remain the source of truth. A bundle records the size and modification time of each
+file it was built from and is only used while all of them are unchanged, otherwise the json files
+are read. Bundles are written to ``<analysis dir>/.bundle`` and are excluded from git.
+"""
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import base64
+import os
+import struct
+
+# ============= local library imports  ==========================
+from pychron import json
+from pychron.core.helpers.logger_setup import new_logger
+from pychron.dvc import (
+    dvc_load,
+    DATA,
+    TAGS,
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+    INTERCEPTS,
+    PEAKCENTER,
+    COSMOGENIC,
+)
+
+logger = new_logger("AnalysisBundle")
+
+BUNDLE = ".bundle"
+BUNDLE_MAGIC = b"PYCB"
+BUNDLE_VERSION = 1
+HEADER = struct.Struct(">4sII")
+
+MEMBERS = (
+    None,
+    "extraction",
+    DATA,
+    INTERCEPTS,
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+    PEAKCENTER,
+    COSMOGENIC,
+    TAGS,
+    "monitor",
+)
+
+# the members read when an analysis is constructed. the measured data is read on demand
+ANALYSIS_MEMBERS = tuple(m for m in MEMBERS if m != DATA)
+
+BLOB_GROUPS = ("signals", "baselines", "sniffs")
+
+
+def member_paths(path):
+    """
+    return a list of (modifier, path) for all of the members of the analysis whose meta file is
+    ``path``
+    """
+    root, name = os.path.split(path)
+    head, ext = os.path.splitext(name)
+    ret = []
+    for modifier in MEMBERS:
+        if modifier:
+            fmt = "{}{}" if modifier.startswith(".") else "{}.{}"
+            p = os.path.join(root, modifier, fmt.format(head, modifier[:4]) + ext)
+        else:
+            p = path
+        ret.append((modifier, p))
+    return ret
+
+
+def bundle_path(path):
+    root = os.path.dirname(path)
+    head = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(root, BUNDLE, "{}.bun".format(head))
+
+
+def _member_key(modifier):
+    return modifier or "meta"
+
+
+def _stat(p):
+    try:
+        st = os.stat(p)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def write_bundle(path):
+    """
+    build the bundle for the analysis whose meta file is ``path``
+
+    returns the bundle path or None if the analysis has no meta file
+    """
+    if not os.path.isfile(path):
+        return
+
+    stats = {}
+    members = {}
+    blobs = []
+    for modifier, p in member_paths(path):
+        key = _member_key(modifier)
+        st = _stat(p)
+        stats[key] = st
+        if st is None:
+            continue
+
+        jd = dvc_load(p)
+        if modifier == DATA:
+            jd = _extract_blobs(jd, blobs)
+        members[key] = jd
+
+    return _write(bundle_path(path), stats, members, blobs)
+
+
+def update_bundle(path, member_path, jd):
+    """
+    replace a single member of the bundle of the analysis whose meta file is ``path`` after
+    ``jd`` was written to ``member_path``. the index is rewritten and the blobs are copied as is.
+
+    the whole bundle is rebuilt if the data member changed or another member is out of date.
+    returns the bundle path or None if the analysis has no bundle
+    """
+    bp = bundle_path(path)
+    try:
+        rfile = open(bp, "rb")
+    except OSError:
+        return
+
+    mps = member_paths(path)
+    modifier = next((m for m, p in mps if p == member_path), DATA)
+    if modifier != DATA:
+        try:
+            with rfile:
+                index = _read_index(rfile)
+                blobs = [rfile.read()]
+        except (struct.error, ValueError, KeyError):
+            index = None
+
+        if index:
+            key = _member_key(modifier)
+            stats = index["stats"]
+            if all(
+                stats.get(_member_key(m)) == _stat(p) for m, p in mps if m != modifier
+            ):
+                stats[key] = _stat(member_path)
+                members = index["members"]
+                members[key] = jd
+                return _write(bp, stats, members, blobs)
+    else:
+        rfile.close()
+
+    return write_bundle(path)
+
+
+def load_bundle(path, modifiers=None):
+    """
+    return a dict of member path: json for the analysis whose meta file is ``path``.
+
+    returns None if there is no bundle or the bundle is out of date. only the ``modifiers``
+    members are returned if given
+    """
+    bp = bundle_path(path)
+    try:
+        rfile = open(bp, "rb")
+    except OSError:
+        return
+
+    if modifiers is None:
+        modifiers = MEMBERS
+
+    try:
+        with rfile:
+            index = _read_index(rfile)
+            if index is None:
+                return
+
+            stats = index["stats"]
+            mps = member_paths(path)
+            for modifier, p in mps:
+                if stats.get(_member_key(modifier)) != _stat(p):
+                    return
+
+            members = index["members"]
+            ret = {}
+            for modifier, p in mps:
+                if modifier not in modifiers:
+                    continue
+
+                jd = members.get(_member_key(modifier))
+                if jd is None:
+                    continue
+
+                if modifier == DATA:
+                    jd = _restore_blobs(jd, rfile.read())
+                ret[p] = jd
+            return ret
+    except (struct.error, ValueError, KeyError) as e:
+        logger.warning("failed loading bundle {}. error: {}".format(bp, e))
+
+
+def load_analysis_files(paths):
+    """
+    paths: list of json paths of a single analysis. the first path must be the meta file
+
+    return a dict of path: json. the bundle is used if it is current
+    """
+    if not paths:
+        return {}
+
+    ret = load_bundle(paths[0], modifiers=ANALYSIS_MEMBERS) or {}
+    for p in paths:
+        if p not in ret:
+            ret[p] = dvc_load(p)
+    return ret
+
+
+def convert_repository(root, progress=None):
+    """
+    write bundles for all of the analyses in the repository at ``root``
+
+    returns the number of bundles written
+    """
+    exclude_bundles(root)
+
+    n = 0
+    for r, ds, fs in os.walk(root):
+        # skip hidden directories and the directories of the non-meta files
+        ds[:] = sorted(d for d in ds if not d.startswith(".") and d not in MEMBERS)
+        if r == root:
+            # repository level files e.g. spectrometer and production files
+            continue
+
+        for fi in sorted(fs):
+            if fi.endswith(".json"):
+                p = os.path.join(r, fi)
+                if write_bundle(p):
+                    n += 1
+                    if progress:
+                        progress(p)
+    return n
+
+
+def exclude_bundles(root):
+    """
+    add the bundle directories to the repository's local exclude file
+    """
+    info = os.path.join(root, ".git", "info")
+    if not os.path.isdir(os.path.join(root, ".git")):
+        return
+
+    if not os.path.isdir(info):
+        os.mkdir(info)
+
+    p = os.path.join(info, "exclude")
+    pattern = "{}/".format(BUNDLE)
+    lines = []
+    if os.path.isfile(p):
+        with open(p, "r") as rfile:
+            lines = [line.strip() for line in rfile]
+
+    if pattern not in lines:
+        with open(p, "a") as afile:
+            afile.write("{}\n".format(pattern))
+
+
+def _read_index(rfile):
+    """
+    read the header and the index. returns None if the bundle has a different format
+    """
+    magic, version, n = HEADER.unpack(rfile.read(HEADER.size))
+    if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+        return
+    return json.loads(rfile.read(n).decode("utf-8"))
+
+
+def _write(bp, stats, members, blobs):
+    index = json.dumps({"stats": stats, "members": members}).encode("utf-8")
+
+    root = os.path.dirname(bp)
+    if not os.path.isdir(root):
+        os.mkdir(root)
+
+    # write to a temporary file so that a reader never sees a partial bundle
+    tmp = "{}.tmp".format(bp)
+    with open(tmp, "wb") as wfile:
+        wfile.write(HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index)))
+        wfile.write(index)
+        for blob in blobs:
+            wfile.write(blob)
+    os.replace(tmp, bp)
+    return bp
+
+
+def _extract_blobs(jd, blobs):
+    """
+    replace the base64 blobs with references into the raw blob section
+    """
+    offset = sum(len(b) for b in blobs)
+
+    jd = dict(jd)
+    for group in BLOB_GROUPS:
+        items = jd.get(group)
+        if not items:
+            continue
+
+        nitems = []
+        for item in items:
+            blob = item.get("blob")
+            if blob:
+                item = dict(item)
+                raw = base64.b64decode(blob)
+                blobs.append(raw)
+                item["blob"] = {"offset": offset, "size": len(raw)}
+                offset += len(raw)
+            nitems.append(item)
+        jd[group] = nitems
+    return jd
+
+
+def _restore_blobs(jd, buf):
+    """
+    replace the blob references with the raw bytes of the blob.
+    ``DVCAnalysis.load_raw_data`` accepts bytes in place of a base64 blob
+    """
+    for group in BLOB_GROUPS:
+        for item in jd.get(group) or ():
+            blob = item.get("blob")
+            if isinstance(blob, dict):
+                o = blob["offset"]
+                item["blob"] = buf[o : o + blob["size"]]
+    return jd
+
+
+# ============= EOF =============================================
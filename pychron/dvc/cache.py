@@ -13,12 +13,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
+from git import Repo, GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+
+from pychron import json
+
 
 class DVCCache(object):
+    """
+    in-memory LRU cache of DVCAnalysis objects.
+
+    entries are kept in access order so that both evicting the least recently used entry and
+    sweeping expired entries only touch the entries that are removed
+    """
+
     def __init__(self, max_size=1000):
-        self._cache = {}
+        self._cache = OrderedDict()
         self.max_size = max_size
 
     def clear(self):
@@ -33,14 +49,13 @@ class DVCCache(object):
     def clean(self):
         t = 60 * 15  # 15 minutes
         now = datetime.now()
-        remove = (
-            k
-            for k, v in self._cache.items()
-            if (now - v["date_accessed"]).total_seconds() > t
-        )
-
-        for k in remove:
-            del self._cache[k]
+        cache = self._cache
+        while cache:
+            key = next(iter(cache))
+            if (now - cache[key]["date_accessed"]).total_seconds() > t:
+                del cache[key]
+            else:
+                break
 
     def report(self):
         return len(self._cache)
@@ -49,29 +64,173 @@ class DVCCache(object):
         obj = self._cache.get(item)
         if obj:
             obj["date_accessed"] = datetime.now()
+            self._cache.move_to_end(item)
             return obj["value"]
 
     def update(self, key, value):
-        if key not in self._cache and len(self._cache) > self.max_size:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self.max_size:
             self.remove_oldest()
 
         self._cache[key] = {"date_accessed": datetime.now(), "value": value}
 
     def remove_oldest(self):
         """
-        Remove the entry that has the oldest accessed date
+        Remove the least recently accessed entry
+        """
+        if self._cache:
+            self._cache.popitem(last=False)
+
+
+class DVCPersistentCache(object):
+    """
+    on-disk cache of the parsed json files of an analysis, stored in a sqlite database. the
+    files of an analysis are stored as one compact json document so an analysis is read with one
+    query and one parse instead of one open and parse per file.
+
+    entries are keyed on the analysis uuid and a digest of the git blob shas (plus size and
+    modification time) of the analysis's files. an entry becomes stale when any of those files is
+    changed by a pull, commit or local edit
+    """
+
+    def __init__(self, root, name="analysis_cache.sqlite"):
+        self.root = root
+        self.path = os.path.join(root, name)
+        self._lock = threading.Lock()
+        self._blob_shas = {}
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyses "
+                "(uuid TEXT PRIMARY KEY, digest TEXT, state TEXT)"
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM analyses")
+        self._blob_shas = {}
+
+    def report(self):
+        with self._lock:
+            (n,) = self._conn.execute("SELECT COUNT(*) FROM analyses").fetchone()
+        return n
+
+    def digest(self, repository, paths):
+        """
+        return a digest of the state of ``paths`` or None if any path is not tracked by git
+        """
+        shas = self.get_blob_shas(repository)
+        if not shas:
+            return
+
+        prefix = os.path.join(self.root, repository, "")
+        n = len(prefix)
+        h = hashlib.sha1()
+        for p in paths:
+            if p.startswith(prefix):
+                rp = p[n:]
+            else:
+                rp = os.path.relpath(p, prefix)
+            if os.sep != "/":
+                rp = rp.replace(os.sep, "/")
+
+            sha = shas.get(rp)
+            if sha is None:
+                return
+            try:
+                st = os.stat(p)
+            except OSError:
+                return
+            h.update(
+                "{}:{}:{}:{}\n".format(rp, sha, st.st_size, st.st_mtime_ns).encode(
+                    "utf-8"
+                )
+            )
+        return h.hexdigest()
+
+    def get_blob_shas(self, repository):
+        """
+        return a dict of relative path: blob sha for all the files in the repository's index.
+
+        the index is read with a single ``git ls-files`` call and reread only when the index file
+        changes
+        """
+        repo_root = os.path.join(self.root, repository)
+        try:
+            mtime = os.stat(os.path.join(repo_root, ".git", "index")).st_mtime_ns
+        except OSError:
+            return
+
+        cached = self._blob_shas.get(repository)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            txt = Repo(repo_root).git.ls_files("-s")
+        except (GitCommandError, InvalidGitRepositoryError, NoSuchPathError):
+            return
+
+        shas = {}
+        for line in txt.splitlines():
+            info, path = line.split("\t", 1)
+            shas[path] = info.split(" ")[1]
+
+        self._blob_shas[repository] = (mtime, shas)
+        return shas
+
+    def get(self, uuid, digest):
+        if digest is None:
+            return
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, state FROM analyses WHERE uuid=?", (uuid,)
+            ).fetchone()
+
+        if row and row[0] == digest:
+            try:
+                state = json.loads(row[1])
+            except ValueError:
+                state = None
+
+            if state is not None:
+                self.hits += 1
+                return state
+
+        self.misses += 1
+
+    def update(self, items):
+        """
+        items: list of (uuid, digest, state)
         """
-        oldest_entry = None
-        for key in self._cache:
-            if oldest_entry is None:
-                oldest_entry = key
-            elif (
-                self._cache[key]["date_accessed"]
-                < self._cache[oldest_entry]["date_accessed"]
-            ):
-                oldest_entry = key
-
-        self._cache.pop(oldest_entry)
+        rows = []
+        for uuid, digest, state in items:
+            if digest is None:
+                continue
+            try:
+                rows.append((uuid, digest, json.dumps(state)))
+            except (TypeError, ValueError, OverflowError):
+                continue
+
+        if rows:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO analyses (uuid, digest, state) VALUES (?,?,?)",
+                    rows,
+                )
+
+    def remove(self, uuid):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM analyses WHERE uuid=?", (uuid,))
 
 
 # ============= EOF =============================================
@@ -17,6 +17,7 @@
 import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -24,7 +25,7 @@ from operator import itemgetter
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
 from git import Repo, GitCommandError, NoSuchPathError, Actor
-from traits.api import Instance, Str, Set, List, provides, Bool, Int
+from traits.api import Instance, Str, Set, List, provides, Bool, Int, Float
 from uncertainties import ufloat, std_dev, nominal_value
 
 from pychron import json
@@ -46,9 +47,13 @@ from pychron.dvc import (
     PATH_MODIFIERS,
     USE_GIT_TAGGING,
 )
-from pychron.dvc.cache import DVCCache
+from pychron.dvc.cache import DVCCache, DVCPersistentCache
 from pychron.dvc.defaults import TRIGA, HOLDER_24_SPOKES, LASER221, LASER65
-from pychron.dvc.dvc_analysis import DVCAnalysis
+from pychron.dvc.dvc_analysis import (
+    DVCAnalysis,
+    analysis_file_paths,
+    preload_analysis_files,
+)
 from pychron.dvc.dvc_database import DVCDatabase
 from pychron.dvc.func import (
     find_interpreted_age_path,
@@ -57,6 +62,7 @@ from pychron.dvc.func import (
     make_interpreted_age_dict,
 )
 from pychron.dvc.meta_repo import MetaRepo, get_frozen_flux, get_frozen_productions
+from pychron.dvc.repo_sync import RepositorySyncer, check_repository, fetch_repository
 from pychron.dvc.tasks.dvc_preferences import DVCConnectionItem
 from pychron.dvc.util import Tag, DVCInterpretedAge
 from pychron.envisage.browser.record_views import InterpretedAgeRecordView
@@ -116,9 +122,15 @@ class DVC(Loggable):
     use_cocktail_irradiation = Str
     use_cache = Bool
     max_cache_size = Int
+    use_persistent_cache = Bool(True)
+    analysis_loader_workers = Int
+    analysis_loader_use_processes = Bool
+    repository_sync_workers = Int(8)
+    repository_sync_timeout = Float(120)
     irradiation_prefix = Str
 
     _cache = None
+    _persistent_cache = None
     _uuid_runid_cache = None
     _pull_cache = None
     _author = None
@@ -745,7 +757,7 @@ class DVC(Loggable):
             self.info("Delete existing icfactors for {}".format(ai))
             ai.delete_icfactors(dets)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current_age(ai)
 
@@ -762,7 +774,7 @@ class DVC(Loggable):
                 )
 
         if self._cache:
-            self._cache.remove(ai.uiid)
+            self._cache.remove(ai.uuid)
         self._update_current_age(ai)
 
     def save_blanks(self, ai, keys, refs):
@@ -770,7 +782,7 @@ class DVC(Loggable):
             self.info("Saving blanks for {}".format(ai))
             ai.dump_blanks(keys, refs, reviewed=True)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current_blanks(ai, keys)
 
@@ -778,7 +790,7 @@ class DVC(Loggable):
         if keys:
             self.info("Saving equilibration for {}".format(ai))
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current(ai, keys)
             return ai.dump_equilibration(keys, reviewed=True)
@@ -788,7 +800,7 @@ class DVC(Loggable):
             self.info("Saving fits for {}".format(ai))
             ai.dump_fits(keys, reviewed=True)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current(ai, keys)
 
@@ -1030,14 +1042,6 @@ class DVC(Loggable):
 
             records = nrecords
 
-        def func(xi, prog, i, n):
-            if prog:
-                prog.change_message("Syncing repository= {}".format(xi))
-            try:
-                self.sync_repo(xi, use_progress=False, pull_frequency=pull_frequency)
-            except BaseException:
-                pass
-
         bad_records = [r for r in records if r.repository_identifier is None]
         if bad_records:
             self.warning_dialog(
@@ -1057,11 +1061,7 @@ class DVC(Loggable):
 
         exps = {r.repository_identifier for r in records}
 
-        if use_progress:
-            progress_iterator(exps, func, threshold=1)
-        else:
-            for ei in exps:
-                self.sync_repo(ei, use_progress=False)
+        self.sync_repos(exps, use_progress=use_progress, pull_frequency=pull_frequency)
         try:
             branches = {ei: get_repository_branch(repository_path(ei)) for ei in exps}
         except NoSuchPathError:
@@ -1136,6 +1136,12 @@ class DVC(Loggable):
 
             sens = meta_repo.get_sensitivities()
 
+        preloaded = None
+        if self._persistent_cache or (
+            self.analysis_loader_workers > 1 and len(records) > 1
+        ):
+            preloaded = self._preload_analysis_files(records)
+
         def func(*args):
             try:
                 return self._make_record(
@@ -1149,6 +1155,7 @@ class DVC(Loggable):
                     frozen_productions=frozen_productions,
                     flux_histories=flux_histories,
                     sample_prep=sample_prep,
+                    preloaded=preloaded,
                     quick=quick,
                     reload=reload,
                     *args
@@ -1193,47 +1200,36 @@ class DVC(Loggable):
 
     # repositories
     def find_changes(self, names, remote, branch):
-        gs = self.application.get_services(IGitHost)
-        for gi in gs:
-            gi.new_session()
-
-        def func(item, prog, i, n):
-            name = item.name
-            if prog:
-                prog.change_message("Examining: {}({}/{})".format(name, i, n))
-            self.debug("examining {}".format(name))
-
-            r = Repo(repository_path(name))
-            if branch in [b.name for b in r.branches]:
-                try:
-                    lc = r.commit(branch).hexsha
-                except BaseException as e:
-                    self.warning("skipping {}. {}".format(name, e))
-                    return
+        """
+        compare the repositories with their remotes concurrently and fetch the changed
+        ones.
 
-                for gi in gs:
-                    outdated, sha = gi.up_to_date(self.organization, name, lc, branch)
-                    if outdated:
-                        try:
-                            fsha = r.commit("FETCH_HEAD").hexsha
-                        except BaseException:
-                            fsha = None
+        names: list of RepoItems. the items are updated once all the repositories have
+        been examined
+        """
+        items = {item.name: item for item in names}
+        syncer = self._repository_syncer()
 
-                        try:
-                            if fsha != sha:
-                                self.debug("fetching {}".format(name))
-                                r.git.fetch()
-
-                            item.dirty = True
-                            item.update(fetch=False)
-                        except GitCommandError as e:
-                            self.warning("error examining {}. {}".format(name, e))
-                    else:
-                        item.update(fetch=False)
+        def func(name):
+            return check_repository(
+                repository_path(name), remote, branch, syncer.timeout
+            )
 
-        progress_loader(names, func, threshold=1)
-        for gi in gs:
-            gi.close_session()
+        report = self._run_repository_syncer(
+            syncer, list(items), func, True, "Examining"
+        )
+        for r in report:
+            if r.ok and r.value:
+                changed, ahead, behind = r.value
+                item = items[r.name]
+                if changed:
+                    item.dirty = True
+                item.set_ahead_behind(ahead, behind)
+
+        if report.errors:
+            self.warning_dialog(
+                "Failed examining repositories\n{}".format(report.summary())
+            )
 
     def repository_add_paths(self, repository_identifier, paths):
         repo = self._get_repository(repository_identifier)
@@ -1315,23 +1311,12 @@ class DVC(Loggable):
         )
 
         if exists:
-            if pull_frequency:
-                now = datetime.now()
-                last_pull = self._pull_cache.get(name)
-                self._pull_cache[name] = now
-                args = (
-                    last_pull,
-                    (datetime.now() - last_pull).seconds,
-                    (datetime.now() - last_pull).seconds < pull_frequency,
-                )
-
-                self.debug(" ".join([str(a) for a in args]))
-
-                if last_pull and (datetime.now() - last_pull).seconds < pull_frequency:
-                    return True
+            if self._is_recently_pulled(name, pull_frequency):
+                return True
 
             repo = self._get_repository(name)
             repo.pull(use_progress=use_progress, use_auto_pull=self.use_auto_pull)
+            self._pull_cache[name] = datetime.now()
             return True
         else:
             self.debug("getting repository from remote")
@@ -1347,20 +1332,67 @@ class DVC(Loggable):
                 #     service.clone_from(name, root, self.organization)
                 #     return True
                 else:
-                    if isinstance(service, LocalGitHostService):
-                        service.create_empty_repo(name)
-                        return True
-                    else:
+                    return self._clone_failed([name], service)
 
-                        self.warning_dialog(
-                            "name={} not in available repos "
-                            "from service={}, organization={}".format(
-                                name, service.remote_url, self.organization
-                            )
-                        )
-                        names = self.remote_repository_names()
-                        for ni in names:
-                            self.debug("available repo== {}".format(ni))
+    def sync_repos(self, names, use_progress=True, pull_frequency=None):
+        """
+        pull or clone the repositories ``names``.
+
+        the fetches run concurrently on a pool of ``repository_sync_workers`` threads,
+        each limited to ``repository_sync_timeout`` seconds. the fetched changes are
+        merged, or offered to the user if use_auto_pull is False, one repository at a
+        time once all the fetches are done. missing repositories are then cloned by the
+        git host service on the calling thread. repositories pulled less than
+        ``pull_frequency`` seconds ago are skipped
+
+        returns a RepositorySyncReport
+        """
+        names = [n for n in names if not self._is_recently_pulled(n, pull_frequency)]
+
+        service = None
+        if self.application and any(not self._repository_exists(n) for n in names):
+            service = self.application.get_service(IGitHost)
+
+        syncer = self._repository_syncer()
+
+        def func(name):
+            if self._repository_exists(name):
+                ahead, behind = fetch_repository(
+                    repository_path(name), timeout=syncer.timeout
+                )
+                return "fetched", behind
+            return "missing", 0
+
+        report = self._run_repository_syncer(
+            syncer, names, func, use_progress, "Syncing repository="
+        )
+
+        failed = []
+        for r in report:
+            if not r.ok:
+                continue
+
+            action, v = r.value
+            self.debug("sync repository {}. {}".format(r.name, action))
+            if action == "fetched":
+                self._pull_cache[r.name] = datetime.now()
+                if v:
+                    try:
+                        repo = self._get_repository(r.name)
+                        repo.merge_fetched(use_auto_pull=self.use_auto_pull, behind=v)
+                    except BaseException as e:
+                        self.warning("failed merging {}. {}".format(r.name, e))
+            elif service is not None:
+                self.debug("getting repository {} from remote".format(r.name))
+                if not service.clone_from(
+                    r.name, repository_path(r.name), self.organization
+                ):
+                    failed.append(r.name)
+
+        if failed:
+            self._clone_failed(failed, service)
+
+        return report
 
     def rollback_repository(self, expid):
         repo = self._get_repository(expid)
@@ -1458,8 +1490,8 @@ class DVC(Loggable):
     def meta_pull(self, **kw):
         return self.meta_repo.smart_pull(**kw)
 
-    def meta_push(self):
-        self.meta_repo.push()
+    def meta_push(self, **kw):
+        self.meta_repo.push(**kw)
 
     def meta_add_all(self):
         self.meta_repo.add_unstaged(paths.meta_root, add_all=True)
@@ -2051,6 +2083,88 @@ class DVC(Loggable):
             prog.change_message("Loading repository {}. {}/{}".format(expid, i, n))
         self.sync_repo(expid)
 
+    def _preload_analysis_files(self, records):
+        """
+        read and parse the json files for ``records``.
+
+        files are taken from the persistent cache when it holds an up-to-date copy. the remaining
+        files are read on a worker pool if ``analysis_loader_workers`` > 1 and added to the
+        persistent cache.
+
+        returns a dict of uuid: {path: json} that is used by DVCAnalysis instead of reading the
+        files on the main thread
+        """
+        st = time.time()
+        store = self._persistent_cache
+        root = paths.repository_dataset_dir
+
+        preloaded = {}
+        digests = {}
+        items = []
+        for r in records:
+            ps = analysis_file_paths(r.uuid, r.record_id, r.repository_identifier)
+            if store:
+                digest = store.digest(r.repository_identifier, ps)
+                state = store.get(r.uuid, digest)
+                if state is not None:
+                    preloaded[r.uuid] = {
+                        os.path.join(root, k): v for k, v in state.items()
+                    }
+                    continue
+                digests[r.uuid] = digest
+
+            items.append((r.uuid, ps))
+
+        ncached = len(preloaded)
+        nworkers = self.analysis_loader_workers
+        if items:
+            if nworkers > 1:
+                # several batches per worker to balance the load without too much scheduling
+                # overhead
+                size = max(1, min(100, len(items) // (nworkers * 4)))
+                batches = [items[i : i + size] for i in range(0, len(items), size)]
+
+                klass = (
+                    ProcessPoolExecutor
+                    if self.analysis_loader_use_processes
+                    else ThreadPoolExecutor
+                )
+                loaded = []
+                try:
+                    with klass(max_workers=nworkers) as pool:
+                        for result in pool.map(preload_analysis_files, batches):
+                            loaded.extend(result)
+                except BaseException as e:
+                    self.warning("Failed preloading analyses. error={}".format(e))
+                    self.debug_exception()
+            else:
+                loaded = preload_analysis_files(items)
+
+            preloaded.update(loaded)
+            if store:
+                store.update(
+                    [
+                        (
+                            uuid,
+                            digests.get(uuid),
+                            {os.path.relpath(k, root): v for k, v in jds.items()},
+                        )
+                        for uuid, jds in loaded
+                    ]
+                )
+
+        self.debug(
+            "Preloaded {} analyses ({} from persistent cache). workers={}, processes={}, "
+            "time={:0.2f}s".format(
+                len(preloaded),
+                ncached,
+                nworkers,
+                self.analysis_loader_use_processes,
+                time.time() - st,
+            )
+        )
+        return preloaded
+
     def _make_record(
         self,
         record,
@@ -2066,6 +2180,7 @@ class DVC(Loggable):
         frozen_productions=None,
         flux_histories=None,
         sample_prep=None,
+        preloaded=None,
         calculate_f_only=False,
         reload=False,
         quick=False,
@@ -2104,7 +2219,9 @@ class DVC(Loggable):
             uuid = record.uuid
 
             try:
-                a = DVCAnalysis(uuid, rid, expid)
+                a = DVCAnalysis(
+                    uuid, rid, expid, preloaded=preloaded.get(uuid) if preloaded else None
+                )
             except AnalysisNotAnvailableError:
                 self.warning_dialog(
                     "Analysis {} not in local repository {}. "
@@ -2119,11 +2236,9 @@ class DVC(Loggable):
             a.set_tag(record.tag)
 
             if sample_prep:
-                a.sample_prep_comment = sample_prep.get(
-                    record.irradiation_position.sample.id
-                )
+                a.sample_prep_comment = sample_prep.get(record.sample_id)
 
-            a.sample_note = record.irradiation_position.sample.note or ""
+            a.sample_note = record.sample_note or ""
 
             if not quick:
                 a.load_name = record.load_name
@@ -2243,6 +2358,54 @@ class DVC(Loggable):
             self._cache.update(record.uuid, a)
         return a
 
+    def _repository_exists(self, name):
+        return os.path.isdir(os.path.join(repository_path(name), ".git"))
+
+    def _is_recently_pulled(self, name, pull_frequency):
+        if pull_frequency and self._repository_exists(name):
+            last_pull = self._pull_cache.get(name)
+            if last_pull:
+                dt = (datetime.now() - last_pull).total_seconds()
+                self.debug(
+                    "{} last pulled {:0.1f}s ago. pull_frequency={}".format(
+                        name, dt, pull_frequency
+                    )
+                )
+                return dt < pull_frequency
+        return False
+
+    def _clone_failed(self, names, service):
+        if isinstance(service, LocalGitHostService):
+            for name in names:
+                service.create_empty_repo(name)
+            return True
+        else:
+            self.warning_dialog(
+                "name={} not in available repos "
+                "from service={}, organization={}".format(
+                    ",".join(names), service.remote_url, self.organization
+                )
+            )
+            rnames = self.remote_repository_names()
+            for ni in rnames:
+                self.debug("available repo== {}".format(ni))
+
+    def _repository_syncer(self):
+        return RepositorySyncer(
+            max_workers=self.repository_sync_workers,
+            timeout=self.repository_sync_timeout,
+        )
+
+    def _run_repository_syncer(self, syncer, names, func, use_progress, message):
+        prog = None
+        if use_progress and len(names) > 1:
+            prog = open_progress(len(names))
+        try:
+            return syncer.run(names, func, progress=prog, message=message)
+        finally:
+            if prog:
+                prog.close()
+
     def _get_repository(self, repository_identifier, as_current=True):
         if isinstance(repository_identifier, GitRepoManager):
             repo = repository_identifier
@@ -2278,9 +2441,34 @@ class DVC(Loggable):
         )
         bind_preference(self, "use_cache", "{}.use_cache".format(prefid))
         bind_preference(self, "max_cache_size", "{}.max_cache_size".format(prefid))
+        bind_preference(
+            self, "use_persistent_cache", "{}.use_persistent_cache".format(prefid)
+        )
+        bind_preference(
+            self, "analysis_loader_workers", "{}.analysis_loader_workers".format(prefid)
+        )
+        bind_preference(
+            self,
+            "analysis_loader_use_processes",
+            "{}.analysis_loader_use_processes".format(prefid),
+        )
         bind_preference(
             self, "update_currents_enabled", "{}.update_currents_enabled".format(prefid)
         )
+        bind_preference(
+            self, "repository_sync_workers", "{}.repository_sync_workers".format(prefid)
+        )
+        bind_preference(
+            self, "repository_sync_timeout", "{}.repository_sync_timeout".format(prefid)
+        )
+        for attr in (
+            "use_session_pool",
+            "pool_size",
+            "pool_max_overflow",
+            "pool_timeout",
+            "pool_pre_ping",
+        ):
+            bind_preference(self.db, attr, "{}.{}".format(prefid, attr))
         bind_preference(self, "use_auto_pull", "{}.use_auto_pull".format(prefid))
         bind_preference(self, "use_auto_push", "{}.use_auto_push".format(prefid))
         bind_preference(
@@ -2295,6 +2483,8 @@ class DVC(Loggable):
         )
         if self.use_cache:
             self._use_cache_changed()
+        if self.use_persistent_cache:
+            self._use_persistent_cache_changed()
 
     def _max_cache_size_changed(self, new):
         if new:
@@ -2311,6 +2501,19 @@ class DVC(Loggable):
         else:
             self._cache = None
 
+    def _use_persistent_cache_changed(self):
+        if self._persistent_cache:
+            self._persistent_cache.close()
+            self._persistent_cache = None
+
+        if self.use_persistent_cache:
+            root = paths.repository_dataset_dir
+            if root and os.path.isdir(root):
+                try:
+                    self._persistent_cache = DVCPersistentCache(root)
+                except BaseException as e:
+                    self.warning("Failed opening persistent cache. error={}".format(e))
+
     def _favorites_changed(self, items):
         try:
             ds = [DVCConnectionItem(attrs=f, load_names=False) for f in items]
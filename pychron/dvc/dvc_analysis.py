@@ -36,6 +36,7 @@ from pychron.dvc import (
     ICFACTORS,
     PEAKCENTER,
     COSMOGENIC,
+    DATA,
 )
 from pychron.dvc import (
     dvc_dump,
@@ -47,6 +48,12 @@ from pychron.dvc import (
     repository_path,
     AnalysisNotAnvailableError,
 )
+from pychron.dvc.analysis_bundle import (
+    ANALYSIS_MEMBERS,
+    load_analysis_files,
+    load_bundle,
+    update_bundle,
+)
 from pychron.experiment.utilities.environmentals import set_environmentals
 from pychron.experiment.utilities.runid import make_aliquot_step, make_step
 from pychron.processing.analyses.analysis import Analysis
@@ -63,6 +70,63 @@ from pychron.pychron_constants import (
 )
 
 
+def get_load_modifiers():
+    modifiers = (
+        INTERCEPTS,
+        BASELINES,
+        BLANKS,
+        ICFACTORS,
+        PEAKCENTER,
+        COSMOGENIC,
+    )
+    if USE_GIT_TAGGING:
+        modifiers += ("tags",)
+    return modifiers
+
+
+def extraction_path(path):
+    root = os.path.dirname(path)
+    head, ext = os.path.splitext(os.path.basename(path))
+    return os.path.join(root, "extraction", "{}.extr{}".format(head, ext))
+
+
+def analysis_file_paths(uuid, record_id, repository_identifier):
+    """
+    return the paths of the json files read when constructing a DVCAnalysis
+    """
+    path = analysis_path((uuid, record_id), repository_identifier)
+    if path is None:
+        return []
+
+    ps = [path, extraction_path(path)]
+    for modifier in get_load_modifiers():
+        p = analysis_path((uuid, record_id), repository_identifier, modifier=modifier)
+        if p:
+            ps.append(p)
+
+    return [p for p in ps if os.path.isfile(p)]
+
+
+def preload_analysis_files(items):
+    """
+    items: list of (key, paths)
+
+    read and parse the json files for a batch of analyses. an analysis's bundle is used if it
+    is current.
+    safe to run in a worker thread or process
+    """
+    return [(key, load_analysis_files(ps)) for key, ps in items]
+
+
+def blob_bytes(blob):
+    """
+    return the raw bytes of a data blob. bundles store the raw bytes, the json files base64 text
+    """
+    if isinstance(blob, bytes):
+        return blob
+    return format_blob(blob)
+
+
 class Blank:
     pass
 
@@ -90,8 +154,12 @@ class DVCAnalysis(Analysis):
     chronology_obj = None
     use_repository_suffix = False
 
+    _preloaded = None
+
     def __init__(self, uuid, record_id, repository_identifier, *args, **kw):
+        preloaded = kw.pop("preloaded", None)
         super(DVCAnalysis, self).__init__(*args, **kw)
+        self._preloaded = preloaded
         self.record_id = record_id
         path = analysis_path((uuid, record_id), repository_identifier)
         self.repository_identifier = repository_identifier
@@ -100,13 +168,12 @@ class DVCAnalysis(Analysis):
         if path is None:
             raise AnalysisNotAnvailableError(repository_identifier, record_id)
 
-        root = os.path.dirname(path)
-        bname = os.path.basename(path)
-        head, ext = os.path.splitext(bname)
+        if preloaded is None:
+            self._preloaded = load_bundle(path, modifiers=ANALYSIS_MEMBERS)
 
-        ep = os.path.join(root, "extraction", "{}.extr{}".format(head, ext))
+        ep = extraction_path(path)
         if os.path.isfile(ep):
-            jd = dvc_load(ep)
+            jd = self._dvc_load(ep)
 
             self.load_extraction(jd)
 
@@ -118,7 +185,7 @@ class DVCAnalysis(Analysis):
             )
 
         if os.path.isfile(path):
-            jd = dvc_load(path)
+            jd = self._dvc_load(path)
             self.load_spectrometer_parameters(jd.get("spec_sha"))
             self.load_environmentals(jd.get("environmental"))
 
@@ -129,6 +196,7 @@ class DVCAnalysis(Analysis):
             )
 
         self.load_paths()
+        self._preloaded = None
 
     @property
     def irradiation_position_position(self):
@@ -221,23 +289,15 @@ class DVCAnalysis(Analysis):
 
     def load_paths(self, modifiers=None):
         if modifiers is None:
-            modifiers = (
-                INTERCEPTS,
-                BASELINES,
-                BLANKS,
-                ICFACTORS,
-                PEAKCENTER,
-                COSMOGENIC,
-            )
-
-        if USE_GIT_TAGGING:
+            modifiers = get_load_modifiers()
+        elif USE_GIT_TAGGING:
             modifiers += ("tags",)
 
         for modifier in modifiers:
             path = self._analysis_path(modifier=modifier)
             if path:
                 if os.path.isfile(path):
-                    jd = dvc_load(path)
+                    jd = self._dvc_load(path)
                     if jd:
                         func = getattr(self, "_load_{}".format(modifier))
                         try:
@@ -276,7 +336,12 @@ class DVCAnalysis(Analysis):
     def load_raw_data(self, keys=None, n_only=False, use_name_pairs=True):
         path = self._analysis_path(modifier=".data")
 
-        jd = dvc_load(path)
+        jd = None
+        bundle = load_bundle(self.meta_path, modifiers=(DATA,))
+        if bundle:
+            jd = bundle.get(path)
+        if jd is None:
+            jd = dvc_load(path)
 
         signals = jd.get("signals", [])
         baselines = jd.get("baselines", [])
@@ -302,14 +367,14 @@ class DVCAnalysis(Analysis):
 
             blob = sd.get("blob")
             if blob:
-                iso.unpack_data(format_blob(blob), n_only)
+                iso.unpack_data(blob_bytes(blob), n_only)
 
             # det = sd['detector']
             bd = next((b for b in baselines if b.get("detector") == det), None)
             if bd:
                 blob = bd.get("blob")
                 if blob:
-                    iso.baseline.unpack_data(format_blob(blob), n_only)
+                    iso.baseline.unpack_data(blob_bytes(blob), n_only)
 
         # loop thru keys to make sure none were missed this can happen when only loading baseline
         if keys:
@@ -320,7 +385,7 @@ class DVCAnalysis(Analysis):
                         if iso.detector == k:
                             blob = bd.get("blob")
                             if blob:
-                                iso.baseline.unpack_data(format_blob(blob), n_only)
+                                iso.baseline.unpack_data(blob_bytes(blob), n_only)
 
         for sn in sniffs:
             isok = sn.get("isotope")
@@ -338,7 +403,7 @@ class DVCAnalysis(Analysis):
             data = None
             blob = sn.get("blob")
             if blob:
-                data = format_blob(blob)
+                data = blob_bytes(blob)
 
             for iso in self.itervalues():
                 if iso.detector == det:
@@ -748,6 +813,18 @@ class DVCAnalysis(Analysis):
 
         dvc_dump(obj, path)
 
+        # keep an existing bundle current
+        meta_path = self.meta_path
+        if meta_path:
+            update_bundle(meta_path, path, obj)
+
+    def _dvc_load(self, path):
+        if self._preloaded:
+            jd = self._preloaded.get(path)
+            if jd is not None:
+                return jd
+        return dvc_load(path)
+
     def _analysis_path(self, repository_identifier=None, **kw):
         if repository_identifier is None:
             repository_identifier = self.repository_identifier
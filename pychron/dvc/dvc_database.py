@@ -18,6 +18,7 @@ from datetime import timedelta, datetime
 from string import digits, ascii_letters
 
 from sqlalchemy import not_, func, distinct, or_, and_
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.sql.functions import count
 from sqlalchemy.util import OrderedSet
@@ -77,6 +78,47 @@ from pychron.pychron_constants import (
 )
 
 
+# columns of the rows returned by DVCDatabase.get_analysis_listing
+ANALYSIS_LISTING_COLUMNS = (
+    "id",
+    "uuid",
+    "timestamp",
+    "aliquot",
+    "increment",
+    "analysis_type",
+    "mass_spectrometer",
+    "extract_device",
+    "extract_value",
+    "cleanup",
+    "pre_cleanup",
+    "post_cleanup",
+    "cryo_temperature",
+    "duration",
+    "comment",
+    "meas_script_name",
+    "extract_script_name",
+    "identifier",
+    "irradiation_position_position",
+    "packet",
+    "irradiation_level",
+    "irradiation",
+    "sample_id",
+    "sample",
+    "sample_note",
+    "material_name",
+    "grainsize",
+    "project",
+    "pi_last_name",
+    "pi_first_initial",
+    "change_tag",
+    # added per page
+    "repository_ids",
+    "positions",
+    "load_name",
+    "load_holder",
+)
+
+
 def listify(obj):
     if obj:
         if not isinstance(obj, (tuple, list)):
@@ -258,6 +300,8 @@ class DVCDatabase(DatabaseAdapter):
     level = Str
     levels = List
 
+    _use_window_count = True
+
     def __init__(self, clear=False, auto_add=False, *args, **kw):
         super(DVCDatabase, self).__init__(*args, **kw)
 
@@ -1574,6 +1618,146 @@ class DVCDatabase(DatabaseAdapter):
             tc = q.count()
             return self._query_all(q, verbose_query=verbose_query), tc
 
+    def get_analysis_listing(
+        self,
+        lns,
+        after=None,
+        limit=500,
+        order="asc",
+        low_post=None,
+        high_post=None,
+        exclude_uuids=None,
+        include_invalid=False,
+        mass_spectrometers=None,
+        repositories=None,
+        loads=None,
+        verbose_query=False,
+    ):
+        """
+        lightweight alternative to ``get_labnumber_analyses`` for the browser tables.
+
+        only the columns the tables show are selected and no ORM objects are built. rows are
+        paged on (timestamp, id); pass the returned cursor as ``after`` to get the next page.
+
+        :return: rows, total, cursor. rows is a list of tuples ordered as
+            ``ANALYSIS_LISTING_COLUMNS``. total is the number of matching analyses after
+            ``after``, i.e. all of them for the first page. cursor is None if there are no more
+            rows
+        """
+        with self.session_ctx() as sess:
+            q = sess.query(
+                AnalysisTbl.id,
+                AnalysisTbl.uuid,
+                AnalysisTbl.timestamp,
+                AnalysisTbl.aliquot,
+                AnalysisTbl.increment,
+                AnalysisTbl.analysis_type,
+                AnalysisTbl.mass_spectrometer,
+                AnalysisTbl.extract_device,
+                AnalysisTbl.extract_value,
+                AnalysisTbl.cleanup,
+                AnalysisTbl.pre_cleanup,
+                AnalysisTbl.post_cleanup,
+                AnalysisTbl.cryo_temperature,
+                AnalysisTbl.duration,
+                AnalysisTbl.comment,
+                AnalysisTbl.measurementName,
+                AnalysisTbl.extractionName,
+                IrradiationPositionTbl.identifier,
+                IrradiationPositionTbl.position,
+                IrradiationPositionTbl.packet,
+                LevelTbl.name,
+                IrradiationTbl.name,
+                SampleTbl.id,
+                SampleTbl.name,
+                SampleTbl.note,
+                MaterialTbl.name,
+                MaterialTbl.grainsize,
+                ProjectTbl.name,
+                PrincipalInvestigatorTbl.last_name,
+                PrincipalInvestigatorTbl.first_initial,
+                AnalysisChangeTbl.tag,
+            )
+            q = q.select_from(AnalysisTbl)
+            q = q.join(
+                IrradiationPositionTbl,
+                AnalysisTbl.irradiation_positionID == IrradiationPositionTbl.id,
+            )
+            q = q.outerjoin(LevelTbl, IrradiationPositionTbl.levelID == LevelTbl.id)
+            q = q.outerjoin(IrradiationTbl, LevelTbl.irradiationID == IrradiationTbl.id)
+            q = q.outerjoin(SampleTbl, IrradiationPositionTbl.sampleID == SampleTbl.id)
+            q = q.outerjoin(MaterialTbl, SampleTbl.materialID == MaterialTbl.id)
+            q = q.outerjoin(ProjectTbl, SampleTbl.projectID == ProjectTbl.id)
+            q = q.outerjoin(
+                PrincipalInvestigatorTbl,
+                ProjectTbl.principal_investigatorID == PrincipalInvestigatorTbl.id,
+            )
+            q = q.outerjoin(
+                AnalysisChangeTbl, AnalysisChangeTbl.analysisID == AnalysisTbl.id
+            )
+
+            # filter on the one-to-many tables with EXISTS so that an analysis is listed once
+            if repositories:
+                q = q.filter(
+                    AnalysisTbl.repository_associations.any(
+                        func.lower(RepositoryAssociationTbl.repository).in_(
+                            [r.lower() for r in listify(repositories)]
+                        )
+                    )
+                )
+            if loads:
+                q = q.filter(
+                    AnalysisTbl.measured_positions.any(
+                        MeasuredPositionTbl.loadName.in_(listify(loads))
+                    )
+                )
+
+            q = in_func(q, AnalysisTbl.mass_spectrometer, mass_spectrometers)
+            q = in_func(q, IrradiationPositionTbl.identifier, lns)
+
+            if low_post:
+                q = q.filter(AnalysisTbl.timestamp >= str(low_post))
+
+            if high_post:
+                q = q.filter(AnalysisTbl.timestamp <= str(high_post))
+
+            if exclude_uuids:
+                q = q.filter(not_(AnalysisTbl.uuid.in_(exclude_uuids)))
+
+            if not include_invalid:
+                q = q.filter(AnalysisChangeTbl.tag != "invalid")
+
+            if after:
+                ts, aid = after
+                if order == "desc":
+                    f = or_(
+                        AnalysisTbl.timestamp < ts,
+                        and_(AnalysisTbl.timestamp == ts, AnalysisTbl.id < aid),
+                    )
+                else:
+                    f = or_(
+                        AnalysisTbl.timestamp > ts,
+                        and_(AnalysisTbl.timestamp == ts, AnalysisTbl.id > aid),
+                    )
+                q = q.filter(f)
+
+            if order == "desc":
+                q = q.order_by(AnalysisTbl.timestamp.desc(), AnalysisTbl.id.desc())
+            else:
+                q = q.order_by(AnalysisTbl.timestamp.asc(), AnalysisTbl.id.asc())
+
+            if verbose_query:
+                self.debug(compile_query(q))
+
+            rows, total = self._query_listing_page(sess, q, limit)
+
+            cursor = None
+            if rows and total > len(rows):
+                last = rows[-1]
+                cursor = last[2], last[0]
+
+            return self._add_listing_associations(sess, rows), total, cursor
+
     def get_repository_date_range(self, names):
         with self.session_ctx() as sess:
             q = sess.query(AnalysisTbl.timestamp)
@@ -2574,6 +2758,77 @@ class DVCDatabase(DatabaseAdapter):
             c.units = units
 
     # private
+    def _query_listing_page(self, sess, q, limit):
+        """
+        return the rows of a listing page and the number of matching rows.
+
+        the count is computed in the same query with a window function. databases without
+        window functions (e.g. MySQL < 8) fall back to a separate count query
+        """
+        if self._use_window_count:
+            wq = q.add_columns(func.count().over())
+            if limit:
+                wq = wq.limit(limit)
+            try:
+                rows = wq.all()
+            except SQLAlchemyError as e:
+                sess.rollback()
+                self.debug("window count not available. {}".format(e))
+                self._use_window_count = False
+            else:
+                total = rows[0][-1] if rows else 0
+                return [tuple(r[:-1]) for r in rows], total
+
+        total = q.count()
+        if limit:
+            q = q.limit(limit)
+        return [tuple(r) for r in q.all()], total
+
+    def _add_listing_associations(self, sess, rows):
+        """
+        append the repositories and measured positions of each analysis to its row.
+        one query per table for the page instead of one per analysis
+        """
+        if not rows:
+            return rows
+
+        ids = [r[0] for r in rows]
+        repos = {}
+        q = sess.query(
+            RepositoryAssociationTbl.analysisID, RepositoryAssociationTbl.repository
+        )
+        q = q.filter(RepositoryAssociationTbl.analysisID.in_(ids))
+        for aid, repo in q.all():
+            repos.setdefault(aid, []).append(repo)
+
+        positions = {}
+        q = sess.query(
+            MeasuredPositionTbl.analysisID,
+            MeasuredPositionTbl.position,
+            MeasuredPositionTbl.loadName,
+            LoadTbl.holderName,
+        )
+        q = q.outerjoin(LoadTbl, MeasuredPositionTbl.loadName == LoadTbl.name)
+        q = q.filter(MeasuredPositionTbl.analysisID.in_(ids))
+        q = q.order_by(MeasuredPositionTbl.id)
+        for aid, pos, load_name, holder in q.all():
+            positions.setdefault(aid, []).append((pos, load_name, holder))
+
+        ret = []
+        for r in rows:
+            aid = r[0]
+            mps = positions.get(aid)
+            if mps:
+                ps = ",".join(["{}".format(p) for p, _, _ in mps if p])
+                _, load_name, holder = mps[0]
+            else:
+                ps, load_name, holder = "", None, None
+
+            ret.append(
+                r + (tuple(repos.get(aid, ())), ps, load_name or "", holder or "")
+            )
+        return ret
+
     def _get_date_range(self, q, asc=None, desc=None, hours=0):
         if asc is None:
             asc = AnalysisTbl.timestamp.asc()
@@ -227,6 +227,20 @@ class AnalysisTbl(Base, IDMixin):
         except AttributeError:
             return ""
 
+    @property
+    def sample_id(self):
+        try:
+            return self.irradiation_position.sample.id
+        except AttributeError:
+            return None
+
+    @property
+    def sample_note(self):
+        try:
+            return self.irradiation_position.sample.note
+        except AttributeError:
+            return None
+
     @property
     def irradiation_position_position(self):
         return self.irradiation_position.position
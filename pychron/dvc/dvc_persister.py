@@ -31,6 +31,8 @@ from yaml import YAMLError
 from pychron.core.helpers.binpack import encode_blob, pack
 from pychron.core.yaml import yload
 from pychron.dvc import dvc_dump, analysis_path, repository_path, NPATH_MODIFIERS
+from pychron.dvc.analysis_bundle import write_bundle, exclude_bundles
+from pychron.dvc.push_queue import DVCPushQueue
 from pychron.experiment.automated_run.persistence import BasePersister
 from pychron.experiment.automated_run.persistence_spec import PersistenceSpec
 from pychron.experiment.automated_run.spec import AutomatedRunSpec
@@ -82,12 +84,22 @@ class DVCPersister(BasePersister):
     save_log_enabled = Bool(False)
     arar_mapping = None
 
+    use_background_push = Bool(True)
+    use_analysis_bundles = Bool(False)
+    push_queue = Instance(DVCPushQueue, ())
+
     def __init__(self, bind=True, load_mapping=True, *args, **kw):
         super(DVCPersister, self).__init__(*args, **kw)
         if bind:
             bind_preference(
                 self, "use_uuid_path_name", "pychron.experiment.use_uuid_path_name"
             )
+            bind_preference(
+                self, "use_background_push", "pychron.experiment.use_background_push"
+            )
+            bind_preference(
+                self, "use_analysis_bundles", "pychron.dvc.use_analysis_bundles"
+            )
 
         if load_mapping:
             self._load_arar_mapping()
@@ -117,6 +129,23 @@ class DVCPersister(BasePersister):
         # push commit
         self.dvc.meta_push()
 
+    def is_push_pending(self, repository):
+        return self.push_queue.is_pending(self._push_key(repository))
+
+    def wait_for_pushes(self, repository=None, timeout=None):
+        """
+        block until the background pushes, or the push of ``repository``, are finished.
+
+        returns False if ``timeout`` expired first
+        """
+        key = None
+        if repository is not None:
+            key = self._push_key(repository)
+        return self.push_queue.wait(key, timeout)
+
+    def _push_key(self, repository):
+        return repository_path(format_repository_identifier(repository))
+
     def initialize(self, repository, pull=True):
         """
         setup git repos.
@@ -142,11 +171,12 @@ class DVCPersister(BasePersister):
         if repo.has_remote(remote) and pull:
             self.info("pulling changes from repo: {}".format(repository))
             try:
-                repo.pull(
-                    remote=remote,
-                    use_progress=False,
-                    use_auto_pull=self.dvc.use_auto_pull,
-                )
+                with self._repository_lock(repo):
+                    repo.pull(
+                        remote=remote,
+                        use_progress=False,
+                        use_auto_pull=self.dvc.use_auto_pull,
+                    )
             except GitCommandError:
                 self.warning("failed pulling changes")
                 self.debug_exception()
@@ -286,70 +316,47 @@ class DVCPersister(BasePersister):
         # save peak center
         self._save_peak_center(self.per_spec.peak_center)
 
+        if self.use_analysis_bundles:
+            self._save_bundle()
+
         # stage files
         dvc = self.dvc
 
         if self.stage_files:
             if commit:
+                # with background pushes the push queue pulls if the remote is ahead
+                background = push and self.use_background_push
                 try:
-                    ar.smart_pull(accept_their=True)
+                    with self._repository_lock(ar):
+                        if not background:
+                            ar.smart_pull(accept_their=True)
 
-                    paths = [
-                        spec_path,
-                    ] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]
+                        self._commit_analysis(ar, spec_path, commit_tag)
 
-                    for p in paths:
-                        if os.path.isfile(p):
-                            ar.add(p, commit=False)
-                        else:
-                            self.debug("not at valid file {}".format(p))
-
-                    # commit files
-                    ar.commit("<{}>".format(commit_tag))
-
-                    # commit default data reduction
-                    add = False
-                    p = self._make_path("intercepts")
-                    if os.path.isfile(p):
-                        ar.add(p, commit=False)
-                        add = True
-
-                    p = self._make_path("baselines")
-                    if os.path.isfile(p):
-                        ar.add(p, commit=False)
-                        add = True
-
-                    if add:
-                        ar.commit("<ISOEVO> default collection fits")
-
-                    for pp, tag, msg in (
-                        (
-                            "blanks",
-                            "BLANKS",
-                            "preceding {}".format(self.per_spec.previous_blank_runid),
-                        ),
-                        ("icfactors", "ICFactor", "default"),
-                    ):
-                        p = self._make_path(pp)
-                        if os.path.isfile(p):
-                            ar.add(p, commit=False)
-                            ar.commit("<{}> {}".format(tag, msg))
                     if push:
-                        # push changes
-                        dvc.push_repository(ar)
+                        if background:
+                            self._queue_push(ar)
+                        else:
+                            # push changes
+                            dvc.push_repository(ar)
 
                     # update meta
-                    dvc.meta_pull(accept_our=True)
+                    with self._repository_lock(dvc.meta_repo):
+                        if not background:
+                            dvc.meta_pull(accept_our=True)
 
-                    dvc.meta_commit(
-                        "repo updated for analysis {}".format(
-                            self.per_spec.run_spec.runid
+                        dvc.meta_commit(
+                            "repo updated for analysis {}".format(
+                                self.per_spec.run_spec.runid
+                            )
                         )
-                    )
 
                     if push:
-                        # push commit
-                        dvc.meta_push()
+                        if background:
+                            self._queue_meta_push()
+                        else:
+                            # push commit
+                            dvc.meta_push()
                 except GitCommandError as e:
                     self.warning(e)
                     if self.confirmation_dialog(
@@ -381,12 +388,87 @@ class DVCPersister(BasePersister):
             npath = self._make_path("logs", ".log")
             shutil.copyfile(path, npath)
             ar = self.active_repository
-            ar.smart_pull(accept_their=True)
-            ar.add(npath, commit=False)
-            ar.commit("<COLLECTION> log")
-            self.dvc.push_repository(ar)
+            with self._repository_lock(ar):
+                if not self.use_background_push:
+                    ar.smart_pull(accept_their=True)
+                ar.add(npath, commit=False)
+                ar.commit("<COLLECTION> log")
+
+            if self.use_background_push:
+                self._queue_push(ar)
+            else:
+                self.dvc.push_repository(ar)
 
     # private
+    def _save_bundle(self):
+        try:
+            write_bundle(self._make_path())
+            exclude_bundles(self.active_repository.path)
+        except (OSError, ValueError) as e:
+            # the bundle is only a cache of the json files. never fail the save because of it
+            self.warning("failed writing analysis bundle. {}".format(e))
+
+    def _commit_analysis(self, ar, spec_path, commit_tag):
+        paths = [
+            spec_path,
+        ] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]
+
+        for p in paths:
+            if os.path.isfile(p):
+                ar.add(p, commit=False)
+            else:
+                self.debug("not at valid file {}".format(p))
+
+        # commit files
+        ar.commit("<{}>".format(commit_tag))
+
+        # commit default data reduction
+        add = False
+        p = self._make_path("intercepts")
+        if os.path.isfile(p):
+            ar.add(p, commit=False)
+            add = True
+
+        p = self._make_path("baselines")
+        if os.path.isfile(p):
+            ar.add(p, commit=False)
+            add = True
+
+        if add:
+            ar.commit("<ISOEVO> default collection fits")
+
+        for pp, tag, msg in (
+            (
+                "blanks",
+                "BLANKS",
+                "preceding {}".format(self.per_spec.previous_blank_runid),
+            ),
+            ("icfactors", "ICFactor", "default"),
+        ):
+            p = self._make_path(pp)
+            if os.path.isfile(p):
+                ar.add(p, commit=False)
+                ar.commit("<{}> {}".format(tag, msg))
+
+    def _repository_lock(self, repo):
+        return self.push_queue.repository_lock(repo.path)
+
+    def _queue_push(self, repo):
+        dvc = self.dvc
+        self.push_queue.put(
+            repo.path,
+            lambda: dvc.push_repository(repo, raise_exceptions=True),
+            lambda: repo.smart_pull(accept_their=True),
+        )
+
+    def _queue_meta_push(self):
+        dvc = self.dvc
+        self.push_queue.put(
+            dvc.meta_repo.path,
+            lambda: dvc.meta_push(raise_exceptions=True),
+            lambda: dvc.meta_pull(accept_our=True),
+        )
+
     def _load_arar_mapping(self):
         """
         Isotope: IsotopeKey
@@ -0,0 +1,203 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import time
+from collections import OrderedDict
+from threading import Thread, Condition, RLock
+
+from git.exc import GitCommandError
+from traits.api import Int, Float
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+
+
+class DVCPushQueue(Loggable):
+    """
+    Push repositories from a background thread.
+
+    ``put`` schedules a push of a repository. A repository already waiting to be pushed is not
+    queued again, so the commits of consecutive runs go out in a single push. A failed push is
+    followed by a pull (to resolve a rejected, non fast-forward push) and retried with an
+    exponential backoff. After ``max_retries`` the push is abandoned; the commits stay local and
+    are sent with the next push of that repository.
+
+    Work on a repository's working tree (commits, pulls) must be done while holding
+    ``repository_lock(key)`` so that it does not run at the same time as a pull on the worker
+    """
+
+    backlog = Int
+    max_retries = Int(5)
+    backoff = Float(2)
+    max_backoff = Float(60)
+
+    def __init__(self, *args, **kw):
+        super(DVCPushQueue, self).__init__(*args, **kw)
+        self._cond = Condition()
+        self._pending = OrderedDict()
+        self._active = None
+        self._locks = {}
+        self._alive = False
+        self._thread = None
+
+    def repository_lock(self, key):
+        with self._cond:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = RLock()
+        return lock
+
+    def put(self, key, push, pull=None):
+        """
+        schedule a push
+
+        :param key: str. usually the repository path
+        :param push: callable. push the repository. must raise GitCommandError on failure
+        :param pull: callable. pull the repository. called before retrying a failed push
+        """
+        if not self._alive:
+            self.start()
+
+        with self._cond:
+            if key in self._pending:
+                self.debug("push {} already queued".format(key))
+            else:
+                self._pending[key] = (push, pull)
+                self._update_backlog()
+                self._cond.notify_all()
+
+    def is_pending(self, key):
+        with self._cond:
+            return key in self._pending or self._active == key
+
+    def wait(self, key=None, timeout=None):
+        """
+        block until all pushes, or the push of ``key``, are finished.
+
+        returns False if ``timeout`` expired first
+        """
+        if key is None:
+            predicate = lambda: self._pending or self._active is not None
+        else:
+            predicate = lambda: key in self._pending or self._active == key
+
+        st = time.time()
+        with self._cond:
+            while predicate():
+                if not self._alive:
+                    return False
+
+                remaining = None
+                if timeout is not None:
+                    remaining = timeout - (time.time() - st)
+                    if remaining <= 0:
+                        return False
+
+                self._cond.wait(remaining)
+        return True
+
+    def start(self):
+        with self._cond:
+            if self._alive:
+                return
+            self._alive = True
+
+        self._thread = t = Thread(target=self._run, name="DVCPushQueue")
+        t.daemon = True
+        t.start()
+
+    def stop(self, timeout=None):
+        with self._cond:
+            self._alive = False
+            self._cond.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # private
+    def _update_backlog(self):
+        n = len(self._pending) + (1 if self._active is not None else 0)
+        if n != self.backlog:
+            self.backlog = n
+
+    def _run(self):
+        while 1:
+            with self._cond:
+                while self._alive and not self._pending:
+                    self._cond.wait()
+
+                if not self._alive:
+                    break
+
+                key, (push, pull) = self._pending.popitem(last=False)
+                self._active = key
+
+            try:
+                self._push(key, push, pull)
+            except BaseException:
+                self.debug_exception()
+            finally:
+                with self._cond:
+                    self._active = None
+                    self._update_backlog()
+                    self._cond.notify_all()
+
+    def _push(self, key, push, pull):
+        attempt = 0
+        while 1:
+            try:
+                push()
+                self.debug("pushed {}".format(key))
+                return True
+            except GitCommandError as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    self.warning(
+                        "failed pushing {} after {} attempts. {}".format(
+                            key, attempt, e
+                        )
+                    )
+                    return
+
+                delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+                self.warning(
+                    "push {} failed. retrying in {:0.1f}s. {}".format(key, delay, e)
+                )
+
+            if pull is not None:
+                try:
+                    with self.repository_lock(key):
+                        pull()
+                except GitCommandError as e:
+                    self.debug("pull {} failed. {}".format(key, e))
+
+            # wait out the backoff. put notifies the condition so keep waiting until the deadline
+            deadline = time.time() + delay
+            with self._cond:
+                while self._alive:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                if not self._alive:
+                    return
+
+
+# ============= EOF =============================================
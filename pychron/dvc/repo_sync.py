@@ -0,0 +1,225 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from traits.api import Float, Int
+
+# ============= standard library imports ========================
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from git import Repo
+
+# ============= local library imports  ==========================
+from pychron.git_archive.utils import ahead_behind
+from pychron.loggable import Loggable
+
+
+def _timeout_kw(timeout):
+    # GitPython does not support killing git commands on windows
+    if timeout and sys.platform != "win32":
+        return {"kill_after_timeout": timeout}
+    return {}
+
+
+def remote_sha(repo, remote="origin", branch="master", timeout=None):
+    """
+    return the sha of ``branch`` on ``remote`` without fetching
+    """
+    out = repo.git.ls_remote(
+        remote, "refs/heads/{}".format(branch), **_timeout_kw(timeout)
+    )
+    if out:
+        return out.split()[0]
+
+
+def fetch_repository(path, remote="origin", timeout=None):
+    """
+    fetch ``remote`` into the repository at ``path``
+
+    returns ahead, behind
+    """
+    repo = Repo(path)
+    repo.git.fetch(remote, **_timeout_kw(timeout))
+    return ahead_behind(repo, fetch=False, remote=remote)
+
+
+def check_repository(path, remote="origin", branch="master", timeout=None):
+    """
+    compare ``branch`` with the remote. the remote is only fetched if it has changed
+    and FETCH_HEAD is not already the remote's sha
+
+    returns changed, ahead, behind or None if the repository has no ``branch``
+    """
+    repo = Repo(path)
+    if branch not in [b.name for b in repo.branches]:
+        return
+
+    local = repo.commit(branch).hexsha
+    rsha = remote_sha(repo, remote, branch, timeout)
+    changed = bool(rsha) and rsha != local
+    if changed:
+        try:
+            fsha = repo.commit("FETCH_HEAD").hexsha
+        except BaseException:
+            fsha = None
+
+        if fsha != rsha:
+            repo.git.fetch(remote, **_timeout_kw(timeout))
+
+    ahead, behind = ahead_behind(repo, fetch=False, remote=remote)
+    return changed, ahead, behind
+
+
+class RepositorySyncResult(object):
+    def __init__(self, name):
+        self.name = name
+        self.value = None
+        self.error = None
+        self.timed_out = False
+        self.elapsed = 0
+
+    @property
+    def ok(self):
+        return not self.timed_out and self.error is None
+
+    @property
+    def status(self):
+        if self.timed_out:
+            return "timed out after {:0.1f}s".format(self.elapsed)
+        elif self.error is not None:
+            return "error: {}".format(self.error)
+        return "ok"
+
+
+class RepositorySyncReport(object):
+    def __init__(self, results, elapsed=0):
+        self.results = results
+        self.elapsed = elapsed
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    @property
+    def errors(self):
+        return [r for r in self.results if not r.ok]
+
+    def summary(self):
+        errors = self.errors
+        lines = ["{}/{} repositories failed".format(len(errors), len(self.results))]
+        lines.extend("{}: {}".format(r.name, r.status) for r in errors)
+        return "\n".join(lines)
+
+
+class RepositorySyncer(Loggable):
+    """
+    run a git operation, e.g. a fetch, on many repositories concurrently.
+
+    the operations run on a pool of ``max_workers`` threads. an operation running longer
+    than ``timeout`` seconds is reported as timed out and no longer waited for. the
+    operations should pass the timeout on to git (see ``fetch_repository``) so that the
+    git process is killed as well. max_workers <= 1 runs the operations one at a time in
+    the calling thread.
+
+    the operations must not touch the GUI. the progress dialog is only updated by the
+    calling thread, which should also apply the results, e.g. merge fetched changes
+    """
+
+    max_workers = Int(8)
+    timeout = Float(120)
+
+    def run(self, names, func, progress=None, message="Syncing"):
+        """
+        names: repository names. duplicates are ignored
+        func: callable. func(name) is called in a worker thread for each name. its
+            return value is the result's ``value``
+        progress: progress dialog
+
+        returns a RepositorySyncReport with the results in the order of ``names``
+        """
+        names = list(dict.fromkeys(names))
+        results = [RepositorySyncResult(n) for n in names]
+        n = len(results)
+
+        def update(r, i):
+            if progress is not None:
+                progress.change_message("{} {} ({}/{})".format(message, r.name, i, n))
+
+        def work(r, started):
+            st = started[r.name] = time.time()
+            try:
+                return func(r.name), None, time.time() - st
+            except BaseException as e:
+                return None, e, time.time() - st
+
+        st = time.time()
+        if self.max_workers <= 1 or n <= 1:
+            for i, r in enumerate(results):
+                r.value, r.error, r.elapsed = work(r, {})
+                update(r, i + 1)
+        elif n:
+            started = {}
+            pool = ThreadPoolExecutor(
+                min(self.max_workers, n), thread_name_prefix="RepositorySync"
+            )
+            futures = {pool.submit(work, r, started): r for r in results}
+            pending = set(futures)
+            i = 0
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for f in done:
+                    r = futures[f]
+                    r.value, r.error, r.elapsed = f.result()
+                    i += 1
+                    update(r, i)
+
+                if self.timeout > 0:
+                    now = time.time()
+                    for f in list(pending):
+                        r = futures[f]
+                        t = started.get(r.name)
+                        if t is not None and now - t > self.timeout:
+                            r.timed_out = True
+                            r.elapsed = now - t
+                            pending.discard(f)
+                            i += 1
+                            update(r, i)
+
+            # do not block on operations that timed out
+            pool.shutdown(wait=False)
+
+        report = RepositorySyncReport(results, time.time() - st)
+        self._report(report)
+        return report
+
+    def _report(self, report):
+        self.debug(
+            "synced {} repositories in {:0.2f}s. errors={}".format(
+                len(report), report.elapsed, len(report.errors)
+            )
+        )
+        for r in report:
+            if r.ok:
+                self.debug("{:<30s} {:0.2f}s".format(r.name, r.elapsed))
+            else:
+                self.warning("{:<30s} {}".format(r.name, r.status))
+
+
+# ============= EOF =============================================
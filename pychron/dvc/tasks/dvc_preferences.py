@@ -16,7 +16,7 @@
 
 # ============= enthought library imports =======================
 from envisage.ui.tasks.preferences_pane import PreferencesPane
-from traits.api import Str, Bool, Int
+from traits.api import Str, Bool, Int, Float
 from traitsui.api import View, Item, HGroup, VGroup
 
 from pychron.core.helpers.strtools import to_bool
@@ -157,7 +157,18 @@ class DVCPreferences(BasePreferencesHelper):
     use_cocktail_irradiation = Bool
     use_cache = Bool
     max_cache_size = Int
+    use_persistent_cache = Bool(True)
+    analysis_loader_workers = Int
+    analysis_loader_use_processes = Bool
+    use_analysis_bundles = Bool
+    use_session_pool = Bool
+    pool_size = Int(5)
+    pool_max_overflow = Int(10)
+    pool_timeout = Float(30)
+    pool_pre_ping = Bool(True)
     update_currents_enabled = Bool
+    repository_sync_workers = Int(8)
+    repository_sync_timeout = Float(120)
     use_auto_pull = Bool(True)
     use_auto_push = Bool(False)
     use_default_commit_author = Bool(False)
@@ -194,6 +205,20 @@ class DVCPreferencesPane(PreferencesPane):
                         tooltip="Push changes when a PushNode is used automatically without asking "
                         "for confirmation.",
                     ),
+                    HGroup(
+                        Item(
+                            "repository_sync_workers",
+                            label="Sync Workers",
+                            tooltip="Number of repositories fetched or cloned at the same "
+                            "time. 0 or 1 syncs repositories one at a time",
+                        ),
+                        Item(
+                            "repository_sync_timeout",
+                            label="Timeout (s)",
+                            tooltip="Give up on a repository that takes longer than this to "
+                            "fetch or clone. 0 disables the timeout",
+                        ),
+                    ),
                 ),
                 BorderVGroup(
                     Item(
@@ -210,8 +235,64 @@ class DVCPreferencesPane(PreferencesPane):
                         Item("use_cache", label="Enabled"),
                         Item("max_cache_size", label="Max Size"),
                     ),
+                    Item(
+                        "use_persistent_cache",
+                        label="Persistent",
+                        tooltip="Keep a copy of the parsed analysis files on disk. Entries are "
+                        "invalidated when the files change",
+                    ),
                     label="Cache",
                 ),
+                BorderVGroup(
+                    HGroup(
+                        Item(
+                            "analysis_loader_workers",
+                            label="Workers",
+                            tooltip="Number of workers used to read analysis files in "
+                            "parallel. 0 or 1 loads analyses serially",
+                        ),
+                        Item(
+                            "analysis_loader_use_processes",
+                            label="Use Processes",
+                            tooltip="Use a process pool instead of a thread pool",
+                        ),
+                    ),
+                    Item(
+                        "use_analysis_bundles",
+                        label="Write Bundles",
+                        tooltip="Write a binary copy of each new analysis next to its json files. "
+                        "Bundles load faster and are ignored when the json files change",
+                    ),
+                    label="Analysis Loading",
+                ),
+                BorderVGroup(
+                    Item(
+                        "use_session_pool",
+                        label="Session per Thread",
+                        tooltip="Give each thread its own database session on a pooled "
+                        "connection so that background work can query concurrently",
+                    ),
+                    HGroup(
+                        Item("pool_size", label="Pool Size"),
+                        Item(
+                            "pool_max_overflow",
+                            label="Overflow",
+                            tooltip="Connections allowed beyond the pool size",
+                        ),
+                        Item(
+                            "pool_timeout",
+                            label="Timeout (s)",
+                            tooltip="Seconds to wait for a free connection",
+                        ),
+                        Item(
+                            "pool_pre_ping",
+                            label="Pre Ping",
+                            tooltip="Test connections before using them",
+                        ),
+                        enabled_when="use_session_pool",
+                    ),
+                    label="Database Connections",
+                ),
             )
         )
         return v
@@ -109,14 +109,17 @@ class RepoItem(HasTraits):
             except InvalidGitRepositoryError:
                 return True
 
-            self.ahead = a
-            self.behind = b
-            self.status = "{},{}".format(a, b)
-            self.refresh_needed = True
+            self.set_ahead_behind(a, b)
             return True
         except GitCommandError:
             pass
 
+    def set_ahead_behind(self, a, b):
+        self.ahead = a
+        self.behind = b
+        self.status = "{},{}".format(a, b)
+        self.refresh_needed = True
+
 
 class ExperimentRepoTask(BaseTask, ColumnSorterMixin):
     id = "pychron.repo.task"
@@ -0,0 +1,199 @@
+import base64
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+from git import Repo
+
+from pychron.core.helpers.binpack import format_blob
+from pychron.dvc import (
+    dvc_dump,
+    dvc_load,
+    dvc_load_many,
+    DATA,
+    INTERCEPTS,
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+)
+from pychron.dvc.analysis_bundle import (
+    ANALYSIS_MEMBERS,
+    bundle_path,
+    convert_repository,
+    load_analysis_files,
+    load_bundle,
+    member_paths,
+    update_bundle,
+    write_bundle,
+)
+
+
+def member_path(path, modifier):
+    return dict(member_paths(path))[modifier]
+
+
+def make_blob(n, seed=0):
+    raw = b"".join(struct.pack(">ff", i + seed, i * 0.1 + seed) for i in range(n))
+    return base64.b64encode(raw).decode("utf-8")
+
+
+ISOTOPES = (("Ar40", "H1"), ("Ar39", "AX"), ("Ar38", "L1"), ("Ar37", "L2"), ("Ar36", "CDD"))
+
+
+def make_analysis(root, name, n=100):
+    """
+    write an analysis with the files of a typical argon analysis. returns the meta path
+    """
+    d = os.path.join(root, name[:2])
+    if not os.path.isdir(d):
+        os.mkdir(d)
+
+    path = os.path.join(d, "{}.json".format(name))
+    meta = {"uuid": name, "aliquot": 1, "identifier": name[:5]}
+    meta.update({"attr{}".format(i): i * 0.5 for i in range(40)})
+    dvc_dump(meta, path)
+
+    def per_isotope(**kw):
+        return {
+            iso: dict(value=1.0 + i, error=0.1, fit="linear", **kw)
+            for i, (iso, _) in enumerate(ISOTOPES)
+        }
+
+    for modifier, obj in (
+        ("extraction", {"extract_value": 1.0, "extract_units": "W"}),
+        (INTERCEPTS, per_isotope(n=n, filter_outliers_dict={})),
+        (BASELINES, per_isotope(n=n)),
+        (BLANKS, per_isotope(references=[])),
+        (ICFACTORS, {det: {"value": 1.0, "error": 0.01} for _, det in ISOTOPES}),
+        (
+            DATA,
+            {
+                "signals": [
+                    {"isotope": iso, "detector": det, "blob": make_blob(n, i)}
+                    for i, (iso, det) in enumerate(ISOTOPES)
+                ],
+                "baselines": [
+                    {"detector": det, "blob": make_blob(n, i)}
+                    for i, (_, det) in enumerate(ISOTOPES)
+                ],
+                "sniffs": [],
+            },
+        ),
+    ):
+        p = member_path(path, modifier)
+        md = os.path.dirname(p)
+        if not os.path.isdir(md):
+            os.mkdir(md)
+        dvc_dump(obj, p)
+    return path
+
+
+class AnalysisBundleTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = make_analysis(self.root, "abcdef")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_round_trip(self):
+        self.assertTrue(os.path.isfile(write_bundle(self.path)))
+
+        bundle = load_bundle(self.path, modifiers=ANALYSIS_MEMBERS)
+        for modifier in ANALYSIS_MEMBERS:
+            p = member_path(self.path, modifier)
+            if os.path.isfile(p):
+                self.assertEqual(bundle[p], dvc_load(p))
+            else:
+                self.assertNotIn(p, bundle)
+
+        self.assertNotIn(member_path(self.path, DATA), bundle)
+
+    def test_blobs(self):
+        write_bundle(self.path)
+
+        p = member_path(self.path, DATA)
+        data = load_bundle(self.path, modifiers=(DATA,))[p]
+        jd = dvc_load(p)
+        for group in ("signals", "baselines"):
+            for a, b in zip(data[group], jd[group]):
+                self.assertIsInstance(a["blob"], bytes)
+                self.assertEqual(a["blob"], format_blob(b["blob"]))
+
+    def test_stale(self):
+        write_bundle(self.path)
+
+        # rewriting a member with a different size invalidates the bundle
+        p = member_path(self.path, INTERCEPTS)
+        dvc_dump({"Ar40": {"value": 2.0, "error": 0.1, "fit": "parabolic"}}, p)
+        self.assertIsNone(load_bundle(self.path))
+
+        paths = [member_path(self.path, m) for m in (None, INTERCEPTS)]
+        ret = load_analysis_files(paths)
+        self.assertEqual(ret[p]["Ar40"]["fit"], "parabolic")
+
+    def test_added_member(self):
+        write_bundle(self.path)
+
+        # a member written after the bundle invalidates it
+        p = member_path(self.path, "tags")
+        os.mkdir(os.path.dirname(p))
+        dvc_dump({"name": "invalid"}, p)
+        self.assertIsNone(load_bundle(self.path))
+
+    def test_update(self):
+        write_bundle(self.path)
+        self.assertIsNone(update_bundle(os.path.join(self.root, "x.json"), "", {}))
+
+        p = member_path(self.path, INTERCEPTS)
+        jd = {"Ar40": {"value": 2.0, "error": 0.1, "fit": "parabolic"}}
+        dvc_dump(jd, p)
+        update_bundle(self.path, p, jd)
+
+        bundle = load_bundle(self.path)
+        self.assertEqual(bundle[p], jd)
+        # the blobs are unchanged
+        dp = member_path(self.path, DATA)
+        data = bundle[dp]["signals"][0]["blob"]
+        self.assertEqual(data, format_blob(dvc_load(dp)["signals"][0]["blob"]))
+
+    def test_update_stale(self):
+        write_bundle(self.path)
+
+        # another member changed since the bundle was written so it is rebuilt
+        bp = member_path(self.path, BLANKS)
+        dvc_dump({"Ar40": {"value": 0.5, "error": 0.1}}, bp)
+
+        p = member_path(self.path, INTERCEPTS)
+        jd = {"Ar40": {"value": 2.0, "error": 0.1, "fit": "parabolic"}}
+        dvc_dump(jd, p)
+        update_bundle(self.path, p, jd)
+
+        bundle = load_bundle(self.path)
+        self.assertEqual(bundle[p], jd)
+        self.assertEqual(bundle[bp], dvc_load(bp))
+
+    def test_fallback(self):
+        paths = [member_path(self.path, m) for m in (None, "extraction")]
+        self.assertFalse(os.path.isfile(bundle_path(self.path)))
+        self.assertEqual(load_analysis_files(paths), dvc_load_many(paths))
+
+    def test_convert_repository(self):
+        Repo.init(self.root).close()
+        make_analysis(self.root, "abcxyz")
+        make_analysis(self.root, "bcdefg")
+
+        self.assertEqual(convert_repository(self.root), 3)
+        for name in ("abcdef", "abcxyz"):
+            self.assertIsNotNone(
+                load_bundle(os.path.join(self.root, "ab", "{}.json".format(name)))
+            )
+
+        with open(os.path.join(self.root, ".git", "info", "exclude")) as rfile:
+            self.assertIn(".bundle/", rfile.read().split())
+
+
+if __name__ == "__main__":
+    unittest.main()
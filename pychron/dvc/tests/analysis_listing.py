@@ -0,0 +1,152 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.dvc.dvc_database import DVCDatabase, ANALYSIS_LISTING_COLUMNS
+from pychron.dvc.dvc_orm import (
+    Base,
+    AnalysisTbl,
+    AnalysisChangeTbl,
+    IrradiationTbl,
+    IrradiationPositionTbl,
+    LevelTbl,
+    MaterialTbl,
+    MeasuredPositionTbl,
+    PrincipalInvestigatorTbl,
+    ProjectTbl,
+    RepositoryAssociationTbl,
+    RepositoryTbl,
+    SampleTbl,
+)
+
+
+def make_db(path, nanalyses=20, nidentifiers=2):
+    db = DVCDatabase()
+    db.trait_set(kind="sqlite", path=path)
+    db.connect()
+    with db.session_ctx() as sess:
+        Base.metadata.create_all(sess.bind)
+
+        pi = PrincipalInvestigatorTbl(last_name="Ross", first_initial="J")
+        project = ProjectTbl(name="Proj", principal_investigator=pi)
+        material = MaterialTbl(name="San", grainsize="20-40")
+        irrad = IrradiationTbl(name="NM-1")
+        level = LevelTbl(name="A", irradiation=irrad)
+        sess.add_all([pi, project, material, irrad, level])
+        for r in ("RepoA", "RepoB"):
+            sess.add(RepositoryTbl(name=r))
+
+        # equal timestamps exercise the id tie breaker of the keyset
+        t0 = datetime(2020, 1, 1)
+        for i in range(nidentifiers):
+            sample = SampleTbl(name="S{}".format(i), project=project, material=material)
+            ip = IrradiationPositionTbl(
+                identifier="1000{}".format(i), position=i + 1, level=level, sample=sample
+            )
+            sess.add_all([sample, ip])
+            for j in range(nanalyses):
+                a = AnalysisTbl(
+                    uuid="{}-{}".format(i, j),
+                    timestamp=t0 + timedelta(hours=j // 2),
+                    aliquot=j,
+                    increment=-1,
+                    analysis_type="unknown",
+                    irradiation_position=ip,
+                )
+                sess.add(a)
+                sess.add(
+                    AnalysisChangeTbl(analysis=a, tag="invalid" if j == 3 else "ok")
+                )
+                sess.add(RepositoryAssociationTbl(analysis=a, repository="RepoA"))
+                if j % 5 == 0:
+                    sess.add(RepositoryAssociationTbl(analysis=a, repository="RepoB"))
+                sess.add(MeasuredPositionTbl(analysis=a, position=j))
+        sess.commit()
+    return db
+
+
+class AnalysisListingTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp()
+        cls.db = make_db(os.path.join(cls.root, "listing.sqlite"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close_session()
+        os.remove(os.path.join(cls.root, "listing.sqlite"))
+        os.rmdir(cls.root)
+
+    def _uuids(self, rows):
+        return [r[ANALYSIS_LISTING_COLUMNS.index("uuid")] for r in rows]
+
+    def test_matches_orm(self):
+        lns = ["10000", "10001"]
+        rows, total, _ = self.db.get_analysis_listing(lns, limit=None)
+        ans, tc = self.db.get_labnumber_analyses(lns)
+
+        self.assertEqual(total, tc)
+        self.assertEqual(len(rows), 38)
+        self.assertEqual(sorted(self._uuids(rows)), sorted(a.uuid for a in ans))
+
+        row = dict(zip(ANALYSIS_LISTING_COLUMNS, rows[0]))
+        self.assertEqual(row["sample"], "S0")
+        self.assertEqual(row["pi_last_name"], "Ross")
+        self.assertEqual(row["repository_ids"], ("RepoA", "RepoB"))
+        self.assertEqual(row["change_tag"], "ok")
+
+    def test_keyset_paging(self):
+        for order in ("asc", "desc"):
+            rows, total, cursor = self.db.get_analysis_listing(
+                ["10000", "10001"], limit=7, order=order
+            )
+            self.assertEqual(total, 38)
+
+            pages = [rows]
+            while cursor:
+                rows, _, cursor = self.db.get_analysis_listing(
+                    ["10000", "10001"], limit=7, order=order, after=cursor
+                )
+                pages.append(rows)
+
+            uuids = [u for p in pages for u in self._uuids(p)]
+            self.assertEqual(len(pages), 6)
+            self.assertEqual(len(uuids), 38)
+            self.assertEqual(len(set(uuids)), 38)
+
+            ts = [r[2] for p in pages for r in p]
+            self.assertEqual(ts, sorted(ts, reverse=order == "desc"))
+
+    def test_filters(self):
+        rows, total, cursor = self.db.get_analysis_listing(
+            ["10000"], repositories=["RepoB"], include_invalid=True
+        )
+        self.assertEqual(total, 4)
+        self.assertEqual(len(rows), 4)
+        self.assertIsNone(cursor)
+
+        rows, total, _ = self.db.get_analysis_listing(["10000"], include_invalid=True)
+        self.assertEqual(total, 20)
+
+    def test_count_fallback(self):
+        self.db._use_window_count = False
+        try:
+            rows, total, cursor = self.db.get_analysis_listing(
+                ["10000", "10001"], limit=7
+            )
+        finally:
+            self.db._use_window_count = True
+
+        self.assertEqual(total, 38)
+        self.assertEqual(len(rows), 7)
+        self.assertIsNotNone(cursor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from git import Repo
+
+from pychron.dvc.cache import DVCCache, DVCPersistentCache
+
+
+class DVCCacheTestCase(unittest.TestCase):
+    def test_lru(self):
+        c = DVCCache(max_size=2)
+        c.update("a", 1)
+        c.update("b", 2)
+        c.get("a")
+        c.update("c", 3)
+
+        self.assertEqual(c.get("a"), 1)
+        self.assertIsNone(c.get("b"))
+        self.assertEqual(c.get("c"), 3)
+        self.assertEqual(c.report(), 2)
+
+    def test_clean(self):
+        c = DVCCache()
+        c.update("a", 1)
+        c.clean()
+        self.assertEqual(c.report(), 1)
+
+
+class DVCPersistentCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.repo_root = os.path.join(self.root, "Repo")
+        os.mkdir(self.repo_root)
+        self.repo = Repo.init(self.repo_root)
+        self.path = os.path.join(self.repo_root, "a.json")
+        self._write({"a": 1})
+        self.cache = DVCPersistentCache(self.root)
+
+    def tearDown(self):
+        self.cache.close()
+        self.repo.close()
+        shutil.rmtree(self.root)
+
+    def _write(self, obj):
+        with open(self.path, "w") as wfile:
+            json.dump(obj, wfile)
+        self.repo.index.add([self.path])
+        self.repo.index.write()
+
+    def test_hit(self):
+        digest = self.cache.digest("Repo", [self.path])
+        self.assertIsNotNone(digest)
+        self.cache.update([("uuid1", digest, {"a.json": {"a": 1}})])
+
+        digest = self.cache.digest("Repo", [self.path])
+        self.assertEqual(self.cache.get("uuid1", digest), {"a.json": {"a": 1}})
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_reopen(self):
+        digest = self.cache.digest("Repo", [self.path])
+        self.cache.update([("uuid1", digest, {"a.json": {"a": 1}})])
+        self.cache.close()
+
+        # a new session reads the entry from disk
+        self.cache = DVCPersistentCache(self.root)
+        digest = self.cache.digest("Repo", [self.path])
+        self.assertEqual(self.cache.get("uuid1", digest), {"a.json": {"a": 1}})
+
+    def test_invalidate_on_change(self):
+        digest = self.cache.digest("Repo", [self.path])
+        self.cache.update([("uuid1", digest, {"a.json": {"a": 1}})])
+
+        # make sure the index mtime changes
+        time.sleep(0.01)
+        self._write({"a": 2})
+
+        digest = self.cache.digest("Repo", [self.path])
+        self.assertIsNone(self.cache.get("uuid1", digest))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_untracked(self):
+        p = os.path.join(self.repo_root, "b.json")
+        with open(p, "w") as wfile:
+            wfile.write("{}")
+
+        self.assertIsNone(self.cache.digest("Repo", [p]))
+
+
+if __name__ == "__main__":
+    unittest.main()
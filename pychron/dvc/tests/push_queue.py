@@ -0,0 +1,93 @@
+import threading
+import unittest
+
+from git.exc import GitCommandError
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.dvc.push_queue import DVCPushQueue
+
+
+class DVCPushQueueTestCase(unittest.TestCase):
+    def setUp(self):
+        self.queue = DVCPushQueue(backoff=0.01, max_retries=2)
+
+    def tearDown(self):
+        self.queue.stop(1)
+
+    def test_coalesce(self):
+        release = threading.Event()
+        pushes = []
+
+        def blocking_push():
+            release.wait(1)
+            pushes.append("a")
+
+        def push_b():
+            pushes.append("b")
+
+        # occupy the worker so the following puts stay pending
+        self.queue.put("a", blocking_push)
+        for i in range(5):
+            self.queue.put("b", push_b)
+
+        self.assertTrue(self.queue.is_pending("b"))
+        self.assertEqual(self.queue.backlog, 2)
+
+        release.set()
+        self.assertTrue(self.queue.wait(timeout=1))
+        self.assertEqual(pushes, ["a", "b"])
+        self.assertEqual(self.queue.backlog, 0)
+
+    def test_retry(self):
+        calls = {"push": 0, "pull": 0}
+
+        def push():
+            calls["push"] += 1
+            if calls["push"] < 3:
+                raise GitCommandError("push", 1)
+
+        def pull():
+            calls["pull"] += 1
+
+        self.queue.put("a", push, pull)
+        self.assertTrue(self.queue.wait("a", timeout=1))
+        self.assertEqual(calls, {"push": 3, "pull": 2})
+
+    def test_give_up(self):
+        calls = []
+
+        def push():
+            calls.append(1)
+            raise GitCommandError("push", 1)
+
+        self.queue.put("a", push)
+        self.assertTrue(self.queue.wait(timeout=1))
+        self.assertEqual(len(calls), 3)
+
+    def test_pull_holds_lock(self):
+        held = []
+
+        def push():
+            if not held:
+                raise GitCommandError("push", 1)
+
+        def pull():
+            lock = self.queue.repository_lock("a")
+            # RLock is reentrant so the worker can acquire it again while pulling
+            held.append(lock.acquire(blocking=False))
+            lock.release()
+
+        with self.queue.repository_lock("a"):
+            self.queue.put("a", push, pull)
+            self.assertFalse(self.queue.wait(timeout=0.1))
+
+        self.assertTrue(self.queue.wait(timeout=1))
+        self.assertEqual(held, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from git import Actor, Repo
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.dvc.repo_sync import (
+    RepositorySyncer,
+    check_repository,
+    fetch_repository,
+)
+
+AUTHOR = Actor("test", "test@example.com")
+
+
+def commit(repo, name="a.txt", text="a"):
+    with open(os.path.join(repo.working_dir, name), "w") as wfile:
+        wfile.write(text)
+    repo.index.add([name])
+    repo.index.commit("added {}".format(name), author=AUTHOR, committer=AUTHOR)
+
+
+def make_repositories(root, name):
+    """
+    make a remote and two clones of it, one to sync and one to push changes from
+
+    returns local, upstream
+    """
+    origin = os.path.join(root, "{}.git".format(name))
+    Repo.init(origin, bare=True, initial_branch="master")
+
+    upstream = Repo.clone_from(origin, os.path.join(root, "{}_upstream".format(name)))
+    upstream.git.checkout("-b", "master")
+    commit(upstream)
+    upstream.git.push("-u", "origin", "master")
+
+    local = Repo.clone_from(origin, os.path.join(root, name))
+    return local, upstream
+
+
+class Progress(object):
+    def __init__(self):
+        self.messages = []
+        self.threads = set()
+
+    def change_message(self, msg, auto_increment=True):
+        self.threads.add(threading.current_thread())
+        self.messages.append(msg)
+
+
+class RepositorySyncTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.local, self.upstream = make_repositories(self.root, "repo")
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_fetch(self):
+        path = self.local.working_dir
+        self.assertEqual(fetch_repository(path), (0, 0))
+
+        commit(self.upstream, "b.txt")
+        self.upstream.git.push("origin", "master")
+        self.assertEqual(fetch_repository(path, timeout=10), (0, 1))
+
+    def test_check(self):
+        path = self.local.working_dir
+        self.assertEqual(check_repository(path), (False, 0, 0))
+        self.assertIsNone(check_repository(path, branch="develop"))
+
+        commit(self.upstream, "b.txt")
+        self.upstream.git.push("origin", "master")
+        self.assertEqual(check_repository(path, timeout=10), (True, 0, 1))
+
+        # FETCH_HEAD is up to date so the remote is not fetched again
+        head = self.local.commit("FETCH_HEAD").hexsha
+        self.assertEqual(check_repository(path), (True, 0, 1))
+        self.assertEqual(self.local.commit("FETCH_HEAD").hexsha, head)
+
+    def test_concurrent(self):
+        def func(name):
+            time.sleep(0.1)
+            return name.upper()
+
+        names = ["r{}".format(i) for i in range(8)]
+        st = time.time()
+        report = RepositorySyncer(max_workers=8).run(names + ["r0"], func)
+        # one at a time would take 8 * 0.1s
+        self.assertLess(time.time() - st, 0.5)
+        self.assertEqual([r.name for r in report], names)
+        self.assertEqual([r.value for r in report], [n.upper() for n in names])
+        self.assertFalse(report.errors)
+
+    def test_timeout(self):
+        def func(name):
+            time.sleep(1 if name == "slow" else 0.01)
+            return name
+
+        st = time.time()
+        report = RepositorySyncer(max_workers=4, timeout=0.2).run(
+            ["a", "slow", "b"], func
+        )
+        self.assertLess(time.time() - st, 0.8)
+        a, slow, b = report
+        self.assertTrue(a.ok and b.ok)
+        self.assertTrue(slow.timed_out)
+        self.assertEqual(report.errors, [slow])
+
+    def test_errors(self):
+        def func(name):
+            if name.startswith("bad"):
+                raise ValueError("no remote {}".format(name))
+            return name
+
+        for workers in (1, 4):
+            report = RepositorySyncer(max_workers=workers).run(
+                ["a", "bad1", "b", "bad2"], func
+            )
+            self.assertEqual([r.name for r in report.errors], ["bad1", "bad2"])
+            self.assertIsInstance(report.errors[0].error, ValueError)
+            summary = report.summary()
+            self.assertTrue(summary.startswith("2/4 repositories failed"))
+            self.assertIn("bad2: error: no remote bad2", summary)
+
+    def test_progress(self):
+        progress = Progress()
+        RepositorySyncer(max_workers=4).run(
+            ["a", "b", "c"], lambda name: time.sleep(0.01), progress=progress
+        )
+        self.assertEqual(len(progress.messages), 3)
+        self.assertTrue(progress.messages[-1].endswith("(3/3)"))
+        # the progress dialog is only used by the calling thread
+        self.assertEqual(progress.threads, {threading.current_thread()})
+
+    def test_fetch_repositories(self):
+        locals_ = [self.local]
+        for i in range(3):
+            local, upstream = make_repositories(self.root, "repo{}".format(i))
+            commit(upstream, "b.txt")
+            upstream.git.push("origin", "master")
+            locals_.append(local)
+
+        paths = {os.path.basename(r.working_dir): r.working_dir for r in locals_}
+        report = RepositorySyncer(max_workers=4).run(
+            list(paths), lambda name: fetch_repository(paths[name])
+        )
+        self.assertEqual([r.value for r in report], [(0, 0), (0, 1), (0, 1), (0, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -47,7 +47,9 @@ from pychron.core.progress import progress_loader
 from pychron.core.ui.table_configurer import SampleTableConfigurer
 from pychron.envisage.browser import progress_bind_records
 from pychron.envisage.browser.adapters import LabnumberAdapter
+from pychron.dvc.dvc_database import ANALYSIS_LISTING_COLUMNS
 from pychron.envisage.browser.record_views import (
+    AnalysisListingRecordView,
     ProjectRecordView,
     LabnumberRecordView,
     PrincipalInvestigatorRecordView,
@@ -503,6 +505,24 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
             # if low_post is None:
             # lps = [si.low_post for si in samples if si.low_post is not None]
             #     low_post = min(lps) if lps else None
+            if make_records and hasattr(db, "get_analysis_listing"):
+                rows, tc, _ = db.get_analysis_listing(
+                    lns,
+                    order=order,
+                    low_post=low_post,
+                    high_post=high_post,
+                    limit=limit,
+                    exclude_uuids=exclude_uuids,
+                    include_invalid=include_invalid,
+                    mass_spectrometers=mass_spectrometers,
+                    repositories=repositories,
+                    loads=loads,
+                )
+                self.debug("retrieved analyses n={} total={}".format(len(rows), tc))
+                return [
+                    AnalysisListingRecordView(ANALYSIS_LISTING_COLUMNS, r) for r in rows
+                ]
+
             ans, tc = db.get_labnumber_analyses(
                 lns,
                 order=order,
@@ -21,7 +21,10 @@ import six
 from sqlalchemy.exc import InternalError
 from traits.api import HasTraits, Str, Date, Long, Bool
 
+from pychron.core.helpers.datetime_tools import make_timef
+from pychron.core.utils import alphas
 from pychron.experiment.utilities.identifier import get_analysis_type
+from pychron.experiment.utilities.runid import make_runid
 
 
 class RecordView(object):
@@ -293,6 +296,90 @@ class AnalysisRecordView(RecordView):
             setattr(self, attr, getattr(dbrecord, attr))
 
 
+class AnalysisListingRecordView(object):
+    """
+    analysis record built from a row of ``DVCDatabase.get_analysis_listing``.
+
+    provides the attributes of a bound ``AnalysisTbl`` that the analysis tables and
+    ``DVC.make_analyses`` use, without the ORM objects
+    """
+
+    group_id = 0
+    graph_id = 0
+    frozen = False
+    delta_time = 0
+    review_status = None
+    is_plateau_step = None
+    use_repository_suffix = False
+    _temporary_tag = None
+
+    def __init__(self, columns, row):
+        self.__dict__.update(zip(columns, row))
+        for attr in ("sample", "project", "packet"):
+            setattr(self, attr, getattr(self, attr) or "")
+
+        self.record_id = make_runid(self.identifier, self.aliquot, self.increment)
+        self.timestampf = make_timef(self.timestamp)
+
+    def bind(self):
+        pass
+
+    def set_tag(self, t):
+        self._temporary_tag = t
+
+    def get_load_name(self):
+        return self.load_name
+
+    def get_load_holder(self):
+        return self.load_holder
+
+    @property
+    def tag(self):
+        return self._temporary_tag or self.change_tag
+
+    @property
+    def repository_identifier(self):
+        if len(self.repository_ids) == 1:
+            return self.repository_ids[0]
+
+    @property
+    def rundate(self):
+        return self.timestamp
+
+    @property
+    def analysis_timestamp(self):
+        return self.timestamp
+
+    @property
+    def position(self):
+        return self.positions
+
+    @property
+    def step(self):
+        return alphas(self.increment)
+
+    @property
+    def display_uuid(self):
+        return (self.uuid or "")[:8]
+
+    @property
+    def material(self):
+        m = self.material_name or ""
+        return "{} ({})".format(m, self.grainsize) if self.grainsize else m
+
+    @property
+    def principal_investigator(self):
+        if self.pi_first_initial:
+            return "{}, {}".format(self.pi_last_name, self.pi_first_initial)
+        return self.pi_last_name or ""
+
+    @property
+    def irradiation_info(self):
+        return "{}{} {}".format(
+            self.irradiation, self.irradiation_level, self.irradiation_position_position
+        )
+
+
 class PrincipalInvestigatorRecordView(RecordView, NameView):
     name = ""
     email = ""
@@ -0,0 +1,258 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from traits.api import Any, Int, List
+
+# ============= standard library imports ========================
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from queue import Empty, Queue
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+
+
+def scheduler_name(dev):
+    """
+    return the name of the communication scheduler of ``dev``.
+
+    an AbstractDevice wraps the device that loads the communicator and the scheduler
+    name, so the name is resolved through the wrapped device
+    """
+    dev = getattr(dev, "_cdevice", None) or dev
+    name = getattr(dev, "_scheduler_name", None)
+    if not name:
+        scheduler = getattr(getattr(dev, "communicator", None), "scheduler", None)
+        name = getattr(scheduler, "name", None)
+    return name
+
+
+def shared_resource_keys(dev):
+    """
+    return the keys of the resources ``dev`` shares with other devices, i.e. the name of
+    its communication scheduler and the address of its communicator
+    """
+    keys = []
+    name = scheduler_name(dev)
+    if name:
+        keys.append(("scheduler", name))
+
+    comm = getattr(dev, "communicator", None)
+    if comm is not None:
+        try:
+            address = comm.address
+        except AttributeError:
+            address = None
+        if address:
+            keys.append(("address", address))
+    return keys
+
+
+def group_devices(devs):
+    """
+    group the devices that share a scheduler or a communicator address, directly or
+    through other devices. the devices of a group and the groups keep the order of
+    ``devs``
+
+    returns a list of lists of devices
+    """
+    parents = list(range(len(devs)))
+
+    def find(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    owners = {}
+    for i, dev in enumerate(devs):
+        for key in shared_resource_keys(dev):
+            if key in owners:
+                a, b = find(owners[key]), find(i)
+                parents[max(a, b)] = min(a, b)
+            else:
+                owners[key] = i
+
+    groups = {}
+    for i, dev in enumerate(devs):
+        groups.setdefault(find(i), []).append(dev)
+    return [groups[k] for k in sorted(groups)]
+
+
+class ProgressRelay(object):
+    """
+    stand-in for a progress dialog passed to devices initialized in a worker thread.
+
+    the calls are queued and replayed on the progress dialog by the thread that owns it
+    """
+
+    canceled = False
+    accepted = False
+
+    def __init__(self):
+        self._queue = Queue()
+
+    def change_message(self, message, auto_increment=True):
+        kw = {"auto_increment": auto_increment}
+        self._queue.put(("change_message", (message,), kw))
+
+    def increase_max(self, step=1):
+        self._queue.put(("increase_max", (step,), {}))
+
+    def increment(self, step=1):
+        self._queue.put(("increment", (step,), {}))
+
+    def replay(self, progress):
+        while 1:
+            try:
+                func, args, kw = self._queue.get_nowait()
+            except Empty:
+                break
+
+            if progress is not None:
+                getattr(progress, func)(*args, **kw)
+
+
+class DeviceTiming(object):
+    def __init__(self, name, group):
+        self.name = name
+        self.group = group
+        self.opened = False
+        self.done = False
+        self.result = None
+        self.error = None
+        self.open_time = 0
+        self.initialize_time = 0
+
+    @property
+    def total(self):
+        return self.open_time + self.initialize_time
+
+    @property
+    def status(self):
+        if self.error:
+            return "error: {}".format(self.error)
+        elif self.result is True:
+            return "ok"
+        elif not self.opened:
+            return "open failed"
+        return "initialize failed"
+
+
+class DeviceStartup(Loggable):
+    """
+    open and initialize devices concurrently.
+
+    devices that share a communication scheduler or a communicator address are one
+    group. the devices of a group are opened and then initialized one at a time, in
+    order, by a single worker, as the Initializer did for all devices. groups run
+    concurrently on a pool of ``max_workers`` threads. max_workers <= 1 runs the groups
+    one at a time in the calling thread
+    """
+
+    max_workers = Int(8)
+    prefs = Any
+    timings = List
+
+    def run(self, devs, progress=None, on_done=None):
+        """
+        devs: list of loaded devices
+        progress: progress dialog. only used by the calling thread
+        on_done: callable. on_done(timing) is called by the calling thread each time a
+            device is done
+
+        returns a list of DeviceTimings in the order of ``devs``
+        """
+        groups = group_devices(devs)
+        timings = {}
+        for i, g in enumerate(groups):
+            for dev in g:
+                timings[id(dev)] = DeviceTiming(dev.name, i)
+
+        relay = ProgressRelay()
+        reported = set()
+
+        def report():
+            relay.replay(progress)
+            if on_done is not None:
+                for t in timings.values():
+                    if t.done and id(t) not in reported:
+                        reported.add(id(t))
+                        on_done(t)
+
+        st = time.time()
+        if self.max_workers <= 1 or len(groups) == 1:
+            for g in groups:
+                self._run_group(g, timings, progress)
+                report()
+        else:
+            n = min(self.max_workers, len(groups))
+            with ThreadPoolExecutor(n, thread_name_prefix="DeviceStartup") as pool:
+                pending = {
+                    pool.submit(self._run_group, g, timings, relay) for g in groups
+                }
+                while pending:
+                    _, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    report()
+            report()
+
+        self.timings = [timings[id(d)] for d in devs]
+        self._report(time.time() - st)
+        return self.timings
+
+    # private
+    def _run_group(self, devs, timings, progress):
+        for dev in devs:
+            t = timings[id(dev)]
+            st = time.time()
+            try:
+                t.opened = bool(dev.open(prefs=self.prefs))
+            except BaseException as e:
+                self.warning("failed opening {}. error={}".format(dev.name, e))
+                t.error = e
+            t.open_time = time.time() - st
+            if not t.opened:
+                self.info("failed connecting to {}".format(dev.name))
+
+        for dev in devs:
+            t = timings[id(dev)]
+            st = time.time()
+            try:
+                t.result = dev.initialize(progress=progress)
+            except BaseException as e:
+                self.warning("failed initializing {}. error={}".format(dev.name, e))
+                t.error = e
+                t.result = False
+            t.initialize_time = time.time() - st
+            t.done = True
+
+    def _report(self, elapsed):
+        ts = sorted(self.timings, key=lambda t: t.total, reverse=True)
+        self.info(
+            "started {} devices in {} groups in {:0.2f}s. device total={:0.2f}s".format(
+                len(ts), len({t.group for t in ts}), elapsed, sum(t.total for t in ts)
+            )
+        )
+        for t in ts:
+            self.info(
+                "{:<30s} group={:<3n} open={:0.2f}s initialize={:0.2f}s {}".format(
+                    t.name, t.group, t.open_time, t.initialize_time, t.status
+                )
+            )
+
+
+# ============= EOF =============================================
@@ -15,12 +15,13 @@
 # ===============================================================================
 
 # ============= enthought library imports =======================
-from traits.api import Any, List
+from traits.api import Any, Int, List
 
 # ============= standard library imports ========================
 # ============= local library imports  ==========================
 from pychron.core.helpers.strtools import to_bool
 from pychron.core.ui.progress_dialog import myProgressDialog
+from pychron.envisage.initialization.device_startup import DeviceStartup
 from pychron.envisage.initialization.initialization_parser import InitializationParser
 from pychron.globals import globalv
 from pychron.hardware.core.i_core_device import ICoreDevice
@@ -37,6 +38,11 @@ class Initializer(Loggable):
     _parser = Any
     _pd = Any
 
+    device_prefs = Any
+    # number of threads opening and initializing devices. 1 opens them one at a time
+    max_workers = Int(8)
+    device_timings = List
+
     def add_initialization(self, a):
         """ """
         self.debug("add initialization {}".format(a))
@@ -225,15 +231,25 @@ class Initializer(Loggable):
                     )
 
                 devs.append(dev)
-                self.info("opening {}".format(dev.name))
-                if not dev.open(prefs=self.device_prefs):
-                    self.info("failed connecting to {}".format(dev.name))
             else:
                 self.info("failed loading {}".format(dev.name))
 
-        for od in devs:
+        if not devs:
+            return
+
+        def on_done(timing):
+            self.info(
+                "opened and initialized {} {:0.2f}s".format(timing.name, timing.total)
+            )
+
+        self.info("opening {}".format(", ".join(d.name for d in devs)))
+        startup = DeviceStartup(max_workers=self.max_workers, prefs=self.device_prefs)
+        timings = startup.run(devs, progress=self._pd, on_done=on_done)
+        self.device_timings.extend(timings)
+
+        for od, timing in zip(devs, timings):
             self.info("Initializing {}".format(od.name))
-            result = od.initialize(progress=self._pd)
+            result = timing.result
             if result is not True:
                 self.warning("Failed setting up communications to {}".format(od.name))
                 od.set_simulation(True)
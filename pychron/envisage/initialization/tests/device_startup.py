@@ -0,0 +1,171 @@
+import threading
+import time
+import unittest
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.envisage.initialization.device_startup import (
+    DeviceStartup,
+    ProgressRelay,
+    group_devices,
+)
+
+
+class Communicator(object):
+    def __init__(self, address):
+        self.address = address
+
+
+class Device(object):
+    """
+    a device whose open and initialize take ``delay`` seconds, like an offline device
+    waiting for its timeout
+    """
+
+    def __init__(
+        self, name, address=None, scheduler=None, delay=0.0, ok=True, log=None
+    ):
+        self.name = name
+        self.communicator = Communicator(address) if address else None
+        self._scheduler_name = scheduler
+        self.delay = delay
+        self.ok = ok
+        self.log = log if log is not None else []
+
+    def open(self, prefs=None):
+        self._call("open")
+        return self.ok
+
+    def initialize(self, progress=None):
+        self._call("initialize")
+        if progress is not None:
+            progress.change_message("initialized {}".format(self.name))
+        if self.ok == "raise":
+            raise ValueError("no response")
+        return self.ok
+
+    def _call(self, name):
+        self.log.append(("start", name, self.name, time.time()))
+        time.sleep(self.delay)
+        self.log.append(("end", name, self.name, time.time()))
+
+
+class WrappedDevice(Device):
+    """
+    like an AbstractDevice. the communicator and the scheduler name belong to the
+    wrapped device
+    """
+
+    _scheduler_name = None
+
+    def __init__(self, name, cdevice):
+        super(WrappedDevice, self).__init__(name)
+        self._cdevice = cdevice
+        self.communicator = cdevice.communicator
+
+
+class Progress(object):
+    def __init__(self):
+        self.messages = []
+        self.thread = None
+
+    def change_message(self, msg, auto_increment=True):
+        self.thread = threading.current_thread()
+        self.messages.append(msg)
+
+
+class DeviceStartupTestCase(unittest.TestCase):
+    def test_group_devices(self):
+        a = Device("a", "/dev/tty.usb0")
+        b = Device("b", "192.168.0.2:1000")
+        c = Device("c", "/dev/tty.usb0", scheduler="bus")
+        d = Device("d", "/dev/tty.usb1", scheduler="bus")
+        e = Device("e")
+        groups = group_devices([a, b, c, d, e])
+        self.assertEqual(
+            [[x.name for x in g] for g in groups], [["a", "c", "d"], ["b"], ["e"]]
+        )
+
+    def test_group_wrapped_devices(self):
+        a = Device("a", "/dev/tty.usb0", scheduler="bus")
+        b = WrappedDevice("b", Device("cb", "/dev/tty.usb1", scheduler="bus"))
+        c = WrappedDevice("c", Device("cc", "/dev/tty.usb2"))
+        groups = group_devices([a, b, c])
+        self.assertEqual([[x.name for x in g] for g in groups], [["a", "b"], ["c"]])
+
+    def test_concurrent(self):
+        log = []
+        devs = [Device("d{}".format(i), delay=0.1, log=log) for i in range(8)]
+        st = time.time()
+        timings = DeviceStartup(max_workers=8).run(devs)
+        # one at a time would take 8 * 2 * 0.1s
+        self.assertLess(time.time() - st, 0.8)
+        self.assertEqual([t.name for t in timings], [d.name for d in devs])
+        self.assertTrue(all(t.result is True for t in timings))
+        self.assertTrue(all(t.total >= 0.2 for t in timings))
+
+    def test_shared_serial(self):
+        log = []
+        devs = [
+            Device(n, "/dev/tty.usb0", delay=0.02, log=log) for n in ("a", "b", "c")
+        ]
+        devs.append(Device("other", "10.0.0.1", delay=0.02, log=log))
+        DeviceStartup(max_workers=4).run(devs)
+
+        # the calls to the shared port do not overlap and keep the order of the
+        # sequential startup, open all then initialize all
+        calls = [(s, f, n) for s, f, n, t in log if n != "other"]
+        expected = []
+        for f in ("open", "initialize"):
+            for n in ("a", "b", "c"):
+                expected.extend([("start", f, n), ("end", f, n)])
+        self.assertEqual(calls, expected)
+
+    def test_failures(self):
+        devs = [
+            Device("offline", ok=False),
+            Device("broken", ok="raise"),
+            Device("ok"),
+        ]
+        done = []
+        timings = DeviceStartup(max_workers=4).run(devs, on_done=done.append)
+        self.assertEqual(sorted(t.name for t in done), ["broken", "offline", "ok"])
+        offline, broken, ok = timings
+        self.assertFalse(offline.result)
+        self.assertEqual(offline.status, "open failed")
+        self.assertFalse(broken.result)
+        self.assertIsInstance(broken.error, ValueError)
+        self.assertEqual(ok.status, "ok")
+
+    def test_progress(self):
+        progress = Progress()
+        devs = [Device("d{}".format(i), delay=0.01) for i in range(4)]
+        DeviceStartup(max_workers=4).run(devs, progress=progress)
+        self.assertEqual(
+            sorted(progress.messages), ["initialized d{}".format(i) for i in range(4)]
+        )
+        # the progress dialog is only used by the calling thread
+        self.assertIs(progress.thread, threading.current_thread())
+
+    def test_relay(self):
+        relay = ProgressRelay()
+        relay.change_message("a")
+        relay.change_message("b")
+        progress = Progress()
+        relay.replay(progress)
+        self.assertEqual(progress.messages, ["a", "b"])
+
+    def test_sequential(self):
+        log = []
+        devs = [Device("d{}".format(i), log=log) for i in range(3)]
+        timings = DeviceStartup(max_workers=1).run(devs)
+        self.assertTrue(all(t.result is True for t in timings))
+        opens = [n for s, f, n, t in log if s == "start" and f == "open"]
+        self.assertEqual(opens, ["d0", "d1", "d2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
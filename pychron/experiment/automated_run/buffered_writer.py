@@ -0,0 +1,211 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import time
+from threading import Thread, Condition
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.logger_setup import new_logger
+
+logger = new_logger("BufferedDataWriter")
+
+
+class BufferedDataWriter(object):
+    """
+    Move data writing off the measurement thread.
+
+    Calling the writer queues a count. A background thread hands the queued counts to
+    ``write_batch`` when ``batch_size`` counts are waiting, when the oldest count is older than
+    ``flush_period`` seconds or when ``flush``/``stop`` is called.
+
+    Has the same call signature as the closure returned by ``AutomatedRunPersister.get_data_writer``
+    """
+
+    def __init__(self, write_batch, batch_size=25, flush_period=5.0, name="DataWriter"):
+        self._write_batch = write_batch
+        self.batch_size = batch_size
+        self.flush_period = flush_period
+        self.name = name
+
+        self._cond = Condition()
+        self._items = []
+        self._oldest = None
+        self._writing = 0
+        self._flush_requested = False
+        self._alive = False
+        self._thread = None
+
+        self.max_queue_depth = 0
+        self.nwritten = 0
+        self.nfailed = 0
+        self.nbatches = 0
+
+    def __call__(self, dets, x, keys, signals):
+        self.put(dets, x, keys, signals)
+
+    @property
+    def queue_depth(self):
+        """
+        number of counts queued or being written
+        """
+        with self._cond:
+            return len(self._items) + self._writing
+
+    def put(self, dets, x, keys, signals):
+        if not self._alive:
+            self.start()
+
+        with self._cond:
+            self._items.append((dets, x, keys, signals))
+            n = len(self._items)
+            if n > self.max_queue_depth:
+                self.max_queue_depth = n
+
+            if n == 1:
+                # wake the writer thread so that it starts timing the flush period
+                self._oldest = time.time()
+                self._cond.notify_all()
+            elif n >= self.batch_size:
+                self._cond.notify_all()
+
+    def start(self):
+        with self._cond:
+            if self._alive:
+                return
+            self._alive = True
+
+        self._thread = t = Thread(target=self._run, name=self.name)
+        t.daemon = True
+        t.start()
+
+    def flush(self, timeout=None):
+        """
+        block until all queued counts have been written.
+
+        returns False if ``timeout`` expired first
+        """
+        st = time.time()
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            try:
+                while self._items or self._writing:
+                    if not self._alive:
+                        # writer thread not running. write on this thread
+                        self._cond.release()
+                        try:
+                            self._write_pending()
+                        finally:
+                            self._cond.acquire()
+                        continue
+
+                    remaining = None
+                    if timeout is not None:
+                        remaining = timeout - (time.time() - st)
+                        if remaining <= 0:
+                            return False
+
+                    self._cond.wait(remaining)
+            finally:
+                # otherwise the writer keeps writing every count as soon as it is queued
+                self._flush_requested = False
+        return True
+
+    def stop(self, timeout=None):
+        """
+        write any queued counts and stop the writer thread.
+
+        returns False if ``timeout`` expired first
+        """
+        st = time.time()
+        ret = self.flush(timeout)
+        with self._cond:
+            self._alive = False
+            self._cond.notify_all()
+
+        t = self._thread
+        if t is not None:
+            if timeout is not None:
+                timeout = max(0, timeout - (time.time() - st))
+            t.join(timeout)
+            self._thread = None
+        return ret
+
+    def report(self):
+        return "written={} failed={} batches={} max_queue_depth={}".format(
+            self.nwritten, self.nfailed, self.nbatches, self.max_queue_depth
+        )
+
+    # private
+    def _ready(self):
+        items = self._items
+        if not items:
+            return False
+
+        return (
+            self._flush_requested
+            or not self._alive
+            or len(items) >= self.batch_size
+            or time.time() - self._oldest >= self.flush_period
+        )
+
+    def _run(self):
+        try:
+            while 1:
+                with self._cond:
+                    while self._alive and not self._ready():
+                        timeout = None
+                        if self._items:
+                            timeout = max(
+                                0, self.flush_period - (time.time() - self._oldest)
+                            )
+                        self._cond.wait(timeout)
+
+                    if not self._alive and not self._items:
+                        break
+
+                self._write_pending()
+        finally:
+            # if the thread dies flush/stop write the remaining counts on the calling thread
+            with self._cond:
+                self._alive = False
+                self._cond.notify_all()
+
+    def _write_pending(self):
+        with self._cond:
+            items, self._items = self._items, []
+            self._writing += len(items)
+
+        if items:
+            n = len(items)
+            failed = n
+            try:
+                self._write_batch(items)
+                failed = 0
+            except Exception as e:
+                logger.warning("failed writing {} counts. error={}".format(n, e))
+            finally:
+                with self._cond:
+                    self._writing -= n
+                    self.nwritten += n - failed
+                    self.nfailed += failed
+                    self.nbatches += 1
+                    self._cond.notify_all()
+
+
+# ============= EOF =============================================
@@ -20,9 +20,11 @@ from threading import Event
 
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance
+from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance, Float
 
 from pychron.envisage.consoleable import Consoleable
+from pychron.experiment.automated_run.buffered_writer import BufferedDataWriter
+from pychron.experiment.automated_run.plot_updater import PlotUpdater
 from pychron.pychron_constants import AR_AR, SIGNAL, BASELINE, WHIFF, SNIFF
 
 
@@ -71,6 +73,12 @@ class DataCollector(Consoleable):
     not_intensity_count = 0
     trigger = None
     plot_panel_update_period = Int(1)
+    plot_frame_rate = Float(10)
+    # seconds to wait for the buffered data writer at the end of a measurement
+    data_writer_timeout = Float(30)
+
+    _plot_updater = None
+    _plot_targets = None
 
     def __init__(self, *args, **kw):
         super(DataCollector, self).__init__(*args, **kw)
@@ -79,6 +87,11 @@ class DataCollector(Consoleable):
             "plot_panel_update_period",
             "pychron.experiment.plot_panel_update_period",
         )
+        bind_preference(
+            self,
+            "plot_frame_rate",
+            "pychron.experiment.plot_frame_rate",
+        )
 
     # def wait(self):
     #     st = time.time()
@@ -140,20 +153,13 @@ class DataCollector(Consoleable):
         self.debug("starting measurement")
 
         self._evt = evt = Event()
-
-        # self._queue = q = Queue()
-        # def writefunc():
-        #     writer = self.data_writer
-        #     while not q.empty() or not evt.wait(10):
-        #         dets = self.detectors
-        #         while not q.empty():
-        #             x, keys, signals = q.get()
-        #             writer(dets, x, keys, signals)
-        #
-        # # only write to file every 10 seconds and not on main thread
-        # t = Thread(target=writefunc)
-        # # t.setDaemon(True)
-        # t.start()
+        self._plot_targets = {}
+        if self.plot_frame_rate > 0:
+            self._plot_updater = PlotUpdater(
+                self._render_plot_frame,
+                frame_rate=self.plot_frame_rate,
+                name="PlotUpdater-{}".format(self.collection_kind),
+            )
 
         self.debug("measurement period (ms) = {}".format(self.period_ms))
         period = self.period_ms * 0.001
@@ -185,11 +191,36 @@ class DataCollector(Consoleable):
                 break
 
         evt.set()
-        # self.debug('waiting for write to finish')
-        # t.join()
+        self._flush_data_writer()
+        self._stop_plot_updater()
 
         self.debug("measurement finished")
 
+    def _flush_data_writer(self):
+        """
+        wait for a buffered data writer to write its queued counts. must be called before the
+        data file is closed
+        """
+        writer = self.data_writer
+        if isinstance(writer, BufferedDataWriter):
+            self.debug("waiting for data writer to finish")
+            if not writer.stop(self.data_writer_timeout):
+                self.warning(
+                    "data writer did not finish within {}s. {} counts not written".format(
+                        self.data_writer_timeout, writer.queue_depth
+                    )
+                )
+            if writer.nfailed:
+                self.warning("failed writing {} counts".format(writer.nfailed))
+            self.debug("data writer finished. {}".format(writer.report()))
+
+    def _stop_plot_updater(self):
+        updater = self._plot_updater
+        if updater is not None:
+            updater.stop()
+            self.debug("plot updater finished. {}".format(updater.report()))
+            self._plot_updater = None
+
     def _pre_trigger_hook(self):
         return True
 
@@ -259,7 +290,6 @@ class DataCollector(Consoleable):
             return data
 
     def _save_data(self, x, keys, signals):
-        # self._queue.put((x, keys, signals))
         self.data_writer(self.detectors, x, keys, signals)
 
         # update arar_age
@@ -312,19 +342,88 @@ class DataCollector(Consoleable):
         return d
 
     def _plot_data(self, cnt, x, keys, signals):
+        """
+        queue the count for the plot updater, or draw it now if the plot frame rate is 0.
+
+        the detector's current isotope is resolved here because peak hopping changes the
+        detector/isotope pairing between counts
+        """
+        data = []
         for dn, signal in zip(keys, signals):
             det = self._get_detector(dn)
             if det:
-                self._set_plot_data(cnt, det, x, signal)
+                data.append((det.name, det.isotope, det.ypadding, signal))
 
-        if not cnt % self.plot_panel_update_period:
-            self.plot_panel.update()
+        updater = self._plot_updater
+        if updater is not None:
+            updater.put(cnt, x, data)
+        else:
+            self._add_plot_data(((cnt, x, data),))
+            if not cnt % self.plot_panel_update_period:
+                self.plot_panel.update()
+
+    def _render_plot_frame(self, items):
+        self._add_plot_data(items)
+        self.plot_panel.update()
+
+    def _add_plot_data(self, items):
+        """
+        add a batch of counts to the graphs and set the fits once for the batch
+
+        items: list of (cnt, x, [(detector, isotope, ypadding, signal),...])
+        """
+        series = {}
+        fits = {}
+        cnt = items[-1][0]
+        for _, x, data in items:
+            for detname, iso, ypadding, signal in data:
+                for target in self._get_plot_targets(detname, iso):
+                    g, pid, sidx, fit_series, fitobj = target
+                    key = (id(g), pid, sidx)
+                    try:
+                        xs, ys, _, _ = series[key]
+                    except KeyError:
+                        xs, ys = [], []
+                        series[key] = (xs, ys, target, ypadding)
+                    xs.append(x)
+                    ys.append(signal)
+                    fits[(id(g), pid, fit_series)] = target
+
+        for xs, ys, (g, pid, sidx, _, _), ypadding in series.values():
+            g.add_bulk_data(
+                xs,
+                ys,
+                plotid=pid,
+                series=sidx,
+                update_y_limits=True,
+                ypadding=ypadding,
+            )
 
-    def _set_plot_data(self, cnt, det, x, signal):
+        for g, pid, _, fit_series, fitobj in fits.values():
+            fit = self._get_plot_fit(fitobj, cnt)
+            if fit:
+                g.set_fit(fit, plotid=pid, series=fit_series)
 
-        iso = det.isotope
-        detname = det.name
-        ypadding = det.ypadding
+    def _get_plot_fit(self, fitobj, cnt):
+        if fitobj is None:
+            return
+        elif isinstance(fitobj, str):
+            return fitobj
+        return fitobj.get_fit(cnt)
+
+    def _get_plot_targets(self, detname, iso):
+        """
+        return a cached list of (graph, plotid, series, fit_series, fit) for this detector/isotope.
+        fit is None, a fit name or an isotope that provides the fit for a given count
+        """
+        if self._plot_targets is None:
+            self._plot_targets = {}
+
+        key = (detname, iso)
+        try:
+            return self._plot_targets[key]
+        except KeyError:
+            pass
 
         if self.collection_kind == SNIFF:
             gs = [
@@ -333,28 +432,25 @@ class DataCollector(Consoleable):
             ]
 
         elif self.collection_kind == BASELINE:
-            iso = self.isotope_group.get_isotope(detector=detname, kind="baseline")
-            if iso is not None:
-                fit = iso.get_fit(cnt)
-            else:
-                fit = "average"
-            gs = [(self.plot_panel.baseline_graph, detname, fit, 0, 0)]
+            fitobj = self.isotope_group.get_isotope(detector=detname, kind="baseline")
+            if fitobj is None:
+                fitobj = "average"
+            gs = [(self.plot_panel.baseline_graph, detname, fitobj, 0, 0)]
         else:
             title = self.isotope_group.get_isotope_title(name=iso, detector=detname)
-            iso = self.isotope_group.get_isotope(name=iso, detector=detname)
-            fit = iso.get_fit(cnt)
+            fitobj = self.isotope_group.get_isotope(name=iso, detector=detname)
             gs = [
                 (
                     self.plot_panel.isotope_graph,
                     title,
-                    fit,
+                    fitobj,
                     self.series_idx,
                     self.fit_series_idx,
                 )
             ]
 
-        for g, name, fit, series, fit_series in gs:
-
+        targets = []
+        for g, name, fitobj, series, fit_series in gs:
             pid = g.get_plotid_by_ytitle(name)
             if pid is None:
                 self.critical(
@@ -362,15 +458,10 @@ class DataCollector(Consoleable):
                 )
                 continue
 
-            g.add_datum(
-                (x, signal),
-                series=series,
-                plotid=pid,
-                update_y_limits=True,
-                ypadding=ypadding,
-            )
-            if fit:
-                g.set_fit(fit, plotid=pid, series=fit_series)
+            targets.append((g, pid, series, fit_series, fitobj))
+
+        self._plot_targets[key] = targets
+        return targets
 
     # ===============================================================================
     #
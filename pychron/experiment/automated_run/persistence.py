@@ -20,7 +20,7 @@ import math
 import os
 import time
 
-from traits.api import Instance, Bool, Interface, provides, Long, Str, Float
+from traits.api import Instance, Bool, Interface, provides, Long, Str, Float, Int
 from xlwt import Workbook, struct
 
 from pychron.core.helpers.datetime_tools import get_datetime
@@ -28,6 +28,7 @@ from pychron.core.helpers.filetools import subdirize
 from pychron.core.helpers.strtools import to_bool
 from pychron.core.ui.preference_binding import set_preference
 from pychron.database.adapters.local_lab_adapter import LocalLabAdapter
+from pychron.experiment.automated_run.buffered_writer import BufferedDataWriter
 from pychron.experiment.automated_run.hop_util import parse_hops
 from pychron.experiment.automated_run.mass_spec_persistence_spec import (
     MassSpecPersistenceSpec,
@@ -232,14 +233,20 @@ class AutomatedRunPersister(BasePersister):
     grouping_threshold = Float
     grouping_suffix = Str
 
+    use_buffered_data_writer = Bool(True)
+    data_writer_batch_size = Int(25)
+    data_writer_flush_period = Float(5)
+
     _db_extraction_id = None
     _temp_analysis_buffer = None
     _current_data_frame = None
+    _data_writers = None
 
     def __init__(self, *args, **kw):
         super(AutomatedRunPersister, self).__init__(*args, **kw)
         # self.bind_preferences()
         self._temp_analysis_buffer = []
+        self._data_writers = []
 
     def set_preferences(self, preferences):
         """
@@ -255,6 +262,9 @@ class AutomatedRunPersister(BasePersister):
             ("use_analysis_grouping", to_bool),
             ("grouping_threshold", float),
             ("grouping_suffix", str),
+            ("use_buffered_data_writer", to_bool),
+            ("data_writer_batch_size", int),
+            ("data_writer_flush_period", float),
         ):
             set_preference(
                 preferences, self, attr, "pychron.experiment.{}".format(attr), cast
@@ -306,18 +316,15 @@ class AutomatedRunPersister(BasePersister):
         grpname should be a str such as "signal", "baseline",etc
         return a closure for writing the data
 
+        if ``use_buffered_data_writer`` the closure is a ``BufferedDataWriter`` that writes
+        batches of counts on a background thread
+
         :param grpname: str
         :return: function
         """
         tables = {}
 
-        def write_data(dets, x, keys, signals):
-            # todo: test whether saving data to h5 in real time is expansive
-
-            # disable H5 data writer
-            # self.unique_warning('NOT Writing data to H5 in real time')
-            # return
-
+        def append_rows(dets, x, keys, signals, touched):
             dm = self.data_manager
             for det in dets:
                 k = det.name
@@ -330,15 +337,16 @@ class AutomatedRunPersister(BasePersister):
 
                         tag = "{}/{}".format(grp, k)
                         if tag in tables:
-                            t = tables["tag"]
+                            t = tables[tag]
                         else:
                             t = dm.get_table(k, grp)
+                            tables[tag] = t
 
                         nrow = t.row
                         nrow["time"] = x
                         nrow["value"] = signals[keys.index(k)]
                         nrow.append()
-                        t.flush()
+                        touched[tag] = t
                 except AttributeError as e:
                     self.debug(
                         "error: {} group:{} det:{} iso:{}".format(
@@ -346,8 +354,38 @@ class AutomatedRunPersister(BasePersister):
                         )
                     )
 
+        def write_batch(items):
+            touched = {}
+            for dets, x, keys, signals in items:
+                append_rows(dets, x, keys, signals, touched)
+
+            for t in touched.values():
+                t.flush()
+
+        if self.use_buffered_data_writer:
+            writer = BufferedDataWriter(
+                write_batch,
+                batch_size=self.data_writer_batch_size,
+                flush_period=self.data_writer_flush_period,
+                name="DataWriter-{}".format(grpname),
+            )
+            self._data_writers.append(writer)
+            return writer
+
+        def write_data(dets, x, keys, signals):
+            write_batch(((dets, x, keys, signals),))
+
         return write_data
 
+    def flush_data_writers(self):
+        """
+        wait for the buffered data writers to finish writing
+        """
+        for w in self._data_writers:
+            w.stop()
+            self.debug("{} {}".format(w.name, w.report()))
+        self._data_writers = []
+
     def build_tables(self, grpname, detectors, n):
         """
         construct the hdf5 table structure
@@ -471,6 +509,8 @@ class AutomatedRunPersister(BasePersister):
         # self.debug('AutomatedRunPersister post_measurement_save deprecated')
         # return
 
+        self.flush_data_writers()
+
         if DEBUG:
             self.debug("Not measurement saving to database")
             return
@@ -0,0 +1,138 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import time
+from threading import Thread, Condition
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.logger_setup import new_logger
+
+logger = new_logger("PlotUpdater")
+
+
+class PlotUpdater(object):
+    """
+    Redraw the acquisition graph at a fixed frame rate on a background thread.
+
+    ``put`` queues a count and returns immediately. Once per frame the queued counts are
+    handed to ``render`` as a single list, so counts that arrive faster than the frame rate
+    are coalesced into one redraw. A frame that is not drawn because the previous ``render``
+    ran longer than the frame period is counted as dropped.
+    """
+
+    def __init__(self, render, frame_rate=10.0, name="PlotUpdater"):
+        self._render = render
+        self.frame_rate = frame_rate
+        self.name = name
+
+        self._cond = Condition()
+        self._items = []
+        self._alive = False
+        self._thread = None
+
+        self.nframes = 0
+        self.ncounts = 0
+        self.ncoalesced = 0
+        self.ndropped = 0
+
+    @property
+    def period(self):
+        return 1 / max(self.frame_rate, 1e-3)
+
+    def put(self, *args):
+        if not self._alive:
+            self.start()
+
+        with self._cond:
+            self._items.append(args)
+
+    def start(self):
+        with self._cond:
+            if self._alive:
+                return
+            self._alive = True
+
+        self._thread = t = Thread(target=self._run, name=self.name)
+        t.daemon = True
+        t.start()
+
+    def stop(self, timeout=None):
+        """
+        draw any queued counts and stop the updater thread
+        """
+        with self._cond:
+            self._alive = False
+            self._cond.notify_all()
+
+        t = self._thread
+        if t is not None:
+            t.join(timeout)
+            if t.is_alive():
+                return
+            self._thread = None
+
+        # draw anything queued while the thread was not running
+        self._render_pending()
+
+    def report(self):
+        return "frames={} counts={} coalesced={} dropped={}".format(
+            self.nframes, self.ncounts, self.ncoalesced, self.ndropped
+        )
+
+    # private
+    def _run(self):
+        period = self.period
+        next_frame = time.time() + period
+        while 1:
+            with self._cond:
+                while self._alive:
+                    remaining = next_frame - time.time()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                alive = self._alive
+
+            self._render_pending()
+            if not alive:
+                break
+
+            now = time.time()
+            next_frame += period
+            if next_frame < now:
+                missed = int((now - next_frame) / period) + 1
+                self.ndropped += missed
+                next_frame += missed * period
+
+    def _render_pending(self):
+        with self._cond:
+            items, self._items = self._items, []
+
+        if not items:
+            return
+
+        self.nframes += 1
+        self.ncounts += len(items)
+        self.ncoalesced += len(items) - 1
+        try:
+            self._render(items)
+        except BaseException as e:
+            logger.warning("failed drawing {} counts. error={}".format(len(items), e))
+
+
+# ============= EOF =============================================
@@ -207,6 +207,8 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
     use_memory_check = Bool(True)
     memory_threshold = Int
     use_dvc = Bool(False)
+    # seconds to wait for the background pushes when a queue ends
+    push_wait_timeout = Float(300)
     use_autoplot = Bool(False)
     monitor_name = DEFAULT_MONITOR_NAME
     experiment_type = Str(AR_AR)
@@ -607,6 +609,13 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
         exp.start_timestamp = datetime.now()
 
+        dvcp = self._get_dvc_persister()
+        if dvcp:
+            # the backlog changes on the push thread. update the stats on the ui thread
+            dvcp.push_queue.on_trait_change(
+                self._update_push_backlog, "backlog", dispatch="ui"
+            )
+
         self._do_event(events.START_QUEUE)
 
         # save experiment to database
@@ -759,6 +768,15 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                 # wait for overlapped runs to finish.
                 self._wait_for(lambda x: self.extracting_run or self.measuring_run)
 
+        # analyses are pushed in the background. make sure they are shared before the queue ends
+        if dvcp:
+            self.set_extract_state("Pushing analyses")
+            self._wait_for_pushes(dvcp)
+            self.set_extract_state(False)
+            dvcp.push_queue.on_trait_change(
+                self._update_push_backlog, "backlog", dispatch="ui", remove=True
+            )
+
         if self._err_message:
             self.warning("automated runs did not complete successfully")
             self.warning("error: {}".format(self._err_message))
@@ -827,6 +845,57 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                 break
             time.sleep(period)
 
+    def _update_push_backlog(self, new):
+        self.stats.push_backlog = new
+
+    def _wait_for_repository_pushes(self, records):
+        """
+        wait for the pending pushes of the repositories of ``records``. loading analyses pulls
+        their repositories which must not overlap a background push of the same repository
+        """
+        dvcp = self._get_dvc_persister()
+        if dvcp:
+            repos = {getattr(r, "repository_identifier", None) for r in records}
+            for repo in repos:
+                if repo:
+                    self._wait_for_pushes(dvcp, repo)
+
+    def _wait_for_pushes(self, dvcp, repository=None, period=1):
+        """
+        wait for the background pushes, or the push of ``repository``, to finish. give up after
+        ``push_wait_timeout`` seconds or if the executor is stopped. the remaining pushes stay
+        on the push queue
+        """
+        q = dvcp.push_queue
+        if repository is None:
+            if not q.backlog:
+                return True
+            msg = "{} pending push(es)".format(q.backlog)
+        else:
+            if not dvcp.is_push_pending(repository):
+                return True
+            msg = "the push of {}".format(repository)
+
+        self.info("waiting for {}. timeout={}s".format(msg, self.push_wait_timeout))
+        st = time.time()
+        while 1:
+            if dvcp.wait_for_pushes(repository, timeout=period):
+                return True
+
+            if not self.is_alive() or self._canceled:
+                reason = "experiment stopped"
+                break
+
+            if self.push_wait_timeout and time.time() - st > self.push_wait_timeout:
+                reason = "timed out after {}s".format(self.push_wait_timeout)
+                break
+
+        self.warning(
+            "stopped waiting for {} ({}). {} push(es) still pending. they will "
+            "continue in the background".format(msg, reason, q.backlog)
+        )
+        return False
+
     def _set_thread_name(self, name):
         self.debug("Changing Thread name to {}".format(name))
         ct = currentThread()
@@ -1371,9 +1440,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         arun.use_syn_extraction = False
 
         if self.use_dvc_persistence:
-            dvcp = self.application.get_service(
-                "pychron.dvc.dvc_persister.DVCPersister"
-            )
+            dvcp = self._get_dvc_persister()
             if dvcp:
                 dvcp.load_name = exp.load_name
                 dvcp.default_principal_investigator = (
@@ -1594,6 +1661,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                 ans = mainstore.get_last_n_analyses(
                     1, mass_spectrometer=ms, analysis_types=atype, verbose=False
                 )
+                self._wait_for_repository_pushes(ans)
                 ans = mainstore.make_analyses(ans, use_progress=False)
             else:
 
@@ -1609,6 +1677,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                         excluded_uuids=excluded,
                         verbose=False,
                     )
+                    self._wait_for_repository_pushes(ans)
                     ans = mainstore.make_analyses(ans, use_progress=False)
 
             rs = ((ai.uuid, ai.record_id, ai.get_ratio(ratio_name)) for ai in ans)
@@ -1876,6 +1945,12 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         else:
             return True
 
+    def _get_dvc_persister(self):
+        if self.use_dvc_persistence:
+            return self.application.get_service(
+                "pychron.dvc.dvc_persister.DVCPersister"
+            )
+
     def _check_dated_repos(self, inform):
         if self.use_dvc_persistence:
             exp = self.experiment_queue
@@ -2507,6 +2582,7 @@ Use Last "blank_{}"= {}
             if info.result:
                 dbr = selector.selected
         if dbr:
+            self._wait_for_repository_pushes([dbr])
             dbr = mainstore.make_analysis(dbr)
 
         return dbr, selected
@@ -109,6 +109,7 @@ class StatsGroup(Loggable):
     end_at = String
 
     nruns_finished = Int
+    push_backlog = Int
     run_duration = String
     current_run_duration = String
 
@@ -512,6 +512,11 @@ class StatsPane(TraitsDockPane):
             ),
             Readonly("remaining", label="Remaining"),
             Readonly("etf", label="Est. finish"),
+            Readonly(
+                "push_backlog",
+                label="Pending Pushes",
+                tooltip="Number of repositories waiting to be pushed",
+            ),
             label="General",
         )
         cur_grp = BorderVGroup(
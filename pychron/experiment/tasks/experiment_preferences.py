@@ -106,6 +106,12 @@ class ExperimentPreferences(BasePreferencesHelper):
     ratio_change_detection_enabled = Bool(False)
     use_preceding_blank = Bool(False)
     plot_panel_update_period = PositiveInteger(1)
+    plot_frame_rate = Float(10)
+
+    use_background_push = Bool(True)
+    use_buffered_data_writer = Bool(True)
+    data_writer_batch_size = PositiveInteger(25)
+    data_writer_flush_period = Float(5)
     execute_open_queues = Bool
     save_all_runs = Bool
 
@@ -285,6 +291,29 @@ class ExperimentPreferencesPane(PreferencesPane):
                 label="Save All analyses",
                 tooltip="Save analysis even if run canceled or failed",
             ),
+            Item(
+                "use_background_push",
+                label="Push in Background",
+                tooltip="Commit analyses locally and push them to the remote repositories "
+                "from a background worker. Pending pushes are finished at the end of the queue",
+            ),
+            Item(
+                "use_buffered_data_writer",
+                label="Buffer Data Writes",
+                tooltip="Write measured counts to file on a background thread",
+            ),
+            Item(
+                "data_writer_batch_size",
+                label="Batch Size",
+                tooltip="Write to file after N counts",
+                enabled_when="use_buffered_data_writer",
+            ),
+            Item(
+                "data_writer_flush_period",
+                label="Flush Period (s)",
+                tooltip="Write to file at least every N seconds",
+                enabled_when="use_buffered_data_writer",
+            ),
             label="Persist",
             show_border=True,
         )
@@ -337,7 +366,14 @@ class ExperimentPreferencesPane(PreferencesPane):
                 Item(
                     "plot_panel_update_period",
                     label="Regression Update Period",
-                    tooltip="update the isotope regression graph every N counts",
+                    tooltip="update the isotope regression graph every N counts. "
+                    "Only used if Plot Frame Rate is 0",
+                ),
+                Item(
+                    "plot_frame_rate",
+                    label="Plot Frame Rate (1/s)",
+                    tooltip="Redraw the isotope regression graph N times per second on a "
+                    "background thread. Set to 0 to redraw on the measurement thread",
                 ),
                 pc_grp,
                 persist_grp,
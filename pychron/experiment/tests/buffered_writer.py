@@ -0,0 +1,97 @@
+import threading
+import time
+import unittest
+
+from pychron.experiment.automated_run.buffered_writer import BufferedDataWriter
+
+
+class BufferedDataWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+        self.threads = set()
+
+        def write_batch(items):
+            self.threads.add(threading.current_thread().name)
+            self.batches.append([x for _, x, _, _ in items])
+
+        self.writer = BufferedDataWriter(write_batch, batch_size=5, flush_period=60)
+
+    def tearDown(self):
+        self.writer.stop(1)
+
+    def _put(self, n):
+        for i in range(n):
+            self.writer(None, i, ["H1"], [float(i)])
+
+    def test_batch_size(self):
+        self._put(5)
+        st = time.time()
+        while not self.batches and time.time() - st < 2:
+            time.sleep(0.01)
+
+        self.assertEqual(self.batches, [[0, 1, 2, 3, 4]])
+        self.assertNotIn(threading.current_thread().name, self.threads)
+
+    def test_flush(self):
+        self._put(3)
+        self.assertTrue(self.writer.flush(1))
+        self.assertEqual(self.batches, [[0, 1, 2]])
+        self.assertEqual(self.writer.queue_depth, 0)
+
+    def test_flush_timeout(self):
+        release = threading.Event()
+
+        def write_batch(items):
+            release.wait(1)
+            self.batches.append([x for _, x, _, _ in items])
+
+        self.writer.stop(1)
+        self.writer = BufferedDataWriter(write_batch, batch_size=5, flush_period=60)
+        self._put(3)
+        self.assertFalse(self.writer.flush(0.05))
+        release.set()
+
+        # the timed out flush no longer forces counts to be written immediately
+        self._put(1)
+        time.sleep(0.2)
+        self.assertEqual(self.batches, [[0, 1, 2]])
+        self.assertEqual(self.writer.queue_depth, 1)
+
+    def test_flush_period(self):
+        self.writer.flush_period = 0.05
+        self._put(2)
+        time.sleep(0.3)
+        self.assertEqual(self.batches, [[0, 1]])
+
+    def test_stop(self):
+        self._put(12)
+        self.writer.stop(1)
+        self.assertEqual(sum(self.batches, []), list(range(12)))
+        self.assertEqual(self.writer.nwritten, 12)
+        self.assertGreaterEqual(self.writer.max_queue_depth, 1)
+
+    def test_write_error(self):
+        def write_batch(items):
+            raise ValueError
+
+        w = BufferedDataWriter(write_batch, batch_size=2)
+        w(None, 0, [], [])
+        w(None, 1, [], [])
+        self.assertTrue(w.stop(1))
+        self.assertEqual(w.queue_depth, 0)
+        self.assertEqual(w.nwritten, 0)
+        self.assertEqual(w.nfailed, 2)
+        self.assertIn("failed=2", w.report())
+
+    def test_stop_timeout(self):
+        release = threading.Event()
+        w = BufferedDataWriter(lambda items: release.wait(2), batch_size=1)
+        w(None, 0, [], [])
+        st = time.time()
+        self.assertFalse(w.stop(0.1))
+        self.assertLess(time.time() - st, 0.5)
+        release.set()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import threading
+import time
+import unittest
+
+from pychron.experiment.automated_run.plot_updater import PlotUpdater
+
+
+class PlotUpdaterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.frames = []
+        self.threads = set()
+
+        def render(items):
+            self.threads.add(threading.current_thread().name)
+            self.frames.append([cnt for cnt, _ in items])
+
+        self.render = render
+        self.updater = PlotUpdater(render, frame_rate=20)
+
+    def tearDown(self):
+        self.updater.stop(1)
+
+    def test_coalesce(self):
+        for i in range(10):
+            self.updater.put(i, None)
+        time.sleep(0.2)
+
+        self.assertEqual(self.frames, [list(range(10))])
+        self.assertEqual(self.updater.ncoalesced, 9)
+        self.assertNotIn(threading.current_thread().name, self.threads)
+
+    def test_stop(self):
+        self.updater.frame_rate = 0.1
+        for i in range(3):
+            self.updater.put(i, None)
+        self.updater.stop(1)
+
+        self.assertEqual(self.frames, [[0, 1, 2]])
+        self.assertEqual(self.updater.nframes, 1)
+
+    def test_put_does_not_block(self):
+        def render(items):
+            time.sleep(0.2)
+
+        u = PlotUpdater(render, frame_rate=100)
+        u.put(0, None)
+        time.sleep(0.05)
+
+        st = time.time()
+        u.put(1, None)
+        self.assertLess(time.time() - st, 0.05)
+
+        u.stop(1)
+        self.assertEqual(u.ncounts, 2)
+        self.assertGreater(u.ndropped, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
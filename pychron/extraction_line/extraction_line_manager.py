@@ -975,6 +975,11 @@ class ExtractionLineManager(Manager, Consoleable):
         vm.on_trait_change(self._handle_console_message, "console_message")
         vm.on_trait_change(self._update_pipette_counts, "pipette_trackers:counts")
         bind_preference(vm, "valves_path", "pychron.extraction_line.valves_path")
+        bind_preference(
+            vm.state_poller,
+            "max_workers",
+            "pychron.extraction_line.hardware_poll_workers",
+        )
 
         return vm
 
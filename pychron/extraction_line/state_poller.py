@@ -0,0 +1,153 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from traits.api import Dict, Float, Int
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+
+
+def device_key(dev):
+    """
+    return the object that serializes the queries to ``dev``.
+
+    devices that share a communicator share a key. a device without a communicator
+    e.g. a simulated device is its own key
+    """
+    return getattr(dev, "communicator", None) or dev
+
+
+def device_name(dev):
+    return getattr(dev, "name", None) or str(dev)
+
+
+class StatePoller(Loggable):
+    """
+    query hardware in groups. one group per actuator/communicator.
+
+    the groups are queried concurrently on a bounded thread pool. the queries of a group are
+    made serially while holding the communicator's lock so a controller never sees
+    interleaved commands.
+    """
+
+    max_workers = Int(4)
+
+    # seconds, name: latency of the last poll of the actuator
+    latencies = Dict
+    # seconds, duration of the last poll
+    poll_time = Float
+
+    _pool = None
+    _pool_lock = None
+
+    def __init__(self, *args, **kw):
+        super(StatePoller, self).__init__(*args, **kw)
+        self._pool_lock = Lock()
+
+    def poll(self, jobs):
+        """
+        jobs: list of (device, key, func). func is called without arguments
+
+        returns a dict of key: result. the result is None if func raised an exception
+        """
+        groups = {}
+        for dev, key, func in jobs:
+            gk = device_key(dev)
+            try:
+                groups[gk][1].append((key, func))
+            except KeyError:
+                groups[gk] = (dev, [(key, func)])
+
+        st = time.time()
+        results = {}
+        latencies = {}
+        groups = list(groups.items())
+        if len(groups) == 1 or self.max_workers < 2:
+            rs = [self._poll_group(*g) for g in groups]
+        else:
+            # submit while holding the lock so that shutdown can not close the pool in between
+            with self._pool_lock:
+                pool = self._get_pool()
+                fs = [pool.submit(self._poll_group, *g) for g in groups]
+            rs = [f.result() for f in fs]
+
+        for name, et, gr in rs:
+            latencies[name] = et
+            results.update(gr)
+
+        self.latencies = latencies
+        self.poll_time = time.time() - st
+        return results
+
+    def report(self):
+        """
+        return a str of the latencies of the last poll, slowest first
+        """
+        ls = sorted(self.latencies.items(), key=lambda x: x[1], reverse=True)
+        return "poll={:0.3f}s {}".format(
+            self.poll_time, ", ".join("{}={:0.3f}s".format(*l) for l in ls)
+        )
+
+    def shutdown(self):
+        """
+        shut down the thread pool without waiting for running polls. the next
+        concurrent poll starts a new pool
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+
+    # private
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="StatePoller"
+            )
+        return self._pool
+
+    def _poll_group(self, gk, group):
+        dev, items = group
+        lock = getattr(gk, "lock", None)
+
+        st = time.time()
+        if lock is not None:
+            lock.acquire()
+        try:
+            results = [(key, self._call(key, func)) for key, func in items]
+        finally:
+            if lock is not None:
+                lock.release()
+
+        return device_name(dev), time.time() - st, results
+
+    def _call(self, key, func):
+        try:
+            return func()
+        except BaseException as e:
+            self.warning("failed querying {}. error={}".format(key, e))
+
+    def _max_workers_changed(self):
+        self.shutdown()
+
+
+# ============= EOF =============================================
@@ -19,7 +19,7 @@ from __future__ import absolute_import
 import time
 from threading import Event, Thread
 
-from traits.api import Int, List
+from traits.api import Int, List, Dict
 
 from pychron.globals import globalv
 from pychron.loggable import Loggable
@@ -38,6 +38,9 @@ class StatusMonitor(Loggable):
     owner_freq = Int(5)
     update_period = Int(1)
 
+    # seconds, name: duration of the last state, lock and owner queries
+    latencies = Dict
+
     def start(self, oid, vm):
         self.debug("start {}".format(oid))
         if not self._clients:
@@ -99,11 +102,15 @@ class StatusMonitor(Loggable):
             self.debug("No valve manager")
         else:
             i = 0
+            st = time.time()
             while 1:
-                time.sleep(self.update_period)
+                # wait the remainder of the period. the queries of the last iteration
+                # count towards the period
+                time.sleep(max(0, self.update_period - (time.time() - st)))
                 if self._stop_evt.is_set():
                     break
 
+                st = time.time()
                 if self._iter(i, vm):
                     break
 
@@ -111,6 +118,11 @@ class StatusMonitor(Loggable):
                     i = 0
                 i += 1
 
+            # release the polling threads while the monitor is stopped
+            poller = getattr(vm, "state_poller", None)
+            if poller is not None:
+                poller.shutdown()
+
         self.debug("Status monitor finished")
 
     def _iter(self, i, vm):
@@ -120,24 +132,24 @@ class StatusMonitor(Loggable):
             self.debug("stop_event set. no more iterations")
             return True
 
-        delay = self.update_period / 2.0
-        if self.state_freq and not i % self.state_freq:
-            if globalv.valve_debug:
-                self.debug("load valve states")
-            vm.load_valve_states()
-            time.sleep(delay)
-
-        if self.lock_freq and not i % self.lock_freq:
-            if globalv.valve_debug:
-                self.debug("load lock states")
-            vm.load_valve_lock_states()
-            time.sleep(delay)
-
-        if self.owner_freq and not i % self.owner_freq:
-            if globalv.valve_debug:
-                self.debug("load owners")
-            vm.load_valve_owners()
-            time.sleep(delay)
+        for freq, name, func in (
+            (self.state_freq, "state", vm.load_valve_states),
+            (self.lock_freq, "lock", vm.load_valve_lock_states),
+            (self.owner_freq, "owner", vm.load_valve_owners),
+        ):
+            if freq and not i % freq:
+                st = time.time()
+                func()
+                self.latencies[name] = time.time() - st
+                if self._stop_evt.is_set():
+                    return True
+
+        if globalv.valve_debug:
+            self.debug(
+                "latencies {}".format(
+                    ", ".join("{}={:0.3f}s".format(*l) for l in self.latencies.items())
+                )
+            )
 
         if self.checksum_freq and not i % self.checksum_freq:
             if not vm.state_checksum:
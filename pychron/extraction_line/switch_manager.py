@@ -19,18 +19,20 @@ import binascii
 import os
 import pickle
 import time
+from functools import partial
 from operator import itemgetter
 from pickle import PickleError
 from string import digits
 
 import yaml
-from traits.api import Any, Dict, List, Bool, Event, Str
+from traits.api import Any, Dict, List, Bool, Event, Str, Instance
 
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.core.helpers.strtools import to_bool
 from pychron.core.yaml import yload
 from pychron.extraction_line import VERBOSE_DEBUG, VERBOSE
 from pychron.extraction_line.pipettes.tracking import PipetteTracker
+from pychron.extraction_line.state_poller import StatePoller
 from pychron.globals import globalv
 from pychron.hardware.core.checksum_helper import computeCRC
 from pychron.hardware.core.i_core_device import ICoreDevice
@@ -85,6 +87,7 @@ class SwitchManager(Manager):
     actuators = List
 
     query_valve_state = Bool(True)
+    state_poller = Instance(StatePoller, ())
 
     use_explanation = True
 
@@ -131,6 +134,7 @@ class SwitchManager(Manager):
     def kill(self):
         super(SwitchManager, self).kill()
         self._save_states()
+        self.state_poller.shutdown()
 
     def create_device(self, name, *args, **kw):
         """ """
@@ -507,28 +511,43 @@ class SwitchManager(Manager):
         self.log(msg, VERBOSE_DEBUG)
 
     def load_hardware_states(self, force=False, verbose=False, refresh_canvas=True):
-        """ """
-        states = []
+        """
+        query the states of the switches. the actuators are queried concurrently
+        """
         words = {}
+        ostates = {}
+        jobs = []
         for k, v in self.switches.items():
             a = (k, v.address, v.state)
             if v.use_state_word:
                 if v.actuator not in words:
                     words[v.actuator] = [a]
+                    jobs.append((v.actuator, v.actuator, v.actuator.get_state_word))
                 else:
                     words[v.actuator].append(a)
 
             elif v.query_state or force:
-                ostate = v.state
-                s = v.get_hardware_indicator_state(verbose=verbose)
-                if not isinstance(s, bool):
-                    s = None
+                ostates[k] = v.state
+                dev = v.state_device if v.state_device is not None else v.actuator
+                jobs.append(
+                    (dev, k, partial(v.get_hardware_indicator_state, verbose=verbose))
+                )
 
-                if ostate != s:
-                    states.append((k, s, False))
+        results = self.state_poller.poll(jobs)
+        if globalv.valve_debug:
+            self.debug("load hardware states {}".format(self.state_poller.report()))
+
+        states = []
+        for k, ostate in ostates.items():
+            s = results.get(k)
+            if not isinstance(s, bool):
+                s = None
+
+            if ostate != s:
+                states.append((k, s, False))
 
         for actuator, items in words.items():
-            stateword = actuator.get_state_word()
+            stateword = results.get(actuator)
             if stateword:
                 for k, address, ostate in items:
                     try:
@@ -93,6 +93,7 @@ class BaseExtractionLinePreferences(BasePreferencesHelper):
 class ExtractionLinePreferences(BaseExtractionLinePreferences):
     use_hardware_update = Bool
     hardware_update_period = Float
+    hardware_poll_workers = Int(4)
     check_master_owner = Bool
 
 
@@ -149,6 +150,11 @@ class ExtractionLinePreferencesPane(PreferencesPane):
                 ),
                 Item("use_hardware_update"),
                 Item("hardware_update_period", enabled_when="use_hardware_update"),
+                Item(
+                    "hardware_poll_workers",
+                    label="Poll Workers",
+                    tooltip="Maximum number of actuators queried concurrently",
+                ),
                 show_border=True,
                 label="Update",
             ),
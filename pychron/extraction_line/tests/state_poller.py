@@ -0,0 +1,198 @@
+import time
+import unittest
+from threading import Lock, RLock, Thread
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.extraction_line.state_poller import StatePoller
+from pychron.extraction_line.status_monitor import StatusMonitor
+from pychron.extraction_line.switch_manager import SwitchManager
+from pychron.hardware.switch import Switch
+
+DELAY = 0.05
+
+
+class FakeCommunicator(object):
+    def __init__(self):
+        self.lock = RLock()
+
+
+class FakeActuator(object):
+    def __init__(self, name, states, word=None):
+        self.name = name
+        self.communicator = FakeCommunicator()
+        self.states = states
+        self.word = word
+        self.active = 0
+        self.max_active = 0
+        self._active_lock = Lock()
+
+    def _query(self):
+        with self._active_lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(DELAY)
+        with self._active_lock:
+            self.active -= 1
+
+    def get_indicator_state(self, address, *args, **kw):
+        self._query()
+        return self.states[address]
+
+    def get_state_word(self):
+        self._query()
+        return self.word
+
+
+def make_switch_manager(nactuators=3, nswitches=4):
+    sm = SwitchManager()
+    actuators = []
+    for i in range(nactuators):
+        addresses = ["{}{}".format(i, j) for j in range(nswitches)]
+        act = FakeActuator("act{}".format(i), {a: True for a in addresses})
+        actuators.append(act)
+        for a in addresses:
+            name = "switch-{}".format(a)
+            sm.switches[name] = Switch(name, address=a, actuator=act)
+    return sm, actuators
+
+
+class StatePollerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.poller = StatePoller(max_workers=4)
+
+    def tearDown(self):
+        self.poller.shutdown()
+
+    def test_concurrent_groups(self):
+        acts = [FakeActuator("act{}".format(i), {"a": True, "b": False}) for i in range(3)]
+        jobs = [
+            (act, (act.name, a), lambda act=act, a=a: act.get_indicator_state(a))
+            for act in acts
+            for a in ("a", "b")
+        ]
+
+        st = time.time()
+        results = self.poller.poll(jobs)
+        et = time.time() - st
+
+        self.assertEqual(len(results), 6)
+        self.assertTrue(results[("act1", "a")])
+        self.assertFalse(results[("act2", "b")])
+
+        # actuators are queried in parallel, the queries of an actuator serially
+        self.assertLess(et, 6 * DELAY)
+        for act in acts:
+            self.assertEqual(act.max_active, 1)
+        self.assertEqual(sorted(self.poller.latencies), ["act0", "act1", "act2"])
+
+    def test_communicator_lock(self):
+        act = FakeActuator("act", {"a": True})
+        jobs = [(act, "a", lambda: act.get_indicator_state("a"))]
+
+        results = {}
+
+        def poll():
+            results.update(self.poller.poll(jobs + jobs))
+
+        with act.communicator.lock:
+            t = Thread(target=poll)
+            t.start()
+            t.join(DELAY * 2)
+            # the poll blocks while another thread holds the communicator
+            self.assertTrue(t.is_alive())
+
+        t.join(1)
+        self.assertEqual(results, {"a": True})
+
+    def test_failed_query(self):
+        act = FakeActuator("act", {})
+        results = self.poller.poll([(act, "a", lambda: act.get_indicator_state("a"))])
+        self.assertEqual(results, {"a": None})
+
+
+class PolledManager(object):
+    """
+    the part of a switch manager used by the status monitor
+    """
+
+    state_checksum = True
+
+    def __init__(self):
+        self.state_poller = StatePoller(max_workers=2)
+        self.acts = [FakeActuator("act{}".format(i), {"a": True}) for i in range(2)]
+
+    def load_valve_states(self):
+        jobs = [
+            (act, act.name, lambda act=act: act.get_indicator_state("a"))
+            for act in self.acts
+        ]
+        self.state_poller.poll(jobs)
+
+    def load_valve_lock_states(self):
+        pass
+
+    def load_valve_owners(self):
+        pass
+
+
+class StatusMonitorPollTestCase(unittest.TestCase):
+    def test_stop_shuts_down_pool(self):
+        vm = PolledManager()
+        poller = vm.state_poller
+        monitor = StatusMonitor(update_period=0, state_freq=1)
+        monitor.start(1, vm)
+
+        st = time.time()
+        while poller._pool is None and time.time() - st < 2:
+            time.sleep(DELAY)
+        self.assertIsNotNone(poller._pool)
+
+        monitor.stop(1, block=False)
+        st = time.time()
+        while poller._pool is not None and time.time() - st < 2:
+            time.sleep(DELAY)
+        self.assertIsNone(poller._pool)
+
+
+class SwitchManagerPollTestCase(unittest.TestCase):
+    def test_load_hardware_states(self):
+        sm, actuators = make_switch_manager()
+        states = []
+        sm.on_trait_change(lambda new: states.extend(new), "refresh_state")
+
+        st = time.time()
+        self.assertTrue(sm.load_hardware_states())
+        et = time.time() - st
+
+        self.assertEqual(len(states), 12)
+        self.assertTrue(all(v.state for v in sm.switches.values()))
+        self.assertLess(et, 12 * DELAY)
+
+        # no changes
+        self.assertIsNone(sm.load_hardware_states())
+
+    def test_state_word(self):
+        sm, actuators = make_switch_manager(nactuators=2, nswitches=2)
+        act = actuators[0]
+        act.word = {"00": False, "01": True}
+        for v in sm.switches.values():
+            if v.actuator is act:
+                v.use_state_word = True
+
+        states = []
+        sm.on_trait_change(lambda new: states.extend(new), "refresh_state")
+        sm.load_hardware_states()
+
+        self.assertEqual(act.max_active, 1)
+        self.assertFalse(sm.switches["switch-00"].state)
+        self.assertTrue(sm.switches["switch-01"].state)
+        self.assertTrue(sm.switches["switch-10"].state)
+        self.assertEqual(len(states), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -766,39 +766,53 @@ class GitRepoManager(Loggable):
                     raise e
             self.debug("fetch complete")
 
-            def merge():
-                try:
-                    repo.git.merge("FETCH_HEAD")
-                except GitCommandError as e:
-                    self.critical("Pull-merge FETCH_HEAD={}".format(e))
-                    self.smart_pull(branch=branch, remote=remote)
-
-            if not use_auto_pull:
-                ahead, behind = self.ahead_behind(remote)
-                if behind:
-                    if self.confirmation_dialog(
-                        'Repository "{}" is behind the official version by {} changes.\n'
-                        "Would you like to pull the available changes?".format(
-                            self.name, behind
-                        )
-                    ):
-                        # show the changes
-                        h = self.git_history_view(branch)
-                        info = h.edit_traits(kind="livemodal")
-                        if info.result:
-                            merge()
-            else:
-                merge()
+            self.merge_fetched(branch, remote, use_auto_pull)
 
             if use_progress:
                 prog.close()
 
         self.debug("pull complete")
 
+    def merge_fetched(
+        self, branch="master", remote="origin", use_auto_pull=False, behind=None
+    ):
+        """
+        merge FETCH_HEAD, i.e. the second half of a pull
+
+        if use_auto_pull is False ask user if they want to accept the available updates.
+        behind: number of commits the branch is behind the remote. calculated if None
+        """
+        repo = self._repo
+
+        def merge():
+            try:
+                repo.git.merge("FETCH_HEAD")
+            except GitCommandError as e:
+                self.critical("Pull-merge FETCH_HEAD={}".format(e))
+                self.smart_pull(branch=branch, remote=remote)
+
+        if not use_auto_pull:
+            if behind is None:
+                ahead, behind = self.ahead_behind(remote)
+            if behind:
+                if self.confirmation_dialog(
+                    'Repository "{}" is behind the official version by {} changes.\n'
+                    "Would you like to pull the available changes?".format(
+                        self.name, behind
+                    )
+                ):
+                    # show the changes
+                    h = self.git_history_view(branch)
+                    info = h.edit_traits(kind="livemodal")
+                    if info.result:
+                        merge()
+        else:
+            merge()
+
     def has_remote(self, remote="origin"):
         return bool(self._get_remote(remote))
 
-    def push(self, branch="master", remote=None, inform=False):
+    def push(self, branch="master", remote=None, inform=False, raise_exceptions=False):
         if remote is None:
             remote = "origin"
 
@@ -811,6 +825,8 @@ class GitRepoManager(Loggable):
                     self.information_dialog("{} push complete".format(self.name))
             except GitCommandError as e:
                 self.debug_exception()
+                if raise_exceptions:
+                    raise
                 if inform:
                     self.warning_dialog(
                         "{} push failed. See log file for more details".format(
@@ -40,6 +40,7 @@ from traitsui.api import View, Item, UItem
 
 from pychron.core.helpers.color_generators import colorname_generator as color_generator
 from pychron.core.helpers.filetools import add_extension
+from pychron.core.helpers.growable_array import GrowableArray
 from pychron.graph.context_menu_mixin import ContextMenuMixin
 from pychron.graph.ml_label import MPlotAxis
 from pychron.graph.offset_plot_label import OffsetPlotLabel
@@ -197,6 +198,8 @@ class Graph(ContextMenuMixin):
     data_len = List
     data_limits = List
 
+    _datum_buffers = Dict
+
     def __init__(self, *args, **kw):
         """ """
         super(Graph, self).__init__(*args, **kw)
@@ -374,6 +377,7 @@ class Graph(ContextMenuMixin):
         self.series = []
         self.data_len = []
         self.data_limits = []
+        self._datum_buffers = {}
 
         if clear_container:
             self.plotcontainer = pc = self.container_factory()
@@ -841,9 +845,8 @@ class Graph(ContextMenuMixin):
         plot = self.plots[plotid]
         data = plot.data
         for n, ds in ((names[0], xs), (names[1], ys)):
-            xx = data.get_data(n)
-            xx = hstack((xx, ds))
-            data.set_data(n, xx)
+            buf = self._get_datum_buffer(plotid, n, data.get_data(n))
+            data.set_data(n, buf.extend(ds))
 
         if update_y_limits:
             ys = data[names[1]]
@@ -886,14 +889,14 @@ class Graph(ContextMenuMixin):
         data = plot.data
         mi, ma = -Inf, Inf
         for i, (name, di) in enumerate(zip(names, datum)):
-            d = data.get_data(name)
-            nd = hstack((d, di))
+            buf = self._get_datum_buffer(plotid, name, data.get_data(name))
+            nd = buf.append(di)
             data.set_data(name, nd)
 
             if i == 1:
-                # y values
-                mi = min(nd)
-                ma = max(nd)
+                # y values. the running bounds of the buffer avoid a pass over the series
+                mi = buf.min
+                ma = buf.max
 
         if update_y_limits:
             if isinstance(ypadding, str):
@@ -906,6 +909,18 @@ class Graph(ContextMenuMixin):
 
             self.set_y_limits(min_=mi, max_=ma + ypad, plotid=plotid)
 
+    def _get_datum_buffer(self, plotid, name, d):
+        """
+        return the growable buffer backing the data source ``name``. a new buffer is created
+        if the data source was set by something other than add_datum
+        """
+        key = (plotid, name)
+        buf = self._datum_buffers.get(key)
+        if buf is None or not buf.is_view(d):
+            buf = GrowableArray(d)
+            self._datum_buffers[key] = buf
+        return buf
+
     def add_range_selector(self, plotid=0, series=0):
         from chaco.tools.range_selection import RangeSelection
         from chaco.tools.range_selection_overlay import RangeSelectionOverlay
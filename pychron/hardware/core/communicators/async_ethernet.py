@@ -0,0 +1,284 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+Persistent, pipelined TCP connections for ``EthernetCommunicator``.
+
+All connections share one asyncio event loop that runs in a daemon thread. Callers in other
+threads use the blocking ``AsyncConnection.ask``, ``tell`` and ``read``.
+
+Requests are written as soon as they are made and the responses are matched to the requests in
+order, so several requests can be outstanding on one connection. This requires that the end of a
+response can be found, either from a message frame with a length header or from a read
+terminator. Without either only one request is outstanding at a time and a response is whatever
+one read returns, as with the blocking ``TCPHandler``.
+
+A request that times out leaves the connection out of step with the responses. The connection is
+closed, the outstanding requests fail and the next request reconnects.
+
+A request ``delay`` waits that many seconds after the request is written before its response is
+read, as ``EthernetCommunicator`` does in blocking mode. The following responses wait for it.
+"""
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import asyncio
+from collections import deque
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from threading import Lock, Thread
+
+# ============= local library imports  ==========================
+from pychron.hardware.core.checksum_helper import computeCRC
+
+_LOOP = None
+_LOOP_LOCK = Lock()
+
+
+def get_event_loop():
+    """
+    return the event loop shared by all of the connections. starts the loop thread if necessary
+    """
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            t = Thread(target=loop.run_forever, name="AsyncEthernetLoop")
+            t.daemon = True
+            t.start()
+            _LOOP = loop
+        return _LOOP
+
+
+class AsyncConnection(object):
+    def __init__(
+        self,
+        host,
+        port,
+        message_frame=None,
+        read_terminator=None,
+        max_inflight=16,
+        datasize=2**12,
+    ):
+        """
+        message_frame: MessageFrame or None
+        read_terminator: str or None. marks the end of a response if there is no message frame
+        max_inflight: maximum number of outstanding requests
+        """
+        self.host = host
+        self.port = port
+        self.message_frame = message_frame
+        self.read_terminator = read_terminator.encode("utf-8") if read_terminator else None
+        self.datasize = datasize
+
+        if not self.pipelined:
+            max_inflight = 1
+        self.max_inflight = max_inflight
+
+        self._loop = get_event_loop()
+        self._reader = None
+        self._writer = None
+        self._read_task = None
+        # (future, message frame, delay) of the outstanding requests in the order they were sent
+        self._pending = deque()
+        self._connect_lock = None
+        self._inflight = None
+        self._pending_evt = None
+
+    @property
+    def pipelined(self):
+        return bool(
+            (self.message_frame and self.message_frame.message_len)
+            or self.read_terminator
+        )
+
+    @property
+    def is_connected(self):
+        return self._writer is not None and not self._writer.is_closing()
+
+    # sync facade
+    def connect(self, timeout=1.0):
+        """
+        return True if connected
+        """
+        return self._run(self._connect(timeout), timeout)
+
+    def ask(self, data, timeout=3.0, message_frame=None, delay=None):
+        """
+        send ``data`` and return the response or None if the request failed or timed out.
+
+        delay: seconds to wait after sending ``data`` before reading the response. not counted
+            in the timeout
+        """
+        delay = delay or 0
+        return self._run(
+            self._ask(data, timeout, message_frame, delay), timeout + delay
+        )
+
+    def tell(self, data, timeout=1.0):
+        """
+        send ``data``. returns True if sent
+        """
+        return self._run(self._tell(data, timeout), timeout)
+
+    def read(self, timeout=3.0, message_frame=None):
+        """
+        return the next response that was not requested
+        """
+        return self._run(self._ask(None, timeout, message_frame, 0), timeout)
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self._close(), self._loop)
+
+    # private
+    def _run(self, coro, timeout):
+        f = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            # the coroutine enforces the timeout. allow for scheduling and connecting
+            return f.result(2 * timeout + 1)
+        except FutureTimeoutError:
+            f.cancel()
+
+    async def _connect(self, timeout):
+        if self._connect_lock is None:
+            # created here so that they are bound to the loop
+            self._connect_lock = asyncio.Lock()
+            self._inflight = asyncio.Semaphore(self.max_inflight)
+            self._pending_evt = asyncio.Event()
+
+        async with self._connect_lock:
+            if self.is_connected:
+                return True
+
+            try:
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port), timeout
+                )
+            except (OSError, asyncio.TimeoutError):
+                self._reader, self._writer = None, None
+                return False
+
+            self._read_task = self._loop.create_task(self._read_loop(self._reader))
+            return True
+
+    async def _ask(self, data, timeout, message_frame, delay):
+        if not await self._connect(timeout):
+            return
+
+        if message_frame is None:
+            message_frame = self.message_frame
+
+        async with self._inflight:
+            # the connection may have been closed while waiting for a slot
+            if not await self._connect(timeout):
+                return
+
+            # the future is queued and the data written without yielding to the loop so that the
+            # order of the queue is the order of the requests
+            w = self._writer
+            fut = self._loop.create_future()
+            self._pending.append((fut, message_frame, delay))
+            self._pending_evt.set()
+            if data is not None:
+                w.write(data.encode("utf-8"))
+
+            try:
+                await w.drain()
+                return await asyncio.wait_for(asyncio.shield(fut), timeout + delay)
+            except (asyncio.TimeoutError, OSError, ConnectionError):
+                # do not close a connection that was opened by another request
+                if self._writer is w:
+                    await self._close()
+
+    async def _tell(self, data, timeout):
+        if not await self._connect(timeout):
+            return
+
+        self._writer.write(data.encode("utf-8"))
+        try:
+            await self._writer.drain()
+            return True
+        except (OSError, ConnectionError):
+            await self._close()
+
+    async def _close(self):
+        w = self._writer
+        self._reader, self._writer = None, None
+        if self._read_task:
+            self._read_task.cancel()
+            self._read_task = None
+
+        self._fail_pending()
+        if w is not None:
+            w.close()
+            try:
+                await w.wait_closed()
+            except (OSError, ConnectionError):
+                pass
+
+    def _fail_pending(self):
+        while self._pending:
+            fut, _, _ = self._pending.popleft()
+            if not fut.done():
+                fut.set_exception(ConnectionError("connection closed"))
+                # mark as retrieved. the request may have timed out and no longer be waiting
+                fut.exception()
+
+    async def _read_loop(self, reader):
+        try:
+            while 1:
+                # wait for a request. a response that was not requested is kept in the stream
+                # buffer for ``read``
+                while not self._pending:
+                    self._pending_evt.clear()
+                    await self._pending_evt.wait()
+
+                fut, frame, delay = self._pending[0]
+                if delay:
+                    await asyncio.sleep(delay)
+                resp = await self._read_response(reader, frame)
+                self._pending.popleft()
+                if not fut.done():
+                    fut.set_result(resp)
+
+        except (asyncio.IncompleteReadError, OSError, ConnectionError, ValueError):
+            if self._reader is reader:
+                self._read_task = None
+                await self._close()
+        except asyncio.CancelledError:
+            pass
+
+    async def _read_response(self, reader, frame):
+        if frame and frame.message_len:
+            nm = frame.nmessage_len
+            header = await reader.readexactly(nm)
+            n = int(header, 16)
+            data = await reader.readexactly(n - nm)
+        elif self.read_terminator:
+            data = await reader.readuntil(self.read_terminator)
+        else:
+            data = await reader.read(self.datasize)
+            if not data:
+                raise ConnectionError("connection closed")
+
+        if frame and frame.checksum:
+            nc = frame.nchecksum
+            checksum = data[-nc:]
+            data = data[:-nc]
+            if computeCRC(data.decode("utf-8")) != checksum.decode("utf-8"):
+                return
+
+        return data.decode("utf-8")
+
+
+# ============= EOF =============================================
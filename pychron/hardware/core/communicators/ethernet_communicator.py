@@ -197,7 +197,21 @@ class EthernetCommunicator(Communicator):
 
     default_timeout = 3
 
-    _comms_report_attrs = ("host", "port", "read_port", "kind", "timeout")
+    # asyncio mode. a persistent TCP connection with pipelined requests. see async_ethernet
+    use_async = False
+    read_terminator = None
+    max_inflight = 16
+    _connection = None
+
+    _comms_report_attrs = (
+        "host",
+        "port",
+        "read_port",
+        "kind",
+        "timeout",
+        "use_async",
+        "read_terminator",
+    )
 
     @property
     def address(self):
@@ -252,6 +266,29 @@ class EthernetCommunicator(Communicator):
             default=3,
         )
 
+        self.use_async = self.config_get(
+            config,
+            "Communications",
+            "use_async",
+            cast="boolean",
+            optional=True,
+            default=False,
+        )
+        read_terminator = self.config_get(
+            config, "Communications", "read_terminator", optional=True
+        )
+        if read_terminator in ("chr(10)", "chr(13)", "chr(0)"):
+            read_terminator = chr(int(read_terminator[4:-1]))
+        self.read_terminator = read_terminator
+        self.max_inflight = self.config_get(
+            config,
+            "Communications",
+            "max_inflight",
+            cast="int",
+            optional=True,
+            default=16,
+        )
+
         if self.kind is None:
             self.kind = "UDP"
 
@@ -268,8 +305,14 @@ class EthernetCommunicator(Communicator):
     def test_connection(self):
         self.simulation = False
 
-        with self._lock:
-            handler = self.get_handler()
+        if self._is_async():
+            handler = self._get_connection()
+            if not handler.connect(self.timeout or 1):
+                self.error_mode = True
+                handler = None
+        else:
+            with self._lock:
+                handler = self.get_handler()
 
         # send a test command so see if wer have connection
         cmd = self.test_cmd
@@ -365,6 +408,19 @@ class EthernetCommunicator(Communicator):
 
         cmd = "{}{}".format(cmd, self.write_terminator)
 
+        if self._is_async():
+            return self._async_ask(
+                cmd,
+                retries,
+                verbose,
+                quiet,
+                info,
+                timeout,
+                message_frame,
+                delay,
+                use_error_mode,
+            )
+
         r = None
         with self._lock:
             if use_error_mode and self.error_mode:
@@ -409,17 +465,31 @@ class EthernetCommunicator(Communicator):
         return r
 
     def reset(self):
+        if self._connection:
+            self._connection.close()
         if self.handler:
             self.handler.end()
         self._reset_connection()
 
     def read(self, datasize=None, *args, **kw):
+        if self._is_async():
+            return self._get_connection().read(self.default_timeout)
+
         with self._lock:
             handler = self.get_handler()
             if handler:
                 return handler.get_packet(datasize=datasize)
 
     def tell(self, cmd, verbose=True, quiet=False, info=None):
+        if self._is_async():
+            cmd = "{}{}".format(cmd, self.write_terminator)
+            if self._get_connection().tell(cmd, self.timeout or 1):
+                if verbose or self.verbose and not quiet:
+                    self.log_tell(cmd, info)
+            else:
+                self.warning("tell. send failed. address: {}".format(self.address))
+            return
+
         with self._lock:
             handler = self.get_handler()
             if handler:
@@ -433,6 +503,78 @@ class EthernetCommunicator(Communicator):
                     self.error_mode = True
 
     # private
+    def _is_async(self):
+        """
+        the asyncio mode needs a TCP connection that the server keeps open between requests
+        """
+        return self.use_async and self.kind.lower() == "tcp" and not self.use_end
+
+    def _get_connection(self):
+        from pychron.hardware.core.communicators.async_ethernet import AsyncConnection
+
+        c = self._connection
+        if c is None or (c.host, c.port) != (self.host, self.port):
+            if c is not None:
+                c.close()
+
+            frame = MessageFrame()
+            frame.set_str(self.message_frame)
+            c = AsyncConnection(
+                self.host,
+                self.port,
+                message_frame=frame,
+                read_terminator=self.read_terminator,
+                max_inflight=self.max_inflight,
+            )
+            self._connection = c
+        return c
+
+    def _async_ask(
+        self,
+        cmd,
+        retries,
+        verbose,
+        quiet,
+        info,
+        timeout,
+        message_frame,
+        delay,
+        use_error_mode,
+    ):
+        if timeout is None:
+            timeout = self.default_timeout
+
+        # as in blocking mode a communicator in error mode makes fewer and shorter attempts
+        if use_error_mode and self.error_mode:
+            retries = 2
+
+        conn = self._get_connection()
+        r = None
+        for i in range(retries):
+            t = 0.25 if use_error_mode and self.error_mode else timeout
+            self.error_mode = False
+            r = conn.ask(cmd, timeout=t, message_frame=message_frame, delay=delay)
+            if r is not None:
+                break
+
+            self.error_mode = True
+
+            if i < retries - 1:
+                # the connection is reopened by the next request
+                self.debug("doing retry {}".format(i))
+                time.sleep(0.025 * 2**i)
+
+        if r is None:
+            re = "ERROR: Connection refused: {}, timeout={}".format(
+                self.address, timeout
+            )
+        else:
+            re = process_response(r)
+
+        if verbose or (self.verbose and not quiet):
+            self.log_response(cmd, re, info)
+        return r
+
     def _reset_connection(self):
         self.handler = None
         self.error_mode = False
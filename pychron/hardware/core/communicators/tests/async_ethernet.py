@@ -0,0 +1,166 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.hardware.core.checksum_helper import computeCRC
+from pychron.hardware.core.communicators.ethernet_communicator import (
+    EthernetCommunicator,
+)
+
+
+class LoopbackServer(object):
+    """
+    stand-in for a device server. each command is answered with "<command>:OK" after
+    ``latency`` seconds. commands are answered in order but several may be in progress.
+    a "SLOW" command is never answered
+    """
+
+    def __init__(self, latency=0.0, framed=False, terminator="\n"):
+        self.latency = latency
+        self.framed = framed
+        self.terminator = terminator
+        self.nconnections = 0
+        self.loop = asyncio.new_event_loop()
+        self.port = None
+        self._server = None
+        self._tasks = []
+
+    def start(self):
+        t = Thread(target=self.loop.run_forever)
+        t.daemon = True
+        t.start()
+        f = asyncio.run_coroutine_threadsafe(self._start(), self.loop)
+        self.port = f.result(5)
+
+    def stop(self):
+        async def stop():
+            self._server.close()
+            for t in self._tasks:
+                t.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    async def _start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _handle(self, reader, writer):
+        self.nconnections += 1
+        self._tasks.append(asyncio.current_task())
+        queue = asyncio.Queue()
+
+        async def respond():
+            while 1:
+                t, cmd = await queue.get()
+                await asyncio.sleep(max(0, t + self.latency - time.time()))
+                writer.write(self._format(cmd).encode("utf-8"))
+
+        task = asyncio.ensure_future(respond())
+        try:
+            while 1:
+                line = await reader.readuntil(b"\r")
+                cmd = line[:-1].decode("utf-8")
+                if cmd != "SLOW":
+                    queue.put_nowait((time.time(), cmd))
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            task.cancel()
+            writer.close()
+
+    def _format(self, cmd):
+        resp = "{}:OK".format(cmd)
+        if self.framed:
+            resp = "{}{}".format(resp, computeCRC(resp))
+            return "{:04X}{}".format(len(resp) + 4, resp)
+        return "{}{}".format(resp, self.terminator)
+
+
+def make_communicator(server, **kw):
+    c = EthernetCommunicator(name="test", **kw)
+    c.open(host="127.0.0.1", port=server.port, kind="TCP")
+    return c
+
+
+class AsyncEthernetTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = LoopbackServer(latency=0.01)
+        self.server.start()
+        self.comm = make_communicator(self.server, use_async=True, read_terminator="\n")
+
+    def tearDown(self):
+        self.comm.reset()
+        self.server.stop()
+
+    def test_ask(self):
+        self.assertFalse(self.comm.simulation)
+        self.assertEqual(self.comm.ask("Read", verbose=False), "Read:OK\n")
+        self.assertEqual(self.comm.ask("Read", verbose=False), "Read:OK\n")
+        self.assertEqual(self.server.nconnections, 1)
+
+    def test_pipelined(self):
+        cmds = ["Cmd{}".format(i) for i in range(50)]
+
+        st = time.time()
+        with ThreadPoolExecutor(10) as pool:
+            rs = list(pool.map(lambda c: self.comm.ask(c, verbose=False), cmds))
+        et = time.time() - st
+
+        self.assertEqual(rs, ["{}:OK\n".format(c) for c in cmds])
+        # 50 round trips of 10 ms one at a time take at least 0.5 s
+        self.assertLess(et, 0.4)
+
+    def test_timeout(self):
+        st = time.time()
+        self.assertIsNone(self.comm.ask("SLOW", timeout=0.1, retries=1, verbose=False))
+        self.assertLess(time.time() - st, 1)
+
+        # a new connection is used for the next request
+        self.assertEqual(self.comm.ask("Read", verbose=False), "Read:OK\n")
+        self.assertEqual(self.server.nconnections, 2)
+
+    def test_error_mode(self):
+        self.assertIsNone(self.comm.ask("SLOW", timeout=0.1, retries=1, verbose=False))
+        self.assertTrue(self.comm.error_mode)
+
+        # in error mode two attempts of 0.25 s are made instead of three of 3 s
+        st = time.time()
+        self.assertIsNone(self.comm.ask("SLOW", verbose=False))
+        self.assertLess(time.time() - st, 1.5)
+
+        self.assertEqual(self.comm.ask("Read", verbose=False), "Read:OK\n")
+        self.assertFalse(self.comm.error_mode)
+
+    def test_delay(self):
+        st = time.time()
+        r = self.comm.ask("Read", timeout=0.1, delay=0.3, verbose=False)
+        self.assertEqual(r, "Read:OK\n")
+        self.assertGreaterEqual(time.time() - st, 0.3)
+
+    def test_tell(self):
+        self.comm.tell("Set", verbose=False)
+        self.assertEqual(self.comm.read(), "Set:OK\n")
+        self.assertEqual(self.comm.ask("Read", verbose=False), "Read:OK\n")
+
+    def test_framed(self):
+        server = LoopbackServer(framed=True)
+        server.start()
+        try:
+            comm = make_communicator(server, use_async=True, message_frame="L4,-,C4")
+            self.assertEqual(comm.ask("Read", verbose=False), "Read:OK")
+            comm.reset()
+        finally:
+            server.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -93,6 +93,12 @@ class HardwarePlugin(BaseTaskPlugin):
             dp.serial_preference.auto_write_handle = to_bool(awh)
 
         ini = Initializer(device_prefs=dp)
+        nworkers = self.application.preferences.get(
+            "pychron.hardware.device_initialization_workers"
+        )
+        if nworkers is not None:
+            ini.max_workers = int(nworkers)
+
         for m in self.managers:
             ini.add_initialization(m)
 
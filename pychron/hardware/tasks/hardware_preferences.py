@@ -41,6 +41,9 @@ class HardwarePreferences(BasePreferencesHelper):
     auto_find_handle = Bool
     auto_write_handle = Bool
 
+    # number of devices opened and initialized concurrently at startup
+    device_initialization_workers = Int(8)
+
     system_lock_name = String
     system_lock_address = String
     enable_system_lock = Bool
@@ -119,11 +122,23 @@ class HardwarePreferencesPane(PreferencesPane):
             label="Pychron Proxy Server",
         )
 
+        startup_grp = VGroup(
+            Item(
+                "device_initialization_workers",
+                label="Device Workers",
+                tooltip="Number of devices opened and initialized concurrently at "
+                "startup. Devices that share a port or scheduler are always "
+                "initialized one at a time",
+            ),
+            show_border=True,
+            label="Startup",
+        )
+
         # sgrp = VGroup(Item('auto_find_handle'),
         #               Item('auto_write_handle', enabled_when='auto_find_handle'),
         #               show_border=True, label='Serial')
         # v = View(VGroup(ehs_grp, sgrp))
-        v = View(ehs_grp)
+        v = View(VGroup(ehs_grp, startup_grp))
         return v
 
 
@@ -301,6 +301,20 @@ class LabspyClient(Loggable):
         except BaseException as e:
             self.debug("failed adding measurement. {}".format(e))
 
+    @auto_connect
+    def add_measurements(self, measurements):
+        """
+        measurements: list of (device, process name, value, units, timestamp)
+        """
+        self.debug("adding {} measurements".format(len(measurements)))
+        try:
+            measurements = [(d, t, float(v), u, ts) for d, t, v, u, ts in measurements]
+            self.db.add_measurements(measurements)
+            for dev, tag, val, unit, _ in measurements:
+                self._check_notifications(dev, tag, val, unit)
+        except BaseException as e:
+            self.debug("failed adding measurements. {}".format(e))
+
     def connect(self):
         self.warning("not connected to db {}".format(self.db.public_url))
         return self.db.connect()
@@ -122,6 +122,45 @@ class LabspyDatabaseAdapter(DatabaseAdapter):
         else:
             self.warning("ProcessInfo={} Device={} not available".format(name, dev))
 
+    def add_measurements(self, measurements):
+        """
+        measurements: list of (device, process name, value, units, timestamp)
+
+        add all of the measurements in one session and commit them together.
+
+        returns the added measurements
+        """
+        sess = self.session
+        pinfos = {}
+        items = []
+        for dev, name, value, unit, ts in measurements:
+            key = dev, name
+            if key not in pinfos:
+                pinfos[key] = self.get_process_info(dev, name)
+                if not pinfos[key]:
+                    self.warning(
+                        "ProcessInfo={} Device={} not available".format(name, dev)
+                    )
+
+            pinfo = pinfos[key]
+            if pinfo:
+                m = Measurement(value=value, pub_date=datetime.fromtimestamp(ts))
+                m.process = pinfo
+                sess.add(m)
+                items.append(m)
+
+        if items:
+            try:
+                sess.flush()
+                sess.commit()
+            except SQLAlchemyError as e:
+                self.warning("failed adding {} measurements. {}".format(len(items), e))
+                sess.rollback()
+                if self.reraise:
+                    raise
+                return []
+        return items
+
     def add_process_info(self, dev, name, unit):
         self.debug("add process info {} {} {}".format(dev, name, unit))
         dbdev = self.get_device(dev)
@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.labspy.database_adapter import LabspyDatabaseAdapter
+from pychron.labspy.orm import Base, Device, Measurement, ProcessInfo
+
+
+class LabspyDatabaseTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.db = db = LabspyDatabaseAdapter()
+        db.trait_set(kind="sqlite", path=os.path.join(self.root, "labspy.sqlite"))
+        db.connect()
+        with db.session_ctx() as sess:
+            Base.metadata.create_all(sess.bind)
+            dev = Device(name="Gauge")
+            sess.add_all([dev, ProcessInfo(name="pressure", units="torr", device=dev)])
+            sess.commit()
+
+    def tearDown(self):
+        self.db.close_session()
+        shutil.rmtree(self.root)
+
+    def _count(self):
+        with self.db.session_ctx(use_parent_session=False) as sess:
+            return sess.query(Measurement).count()
+
+    def test_add_measurements(self):
+        ts = time.time()
+        ms = [("Gauge", "pressure", float(i), "torr", ts + i) for i in range(5)]
+        ms.append(("Gauge", "missing", 1.0, "torr", ts))
+
+        # LabspyClient.add_measurements uses its own session, closed afterwards
+        with self.db.session_ctx(use_parent_session=False):
+            added = self.db.add_measurements(ms)
+
+        self.assertEqual(len(added), 5)
+        self.assertEqual(self._count(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -389,14 +389,7 @@ class StageManager(BaseStageManager):
             smap = self.stage_map
 
             xx, yy = smap.map_to_uncalibration((x, y), ca.center, ca.rotation)
-            return next(
-                (
-                    hole
-                    for hole in smap.sample_holes
-                    if abs(hole.x - xx) < tol and abs(hole.y - yy) < tol
-                ),
-                None,
-            )
+            return smap.get_hole_index().in_box(xx, yy, tol)
 
     def get_hole_xy(self, key):
         hole = self.stage_map.get_hole(key)
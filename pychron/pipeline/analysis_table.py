@@ -0,0 +1,228 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import operator
+
+from numpy import argsort, array, asarray, fromiter, isin, nan, number, unique
+from uncertainties import nominal_value, std_dev
+
+# ============= local library imports  ==========================
+
+COMPARATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
+def _nominal(attr):
+    def func(a):
+        v = getattr(a, attr)
+        return nan if v is None else nominal_value(v)
+
+    return func
+
+
+def _error(attr):
+    def func(a):
+        v = getattr(a, attr)
+        return nan if v is None else std_dev(v)
+
+    return func
+
+
+def _isotope(key, error=False):
+    def func(a):
+        try:
+            v = a.get_value(key)
+        except (KeyError, AttributeError):
+            return nan
+        return std_dev(v) if error else nominal_value(v)
+
+    return func
+
+
+# float columns that are not plain attributes. a missing value is nan
+FLOAT_COLUMNS = {
+    "age": _nominal("uage"),
+    "age_err": _error("uage"),
+    "kca": _nominal("kca"),
+    "kca_err": _error("kca"),
+}
+
+
+def to_column(values):
+    """
+    return ``values`` as an array. values of mixed types, None or values numpy cannot
+    compare, e.g. dicts or ufloats, are an object array
+    """
+    types = {type(v) for v in values}
+    if len(types) > 1 or not all(
+        issubclass(t, (int, float, str, number)) for t in types
+    ):
+        c = array(values + [None], dtype=object)[:-1]
+    else:
+        c = array(values)
+    return c
+
+
+def is_vectorizable(column):
+    return column.dtype.kind != "O"
+
+
+def first_appearance_codes(values):
+    """
+    return the code of each value and the unique values. codes number the unique values
+    in the order they first appear in ``values``
+    """
+    uniques, first, inverse = unique(values, return_index=True, return_inverse=True)
+    order = argsort(first)
+    rank = argsort(order)
+    return rank[inverse], uniques[order]
+
+
+class AnalysisTable(object):
+    """
+    columnar view of a list of analyses.
+
+    a column is an array with one value per analysis built the first time it is used.
+    vectorized operations return index arrays into ``analyses``. ``assign`` writes
+    values to the analyses and the column so the two stay in sync. a column whose
+    attribute is changed by other code has to be invalidated
+    """
+
+    def __init__(self, analyses, columns=None):
+        self.analyses = list(analyses)
+        self._columns = columns or {}
+
+    def __len__(self):
+        return len(self.analyses)
+
+    def column(self, name):
+        """
+        name: attribute name, a key of FLOAT_COLUMNS, "iso:<key>" or "iso_err:<key>" for
+        the value or error of an isotope or ratio
+        """
+        try:
+            return self._columns[name]
+        except KeyError:
+            c = self._build(name)
+            self._columns[name] = c
+            return c
+
+    def is_vectorizable(self, name):
+        return is_vectorizable(self.column(name))
+
+    def invalidate(self, *names):
+        """
+        drop the named columns or all columns if no names are given
+        """
+        if names:
+            for n in names:
+                self._columns.pop(n, None)
+        else:
+            self._columns = {}
+
+    def assign(self, name, values, idxs=None):
+        """
+        set the attribute ``name`` of the analyses at ``idxs`` (all if None)
+        """
+        if idxs is None:
+            ans = self.analyses
+        else:
+            ans = [self.analyses[i] for i in idxs]
+
+        values = asarray(values)
+        for a, v in zip(ans, values.tolist()):
+            setattr(a, name, v)
+
+        if idxs is None:
+            self._columns[name] = values
+        elif name in self._columns:
+            c = self._columns[name]
+            if c.dtype == values.dtype or c.dtype.kind == values.dtype.kind == "f":
+                c[idxs] = values
+            else:
+                self._columns.pop(name)
+
+    def take(self, idxs):
+        """
+        return a new table of the analyses at ``idxs``
+        """
+        idxs = asarray(idxs, dtype=int)
+        cs = {k: v[idxs] for k, v in self._columns.items()}
+        return AnalysisTable([self.analyses[i] for i in idxs], cs)
+
+    def argsort(self, name):
+        """
+        return the indices that sort the table by ``name``. equal values keep their
+        order
+        """
+        return argsort(self.column(name), kind="stable")
+
+    def isin(self, name, values):
+        return isin(self.column(name), list(values))
+
+    def compare(self, name, comparator, criterion):
+        """
+        return a boolean array or None if the column cannot be compared with numpy.
+
+        comparator: a key of COMPARATORS, "between" or "not between"
+        criterion: value or, for between, (low, high)
+        """
+        c = self.column(name)
+        if not is_vectorizable(c):
+            return
+
+        try:
+            if comparator == "between":
+                low, high = criterion
+                r = (low < c) & (c < high)
+            elif comparator == "not between":
+                low, high = criterion
+                r = (low > c) | (c > high)
+            else:
+                r = COMPARATORS[comparator](c, criterion)
+        except TypeError:
+            return
+
+        r = asarray(r, dtype=bool)
+        # numpy returns a scalar if it could not compare the elements
+        if r.shape == c.shape:
+            return r
+
+    # private
+    def _build(self, name):
+        n = len(self.analyses)
+        if name in FLOAT_COLUMNS:
+            func = FLOAT_COLUMNS[name]
+        elif name.startswith("iso:"):
+            func = _isotope(name[4:])
+        elif name.startswith("iso_err:"):
+            func = _isotope(name[8:], error=True)
+        else:
+            return to_column([getattr(a, name) for a in self.analyses])
+
+        return fromiter((func(a) for a in self.analyses), dtype=float, count=n)
+
+
+# ============= EOF =============================================
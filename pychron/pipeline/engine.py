@@ -395,6 +395,8 @@ class PipelineEngine(Loggable):
         if not items or len(items) == 1:
             items = self.selected.unknowns
         group_analyses_by_key(items, attr)
+        if self.state:
+            self.state.invalidate_tables()
 
         sunks = sorted(self.selected.unknowns, key=attrgetter(attr))
         self.selected.unknowns = sunks
@@ -766,6 +768,8 @@ class PipelineEngine(Loggable):
                         node.run(state)
                         node.visited = True
                         self.selected = node
+                        if not node.updates_tables:
+                            state.invalidate_tables()
                     except NoAnalysesError:
                         self.information_dialog("No Analyses in Pipeline!")
                         self.pipeline.reset()
@@ -844,6 +848,8 @@ class PipelineEngine(Loggable):
                         node.run(state)
                         node.visited = True
                         self.selected = node
+                        if not node.updates_tables:
+                            state.invalidate_tables()
                         # self.update_detectors()
                     except NoAnalysesError:
                         self.information_dialog("No Analyses in Pipeline!")
@@ -1162,6 +1168,9 @@ class PipelineEngine(Loggable):
         for si in items:
             setattr(si, attr, gid)
 
+        if self.state:
+            self.state.invalidate_tables()
+
         if hasattr(self.selected, "editor") and self.selected.editor:
             self.selected.editor.refresh_needed = True
         self.refresh_table_needed = True
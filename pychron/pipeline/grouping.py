@@ -16,6 +16,10 @@
 from itertools import groupby
 from operator import attrgetter
 
+from numpy import arange, concatenate, cumsum, flatnonzero, lexsort, unique
+
+from pychron.pipeline.analysis_table import first_appearance_codes
+
 
 def group_analyses_by_key(
     items,
@@ -58,4 +62,54 @@ def group_analyses_by_key(
     return items
 
 
+def group_table_by_key(
+    table,
+    key,
+    attr="group_id",
+    id_func=None,
+    sorting_enabled=True,
+    parent_group=None,
+    as_int=True,
+):
+    """
+    vectorized ``group_analyses_by_key`` for an AnalysisTable. ``key`` is the name of a
+    vectorizable column. the order of the table is not changed
+
+    returns the indices that sort the table by ``key`` if ``sorting_enabled``
+    """
+    keys = table.column(key)
+    codes, _ = first_appearance_codes(keys)
+    gids = codes if as_int else keys
+    order = table.argsort(key) if sorting_enabled else arange(len(table))
+
+    if id_func is None:
+        # the id only depends on the key so the parent groups do not matter
+        table.assign(attr, gids)
+        table.assign(attr.replace("_id", "_name"), keys)
+        return order
+
+    if not len(table):
+        return order
+
+    if parent_group is None:
+        parent_group = "group_id"
+
+    # consecutive runs of the parent group then the keys in sorted order within a run
+    parents = table.column(parent_group)[order]
+    runs = concatenate(([0], cumsum(parents[1:] != parents[:-1], dtype=int)))
+    _, skeys = unique(keys[order], return_inverse=True)
+    o = lexsort((skeys, runs))
+    runs, skeys, idxs = runs[o], skeys[o], order[o]
+
+    starts = flatnonzero((runs[1:] != runs[:-1]) | (skeys[1:] != skeys[:-1])) + 1
+    starts = concatenate(([0], starts, [len(idxs)]))
+
+    ans = table.analyses
+    for s, e in zip(starts[:-1], starts[1:]):
+        gi = idxs[s:e]
+        id_func(gids[gi[0]].item(), [ans[i] for i in gi])
+
+    return order
+
+
 # ============= EOF =============================================
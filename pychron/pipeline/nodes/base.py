@@ -48,6 +48,8 @@ class BaseNode(ColumnSorterMixin):
     skip_meaning = Str
     use_state_unknowns = True
     use_state_references = True
+    # True if the node keeps the analysis tables of the state in sync with its changes
+    updates_tables = False
 
     def __init__(self, *args, **kw):
         super(BaseNode, self).__init__(*args, **kw)
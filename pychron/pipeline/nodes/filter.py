@@ -17,8 +17,8 @@
 # ============= enthought library imports =======================
 import datetime
 import re
-from operator import attrgetter
 
+from numpy import argsort, array, flatnonzero, ones
 from traits.api import HasTraits, Str, Property, List, Enum, Button, Bool, Float, Range
 from traitsui.api import View, UItem, HGroup, EnumEditor, InstanceEditor, Item, VGroup
 from traitsui.editors.api import ListEditor
@@ -28,6 +28,7 @@ from pychron.core.helpers.traitsui_shortcuts import okcancel_view
 from pychron.core.stats import calculate_mswd, validate_mswd
 from pychron.envisage.icon_button_editor import icon_button_editor
 from pychron.pipeline.nodes.base import BaseNode
+from pychron.pychron_constants import EXCLUDE_TAGS
 
 COMP_RE = re.compile(r"<=|>=|>|<|==|between|not between")
 
@@ -50,6 +51,16 @@ class PipelineFilter(HasTraits):
         "tag",
     )
 
+    # attribute: AnalysisTable column of the attributes that can be filtered vectorized
+    table_columns = {
+        "age": "age",
+        "age error": "age_err",
+        "kca": "kca",
+        "kca error": "kca_err",
+        "aliquot": "aliquot",
+        "step": "step",
+    }
+
     chain_operator = Enum("and", "or")
     show_chain = Bool
     remove_button = Button
@@ -136,6 +147,34 @@ class PipelineFilter(HasTraits):
 
         return ret
 
+    def evaluate_table(self, table):
+        """
+        vectorized ``evaluate``. returns a boolean array or None if the filter cannot be
+        evaluated on the columns of ``table``
+        """
+        attr = self.attribute
+        comp = self.comparator
+        crit = self.criterion
+        if not (attr and comp and crit):
+            return ones(len(table), dtype=bool)
+
+        name = self.table_columns.get(attr)
+        if name is None:
+            return
+
+        # step is compared as a str, everything else as a number
+        conv = str if attr == "step" else float
+        try:
+            if comp in ("between", "not between"):
+                low, high = crit.split(",")
+                crit = conv(low), conv(high)
+            else:
+                crit = conv(crit)
+        except ValueError:
+            return
+
+        return table.compare(name, comp, crit)
+
     def _convert_date(self, d):
         for s in (
             "%B",
@@ -194,6 +233,7 @@ class PipelineFilter(HasTraits):
 class FilterNode(BaseNode):
     name = Property(depends_on="filters")
     analysis_kind = "unknowns"
+    updates_tables = True
     filters = List
     add_filter_button = Button
     remove = Bool(False)
@@ -266,26 +306,31 @@ class FilterNode(BaseNode):
         for fi in self.filters:
             fi.generate_evaluate_func()
 
-        def filterfunc(item):
-            fo = self.filters[0]
-            flag = fo.evaluate(item)
-            for f in self.filters[1:]:
-                b = f.evaluate(item)
-                if fi.chain_operator == "and":
-                    flag = flag and b
-                else:
-                    flag = flag or b
-            return flag
-
         ans = getattr(state, self.analysis_kind)
+        table = state.get_table(self.analysis_kind)
+
+        fo = self.filters[0]
+        mask = self._evaluate(fo, table)
+        for f in self.filters[1:]:
+            b = self._evaluate(f, table)
+            if f.chain_operator == "and":
+                mask = mask & b
+            else:
+                mask = mask | b
+
         if self.remove:
-            # vs = list(filter(filterfunc, getattr(state, self.analysis_kind)))
-            vs = [a for a in ans if filterfunc(a)]
-            setattr(state, self.analysis_kind, vs)
+            idxs = flatnonzero(mask)
+            table = table.take(idxs)
+            state.set_analyses(self.analysis_kind, table.analyses, table)
         else:
-            for a in ans:
-                if not filterfunc(a):
-                    a.temp_status = "omit"
+            for i in flatnonzero(~mask):
+                ans[i].temp_status = "omit"
+
+    def _evaluate(self, f, table):
+        mask = f.evaluate_table(table)
+        if mask is None:
+            mask = array([bool(f.evaluate(a)) for a in table.analyses], dtype=bool)
+        return mask
 
     def add_filter(self, attr, comp, crit):
         self.filters.append(
@@ -302,6 +347,7 @@ class FilterNode(BaseNode):
 
 class MSWDFilterNode(BaseNode):
     name = "MSWD Filter"
+    updates_tables = True
     kind = Enum("Mahon", "Threshold", "Plateau")
     mswd_threshold = Float
     plateau_threshold = Range(0.0, 5.0)
@@ -333,27 +379,24 @@ class MSWDFilterNode(BaseNode):
         return v
 
     def run(self, state):
-        unks = state.unknowns
-        unks = [ui for ui in unks if not ui.is_omitted_by_tag()]
+        table = state.get_table("unknowns")
+        idxs = flatnonzero(~table.isin("tag", EXCLUDE_TAGS))
         attr = self.attr.lower()
-        unks = sorted(unks, key=attrgetter(attr))
+        if attr == "age":
+            xs, es = table.column("age"), table.column("age_err_wo_j")
+        else:
+            xs, es = table.column("kca"), table.column("kca_err")
+
+        idxs = idxs[argsort(xs[idxs], kind="stable")]
         kind = self.kind.lower()
         self._prev_mswd = 0
-        for i in range(len(unks) - 2):
-            if self._validate_mswd(kind, unks, attr):
+        for i in range(len(idxs) - 2):
+            if self._validate_mswd(kind, xs[idxs], es[idxs]):
                 break
             else:
-                unks = self._filter_mswd(unks)
-
-    def _validate_mswd(self, kind, unks, attr):
-        if attr == "age":
-            xs = [u.age for u in unks]
-            es = [u.age_err_wo_j for u in unks]
-        elif attr == "kca":
-            vs = [u.kca for u in unks]
-            xs = [nominal_value(v) for v in vs]
-            es = [std_dev(v) for v in vs]
+                idxs = self._filter_mswd(table, idxs)
 
+    def _validate_mswd(self, kind, xs, es):
         mswd = calculate_mswd(xs, es)
         if kind == "mahon":
             v = validate_mswd(mswd, len(xs))
@@ -365,10 +408,10 @@ class MSWDFilterNode(BaseNode):
 
         return v
 
-    def _filter_mswd(self, unks):
+    def _filter_mswd(self, table, idxs):
         # remove oldest age
-        unks[-1].temp_status = "omit"
-        return unks[:-1]
+        table.analyses[idxs[-1]].temp_status = "omit"
+        return idxs[:-1]
 
 
 if __name__ == "__main__":
@@ -22,7 +22,7 @@ from pyface.constant import YES
 from traits.api import Bool, List
 
 from pychron.core.helpers.iterfuncs import groupby_group_id
-from pychron.core.progress import progress_loader
+from pychron.core.progress import progress_iterator, progress_loader
 from pychron.options.options_manager import (
     BlanksOptionsManager,
     ICFactorOptionsManager,
@@ -43,6 +43,7 @@ from pychron.pipeline.nodes.figure import FigureNode
 from pychron.pipeline.results.define_equilibration import DefineEquilibrationResult
 from pychron.pipeline.results.iso_evo import IsoEvoResult
 from pychron.pipeline.state import get_detector_set, get_isotope_pairs_set
+from pychron.processing.isotope import fit_isotopes
 from pychron.pychron_constants import NULL_STR
 
 
@@ -315,6 +316,7 @@ class FitIsotopeEvolutionNode(FitNode):
             if self.check_refit(unks):
                 return
 
+            self._fit_all(unks)
             fs = progress_loader(unks, self._assemble_result, threshold=1, step=10)
 
             if self.editor:
@@ -325,14 +327,37 @@ class FitIsotopeEvolutionNode(FitNode):
                 e = IsoEvolutionResultsEditor(fs, self._fits)
                 state.editors.append(e)
 
+    def _fit_all(self, unks):
+        """
+        load the raw data of all the analyses and fit the regressions that can be fit
+        together in one batch. the rest are fit by their regressor when used
+        """
+
+        def load_raw(xi, prog, i, n):
+            if prog:
+                prog.change_message("Load raw data {}".format(xi.record_id))
+            xi.load_raw_data(self._keys)
+            xi.set_fits(self._fits)
+
+        progress_iterator(unks, load_raw, threshold=1)
+
+        keys = set(self._keys)
+        isos = []
+        for xi in unks:
+            for iso in xi.isotopes.values():
+                if iso.name in keys:
+                    isos.append(iso)
+                    isos.append(iso.baseline)
+                elif iso.detector in keys:
+                    isos.append(iso.baseline)
+
+        fit_isotopes(isos)
+
     def _assemble_result(self, xi, prog, i, n):
         if prog:
-            prog.change_message("Load raw data {}".format(xi.record_id))
+            prog.change_message("Assemble results {}".format(xi.record_id))
 
         fits = self._fits
-        xi.load_raw_data(self._keys)
-
-        xi.set_fits(fits)
         isotopes = xi.isotopes
         for f in fits:
             k = f.name
@@ -456,7 +481,7 @@ class FitIsotopeEvolutionNode(FitNode):
                     smart_filter_goodness=smart_filter_goodness,
                     smart_filter_threshold=smart_filter_threshold,
                     smart_filter=e,
-                    regression_str=iso.regressor.tostring(),
+                    regression_str=iso.regression_string(),
                     fit=iso.fit,
                     isotope=k,
                 )
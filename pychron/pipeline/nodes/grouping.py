@@ -16,7 +16,7 @@
 import os
 from operator import attrgetter
 
-from numpy import array, array_split
+from numpy import cumsum, empty, zeros
 
 # ============= enthought library imports =======================
 from traits.api import Str, Enum, Tuple
@@ -25,7 +25,7 @@ from traitsui.api import UItem, EnumEditor, VGroup
 from pychron.core.helpers.datetime_tools import bin_timestamps
 from pychron.core.helpers.strtools import to_bool
 from pychron.core.helpers.traitsui_shortcuts import okcancel_view
-from pychron.pipeline.grouping import group_analyses_by_key
+from pychron.pipeline.grouping import group_analyses_by_key, group_table_by_key
 from pychron.pipeline.nodes.base import BaseNode
 from pychron.pipeline.subgrouping import apply_subgrouping, compress_groups
 from pychron.processing.analyses.preferred import get_preferred_grp, Preferred
@@ -64,6 +64,8 @@ class GroupingNode(BaseNode):
     _state = None
     _parent_group = None
 
+    updates_tables = True
+
     def load(self, nodedict):
         self.by_key = nodedict.get("key", "Identifier")
         if to_bool(os.getenv("CSV_DEBUG")):
@@ -74,6 +76,11 @@ class GroupingNode(BaseNode):
         d["key"] = self.by_key
 
     def _generate_key(self):
+        key = self._generate_key_name()
+        if key:
+            return attrgetter(key)
+
+    def _generate_key_name(self):
         key = self.by_key
         if key != "No Grouping":
             if key == "Aliquot":
@@ -84,7 +91,7 @@ class GroupingNode(BaseNode):
                 key = "label_name"
             else:
                 key = self._generate_key_hook(key)
-            return attrgetter(key.lower())
+            return key.lower()
 
     def _generate_key_hook(self, key):
         return key
@@ -103,18 +110,24 @@ class GroupingNode(BaseNode):
         for unk in unks:
             self._clear_grouping(unk)
 
+        table = state.get_table(self.analysis_kind)
+        table.invalidate(self._attr)
+
         if self.by_key != "No Grouping":
-            key = self._generate_key()
-            group_analyses_by_key(
-                unks,
-                key=key,
+            key = self._generate_key_name()
+            kw = dict(
                 attr=self._attr,
                 id_func=self._id_func,
                 sorting_enabled=self._sorting_enabled,
                 parent_group=self._parent_group,
             )
+            if table.is_vectorizable(key):
+                group_table_by_key(table, key, **kw)
+            else:
+                group_analyses_by_key(unks, key=attrgetter(key), **kw)
+                table = None
 
-            setattr(state, self.analysis_kind, unks)
+            state.set_analyses(self.analysis_kind, unks, table)
             setattr(self, self.analysis_kind, unks)
 
     def _clear_grouping(self, unk):
@@ -231,26 +244,25 @@ class SubGroupingNode(GroupingNode, Preferred):
 
 class BinNode(BaseNode):
     analysis_kind = "unknowns"
+    updates_tables = True
 
     def run(self, state):
-        unks = getattr(state, self.analysis_kind)
-
-        key = attrgetter("timestamp")
-        unks = sorted(unks, key=key)
+        table = state.get_table(self.analysis_kind)
+        order = table.argsort("timestamp")
 
         tol_hrs = 1
 
-        ts = array([ai.timestamp for ai in unks])
+        ts = table.column("timestamp")[order]
 
         idxs = bin_timestamps(ts, tol_hrs)
-        if idxs:
-            unks = array(unks)
-            for i, ais in enumerate(array_split(unks, idxs + 1)):
-                for ai in ais:
-                    ai.group_id = i
-        else:
-            for ai in unks:
-                ai.group_id = 0
+
+        # a new bin starts after each gap
+        starts = zeros(len(ts), dtype=int)
+        starts[idxs + 1] = 1
+
+        gids = empty(len(ts), dtype=int)
+        gids[order] = cumsum(starts)
+        table.assign("group_id", gids)
 
 
 # ============= EOF =============================================
@@ -17,7 +17,9 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
-from traits.api import HasTraits, List, Bool, Any, Set, Str, Dict
+from traits.api import HasTraits, List, Bool, Any, Set, Str, Dict, on_trait_change
+
+from pychron.pipeline.analysis_table import AnalysisTable
 
 
 def get_detector_set(ans):
@@ -73,5 +75,34 @@ class EngineState(HasTraits):
 
     correlation_ellipses = None
 
+    _tables = Dict
+
+    def get_table(self, kind="unknowns"):
+        """
+        return the AnalysisTable of ``unknowns`` or ``references``
+        """
+        ans = getattr(self, kind)
+        table = self._tables.get(kind)
+        if table is None or len(table) != len(ans):
+            table = AnalysisTable(ans)
+            self._tables[kind] = table
+        return table
+
+    def set_analyses(self, kind, ans, table=None):
+        """
+        replace the ``unknowns`` or ``references``. ``table`` is the AnalysisTable of
+        ``ans`` if the caller has one
+        """
+        setattr(self, kind, ans)
+        if table is not None:
+            self._tables[kind] = table
+
+    def invalidate_tables(self):
+        self._tables = {}
+
+    @on_trait_change("unknowns, unknowns_items, references, references_items")
+    def _analyses_changed(self, name, new):
+        self._tables.pop(name.replace("_items", ""), None)
+
 
 # ============= EOF =============================================
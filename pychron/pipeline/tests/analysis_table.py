@@ -0,0 +1,158 @@
+import random
+import unittest
+from operator import attrgetter
+
+from numpy import isnan
+from uncertainties import ufloat
+
+from pychron.pipeline.analysis_table import AnalysisTable
+from pychron.pipeline.grouping import group_analyses_by_key, group_table_by_key
+from pychron.pipeline.state import EngineState
+
+
+class Analysis(object):
+    group_id = 0
+    group_name = ""
+    subgroup = None
+
+    def __init__(self, identifier, aliquot, step, age, timestamp, tag="ok"):
+        self.identifier = identifier
+        self.aliquot = aliquot
+        self.step = step
+        self.uage = None if age is None else ufloat(age, age * 0.01)
+        self.kca = ufloat(10, 1)
+        self.timestamp = timestamp
+        self.tag = tag
+
+
+def make_analyses(n, nidentifiers=5, seed=1):
+    rnd = random.Random(seed)
+    ans = []
+    for i in range(n):
+        a = Analysis(
+            "{:05n}".format(rnd.randint(0, nidentifiers - 1)),
+            rnd.randint(0, 3),
+            rnd.choice("ABC"),
+            rnd.uniform(1, 100),
+            1000 + i * 60,
+        )
+        ans.append(a)
+    return ans
+
+
+def snapshot(ans):
+    return [(a.group_id, a.group_name) for a in ans]
+
+
+class AnalysisTableTestCase(unittest.TestCase):
+    def setUp(self):
+        self.ans = make_analyses(50)
+        self.table = AnalysisTable(self.ans)
+
+    def test_columns(self):
+        ans = self.ans + [Analysis("a", 0, "", None, 0)]
+        t = AnalysisTable(ans)
+        ages = t.column("age")
+        self.assertAlmostEqual(ages[0], ans[0].uage.nominal_value)
+        self.assertTrue(isnan(ages[-1]))
+        self.assertEqual(t.column("step").dtype.kind, "U")
+        self.assertTrue(t.is_vectorizable("aliquot"))
+
+    def test_not_vectorizable(self):
+        self.ans[0].subgroup = {"name": "01"}
+        self.assertFalse(self.table.is_vectorizable("subgroup"))
+        self.assertFalse(self.table.is_vectorizable("uage"))
+        self.assertIsNone(self.table.compare("subgroup", "=", 1))
+
+    def test_compare(self):
+        for comp, crit, func in (
+            ("<", 50, lambda a: a.uage.nominal_value < 50),
+            (">=", 50, lambda a: a.uage.nominal_value >= 50),
+            ("between", (20, 60), lambda a: 20 < a.uage.nominal_value < 60),
+            ("not between", (20, 60), lambda a: not 20 <= a.uage.nominal_value <= 60),
+        ):
+            mask = self.table.compare("age", comp, crit)
+            self.assertEqual(list(mask), [func(a) for a in self.ans])
+
+        mask = self.table.compare("step", "=", "B")
+        self.assertEqual(list(mask), [a.step == "B" for a in self.ans])
+
+        # a str column can not be compared with a number
+        self.assertIsNone(self.table.compare("step", "<", 5.0))
+
+    def test_assign_take(self):
+        t = self.table.take([3, 1])
+        self.assertEqual(t.analyses, [self.ans[3], self.ans[1]])
+
+        t.assign("group_id", [7, 8])
+        self.assertEqual((self.ans[3].group_id, self.ans[1].group_id), (7, 8))
+        self.assertIsInstance(self.ans[3].group_id, int)
+        self.assertEqual(list(t.column("group_id")), [7, 8])
+
+        self.table.column("group_id")
+        self.table.assign("group_id", [5], idxs=[0])
+        self.assertEqual(self.table.column("group_id")[0], 5)
+
+    def test_group_by_key(self):
+        ans = self.ans
+        for key in ("identifier", "step", "aliquot"):
+            items = group_analyses_by_key(ans, key)
+            expected = snapshot(ans)
+
+            for a in ans:
+                a.group_id, a.group_name = 0, ""
+
+            t = AnalysisTable(ans)
+            order = group_table_by_key(t, key)
+            self.assertEqual(snapshot(ans), expected)
+            self.assertEqual([ans[i] for i in order], items)
+            self.assertEqual(list(t.column("group_id")), [a.group_id for a in ans])
+
+    def test_group_by_key_id_func(self):
+        ans = self.ans
+        for i, a in enumerate(ans):
+            a.group_id = i // 20
+
+        def func(calls):
+            def id_func(gid, items):
+                calls.append((gid, [a.aliquot for a in items]))
+
+            return id_func
+
+        expected = []
+        group_analyses_by_key(
+            ans,
+            attrgetter("aliquot"),
+            id_func=func(expected),
+            sorting_enabled=False,
+            parent_group="group_id",
+        )
+
+        calls = []
+        group_table_by_key(
+            AnalysisTable(ans),
+            "aliquot",
+            id_func=func(calls),
+            sorting_enabled=False,
+            parent_group="group_id",
+        )
+        self.assertEqual(calls, expected)
+
+    def test_state(self):
+        state = EngineState(unknowns=self.ans)
+        t = state.get_table()
+        self.assertIs(state.get_table(), t)
+
+        state.unknowns.append(Analysis("a", 0, "", 1, 0))
+        self.assertIsNot(state.get_table(), t)
+
+        t = AnalysisTable(self.ans[:10])
+        state.set_analyses("unknowns", t.analyses, t)
+        self.assertIs(state.get_table(), t)
+
+        state.invalidate_tables()
+        self.assertIsNot(state.get_table(), t)
+
+
+if __name__ == "__main__":
+    unittest.main()
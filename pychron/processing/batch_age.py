@@ -0,0 +1,447 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+Vectorized F and age calculation for many analyses at once.
+
+Mirrors calculate_f/age_equation in argon_calculations but propagates 1 sigma errors linearly with
+an explicit jacobian instead of uncertainties.ufloat objects. every analysis has the same set of
+independent variables (see the column indices below); an error excluding a component (e.g. J or
+the irradiation constants) is computed by dropping the corresponding columns.
+
+the cosmogenic correction is not supported. BatchAgeInputs raises a ValueError for analyses
+that use it; use the per-analysis path for those analyses
+
+this module is a library. ArArAge.calculate_age does not use it because the results are plain
+values and errors. analysis groups need the correlated uncertainties objects of the per-analysis
+path, e.g. for J correlated weighted means and isochrons. use it where only F, ages and their
+errors are needed, e.g. bulk recalculations and exports, and use apply_batch_ages with care
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+# ============= local library imports  ==========================
+from numpy import (
+    asarray,
+    zeros,
+    ones,
+    log,
+    where,
+    errstate,
+    sqrt,
+    broadcast_to,
+)
+from uncertainties import nominal_value, std_dev, ufloat
+
+from pychron.processing.arar_constants import ArArConstants
+from pychron.pychron_constants import ARGON_KEYS
+
+INTERCEPT, BASELINE, BLANK, BACKGROUND, DISCRIMINATION, IC_FACTOR = range(6)
+NISOTOPE_COLUMNS = 6
+
+INTERFERENCE_KEYS = ("K4039", "K3839", "K3739", "Ca3937", "Ca3837", "Ca3637", "Cl3638")
+INTERFERENCE_COLUMN = NISOTOPE_COLUMNS * 5
+ATM4036_COLUMN = INTERFERENCE_COLUMN + len(INTERFERENCE_KEYS)
+FIXED_K3739_COLUMN = ATM4036_COLUMN + 1
+J_COLUMN = FIXED_K3739_COLUMN + 1
+LAMBDA_K_COLUMN = J_COLUMN + 1
+NCOLUMNS = LAMBDA_K_COLUMN + 1
+
+AGE_SCALARS = {"a": 1, "ka": 1e-3, "Ma": 1e-6, "Ga": 1e-9}
+
+
+def isotope_column(idx, kind):
+    return idx * NISOTOPE_COLUMNS + kind
+
+
+class LinearArray(object):
+    """
+    N values and their (N, NCOLUMNS) jacobian with respect to the independent variables
+    """
+
+    def __init__(self, value, jac):
+        self.value = value
+        self.jac = jac
+
+    @classmethod
+    def variable(cls, value, column):
+        value = asarray(value, dtype=float)
+        jac = zeros((value.shape[0], NCOLUMNS))
+        jac[:, column] = 1
+        return cls(value, jac)
+
+    @classmethod
+    def constant(cls, value, n=None):
+        value = asarray(value, dtype=float)
+        if n is not None:
+            value = broadcast_to(value, (n,)).copy()
+        return cls(value, zeros((value.shape[0], NCOLUMNS)))
+
+    def std_dev(self, errors, exclude=None):
+        """
+        errors: (N, NCOLUMNS) 1 sigma errors of the independent variables
+        exclude: list of columns to leave out
+        """
+        d = self.jac * errors
+        if exclude:
+            d[:, exclude] = 0
+        return sqrt((d * d).sum(axis=1))
+
+    def where(self, mask, other):
+        """
+        return a new LinearArray taking ``other`` where mask is True
+        """
+        if not isinstance(other, LinearArray):
+            other = LinearArray.constant(other, self.value.shape[0])
+
+        return LinearArray(
+            where(mask, other.value, self.value),
+            where(mask[:, None], other.jac, self.jac),
+        )
+
+    def log(self):
+        return LinearArray(log(self.value), self.jac / self.value[:, None])
+
+    def __neg__(self):
+        return LinearArray(-self.value, -self.jac)
+
+    def __add__(self, other):
+        if isinstance(other, LinearArray):
+            return LinearArray(self.value + other.value, self.jac + other.jac)
+        return LinearArray(self.value + other, self.jac)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, LinearArray):
+            return LinearArray(
+                self.value * other.value,
+                self.jac * other.value[:, None] + other.jac * self.value[:, None],
+            )
+        other = asarray(other, dtype=float)
+        o = other[:, None] if other.ndim else other
+        return LinearArray(self.value * other, self.jac * o)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, LinearArray):
+            v = self.value / other.value
+            jac = (self.jac - other.jac * v[:, None]) / other.value[:, None]
+            return LinearArray(v, jac)
+        other = asarray(other, dtype=float)
+        return self * (1 / other)
+
+    def __rtruediv__(self, other):
+        # other / self
+        other = asarray(other, dtype=float)
+        v = other / self.value
+        o = v / self.value
+        return LinearArray(v, -self.jac * o[:, None])
+
+
+class BatchAgeInputs(object):
+    """
+    arrays describing N analyses.
+
+    values and errors are (N, NCOLUMNS) arrays of the independent variables. the remaining
+    attributes are length N arrays
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.values = zeros((n, NCOLUMNS))
+        self.errors = zeros((n, NCOLUMNS))
+
+        # isotope intensity options. (N, 5) in ARGON_KEYS order
+        self.correct_for_blank = ones((n, 5), dtype=bool)
+        self.blank_after_ic = zeros((n, 5), dtype=bool)
+
+        self.ar39_decay_factor = ones(n)
+        self.ar37_decay_factor = ones(n)
+        self.decay_time = zeros(n)
+        self.abundance_sensitivity = zeros(n)
+
+        self.lambda_cl36 = zeros(n)
+        self.atm3836 = zeros(n)
+        self.use_fixed_k3739 = zeros(n, dtype=bool)
+        self.allow_negative_ca_correction = ones(n, dtype=bool)
+        self.age_scalar = ones(n)
+        self.position_jerr = zeros(n)
+
+        # discrimination and ic factors default to 1
+        for i in range(5):
+            self.values[:, isotope_column(i, DISCRIMINATION)] = 1
+            self.values[:, isotope_column(i, IC_FACTOR)] = 1
+
+    def set_column(self, column, value, error=0):
+        self.values[:, column] = value
+        self.errors[:, column] = error
+
+    def set_isotope(self, idx, kind, value, error=0):
+        self.set_column(isotope_column(idx, kind), value, error)
+
+    def set_interference(self, key, value, error=0):
+        self.set_column(INTERFERENCE_COLUMN + INTERFERENCE_KEYS.index(key), value, error)
+
+    def variable(self, column):
+        return LinearArray.variable(self.values[:, column], column)
+
+    def set_analysis(self, i, analysis):
+        """
+        fill row ``i`` from an Analysis/ArArAge
+        """
+        vs, es = self.values[i], self.errors[i]
+
+        def setuv(column, uv, default=0):
+            if uv is None:
+                uv = default
+            vs[column] = nominal_value(uv)
+            es[column] = std_dev(uv)
+
+        arc = analysis.arar_constants or ArArConstants()
+        if arc.use_cosmogenic_correction:
+            raise ValueError(
+                "analysis {} uses the cosmogenic correction, which is not "
+                "supported".format(i)
+            )
+
+        analysis.calculate_decay_factors()
+        isotopes = analysis.isotopes
+        for idx, k in enumerate(ARGON_KEYS):
+            iso = isotopes[analysis.arar_mapping[k]]
+            c = idx * NISOTOPE_COLUMNS
+            setuv(c + INTERCEPT, iso.uvalue)
+
+            bs = iso.baseline.uvalue
+            if not iso.include_baseline_error:
+                bs = nominal_value(bs)
+            setuv(c + BASELINE, bs)
+            setuv(c + BLANK, iso.blank.uvalue)
+            setuv(c + BACKGROUND, iso.background.uvalue if iso.background else 0)
+            setuv(c + DISCRIMINATION, iso.discrimination, 1)
+            setuv(c + IC_FACTOR, iso.ic_factor or 1.0, 1)
+
+            faraday = iso.detector.lower() == "faraday"
+            self.correct_for_blank[i, idx] = iso.correct_for_blank and not faraday
+            self.blank_after_ic[i, idx] = faraday
+
+        pr = analysis.interference_corrections or {}
+        for j, k in enumerate(INTERFERENCE_KEYS):
+            setuv(INTERFERENCE_COLUMN + j, pr.get(k, 0))
+
+        setuv(ATM4036_COLUMN, arc.atm4036)
+        setuv(J_COLUMN, analysis.j)
+        setuv(LAMBDA_K_COLUMN, arc.lambda_k)
+
+        fixed_k3739 = analysis.fixed_k3739
+        self.use_fixed_k3739[i] = bool(fixed_k3739) or arc.k3739_mode.lower() != "normal"
+        setuv(FIXED_K3739_COLUMN, fixed_k3739 or arc.fixed_k3739)
+
+        self.ar39_decay_factor[i] = analysis.ar39decayfactor or 1
+        self.ar37_decay_factor[i] = analysis.ar37decayfactor or 1
+        self.decay_time[i] = analysis.decay_days
+        self.abundance_sensitivity[i] = arc.abundance_sensitivity
+        self.lambda_cl36[i] = nominal_value(arc.lambda_Cl36)
+        self.atm3836[i] = nominal_value(arc.atm3836)
+        self.allow_negative_ca_correction[i] = arc.allow_negative_ca_correction
+        self.age_scalar[i] = AGE_SCALARS.get(arc.age_units, 1)
+        self.position_jerr[i] = analysis.position_jerr or 0
+
+    @classmethod
+    def from_analyses(cls, analyses):
+        inputs = cls(len(analyses))
+        for i, a in enumerate(analyses):
+            inputs.set_analysis(i, a)
+        return inputs
+
+
+class BatchAgeResults(object):
+    def __init__(self, **kw):
+        for k, v in kw.items():
+            setattr(self, k, v)
+
+
+def _intensities(inputs):
+    ret = []
+    for idx in range(5):
+
+        def var(kind):
+            return inputs.variable(isotope_column(idx, kind))
+
+        blank = var(BLANK)
+        v = var(INTERCEPT) - var(BASELINE)
+        v = v - blank * inputs.correct_for_blank[:, idx]
+        v = v - var(BACKGROUND)
+        v = v * var(DISCRIMINATION) * var(IC_FACTOR)
+        v = v - blank * inputs.blank_after_ic[:, idx]
+        ret.append(v)
+
+    s40, s39, s38, s37, s36 = ret
+
+    # abundance sensitivity
+    ab = inputs.abundance_sensitivity
+    if ab.any():
+        s40, s39, s38, s37, s36 = (
+            s40 - ab * (s39 + s39),
+            s39 - ab * (s40 + s38),
+            s38 - ab * (s39 + s37),
+            s37 - ab * (s38 + s36),
+            s36 - ab * (s37 + s37),
+        )
+
+    s39 = s39 * inputs.ar39_decay_factor
+    s37 = s37 * inputs.ar37_decay_factor
+    return s40, s39, s38, s37, s36
+
+
+def batch_calculate_f(inputs):
+    """
+    vectorized version of calculate_f.
+
+    returns F, rad40, k39, a40 as LinearArrays
+    """
+
+    def interference(key):
+        return inputs.variable(INTERFERENCE_COLUMN + INTERFERENCE_KEYS.index(key))
+
+    a40, a39, a38, a37, a36 = _intensities(inputs)
+
+    ca3937 = interference("Ca3937")
+    k3739 = interference("K3739")
+
+    with errstate(divide="ignore", invalid="ignore"):
+        # normal
+        k39 = (a39 - ca3937 * a37) / (1 - k3739 * ca3937)
+        k37 = k3739 * k39
+        ca37 = a37 - k37
+
+        # fixed k3739
+        fixed = inputs.use_fixed_k3739
+        if fixed.any():
+            x = inputs.variable(FIXED_K3739_COLUMN)
+            y = 1 / ca3937
+            y = y.where(ca3937.value == 0, 1)
+
+            fca37 = (a39 * x * y) / (x + y)
+            fca39 = ca3937 * fca37
+            fk39 = a39 - fca39
+            ca37 = ca37.where(fixed, fca37)
+            k39 = k39.where(fixed, fk39)
+
+        k38 = interference("K3839") * k39
+
+        negative = ~inputs.allow_negative_ca_correction & (ca37.value < 0)
+        ca37 = ca37.where(negative, 0)
+
+        ca36 = interference("Ca3637") * ca37
+        ca38 = interference("Ca3837") * ca37
+
+        # atmospheric
+        m = interference("Cl3638") * (inputs.lambda_cl36 * inputs.decay_time)
+        atm36 = (a36 - ca36 - m * (a38 - k38 - ca38)) / (1 - m * inputs.atm3836)
+
+        atm40 = atm36 * inputs.variable(ATM4036_COLUMN)
+        k40 = k39 * interference("K4039")
+        rad40 = a40 - atm40 - k40
+
+        f = rad40 / k39
+        f = f.where(k39.value == 0, 1.0)
+
+    return f, rad40, k39, a40
+
+
+def batch_age_equation(inputs, f):
+    """
+    vectorized version of age_equation.
+    """
+    j = inputs.variable(J_COLUMN)
+    lambda_k = inputs.variable(LAMBDA_K_COLUMN)
+    with errstate(divide="ignore", invalid="ignore"):
+        x = 1 + j * f
+        invalid = x.value <= 0
+        x = x.where(invalid, 1)
+        age = x.log() / lambda_k * inputs.age_scalar
+        age = age.where(invalid, 0)
+    return age
+
+
+def batch_calculate_ages(analyses=None, inputs=None, include_decay_error=False):
+    """
+    calculate F, age and 1 sigma errors for many analyses in one pass.
+
+    either ``analyses`` or ``inputs`` (BatchAgeInputs) must be supplied
+    """
+    if inputs is None:
+        inputs = BatchAgeInputs.from_analyses(analyses)
+
+    f, rad40, k39, a40 = batch_calculate_f(inputs)
+    age = batch_age_equation(inputs, f)
+
+    errors = inputs.errors
+    interference_columns = list(
+        range(INTERFERENCE_COLUMN, INTERFERENCE_COLUMN + len(INTERFERENCE_KEYS))
+    )
+    exclude = [] if include_decay_error else [LAMBDA_K_COLUMN]
+
+    position_errors = errors.copy()
+    position_errors[:, J_COLUMN] = inputs.position_jerr
+
+    with errstate(divide="ignore", invalid="ignore"):
+        radiogenic_yield = where(a40.value == 0, 0, rad40.value / a40.value * 100)
+
+    return BatchAgeResults(
+        F=f.value,
+        F_err=f.std_dev(errors),
+        F_err_wo_irrad=f.std_dev(errors, interference_columns),
+        age=age.value,
+        age_err=age.std_dev(errors, exclude + [J_COLUMN]),
+        age_err_w_j=age.std_dev(errors, exclude),
+        age_err_w_position=age.std_dev(position_errors, exclude),
+        rad40=rad40.value,
+        k39=k39.value,
+        radiogenic_yield=radiogenic_yield,
+    )
+
+
+def apply_batch_ages(analyses, results):
+    """
+    set the F and age attributes of ``analyses`` from ``results``.
+
+    the uncertainties objects (uF, uage, ...) are replaced by independent ufloats, so error
+    correlations between analyses and error components are not available afterwards.
+    use analysis.calculate_age(force=True) when those are required
+    """
+    for i, a in enumerate(analyses):
+        a.F = float(results.F[i])
+        a.F_err = float(results.F_err[i])
+        a.F_err_wo_irrad = float(results.F_err_wo_irrad[i])
+        a.uF = ufloat(a.F, a.F_err)
+
+        age = float(results.age[i])
+        a.uage = ufloat(age, float(results.age_err[i]))
+        a.uage_w_j_err = ufloat(age, float(results.age_err_w_j[i]))
+        a.uage_w_position_err = ufloat(age, float(results.age_err_w_position[i]))
+        a.age = age
+        a.age_err = a.age_err_wo_j = float(results.age_err[i])
+
+
+# ============= EOF =============================================
@@ -19,7 +19,6 @@
 #     String, Either, Dict, cached_property, Event, List, Bool, Int, Array
 # ============= standard library imports ========================
 import re
-import struct
 from binascii import hexlify
 from math import isnan, isinf
 
@@ -28,8 +27,11 @@ from numpy import array, Inf, polyfit, gradient, array_split, mean, isfinite
 from uncertainties import ufloat, nominal_value, std_dev
 
 from pychron.core.geometry.geometry import curvature_at
-from pychron.core.helpers.binpack import unpack
+from pychron.core.helpers.binpack import unpack_columns, pack_array, count_records
 from pychron.core.helpers.fits import natural_name_fit, fit_to_degree
+from pychron.core.helpers.growable_array import GrowableArray
+from pychron.core.regression.base_regressor import truncate_excluded
+from pychron.core.regression.batch_regressor import BatchRegressor, is_batch_fit
 from pychron.core.regression.least_squares_regressor import (
     ExponentialRegressor,
     FitError,
@@ -40,6 +42,32 @@ from pychron.core.regression.ols_regressor import PolynomialRegressor
 from pychron.pychron_constants import AUTO_N
 
 
+class RegressionCacheStats(object):
+    """
+    process wide hit/miss counts for the cached regressions of IsotopicMeasurement
+    """
+
+    hits = 0
+    misses = 0
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        n = self.hits + self.misses
+        return self.hits / n if n else 0
+
+    def __str__(self):
+        return "hits={} misses={} hit_rate={:0.2f}".format(
+            self.hits, self.misses, self.hit_rate
+        )
+
+
+regression_cache_stats = RegressionCacheStats()
+
+
 def fit_abbreviation(
     fit,
 ):
@@ -61,6 +89,10 @@ class BaseMeasurement(object):
     detector_serial_id = None
     group_data = 0
     _regressor = None
+    _regression_key = None
+    _regression_data = None
+    _xs_buffer = None
+    _ys_buffer = None
 
     @property
     def n(self):
@@ -87,9 +119,34 @@ class BaseMeasurement(object):
     def set_grouping(self, n):
         self.group_data = n
         self._regressor = None
+        self.invalidate_regression()
         # if self._regressor:
         #     self._regressor.dirty = True
 
+    def add_datum(self, x, y):
+        """
+        append a single count to xs/ys. amortized O(1)
+        """
+        xb, yb = self._xs_buffer, self._ys_buffer
+        if xb is None or not (xb.is_view(self.xs) and yb.is_view(self.ys)):
+            # xs/ys were reassigned since the last append
+            xb, yb = GrowableArray(self.xs), GrowableArray(self.ys)
+            self._xs_buffer, self._ys_buffer = xb, yb
+
+        self.xs = xb.append(x)
+        self.ys = yb.append(y)
+        self.invalidate_regression()
+
+    def invalidate_regression(self):
+        """
+        force the next regressor access to refit the data.
+
+        required after modifying xs or ys in place. reassigning xs/ys or changing fit, error_type,
+        filtering, truncation or grouping is detected automatically
+        """
+        self._regression_key = None
+        self._regression_data = None
+
     def get_data(self):
         xs = self.offset_xs
         ys = self.ys
@@ -104,8 +161,7 @@ class BaseMeasurement(object):
         if endianness is None:
             endianness = self.endianness
 
-        fmt = "{}ff".format(endianness)
-        txt = b"".join((struct.pack(fmt, x, y) for x, y in zip(self.xs, self.ys)))
+        txt = pack_array("{}ff".format(endianness), self.xs, self.ys)
         if as_hex:
             txt = hexlify(txt)
         return txt
@@ -114,35 +170,29 @@ class BaseMeasurement(object):
         if not blob:
             return
 
+        if n_only:
+            self.n = count_records(blob, "{}ff".format(self.endianness))
+            return
+
         try:
             xs, ys = self._unpack_blob(blob)
         except (ValueError, TypeError, IndexError, AttributeError) as e:
             self.unpack_error = e
             return
 
-        if n_only:
-            self.n = len(xs)
-        else:
-            self.xs = array(xs)
-            self.ys = array(ys)
-
-            # print self.name, self.xs.shape, self.ys.shape
-            # print self.name, self.ys
+        self.xs = xs
+        self.ys = ys
+        self.invalidate_regression()
 
     def _unpack_blob(self, blob, endianness=None):
         if endianness is None:
             endianness = self.endianness
 
-        try:
-            x, y = unpack(blob, fmt="{}ff".format(endianness))
-            # x, y = zip(*[struct.unpack('{}ff'.format(endianness), blob[i:i + 8]) for i in range(0, len(blob), 8)])
-            if self.reverse_unpack:
-                return y, x
-            else:
-                return x, y
-
-        except struct.error as e:
-            print("unpack_blob", e)
+        x, y = unpack_columns(blob, fmt="{}ff".format(endianness))
+        if self.reverse_unpack:
+            return y, x
+        else:
+            return x, y
 
     def get_slope(self, n=-1):
         if (
@@ -202,6 +252,7 @@ class IsotopicMeasurement(BaseMeasurement):
     _ovalue = None
 
     _fn = None
+    _batch_fit = None
 
     def __init__(self, *args, **kw):
         super(IsotopicMeasurement, self).__init__(*args, **kw)
@@ -233,18 +284,27 @@ class IsotopicMeasurement(BaseMeasurement):
 
     @property
     def rsquared(self):
+        bf = self.get_batch_fit()
+        if bf:
+            return bf.rsquared
         if self._regressor:
             return self._regressor.rsquared
 
     @property
     def rsquared_adj(self):
+        bf = self.get_batch_fit()
+        if bf:
+            return bf.rsquared_adj
         if self._regressor:
             return self._regressor.rsquared_adj
 
     @property
     def fn(self):
+        bf = self.get_batch_fit()
         if self._fn is not None:
             n = self._fn
+        elif bf:
+            n = bf.n
         elif self._regressor:
             n = self._regressor.clean_xs.shape[0]
         else:
@@ -263,6 +323,9 @@ class IsotopicMeasurement(BaseMeasurement):
 
     @property
     def outlier_excluded(self):
+        bf = self.get_batch_fit()
+        if bf:
+            return [int(i) for i in bf.outliers]
         if self._regressor:
             return [int(i) for i in self._regressor.outlier_excluded]
 
@@ -273,11 +336,13 @@ class IsotopicMeasurement(BaseMeasurement):
                 reg = self.regressor
 
             reg.ouser_excluded = ue
+            self.invalidate_regression()
 
     def set_filtering(self, d):
         self.filter_outliers_dict = d.copy()
         if self._regressor:
             self._regressor.dirty = True
+        self.invalidate_regression()
 
     def set_fit_blocks(self, fit):
         """
@@ -351,6 +416,7 @@ class IsotopicMeasurement(BaseMeasurement):
         self._fn = None
         if self._regressor:
             self._regressor.dirty = True
+        self.invalidate_regression()
 
     def attr_set(self, **kw):
         for k, v in kw.items():
@@ -423,7 +489,8 @@ class IsotopicMeasurement(BaseMeasurement):
             and not self.user_defined_value
             and self.xs.shape[0] > 1
         ):
-            v = self.regressor.predict(0)
+            bf = self.get_batch_fit()
+            v = bf.intercept if bf else self.regressor.predict(0)
 
             if isnan(v) or isinf(v):
                 v = 0
@@ -443,7 +510,8 @@ class IsotopicMeasurement(BaseMeasurement):
             and not self.user_defined_error
             and self.xs.shape[0] > 1
         ):
-            v = self.regressor.predict_error(0)
+            bf = self.get_batch_fit()
+            v = bf.error if bf else self.regressor.predict_error(0)
             if isnan(v) or isinf(v):
                 v = 0
             return v
@@ -474,7 +542,87 @@ class IsotopicMeasurement(BaseMeasurement):
         if fit is None:
             fit = "linear"
             self.fit = fit
-        return self._regressor_factory(fit)
+
+        reg = self._regressor
+        if reg is not None and self._is_regression_cached():
+            regression_cache_stats.hits += 1
+            return reg
+
+        regression_cache_stats.misses += 1
+        reg = self._regressor_factory(fit)
+        self._regression_key = self._make_regression_key()
+        self._regression_data = (self.xs, self.ys, self.xs.shape, self.ys.shape)
+        return reg
+
+    def is_batch_fittable(self):
+        """
+        return True if ``fit_isotopes`` can fit this measurement
+        """
+        if (
+            self.use_stored_value
+            or self.user_defined_value
+            or self.user_defined_error
+            or self.xs.shape[0] < 2
+            or self.xs.shape != self.ys.shape
+        ):
+            return False
+
+        reg = self._regressor
+        if reg is not None and (reg.user_excluded or reg.ouser_excluded):
+            return False
+
+        fit = self.fit or "linear"
+        return bool(is_batch_fit(fit, self.error_type, self.filter_outliers_dict))
+
+    def set_batch_fit(self, bf):
+        """
+        use the SeriesFit ``bf`` instead of the regressor until the data or the fit
+        change
+        """
+        self.fit = bf.fit
+        self._batch_fit = bf
+        # the regressor may have been made with other settings
+        self._regressor = None
+        self._regression_key = self._make_regression_key()
+        self._regression_data = (self.xs, self.ys, self.xs.shape, self.ys.shape)
+
+    def get_batch_fit(self):
+        if self._batch_fit is not None and self._is_regression_cached():
+            return self._batch_fit
+
+    def regression_string(self):
+        bf = self.get_batch_fit()
+        if bf:
+            return bf.tostring()
+        return self.regressor.tostring()
+
+    def _make_regression_key(self):
+        fod = self.filter_outliers_dict
+        if fod:
+            fod = tuple(sorted(fod.items()))
+
+        return (
+            self.fit,
+            self.error_type,
+            fod,
+            self.truncate,
+            self.group_data,
+            self.time_zero_offset,
+        )
+
+    def _is_regression_cached(self):
+        data = self._regression_data
+        if data is None:
+            return False
+
+        xs, ys, xshape, yshape = data
+        return (
+            xs is self.xs
+            and ys is self.ys
+            and xshape == self.xs.shape
+            and yshape == self.ys.shape
+            and self._regression_key == self._make_regression_key()
+        )
 
     def _regressor_factory(self, fit):
         lfit = fit.lower()
@@ -550,6 +698,9 @@ class IsotopicMeasurement(BaseMeasurement):
         return self.regressor.calculate_standard_error_fit()
 
     def noutliers(self):
+        bf = self.get_batch_fit()
+        if bf:
+            return bf.noutliers
         return self.regressor.xs.shape[0] - self.regressor.clean_xs.shape[0]
 
     def _get_curvature_ys(self):
@@ -818,4 +969,43 @@ class Isotope(BaseIsotope):
             return "{} {}".format(self.name, e)
 
 
+def fit_isotopes(isotopes):
+    """
+    fit the regressions of many IsotopicMeasurements at once.
+
+    the measurements are grouped by fit, error type and outlier filtering and each
+    group is fit by a BatchRegressor. measurements the batch cannot fit are left to
+    their regressor.
+
+    returns the number of measurements fit
+    """
+    groups = {}
+    for iso in isotopes:
+        if iso.is_batch_fittable():
+            fod = tuple(sorted((iso.filter_outliers_dict or {}).items()))
+            key = (iso.fit or "linear", iso.error_type or "SEM", fod)
+            groups.setdefault(key, []).append(iso)
+
+    nfit = 0
+    for (fit, error_type, fod), isos in groups.items():
+        xs, ys, excluded = [], [], []
+        for iso in isos:
+            x, y = iso.get_data()
+            x, y = array(x), array(y)
+            ex = None
+            if iso.truncate:
+                ex = truncate_excluded(iso.truncate, x)
+            xs.append(x)
+            ys.append(y)
+            excluded.append(ex or [])
+
+        reg = BatchRegressor(fit, error_type, dict(fod))
+        for iso, bf in zip(isos, reg.fit_series(xs, ys, excluded)):
+            if bf is not None:
+                iso.set_batch_fit(bf)
+                nfit += 1
+
+    return nfit
+
+
 # ============= EOF =============================================
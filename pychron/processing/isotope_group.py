@@ -18,7 +18,6 @@
 import logging
 import os
 
-from numpy import append as npappend
 from traits.api import Property, Dict, Str
 from traits.has_traits import HasTraits
 from uncertainties import ufloat
@@ -266,11 +265,7 @@ class IsotopeGroup(HasTraits):
             if kind == "sniff":
                 isotope._value = signal
 
-            xs = npappend(isotope.xs, x)
-            ys = npappend(isotope.ys, signal)
-            isotope.xs = xs
-            isotope.ys = ys
-            # isotope.dirty = True
+            isotope.add_datum(x, signal)
 
         isotopes = self.isotopes
         if kind == "baseline":
@@ -17,7 +17,7 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
-from numpy import argmax, array
+from numpy import argmax, array, asarray, where, triu, ones
 from six.moves import range
 from traits.api import HasTraits, List, Array
 
@@ -63,13 +63,86 @@ class Plateau(HasTraits):
     def find_plateaus(self, method=""):
         """
         method: str either fleck 1977 or mahon 1996
+
+        returns the same plateau as ``find_plateaus_exhaustive`` but tests each start/end pair
+        in constant time. the released gas and the mswd are accumulated as the end step advances
+        and the overlap test uses the precomputed latest conflicting step for each step
         """
-        if method.lower() == MAHON:
-            self.use_mswd = True
-            self.use_overlap = False
-        else:
-            self.use_mswd = False
-            self.use_overlap = True
+        self._set_method(method)
+
+        ages = asarray(self.ages)
+        n = len(ages)
+        excludes = set(self.excludes)
+        signals = [(s if i not in excludes else 0) for i, s in enumerate(self.signals)]
+        self.total_signal = float(sum(signals))
+
+        min_fraction = self.gas_fraction / 100.0
+        use_overlap = self.use_overlap
+        use_mswd = self.use_mswd
+        nsteps = self.nsteps
+
+        if use_overlap:
+            last_conflicts = self._get_last_conflicts()
+        if use_mswd:
+            errors = asarray(self.errors)
+
+        idx = []
+        span = None
+        for start in range(n):
+            if start in excludes:
+                continue
+
+            potential_end = None
+            ss = 0
+            last_conflict = -1
+            sw = swx = swxx = 0
+            for i in range(start, n):
+                ss += signals[i]
+                if use_overlap and i > start:
+                    last_conflict = max(last_conflict, last_conflicts[i])
+
+                if use_mswd:
+                    w = errors[i] ** -2
+                    dx = ages[i] - ages[start]
+                    sw += w
+                    swx += w * dx
+                    swxx += w * dx * dx
+
+                if i in excludes:
+                    continue
+
+                if (i - start) + 1 < nsteps:
+                    continue
+
+                if use_overlap and last_conflict >= start:
+                    break
+
+                if use_mswd:
+                    m = i - start + 1
+                    mswd = max(swxx - swx ** 2 / sw, 0) / (m - 1) if m > 1 else 0
+                    if not validate_mswd(mswd, m):
+                        continue
+
+                if not ss / self.total_signal >= min_fraction:
+                    continue
+
+                potential_end = i
+
+            if potential_end:
+                s = potential_end - start
+                if span is None or s > span:
+                    span = s
+                    idx = (start, potential_end)
+
+        return idx
+
+    def find_plateaus_exhaustive(self, method=""):
+        """
+        method: str either fleck 1977 or mahon 1996
+
+        reference implementation that checks every start/end pair
+        """
+        self._set_method(method)
 
         n = len(self.ages)
         excludes = self.excludes
@@ -96,6 +169,34 @@ class Plateau(HasTraits):
 
         return idxs
 
+    def _set_method(self, method):
+        if method.lower() == MAHON.lower():
+            self.use_mswd = True
+            self.use_overlap = False
+        else:
+            self.use_mswd = False
+            self.use_overlap = True
+
+    def _get_last_conflicts(self):
+        """
+        for each step return the index of the latest earlier step it does not overlap, or -1.
+
+        a plateau starting at ``start`` passes the overlap test up to ``end`` if the latest
+        conflict of every step in (start, end] is before ``start``
+        """
+        ages = asarray(self.ages)
+        errors = asarray(self.errors) * self.overlap_sigma
+        lo = ages - errors
+        hi = ages + errors
+
+        n = len(ages)
+        conflicts = ~((lo[:, None] < hi[None, :]) & (hi[:, None] > lo[None, :]))
+        # only earlier steps
+        conflicts &= triu(ones((n, n), dtype=bool), 1)
+
+        last = (n - 1) - argmax(conflicts[::-1], axis=0)
+        return where(conflicts.any(axis=0), last, -1).tolist()
+
     def _find_plateaus(self, n, start, excludes, overlap_func):
         potential_end = None
         for i in range(start, n, 1):
@@ -138,8 +239,8 @@ class Plateau(HasTraits):
         """
         return False if not valid
         """
-        ages = self.ages[start, end + 1]
-        errors = self.errors[start, end + 1]
+        ages = self.ages[start : end + 1]
+        errors = self.errors[start : end + 1]
         mswd = calculate_mswd(ages, errors)
         return validate_mswd(mswd, len(ages))
 
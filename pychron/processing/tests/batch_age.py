@@ -0,0 +1,110 @@
+import unittest
+
+from numpy import random, allclose
+from uncertainties import ufloat
+
+from pychron.processing.arar_age import ArArAge
+from pychron.processing.batch_age import batch_calculate_ages, apply_batch_ages
+from pychron.processing.isotope import Isotope
+from pychron.pychron_constants import ARGON_KEYS
+
+INTENSITIES = (
+    (3000.0, 30.0),
+    (300.0, 1.0),
+    (4.0, 0.1),
+    (2.0, 0.2),
+    (1.5, 0.05),
+)
+
+
+def make_analysis(rng, k3739_mode="Normal", allow_negative_ca_correction=True):
+    a = ArArAge()
+    a.arar_constants.k3739_mode = k3739_mode
+    a.arar_constants.allow_negative_ca_correction = allow_negative_ca_correction
+    a.arar_constants.age_units = "Ma"
+
+    for k, (v, e) in zip(ARGON_KEYS, INTENSITIES):
+        iso = Isotope(k, "H1")
+        iso.set_uvalue((v * rng.uniform(0.5, 1.5), e))
+        iso.set_baseline(rng.normal(0, 0.01), 0.001)
+        iso.set_blank(v * 0.01, v * 0.001)
+        iso.include_baseline_error = True
+        iso.ic_factor = ufloat(rng.uniform(0.95, 1.05), 0.001)
+        a.isotopes[k] = iso
+
+    a.interference_corrections = {
+        k: ufloat(v, v * 0.01, tag=k)
+        for k, v in (
+            ("K4039", 0.001),
+            ("K3839", 0.012),
+            ("K3739", 0.0002),
+            ("Ca3937", 0.0007),
+            ("Ca3837", 0.00003),
+            ("Ca3637", 0.00027),
+            ("Cl3638", 250.0),
+        )
+    }
+    a.j = ufloat(0.004, 0.000004)
+    a.position_jerr = 0.000002
+    a.ar39decayfactor = rng.uniform(1, 1.01)
+    a.ar37decayfactor = rng.uniform(1, 5)
+    a.timestamp = 100 * 24 * 3600
+    a.irradiation_time = 0
+    return a
+
+
+class BatchAgeTestCase(unittest.TestCase):
+    def _compare(self, analyses):
+        results = batch_calculate_ages(analyses)
+        for i, a in enumerate(analyses):
+            a.calculate_age(force=True)
+
+        for attr, rattr in (
+            ("F", "F"),
+            ("F_err", "F_err"),
+            ("F_err_wo_irrad", "F_err_wo_irrad"),
+            ("age", "age"),
+            ("age_err", "age_err"),
+        ):
+            expected = [getattr(a, attr) for a in analyses]
+            self.assertTrue(
+                allclose(expected, getattr(results, rattr), rtol=1e-9), attr
+            )
+
+        for uattr, rattr in (
+            ("uage_w_j_err", "age_err_w_j"),
+            ("uage_w_position_err", "age_err_w_position"),
+        ):
+            expected = [getattr(a, uattr).std_dev for a in analyses]
+            self.assertTrue(allclose(expected, getattr(results, rattr), rtol=1e-9))
+
+    def test_normal(self):
+        rng = random.RandomState(1)
+        self._compare([make_analysis(rng) for _ in range(20)])
+
+    def test_fixed_k3739(self):
+        rng = random.RandomState(2)
+        self._compare([make_analysis(rng, k3739_mode="Fixed") for _ in range(5)])
+
+    def test_no_negative_ca(self):
+        rng = random.RandomState(3)
+        ans = [make_analysis(rng, allow_negative_ca_correction=False) for _ in range(5)]
+        for a in ans:
+            a.isotopes["Ar37"].set_uvalue((-1, 0.1))
+        self._compare(ans)
+
+    def test_cosmogenic(self):
+        rng = random.RandomState(5)
+        ans = [make_analysis(rng) for _ in range(3)]
+        ans[1].arar_constants.use_cosmogenic_correction = True
+        self.assertRaises(ValueError, batch_calculate_ages, ans)
+
+    def test_apply(self):
+        rng = random.RandomState(4)
+        ans = [make_analysis(rng) for _ in range(3)]
+        apply_batch_ages(ans, batch_calculate_ages(ans))
+        self.assertTrue(all(a.age > 0 for a in ans))
+
+
+if __name__ == "__main__":
+    unittest.main()
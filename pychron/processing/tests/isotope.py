@@ -4,9 +4,9 @@ __author__ = "ross"
 
 import unittest
 
-from numpy import linspace
+from numpy import linspace, append
 
-from pychron.processing.isotope import Isotope
+from pychron.processing.isotope import Isotope, regression_cache_stats
 
 
 class IsotopeTestCase(unittest.TestCase):
@@ -42,5 +42,51 @@ class IsotopeTestCase(unittest.TestCase):
         # self.assertEqual(v, 99)
 
 
+class RegressionCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.iso = Isotope("Ar40", "H1")
+        xs = linspace(10, 410, 400)
+        self.iso.xs = xs
+        self.iso.ys = 1000.0 - 2.0 * xs
+        self.iso.fit = "linear"
+        regression_cache_stats.reset()
+
+    def test_repeated_reads(self):
+        v = self.iso.value
+        for i in range(5):
+            self.assertEqual(self.iso.value, v)
+            self.iso.error
+
+        self.assertEqual(regression_cache_stats.misses, 1)
+        self.assertEqual(regression_cache_stats.hits, 10)
+
+    def test_fit_change(self):
+        self.iso.value
+        self.iso.fit = "parabolic"
+        self.iso.value
+        self.assertEqual(regression_cache_stats.misses, 2)
+
+    def test_append_data(self):
+        iso = self.iso
+        v = iso.value
+        iso.xs = append(iso.xs, 420)
+        iso.ys = append(iso.ys, 1000)
+        self.assertNotEqual(iso.value, v)
+        self.assertEqual(regression_cache_stats.misses, 2)
+
+    def test_in_place_modification(self):
+        iso = self.iso
+        v = iso.value
+        iso.ys[:10] = 0
+        iso.invalidate_regression()
+        self.assertNotEqual(iso.value, v)
+
+    def test_filtering(self):
+        self.iso.value
+        self.iso.set_filter_outliers_dict(filter_outliers=True)
+        self.iso.value
+        self.assertEqual(regression_cache_stats.misses, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,7 +4,10 @@ __author__ = "ross"
 
 import unittest
 
+from numpy import random
+
 from pychron.processing.plateau import Plateau
+from pychron.pychron_constants import FLECK, MAHON
 
 
 class PlateauTestCase(unittest.TestCase):
@@ -153,5 +156,38 @@ class PlateauTestCase(unittest.TestCase):
         return ages, errors, signals, exclude, idx
 
 
+def make_random_plateau(rng, n):
+    # a few populations so that plateaus of different lengths exist
+    ages = rng.choice((10.0, 10.5, 12.0), n) + rng.normal(0, 0.3, n)
+    errors = rng.uniform(0.05, 0.6, n)
+    signals = rng.uniform(0, 10, n)
+    excludes = sorted(rng.choice(n, rng.randint(0, 3), replace=False).tolist())
+    return Plateau(
+        ages=ages,
+        errors=errors,
+        signals=signals,
+        excludes=excludes,
+        nsteps=rng.randint(1, 6),
+        gas_fraction=rng.choice((0, 20, 50)),
+        overlap_sigma=rng.choice((1, 2)),
+    )
+
+
+class PlateauEngineTestCase(unittest.TestCase):
+    def _compare(self, method, seed):
+        rng = random.RandomState(seed)
+        for _ in range(200):
+            p = make_random_plateau(rng, rng.randint(2, 25))
+            self.assertEqual(
+                p.find_plateaus(method), p.find_plateaus_exhaustive(method)
+            )
+
+    def test_fleck(self):
+        self._compare(FLECK, 1)
+
+    def test_mahon(self):
+        self._compare(MAHON, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -24,7 +24,7 @@ from queue import Empty, LifoQueue
 from threading import Event, Thread, Lock
 
 import yaml
-from traits.api import Str, Any, Bool, Int, Dict
+from traits.api import Str, Any, Bool, Int
 
 from pychron.core.yaml import yload
 from pychron.globals import globalv
@@ -46,9 +46,18 @@ from pychron.pyscripts.error import (
     KlassError,
     MainError,
 )
+from pychron.pyscripts.script_cache import (
+    CODE_CACHE,
+    DURATION_CACHE,
+    file_mtime,
+    text_hash,
+)
 
 BLOCK_LOCK = Lock()
 
+# context entries that are not part of the duration cache key
+NON_DURATION_CTX = ("ex", "mx", "testing_syntax")
+
 
 class IntervalContext(object):
     def __init__(self, obj, dur):
@@ -106,8 +115,9 @@ class PyScript(Loggable):
     _wait_control = None
 
     _estimated_duration = 0
-    _estimated_durations = Dict
     _graph_calc = False
+    # (path, mtime) of the gosub scripts used by the last dry run
+    _dependencies = None
 
     trace_line = Int
     interpolation_path = Str
@@ -131,26 +141,17 @@ class PyScript(Loggable):
 
     def calculate_estimated_duration(self, ctx=None, force=False):
         """
-        maintain a dictionary of previous calculated durations.
-        key=hash(ctx), value=duration
+        durations are memoized process wide.
+        key=hash(script text, duration relevant ctx), value=duration
 
+        a dry run is only done if the key is not cached or ``force``
         """
-
-        if ctx is None:
-            ctx = self._ctx
-
-        def calc_dur():
-            self.debug("calculate duration")
+        if ctx:
             self.setup_context(**ctx)
-            # self.syntax_checked = False
-            # self.debug('calculate_estimated duration. syntax requires testing')
-            self.test()
-            # self.debug('pyscript estimated duration= {}'.format(self._estimated_duration))
-
-        # self.debug('calculate estimated duration force={}, syntax_checked={}'.format(force, self.syntax_checked))
-        if force or not self.syntax_checked or not ctx:
-            calc_dur()
 
+        self.debug("calculate duration")
+        self.syntax_checked = False
+        self.test(use_cache=not force)
         return self.get_estimated_duration()
 
     def traceit(self, frame, event, arg):
@@ -196,10 +197,23 @@ class PyScript(Loggable):
         else:
             return _ex_()
 
-    def test(self, argv=None):
+    def test(self, argv=None, use_cache=True):
         if not self.syntax_checked:
+            key = None
+            if argv is None:
+                key = self._generate_ctx_hash(self._ctx or {})
+                if use_cache:
+                    v = DURATION_CACHE.lookup(key)
+                    if v is not None:
+                        # this script and context passed a previous dry run
+                        self._estimated_duration, deps = v
+                        self._dependencies = list(deps)
+                        self.syntax_checked = True
+                        self._syntax_error = False
+                        return
 
             self.debug("testing...")
+            self._dependencies = []
             self._estimated_duration = 0
             self.syntax_checked = True
             self.testing_syntax = True
@@ -221,6 +235,10 @@ class PyScript(Loggable):
             else:
                 self.console_info("syntax checking passed")
                 self._syntax_error = False
+                if key is not None:
+                    DURATION_CACHE.set_duration(
+                        key, self._estimated_duration, self._dependencies
+                    )
 
             self.testing_syntax = False
 
@@ -252,7 +270,7 @@ class PyScript(Loggable):
         else:
 
             try:
-                code = compile(snippet, "<string>", "exec")
+                code = CODE_CACHE.compile(snippet)
             except BaseException as e:
                 exc = self.debug_exception()
                 self.exception_trace = exc
@@ -484,8 +502,9 @@ class PyScript(Loggable):
 
         if calc_time:
             s.bootstrap()
-            s.calculate_estimated_duration(force=True)
+            s.calculate_estimated_duration()
             self._estimated_duration += s.get_estimated_duration()
+            self._add_dependency(s)
             return
 
         if self.testing_syntax:
@@ -493,6 +512,7 @@ class PyScript(Loggable):
             err = s.test(argv=argv)
             if err:
                 raise PyscriptError(self.name, err)
+            self._add_dependency(s)
 
         else:
             if not self._cancel:
@@ -865,31 +885,32 @@ class PyScript(Loggable):
 
     def _generate_ctx_hash(self, ctx):
         """
-        generate a sha1 hash from self.__class__, duration, cleanup and len(position)
+        generate a sha1 hash from self.__class__, the script text and every ctx entry.
+        the position list is reduced to its length. the context objects (ex, mx) are derived
+        from ctx and the script text and are skipped
 
         need to add __class__ to the hash because the durations of a MeasurementScript
         and a ExtractionScript will be different for the same context
         """
         sha1 = hashlib.sha1()
-
-        pos = ctx.get("position")
-        if pos:
-            pos = len(pos)
-        for v in (self.__class__, ctx.get("duration"), ctx.get("cleanup"), pos):
-            sha1.update(str(v))
-        h = sha1.hexdigest()
-        return h
-
-    # def _update_cached_duration(self, h, d):
-    #     global __CACHED_DURATIONS__
-    #     if len(__CACHED_DURATIONS__) > 100:
-    #         self.debug('clearing global cached durations dict')
-    #         __CACHED_DURATIONS__ = {}
-    #
-    #     __CACHED_DURATIONS__[h] = d
-    #
-    # def _get_cached_duration(self, h):
-    #     return __CACHED_DURATIONS__[h]
+        for v in (self.__class__.__name__, text_hash(self.text)):
+            sha1.update(v.encode("utf-8"))
+
+        for k in sorted(ctx):
+            if k in NON_DURATION_CTX:
+                continue
+
+            v = ctx[k]
+            if k == "position":
+                v = len(v) if v else 0
+            sha1.update("{}={!r}".format(k, v).encode("utf-8"))
+        return sha1.hexdigest()
+
+    def _add_dependency(self, s):
+        if self._dependencies is not None:
+            self._dependencies.append((s.filename, file_mtime(s.filename)))
+            if s._dependencies:
+                self._dependencies.extend(s._dependencies)
 
     def _cancel_hook(self, **kw):
         pass
@@ -0,0 +1,123 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+Process wide caches used by ``PyScript``.
+
+``CODE_CACHE`` holds the compiled code objects of pyscripts keyed on the sha1 of the script text.
+
+``DURATION_CACHE`` holds the estimated durations of dry runs keyed on the script text and the
+duration relevant context (see ``PyScript._generate_ctx_hash``). An entry also records the
+modification times of the gosub scripts used during the dry run and is dropped if any of them
+changed.
+"""
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock
+
+# ============= local library imports  ==========================
+
+
+def text_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def file_mtime(p):
+    try:
+        return os.stat(p).st_mtime_ns
+    except OSError:
+        return None
+
+
+class LRUCache(object):
+    def __init__(self, max_size=500):
+        self.max_size = max_size
+        self.nhits = 0
+        self.nmisses = 0
+        self._items = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                v = self._items[key]
+            except KeyError:
+                self.nmisses += 1
+                return
+
+            self._items.move_to_end(key)
+            self.nhits += 1
+            return v
+
+    def set(self, key, v):
+        with self._lock:
+            self._items[key] = v
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.nhits = 0
+            self.nmisses = 0
+
+    def report(self):
+        with self._lock:
+            return len(self._items), self.nhits, self.nmisses
+
+
+class CodeCache(LRUCache):
+    def compile(self, text, filename="<string>"):
+        """
+        return the code object of ``text``. raises the compile exceptions
+        """
+        key = text_hash(text), filename
+        code = self.get(key)
+        if code is None:
+            code = compile(text, filename, "exec")
+            self.set(key, code)
+        return code
+
+
+class DurationCache(LRUCache):
+    def lookup(self, key):
+        """
+        return (duration, dependencies) or None if missing or a dependency changed
+        """
+        v = self.get(key)
+        if v is not None:
+            if all(file_mtime(p) == mt for p, mt in v[1]):
+                return v
+            self.discard(key)
+
+    def set_duration(self, key, duration, dependencies=None):
+        """
+        dependencies: list of (path, mtime) of the files used to calculate the duration
+        """
+        self.set(key, (duration, tuple(dependencies or ())))
+
+
+CODE_CACHE = CodeCache()
+DURATION_CACHE = DurationCache(max_size=2000)
+
+# ============= EOF =============================================
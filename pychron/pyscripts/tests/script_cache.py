@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.pyscripts.extraction_line_pyscript import ExtractionPyScript
+from pychron.pyscripts.script_cache import CODE_CACHE, DURATION_CACHE
+
+MAIN = """
+def main():
+    sleep(ex.duration)
+    gosub('child')
+"""
+
+CHILD = """
+def main():
+    sleep(3)
+"""
+
+QUICK = """
+def main():
+    sleep(ex.duration)
+"""
+
+
+def make_script(root, name="main.py", text=MAIN):
+    with open(os.path.join(root, name), "w") as wfile:
+        wfile.write(text)
+
+    s = ExtractionPyScript(root=root, name=name)
+    s.bootstrap()
+    return s
+
+
+class ScriptCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        CODE_CACHE.clear()
+        DURATION_CACHE.clear()
+
+        self.root = tempfile.mkdtemp()
+        make_script(self.root, "child.py", CHILD)
+        self.s = make_script(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_code_cache(self):
+        c1 = CODE_CACHE.compile(MAIN)
+        c2 = CODE_CACHE.compile(MAIN)
+        self.assertIs(c1, c2)
+        self.assertEqual(CODE_CACHE.report(), (1, 1, 1))
+
+    def test_duration_ctx(self):
+        d5 = self.s.calculate_estimated_duration(dict(duration=5))
+        d10 = self.s.calculate_estimated_duration(dict(duration=10))
+        self.assertGreater(d10, d5)
+
+        # both contexts are cached. a new script object with the same text is a cache hit
+        s = make_script(self.root)
+        nhits = DURATION_CACHE.nhits
+        self.assertEqual(s.calculate_estimated_duration(dict(duration=5)), d5)
+        self.assertEqual(DURATION_CACHE.nhits, nhits + 1)
+
+    def test_position_length(self):
+        h1 = self.s._generate_ctx_hash(dict(duration=1, position=[1, 2]))
+        h2 = self.s._generate_ctx_hash(dict(duration=1, position=[3, 4]))
+        h3 = self.s._generate_ctx_hash(dict(duration=1, position=[3]))
+        self.assertEqual(h1, h2)
+        self.assertNotEqual(h1, h3)
+
+    def test_syntax_ok(self):
+        self.s.calculate_estimated_duration(dict(duration=5))
+
+        s = make_script(self.root)
+        s.setup_context(duration=5)
+        nhits = DURATION_CACHE.nhits
+        self.assertTrue(s.syntax_ok(warn=False))
+        self.assertEqual(DURATION_CACHE.nhits, nhits + 1)
+
+    def test_dependency_modified(self):
+        ctx = dict(duration=5)
+        d = self.s.calculate_estimated_duration(ctx)
+
+        # make sure the modification time changes
+        time.sleep(0.01)
+        make_script(self.root, "child.py", CHILD.replace("3", "30"))
+
+        s = make_script(self.root)
+        self.assertGreater(s.calculate_estimated_duration(ctx), d)
+
+    def test_force(self):
+        ctx = dict(duration=5)
+        self.s.calculate_estimated_duration(ctx)
+        nmisses = DURATION_CACHE.nmisses
+        self.s.calculate_estimated_duration(ctx, force=True)
+        self.assertEqual(DURATION_CACHE.nmisses, nmisses)
+
+    def test_execute_cached(self):
+        ctx = dict(duration=0)
+        make_script(self.root, "quick.py", QUICK).calculate_estimated_duration(ctx)
+
+        s = make_script(self.root, "quick.py", QUICK)
+        s.setup_context(**ctx)
+        nhits = DURATION_CACHE.nhits
+        s.test()
+        self.assertEqual(DURATION_CACHE.nhits, nhits + 1)
+        self.assertTrue(s.execute())
+
+
+if __name__ == "__main__":
+    unittest.main()
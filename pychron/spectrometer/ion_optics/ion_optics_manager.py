@@ -242,6 +242,7 @@ class IonOpticsManager(Manager):
         dataspace = "dac"
         use_accel_voltage = False
         use_extend = False
+        use_adaptive = False
         self._setup_config()
         if config_name:
             pcconfig.load()
@@ -275,6 +276,7 @@ class IonOpticsManager(Manager):
             dataspace = pcc.dataspace
             use_accel_voltage = pcc.use_accel_voltage
             use_extend = pcc.use_extend
+            use_adaptive = pcc.use_adaptive
             window = pcc.window
             min_peak_height = pcc.min_peak_height
             step_width = pcc.step_width
@@ -328,6 +330,7 @@ class IonOpticsManager(Manager):
             dataspace=dataspace,
             use_accel_voltage=use_accel_voltage,
             use_extend=use_extend,
+            use_adaptive=use_adaptive,
             period=period,
             window=window,
             percent=percent,
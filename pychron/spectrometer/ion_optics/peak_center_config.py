@@ -85,6 +85,7 @@ class PeakCenterConfig(HasTraits):
     update_others = Bool(True)
 
     use_extend = Bool(False)
+    use_adaptive = Bool(False)
 
     # def _integration_time_default(self):
     #     return QTEGRA_INTEGRATION_TIMES[4]  # 1.048576
@@ -225,6 +226,13 @@ class PeakCenterConfig(HasTraits):
                 "step_width", visible_when='dataspace=="mass"', label="Step Width (amu)"
             ),
             Item("use_extend"),
+            Item(
+                "use_adaptive",
+                label="Adaptive",
+                tooltip="Sweep the window with coarse steps, stop once both flanks of "
+                "the peak are found, then sweep only the flanks and the top of the peak "
+                "with the step width",
+            ),
             show_border=True,
             label="Measure",
         )
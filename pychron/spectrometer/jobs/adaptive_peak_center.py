@@ -0,0 +1,249 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from traits.api import Array, Bool, Float, HasTraits, Int
+
+# ============= standard library imports ========================
+import time
+
+from numpy import argsort, array
+
+# ============= local library imports  ==========================
+
+
+def wait_for_stable(
+    read, tolerance=0.01, floor=1.0, nstable=1, timeout=10, clock=None, wait=None
+):
+    """
+    read until ``nstable`` consecutive pairs of readings of the reference signal agree
+    to within ``tolerance`` (fraction of the signal) or ``floor``, whichever is larger.
+
+    read: callable. returns the intensities. the first is the reference signal
+    wait: callable. called between readings. must wait at least one integration,
+        e.g. spectrometer.settle, otherwise the spectrometer may return the same
+        integration twice and the signal looks stable while the magnet is moving
+
+    returns the last intensities, stable
+    """
+    if clock is None:
+        clock = time.time
+
+    st = clock()
+    prev = read()
+    n = 0
+    while 1:
+        if wait is not None:
+            wait()
+        cur = read()
+        if abs(cur[0] - prev[0]) <= max(tolerance * abs(cur[0]), floor):
+            n += 1
+            if n >= nstable:
+                return cur, True
+        else:
+            n = 0
+
+        if clock() - st > timeout:
+            return cur, False
+        prev = cur
+
+
+class AdaptivePeakScan(HasTraits):
+    """
+    coarse to fine peak scan.
+
+    the window is swept at ``coarse_factor`` times the step width until both flanks
+    of the reference peak are defined, i.e. the signal has risen above and fallen back
+    below ``percent`` of its maximum. only the intervals bracketing the two threshold
+    crossings are then swept at the step width. each sweep approaches its values in
+    the direction of the coarse sweep.
+
+    after a jump, the magnet is settled by reading, one integration apart, until the
+    signal is stable instead of waiting a fixed time. the settled reading at the start
+    of the window is kept
+
+    the scanned values and intensities, sorted by value, are kept in ``xs`` and
+    ``intensities`` (npoints x ndetectors)
+    """
+
+    percent = Int(80)
+    min_peak_height = Float(1.0)
+    coarse_factor = Int(4)
+    overscan = Int(1)
+
+    settle_tolerance = Float(0.01)
+    settle_floor = Float(1.0)
+    settle_timeout = Float(10)
+    nstable = Int(1)
+
+    xs = Array
+    intensities = Array
+    flanks_defined = Bool
+    nreads = Int
+
+    def scan(self, start, end, width, step, read, alive=None, clock=None, wait=None):
+        """
+        start, end: window. swept from start to end
+        width: fine step width
+        step: callable. step(v) moves to v
+        read: callable. returns the intensities at the current position
+        alive: callable. the scan stops if alive() is False
+        wait: callable. waits for a new integration between the readings of the
+            stability test. see wait_for_stable
+
+        returns True if the scan was not stopped
+        """
+        self.nreads = 0
+        self.flanks_defined = False
+
+        def counted_read():
+            self.nreads += 1
+            return read()
+
+        def is_alive():
+            return alive is None or alive()
+
+        direction = 1 if end >= start else -1
+        width = abs(width)
+        coarse = width * max(1, self.coarse_factor)
+        eps = width * 1e-6
+
+        xs, ys = [], []
+
+        # coarse sweep
+        step(start)
+        intensity, _ = self._settle(counted_read, clock, wait)
+        xs.append(start)
+        ys.append(intensity)
+
+        v = start
+        while is_alive():
+            v += direction * coarse
+            if direction * (v - end) > eps:
+                break
+
+            step(v)
+            xs.append(v)
+            ys.append(counted_read())
+            if self._find_flanks([y[0] for y in ys]):
+                self.flanks_defined = True
+                break
+
+        # fine sweep across the flanks and the top of the peak
+        flanks = self._find_flanks([y[0] for y in ys])
+        if flanks:
+            pos = xs[-1]
+            for v in self._fine_values(xs, flanks, direction, width, coarse):
+                if not is_alive():
+                    break
+
+                d = direction * (v - pos)
+                if d < 0:
+                    # approach from the same side as the coarse sweep
+                    step(v - direction * width)
+                    self._settle(counted_read, clock, wait)
+                    d = width
+
+                step(v)
+                if d > coarse + eps:
+                    intensity, _ = self._settle(counted_read, clock, wait)
+                else:
+                    intensity = counted_read()
+
+                xs.append(v)
+                ys.append(intensity)
+                pos = v
+
+        idx = argsort(xs)
+        self.xs = array(xs)[idx]
+        self.intensities = array(ys, dtype=float)[idx]
+        return is_alive()
+
+    # private
+    def _settle(self, read, clock, wait):
+        return wait_for_stable(
+            read,
+            tolerance=self.settle_tolerance,
+            floor=self.settle_floor,
+            nstable=self.nstable,
+            timeout=self.settle_timeout,
+            clock=clock,
+            wait=wait,
+        )
+
+    def _fine_values(self, xs, flanks, direction, width, coarse):
+        """
+        values, in sweep order, between the points bracketing each threshold crossing
+        and within two steps, plus the uncertainty of the coarse estimate, of the
+        center. calculate_peak_center tests that the peak is flat with the points
+        next to the center so these must be evenly spaced as well
+        """
+        (la, lb), (ha, hb) = flanks
+        center = (xs[la] + xs[lb] + xs[ha] + xs[hb]) / 4.0
+        r = 2 * width + coarse / 2.0
+        eps = width * 1e-6
+
+        def interval(a, b):
+            vs = []
+            v = a + direction * width
+            while direction * (b - v) > eps:
+                vs.append(v)
+                v += direction * width
+            return vs
+
+        c = center - direction * r
+        cs = [c] + interval(c, center + direction * (r + width))
+        values = interval(xs[la], xs[lb]) + cs + interval(xs[ha], xs[hb])
+
+        # skip values already measured
+        ret = []
+        for v in sorted(values, key=lambda x: direction * x):
+            if all(abs(v - x) > width / 2.0 for x in xs + ret):
+                ret.append(v)
+        return ret
+
+    def _find_flanks(self, ys):
+        """
+        ys: reference intensities in sweep order
+
+        returns the index pairs of the consecutive points bracketing the threshold
+        crossings before and after the maximum or None if the flanks are not defined
+        yet
+        """
+        imax = max(range(len(ys)), key=ys.__getitem__)
+        ma = ys[imax]
+        if ma < self.min_peak_height:
+            return
+
+        threshold = ma * (1 - self.percent / 100.0)
+        low = next((i for i in range(imax, -1, -1) if ys[i] < threshold), None)
+        if low is None:
+            return
+
+        high = next((i for i in range(imax, len(ys)) if ys[i] < threshold), None)
+        if high is None:
+            return
+
+        # require ``overscan`` points beyond the high crossing below the threshold
+        # so that noise on the top of the peak is not taken for the flank
+        tail = ys[high : high + self.overscan + 1]
+        if len(tail) <= self.overscan or any(y >= threshold for y in tail):
+            return
+
+        return (low, low + 1), (high - 1, high)
+
+
+# ============= EOF =============================================
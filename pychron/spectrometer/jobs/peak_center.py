@@ -33,6 +33,7 @@ from pychron.core.stats.peak_detection import (
 )
 from pychron.core.ui.gui import invoke_in_main_thread
 from pychron.graph.graph import Graph
+from .adaptive_peak_center import AdaptivePeakScan
 from .magnet_sweep import MagnetSweep, AccelVoltageSweep
 
 
@@ -93,9 +94,15 @@ class BasePeakCenter(HasTraits):
     result = None
     directions = None
     use_extend = False
+    use_adaptive = False
+    coarse_factor = 4
 
     results = List
 
+    # data of the last adaptive scan
+    _scan_xs = None
+    _scan_ys = None
+
     def close_graph(self):
         self.graph.close_ui()
 
@@ -171,8 +178,11 @@ class BasePeakCenter(HasTraits):
             if not isinstance(det, str):
                 det = det.name
 
-            xs = g.get_data(series=i)
-            ys = g.get_data(series=i, axis=1)
+            if self._scan_xs is not None:
+                xs, ys = self._scan_xs, self._scan_ys[:, i]
+            else:
+                xs = g.get_data(series=i)
+                ys = g.get_data(series=i, axis=1)
 
             pts = vstack((xs, ys)).T
             data.append((det, pts))
@@ -182,7 +192,10 @@ class BasePeakCenter(HasTraits):
         """
         returns center, success (float/None, bool)
         """
+        if self.use_adaptive and self.directions != "Oscillate":
+            return self._adaptive_iteration(start, end, width)
 
+        self._scan_xs, self._scan_ys = None, None
         graph = self.graph
 
         spec = self.spectrometer
@@ -268,6 +281,67 @@ class BasePeakCenter(HasTraits):
         return center, smart_shift, success
 
     # private
+    def _adaptive_iteration(self, start, end, width):
+        """
+        coarse to fine scan of the window. see AdaptivePeakScan.
+
+        the scan settles by waiting for a stable signal and stops once the flanks of
+        the peak are defined. the data is kept in _scan_xs, _scan_ys and plotted at the
+        end of the scan
+        """
+        spec = self.spectrometer
+        if self.directions == "Decrease":
+            start, end = end, start
+
+        self.graph.set_x_limits(min_=min([start, end]), max_=max([start, end]))
+
+        scan = AdaptivePeakScan(
+            percent=self.percent,
+            min_peak_height=self.min_peak_height,
+            coarse_factor=self.coarse_factor,
+            settle_floor=self.min_peak_height,
+            settle_timeout=1 if spec.simulation else 10,
+        )
+        self.info(
+            "Adaptive scan {:0.5f} - {:0.5f}. step_width={} coarse_factor={}".format(
+                start, end, width, self.coarse_factor
+            )
+        )
+        st = time.time()
+        ok = scan.scan(
+            start,
+            end,
+            width,
+            self._step,
+            self._step_intensity,
+            alive=self.isAlive,
+            wait=spec.settle,
+        )
+        self.info(
+            "Adaptive scan finished in {:0.1f}s. reads={} flanks defined={}".format(
+                time.time() - st, scan.nreads, scan.flanks_defined
+            )
+        )
+
+        xs, ys = scan.xs, scan.intensities
+        self._scan_xs, self._scan_ys = xs, ys
+        for xi, yi in zip(xs, ys):
+            self._graph_hook(xi, yi, 0)
+
+        center, smart_shift, success = None, False, False
+        if ok and not self.canceled and xs.shape[0]:
+            intensities = ys[:, 0]
+            args = self._prepare_result(xs, intensities)
+            if args:
+                center, success = args
+            else:
+                smart_shift = max(intensities) > self.min_peak_height * 5
+                center = xs[argmax(intensities)]
+
+        if self.use_dac_offset and center is not None:
+            center += self.dac_offset
+        return center, smart_shift, success
+
     def _prepare_result(self, dac_values, intensities):
         result = self._calculate_peak_center(dac_values, intensities)
         self.debug("result of _calculate_peak_center={}".format(result))
@@ -307,8 +381,11 @@ class BasePeakCenter(HasTraits):
                 return self._alive
 
     def _get_result(self, i, det):
-        xs = self.graph.get_data(series=i)
-        ys = getattr(self.graph.plots[0], "odata{}".format(i))
+        if self._scan_xs is not None:
+            xs, ys = self._scan_xs, self._scan_ys[:, i]
+        else:
+            xs = self.graph.get_data(series=i)
+            ys = getattr(self.graph.plots[0], "odata{}".format(i))
 
         if xs.shape == ys.shape:
             pts = vstack((xs, ys)).T
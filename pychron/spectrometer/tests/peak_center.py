@@ -0,0 +1,242 @@
+import unittest
+from math import erf, exp
+
+from numpy import arange, array, random
+
+from pychron.core.stats.peak_detection import PeakCenterError, calculate_peak_center
+from pychron.spectrometer.jobs.adaptive_peak_center import (
+    AdaptivePeakScan,
+    wait_for_stable,
+)
+
+WINDOW = 0.015
+STEP_WIDTH = 0.0005
+
+
+class SimulatedSpectrometer(object):
+    """
+    a magnet that follows its dac with a first order lag and a flat topped peak.
+
+    time is simulated. like GetData, a reading returns the last completed
+    integration and takes no time. ``settle`` waits one integration
+    """
+
+    def __init__(
+        self,
+        center=5.0,
+        half_width=0.003,
+        edge=0.0006,
+        magnitude=500,
+        baseline=0.5,
+        noise=0.3,
+        tau=0.15,
+        integration_time=1.048576,
+        seed=7,
+    ):
+        self.center = center
+        self.half_width = half_width
+        self.edge = edge
+        self.magnitude = magnitude
+        self.baseline = baseline
+        self.noise = noise
+        self.tau = tau
+        self.integration_time = integration_time
+
+        self.clock = 0
+        self.nreads = 0
+        self._rnd = random.RandomState(seed)
+        self._target = center
+        self._from = center
+        self._t0 = 0
+        self._integration = None
+        self._signal = None
+
+    def time(self):
+        return self.clock
+
+    def sleep(self, t):
+        self.clock += t
+
+    def settle(self):
+        self.sleep(self.integration_time)
+
+    def position(self, t=None):
+        if t is None:
+            t = self.clock
+        dt = max(0, t - self._t0)
+        return self._target + (self._from - self._target) * exp(-dt / self.tau)
+
+    def set_dac(self, v):
+        self._from = self.position()
+        self._target = v
+        self._t0 = self.clock
+
+    def step(self, v):
+        """
+        MagnetSweep._step. set the dac and settle
+        """
+        self.set_dac(v)
+        self.settle()
+
+    def read(self):
+        self.nreads += 1
+        k = int(self.clock / self.integration_time + 1e-9)
+        if k != self._integration:
+            # the signal at the end of the last completed integration
+            self._integration = k
+            x = self.position(k * self.integration_time) - self.center
+            w, e = self.half_width, self.edge
+            s = 0.5 * self.magnitude * (erf((x + w) / e) - erf((x - w) / e))
+            self._signal = s + self.baseline + self._rnd.normal(0, self.noise)
+        return [self._signal]
+
+
+def full_sweep(spec, start, end, width, percent=80):
+    """
+    the PeakCenter.iteration sweep. fixed waits, a baseline wait and the whole window at
+    the step width
+    """
+    it = spec.integration_time
+    spec.set_dac((end - start) / 2.0 + start)
+    spec.sleep(it * 2)
+    cur_intensity = spec.read()[0]
+
+    spec.set_dac(start)
+    spec.sleep(it * 2)
+
+    tol = cur_intensity * (1 - percent / 100.0) / 2.0
+    st = spec.time()
+    while 1:
+        signal = spec.read()[0]
+        spec.sleep(it)
+        if signal <= tol or spec.time() - st > 10:
+            break
+
+    xs, ys = [], []
+    for v in arange(start, end + width / 2.0, width):
+        spec.step(v)
+        xs.append(v)
+        ys.append(spec.read()[0])
+    return array(xs), array(ys)
+
+
+def adaptive_sweep(spec, start, end, width, percent=80, **kw):
+    scan = AdaptivePeakScan(percent=percent, min_peak_height=5, **kw)
+    scan.scan(
+        start, end, width, spec.step, spec.read, clock=spec.time, wait=spec.settle
+    )
+    return scan
+
+
+def center_of(xs, ys, percent=80):
+    return calculate_peak_center(xs, ys, min_peak_height=5, percent=percent)[0][1]
+
+
+class PeakCenterTestCase(unittest.TestCase):
+    def test_wait_for_stable(self):
+        values = iter([100, 60, 40, 35, 34.9, 34.8])
+        reading, stable = wait_for_stable(
+            lambda: [next(values)], tolerance=0.01, floor=0.5
+        )
+        self.assertTrue(stable)
+        self.assertEqual(reading, [34.9])
+
+        clock = iter(range(100))
+        reading, stable = wait_for_stable(
+            lambda: [random.uniform(0, 100)],
+            tolerance=0.0,
+            floor=0.0,
+            timeout=3,
+            clock=lambda: next(clock),
+        )
+        self.assertFalse(stable)
+
+    def test_wait_for_stable_integration(self):
+        spec = SimulatedSpectrometer()
+        spec.settle()
+        on_peak = spec.read()
+
+        # move off the peak. without waiting, the readings are of the same
+        # integration and look stable
+        spec.set_dac(5.02)
+        reading, stable = wait_for_stable(spec.read, clock=spec.time)
+        self.assertTrue(stable)
+        self.assertEqual(reading, on_peak)
+
+        reading, stable = wait_for_stable(spec.read, clock=spec.time, wait=spec.settle)
+        self.assertTrue(stable)
+        self.assertLess(reading[0], 5)
+
+    def test_adaptive(self):
+        for offset in (-0.004, 0, 0.0023):
+            spec = SimulatedSpectrometer(center=5 + offset)
+            start, end = 5 - WINDOW, 5 + WINDOW
+            scan = adaptive_sweep(spec, start, end, STEP_WIDTH)
+            self.assertTrue(scan.flanks_defined)
+            self.assertEqual(scan.nreads, spec.nreads)
+            self.assertEqual(scan.xs.shape[0], scan.intensities.shape[0])
+            self.assertTrue((scan.xs[1:] > scan.xs[:-1]).all())
+
+            center = center_of(scan.xs, scan.intensities[:, 0])
+            self.assertLess(abs(center - spec.center), 2 * STEP_WIDTH)
+
+            # stopped early, once past the peak
+            self.assertLess(scan.xs.max(), end)
+
+    def test_faster(self):
+        start, end = 5 - WINDOW, 5 + WINDOW
+        spec = SimulatedSpectrometer()
+        xs, ys = full_sweep(spec, start, end, STEP_WIDTH)
+        full_time, full_center = spec.time(), center_of(xs, ys)
+
+        spec = SimulatedSpectrometer()
+        scan = adaptive_sweep(spec, start, end, STEP_WIDTH)
+        center = center_of(scan.xs, scan.intensities[:, 0])
+
+        self.assertLess(spec.time(), 0.6 * full_time)
+        self.assertLess(abs(full_center - spec.center), 2 * STEP_WIDTH)
+        self.assertLess(abs(center - spec.center), 2 * STEP_WIDTH)
+
+    def test_decrease(self):
+        spec = SimulatedSpectrometer(center=5.002)
+        scan = adaptive_sweep(spec, 5 + WINDOW, 5 - WINDOW, STEP_WIDTH)
+        self.assertTrue(scan.flanks_defined)
+        self.assertTrue((scan.xs[1:] > scan.xs[:-1]).all())
+        center = center_of(scan.xs, scan.intensities[:, 0])
+        self.assertLess(abs(center - spec.center), 2 * STEP_WIDTH)
+        self.assertGreater(scan.xs.min(), 5 - WINDOW)
+
+    def test_no_peak(self):
+        spec = SimulatedSpectrometer(center=6)
+        start, end = 5 - WINDOW, 5 + WINDOW
+        scan = adaptive_sweep(spec, start, end, STEP_WIDTH)
+        self.assertFalse(scan.flanks_defined)
+        # the whole window is swept at the coarse step
+        self.assertAlmostEqual(scan.xs[0], start)
+        self.assertAlmostEqual(scan.xs[-1], end)
+        self.assertEqual(scan.xs.shape[0], 16)
+        self.assertRaises(PeakCenterError, center_of, scan.xs, scan.intensities[:, 0])
+
+    def test_stopped(self):
+        spec = SimulatedSpectrometer()
+        scan = AdaptivePeakScan(min_peak_height=5)
+        reads = []
+
+        def read():
+            reads.append(1)
+            return spec.read()
+
+        alive = scan.scan(
+            5 - WINDOW,
+            5 + WINDOW,
+            STEP_WIDTH,
+            spec.step,
+            read,
+            alive=lambda: len(reads) < 5,
+        )
+        self.assertFalse(alive)
+        self.assertEqual(len(reads), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,11 +19,21 @@ from __future__ import absolute_import
 
 import os
 
-from traits.api import HasTraits, Str, CFloat, Float, Property, List, Enum
+from traits.api import (
+    HasTraits,
+    Str,
+    CFloat,
+    Float,
+    Property,
+    List,
+    Enum,
+    on_trait_change,
+)
 
 from pychron.core.geometry.affine import transform_point, itransform_point
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.loggable import Loggable
+from pychron.stage.maps.hole_index import HoleIndex
 
 
 class SampleHole(HasTraits):
@@ -71,6 +81,11 @@ class BaseStageMap(Loggable):
     # should always be N,E,S,W,center
     calibration_holes = None
 
+    # lazily built lookups. reset when the holes or their positions change
+    _hole_ids = None
+    _nominal_index = None
+    _corrected_index = None
+
     # def __init__(self, *args, **kw):
     #     super(BaseStageMap, self).__init__(*args, **kw)
     #     self.load()
@@ -194,13 +209,44 @@ class BaseStageMap(Loggable):
         return pt
 
     def get_hole(self, key):
-        return next((h for h in self.sample_holes if h.id == str(key)), None)
+        ids = self._hole_ids
+        if ids is None:
+            ids = {}
+            for h in self.sample_holes:
+                ids.setdefault(h.id, h)
+            self._hole_ids = ids
+
+        return ids.get(str(key))
 
     def get_hole_pos(self, key):
         """
         hole ids are str so convert key to str
         """
-        return next(((h.x, h.y) for h in self.sample_holes if h.id == str(key)), None)
+        h = self.get_hole(key)
+        if h is not None:
+            return h.x, h.y
+
+    def get_nearest_holes(self, x, y, k=1, radius=None, corrected=False):
+        """
+        return a list of (hole, distance) of the ``k`` holes nearest to x,y
+        """
+        return self.get_hole_index(corrected).nearest(x, y, k=k, radius=radius)
+
+    def get_holes_within(self, x, y, radius, corrected=False):
+        """
+        return a list of (hole, distance) of the holes within ``radius`` of x,y
+        """
+        return self.get_hole_index(corrected).within(x, y, radius)
+
+    def get_hole_index(self, corrected=False):
+        if corrected:
+            if self._corrected_index is None:
+                self._corrected_index = HoleIndex(self.sample_holes, corrected=True)
+            return self._corrected_index
+        else:
+            if self._nominal_index is None:
+                self._nominal_index = HoleIndex(self.sample_holes)
+            return self._nominal_index
 
     def check_valid_hole(self, key, autocenter_only=False, **kw):
         if autocenter_only and not key:
@@ -246,6 +292,16 @@ Check that the file is UTF-8 and Unix (LF) linefeed""".format(
             # print(rs[0].id, rs[-1].id)
 
     # private
+    @on_trait_change("sample_holes, sample_holes_items, sample_holes:[id, x, y]")
+    def _reset_hole_lookups(self):
+        self._hole_ids = None
+        self._nominal_index = None
+        self._corrected_index = None
+
+    @on_trait_change("sample_holes:[x_cor, y_cor]")
+    def _reset_corrected_index(self):
+        self._corrected_index = None
+
     def _grouped_rows(self, reverse=True):
         # def func(x):
         #     return x.y
@@ -0,0 +1,96 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from math import hypot
+
+from numpy import array, inf, isinf
+from scipy.spatial import cKDTree
+
+# ============= local library imports  ==========================
+
+
+class HoleIndex(object):
+    """
+    KD-tree over the positions of a list of SampleHoles.
+
+    corrected=True indexes the corrected positions of the holes that have a correction,
+    otherwise the nominal positions of all holes
+    """
+
+    def __init__(self, holes, corrected=False):
+        if corrected:
+            holes = [h for h in holes if h.has_correction()]
+            pts = [h.corrected_position for h in holes]
+        else:
+            pts = [h.nominal_position for h in holes]
+
+        self.holes = holes
+        # the candidates of a query are few. plain floats are faster than numpy for them
+        self._pts = [(float(px), float(py)) for px, py in pts]
+        self._tree = cKDTree(array(self._pts).reshape(-1, 2)) if holes else None
+
+    def nearest(self, x, y, k=1, radius=None):
+        """
+        return a list of (hole, distance) of the ``k`` nearest holes, nearest first.
+        only holes closer than ``radius`` are returned if given
+        """
+        if self._tree is None:
+            return []
+
+        k = min(k, len(self.holes))
+        ds, idxs = self._tree.query(
+            (x, y), k=k, distance_upper_bound=inf if radius is None else radius
+        )
+        if k == 1:
+            ds, idxs = (ds,), (idxs,)
+
+        return [(self.holes[i], d) for d, i in zip(ds, idxs) if not isinf(d)]
+
+    def within(self, x, y, radius):
+        """
+        return a list of (hole, distance) of the holes within ``radius``, nearest first
+        """
+        if self._tree is None:
+            return []
+
+        idxs = self._tree.query_ball_point((x, y), radius)
+        return self._sorted(x, y, idxs)
+
+    def in_box(self, x, y, tol):
+        """
+        return the nearest hole with abs(dx) < tol and abs(dy) < tol or None
+        """
+        if self._tree is None:
+            return
+
+        # p=inf is the chebyshev distance i.e. a square of half width tol
+        idxs = self._tree.query_ball_point((x, y), tol, p=inf)
+        pts = self._pts
+        idxs = [
+            i for i in idxs if abs(pts[i][0] - x) < tol and abs(pts[i][1] - y) < tol
+        ]
+        if idxs:
+            return self._sorted(x, y, idxs)[0][0]
+
+    def _sorted(self, x, y, idxs):
+        pts = self._pts
+        ds = [(self.holes[i], hypot(pts[i][0] - x, pts[i][1] - y)) for i in idxs]
+        return sorted(ds, key=lambda h: h[1])
+
+
+# ============= EOF =============================================
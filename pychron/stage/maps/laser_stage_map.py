@@ -117,6 +117,7 @@ class LaserStageMap(BaseStageMap):
                             h.x_cor = x
                             h.y_cor = y
                             h.corrected = True
+                self._reset_corrected_index()
 
     def generate_row_interpolated_corrections(self, dump_corrections=True):
         self.debug("generate row interpolated corrections")
@@ -162,6 +163,7 @@ class LaserStageMap(BaseStageMap):
             h.y_cor = 0
             h.corrected = False
             h.interpolated = False
+        self._reset_corrected_index()
 
         return p
 
@@ -180,36 +182,29 @@ class LaserStageMap(BaseStageMap):
     def set_hole_correction(self, hole, x_cor, y_cor):
         self.debug("set hole correction {}, x={}, y={}".format(hole, x_cor, y_cor))
         if not isinstance(hole, SampleHole):
-            hole = next((h for h in self.sample_holes if h.id == hole), None)
+            hole = self.get_hole(hole)
 
         if hole is not None:
             self.debug("setting correction {}".format(hole.id))
             hole.x_cor = x_cor
             hole.y_cor = y_cor
             hole.corrected = True
+            self._reset_corrected_index()
 
     def _get_hole_by_position(self, x, y, tol=None):
-        return self._get_hole_by_pos(x, y, "x", "y", tol)
+        return self._get_hole_by_pos(x, y, False, tol)
 
     def _get_hole_by_corrected_position(self, x, y, tol=None):
-        return self._get_hole_by_pos(x, y, "x_cor", "y_cor", tol)
+        return self._get_hole_by_pos(x, y, True, tol)
 
-    def _get_hole_by_pos(self, x, y, xkey, ykey, tol):
+    def _get_hole_by_pos(self, x, y, corrected, tol):
+        """
+        return the hole nearest to x,y within a square of half width ``tol``
+        """
         if tol is None:
             tol = self.g_dimension  # * 0.75
 
-        def pythag(hi, xi, yi):
-            return ((hi.x - xi) ** 2 + (hi.y - yi) ** 2) ** 0.5
-
-        holes = [
-            (hole, pythag(hole, x, y))
-            for hole in self.sample_holes
-            if abs(getattr(hole, xkey) - x) < tol and abs(getattr(hole, ykey) - y) < tol
-        ]
-        if holes:
-            # sort holes by deviation
-            holes = sorted(holes, lambda a, b: (a[1] > b[1]) - (a[1] < b[1]))
-            return holes[0][0]
+        return self.get_hole_index(corrected).in_box(x, y, tol)
 
     def traits_view(self):
         from .stage_map_view import StageMapView
@@ -0,0 +1,117 @@
+import os
+import random
+import tempfile
+import unittest
+
+from pychron.globals import globalv
+
+globalv.use_warning_display = False
+globalv.use_logger_display = False
+
+from pychron.stage.maps.laser_stage_map import LaserStageMap
+
+
+def make_map(root, nholes=1000, spacing=2.0):
+    """
+    write and load a square tray of ``nholes`` holes
+    """
+    n = int(nholes**0.5)
+    p = os.path.join(root, "{}-hole.txt".format(n * n))
+    with open(p, "w") as wfile:
+        wfile.write("circle,{}\n".format(spacing / 2))
+        wfile.write("1\n")
+        wfile.write("1,2,3,4,5\n")
+        for j in range(n):
+            for i in range(n):
+                wfile.write("{},{}\n".format(i * spacing, j * spacing))
+
+    sm = LaserStageMap(file_path=p)
+    sm.load()
+    return sm
+
+
+def brute_in_box(sm, x, y, tol, corrected=False):
+    holes = []
+    for h in sm.sample_holes:
+        if corrected:
+            if not h.has_correction():
+                continue
+            hx, hy = h.x_cor, h.y_cor
+        else:
+            hx, hy = h.x, h.y
+
+        if abs(hx - x) < tol and abs(hy - y) < tol:
+            holes.append((((hx - x) ** 2 + (hy - y) ** 2) ** 0.5, h))
+
+    if holes:
+        return min(holes, key=lambda h: h[0])[1]
+
+
+class HoleIndexTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp()
+        cls.sm = make_map(cls.root, nholes=400)
+
+    @classmethod
+    def tearDownClass(cls):
+        for f in os.listdir(cls.root):
+            os.remove(os.path.join(cls.root, f))
+        os.rmdir(cls.root)
+
+    def test_get_hole(self):
+        self.assertEqual(self.sm.get_hole(21).id, "21")
+        self.assertEqual(self.sm.get_hole_pos("21"), (0, 2))
+        self.assertIsNone(self.sm.get_hole("1000"))
+
+    def test_in_box(self):
+        rng = random.Random(1)
+        for i in range(500):
+            x, y = rng.uniform(-2, 40), rng.uniform(-2, 40)
+            tol = rng.uniform(0.1, 2)
+            self.assertIs(
+                self.sm._get_hole_by_position(x, y, tol), brute_in_box(self.sm, x, y, tol)
+            )
+
+    def test_nearest(self):
+        holes = self.sm.get_nearest_holes(2.1, 1.9, k=4)
+        self.assertEqual([h.id for h, d in holes[:1]], ["22"])
+        self.assertEqual(len(holes), 4)
+        self.assertEqual([d for h, d in holes], sorted(d for h, d in holes))
+
+        self.assertEqual(len(self.sm.get_nearest_holes(2.1, 1.9, k=4, radius=1)), 1)
+
+    def test_within(self):
+        holes = self.sm.get_holes_within(2, 2, 2.5)
+        # the hole and its 4 neighbors
+        self.assertEqual(len(holes), 5)
+        self.assertEqual(holes[0][0].id, "22")
+        self.assertEqual(holes[0][1], 0)
+
+    def test_corrections(self):
+        sm = make_map(self.root, nholes=25)
+        self.assertIsNone(sm._get_hole_by_corrected_position(0, 0, 0.5))
+
+        sm.set_hole_correction("7", 2.2, 2.1)
+        self.assertEqual(sm._get_hole_by_corrected_position(2.2, 2, 0.5).id, "7")
+
+        # moving the correction rebuilds the index
+        sm.set_hole_correction("7", 10, 10)
+        self.assertIsNone(sm._get_hole_by_corrected_position(2.2, 2, 0.5))
+        self.assertEqual(sm._get_hole_by_corrected_position(10, 10, 0.5).id, "7")
+
+        # nominal positions are unaffected
+        self.assertEqual(sm._get_hole_by_position(2.2, 2.1).id, "7")
+
+        sm.clear_correction_file()
+        self.assertIsNone(sm._get_hole_by_corrected_position(10, 10, 0.5))
+
+    def test_moved_hole(self):
+        sm = make_map(self.root, nholes=25)
+        h = sm.get_hole("1")
+        h.x = 100
+        self.assertIs(sm._get_hole_by_position(100, 0), h)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,15 @@ import os
 import unittest
 
 from pychron.canvas.canvas2D.tests.calibration_item import CalibrationObjectTestCase
+from pychron.core.helpers.tests.binpack import BinpackTestCase
 from pychron.core.helpers.tests.floatfmt import SigFigStdFmtTestCase
+from pychron.core.helpers.tests.growable_array import GrowableArrayTestCase
+from pychron.core.stats.tests.monte_carlo_test import MonteCarloTestCase
 from pychron.core.stats.tests.mswd_tests import MSWDTestCase
 
 # # Core
 from pychron.core.stats.tests.peak_detection_test import MultiPeakDetectionTestCase
+from pychron.core.stats.tests.probability_curves_test import ProbabilityCurvesTestCase
 from pychron.core.tests.spell_correct import SpellCorrectTestCase
 from pychron.core.tests.filtering_tests import FilteringTestCase
 
@@ -14,6 +18,7 @@ from pychron.core.helpers.tests.floatfmt import FloatfmtTestCase
 from pychron.core.helpers.tests.strtools import CamelCaseTestCase
 
 from pychron.core.xml.tests.xml_parser import XMLParserTestCase
+from pychron.core.regression.tests.batch_regressor import BatchRegressorTestCase
 from pychron.core.regression.tests.regression import (
     OLSRegressionTest,
     MeanRegressionTest,
@@ -22,7 +27,16 @@ from pychron.core.regression.tests.regression import (
     TruncateRegressionTest,
 )
 from pychron.core.tests.alpha_tests import AlphaTestCase
+from pychron.dashboard.tests.recorder import ProcessValueRecorderTestCase
+from pychron.database.tests.session_pool import SessionPoolTestCase
+from pychron.dvc.tests.analysis_bundle import AnalysisBundleTestCase
+from pychron.dvc.tests.analysis_listing import AnalysisListingTestCase
+from pychron.dvc.tests.cache import DVCCacheTestCase, DVCPersistentCacheTestCase
+from pychron.dvc.tests.push_queue import DVCPushQueueTestCase
+from pychron.dvc.tests.repo_sync import RepositorySyncTestCase
+from pychron.envisage.initialization.tests.device_startup import DeviceStartupTestCase
 from pychron.experiment.tests.backup import BackupTestCase
+from pychron.experiment.tests.buffered_writer import BufferedDataWriterTestCase
 from pychron.experiment.tests.comment_template import CommentTemplaterTestCase
 from pychron.experiment.tests.conditionals import (
     ConditionalsTestCase,
@@ -36,11 +50,24 @@ from pychron.experiment.tests.frequency_test import (
 from pychron.experiment.tests.identifier import IdentifierTestCase
 from pychron.experiment.tests.peak_hop_parse import PeakHopYamlCase1, PeakHopTxtCase
 from pychron.experiment.tests.peak_hop_parse import PeakHopYamlCase2
+from pychron.experiment.tests.plot_updater import PlotUpdaterTestCase
 from pychron.experiment.tests.position_regex_test import XYTestCase
 from pychron.experiment.tests.renumber_aliquot_test import RenumberAliquotTestCase
 from pychron.external_pipette.tests.external_pipette import ExternalPipetteTestCase
+from pychron.extraction_line.tests.state_poller import (
+    StatePollerTestCase,
+    SwitchManagerPollTestCase,
+    StatusMonitorPollTestCase,
+)
+from pychron.hardware.core.communicators.tests.async_ethernet import (
+    AsyncEthernetTestCase,
+)
+from pychron.labspy.tests.database_adapter import LabspyDatabaseTestCase
+from pychron.pipeline.tests.analysis_table import AnalysisTableTestCase
 from pychron.processing.tests.age_converter import AgeConverterTestCase
-from pychron.processing.tests.plateau import PlateauTestCase
+from pychron.processing.tests.batch_age import BatchAgeTestCase
+from pychron.processing.tests.isotope import RegressionCacheTestCase
+from pychron.processing.tests.plateau import PlateauTestCase, PlateauEngineTestCase
 from pychron.processing.tests.ratio import RatioTestCase
 
 #
@@ -53,8 +80,11 @@ from pychron.processing.tests.ratio import RatioTestCase
 # use_logger = False
 #
 #
+from pychron.pyscripts.tests.script_cache import ScriptCacheTestCase
 from pychron.spectrometer.tests.integration_time import IntegrationTimeTestCase
 from pychron.spectrometer.tests.mftable import DiscreteMFTableTestCase
+from pychron.spectrometer.tests.peak_center import PeakCenterTestCase
+from pychron.stage.tests.hole_index import HoleIndexTestCase
 from pychron.stage.tests.stage_map import StageMapTestCase, TransformTestCase
 
 
@@ -81,9 +111,12 @@ def suite():
         SpellCorrectTestCase,
         FilteringTestCase,
         MultiPeakDetectionTestCase,
+        ProbabilityCurvesTestCase,
         FloatfmtTestCase,
         SigFigStdFmtTestCase,
         CamelCaseTestCase,
+        BinpackTestCase,
+        GrowableArrayTestCase,
         RatioTestCase,
         XMLParserTestCase,
         OLSRegressionTest,
@@ -91,7 +124,22 @@ def suite():
         FilterOLSRegressionTest,
         OLSRegressionTest2,
         TruncateRegressionTest,
+        BatchRegressorTestCase,
         MSWDTestCase,
+        MonteCarloTestCase,
+        # Dashboard
+        ProcessValueRecorderTestCase,
+        # Database
+        SessionPoolTestCase,
+        # DVC
+        AnalysisBundleTestCase,
+        AnalysisListingTestCase,
+        DVCCacheTestCase,
+        DVCPersistentCacheTestCase,
+        DVCPushQueueTestCase,
+        RepositorySyncTestCase,
+        # Envisage
+        DeviceStartupTestCase,
         # old
         # ExpoRegressionTest,
         # ExpoRegressionTest2,
@@ -113,13 +161,29 @@ def suite():
         ParseConditionalsTestCase,
         IdentifierTestCase,
         CommentTemplaterTestCase,
+        BufferedDataWriterTestCase,
+        PlotUpdaterTestCase,
         # ExternalPipette
         ExternalPipetteTestCase,
+        # ExtractionLine
+        StatePollerTestCase,
+        SwitchManagerPollTestCase,
+        StatusMonitorPollTestCase,
+        # Hardware
+        AsyncEthernetTestCase,
+        # Labspy
+        LabspyDatabaseTestCase,
+        # Pipeline
+        AnalysisTableTestCase,
         # Processing
         PlateauTestCase,
+        PlateauEngineTestCase,
         RatioTestCase,
         AgeConverterTestCase,
+        BatchAgeTestCase,
+        RegressionCacheTestCase,
         # Pyscripts
+        ScriptCacheTestCase,
         # WaitForTestCase,
         # InterpolationTestCase,
         # DocstrContextTestCase,
@@ -127,9 +191,11 @@ def suite():
         # MFTableTestCase,
         DiscreteMFTableTestCase,
         IntegrationTimeTestCase,
+        PeakCenterTestCase,
         # Stage
         StageMapTestCase,
         TransformTestCase,
+        HoleIndexTestCase,
     )
 
     for t in tests: